@@ -43,6 +43,7 @@ PYTHON3_DEPENDENCIES="libbde-python3
                       libvslvm-python3
                       python3-XlsxWriter
                       python3-acstore
+                      python3-apsw
                       python3-artifacts
                       python3-bencode
                       python3-certifi
@@ -58,6 +59,8 @@ PYTHON3_DEPENDENCIES="libbde-python3
                       python3-future
                       python3-idna
                       python3-lz4
+                      python3-msgpack
+                      python3-numpy
                       python3-opensearch
                       python3-pefile
                       python3-psutil
@@ -49,6 +49,7 @@ PYTHON_DEPENDENCIES="libbde-python3
                      libvshadow-python3
                      libvslvm-python3
                      python3-acstore
+                     python3-apsw
                      python3-artifacts
                      python3-bencode
                      python3-certifi
@@ -65,6 +66,8 @@ PYTHON_DEPENDENCIES="libbde-python3
                      python3-future
                      python3-idna
                      python3-lz4
+                     python3-msgpack
+                     python3-numpy
                      python3-opensearch
                      python3-pefile
                      python3-psutil
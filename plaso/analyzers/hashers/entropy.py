@@ -4,12 +4,21 @@
 import collections
 import math
 
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
 from plaso.analyzers.hashers import interface
 from plaso.analyzers.hashers import manager
 
 
 class EntropyHasher(interface.BaseHasher):
-  """Calculates the byte entropy of input files."""
+  """Calculates the byte entropy of input files.
+
+  If NumPy is available the byte frequencies are counted with numpy.bincount,
+  otherwise with collections.Counter.
+  """
 
   NAME = 'entropy'
   ATTRIBUTE_NAME = 'file_entropy'
@@ -18,7 +27,11 @@ class EntropyHasher(interface.BaseHasher):
   def __init__(self):
     """Initializes the entropy hasher."""
     super(EntropyHasher, self).__init__()
-    self._byte_frequency_counter = collections.Counter()
+    if numpy:
+      self._byte_frequency_counter = numpy.zeros(256, dtype=numpy.int64)
+    else:
+      self._byte_frequency_counter = collections.Counter()
+
     self._file_length = 0
 
   def GetStringDigest(self):
@@ -34,11 +47,22 @@ class EntropyHasher(interface.BaseHasher):
     if self._file_length == 0:
       return '0.000000'
 
-    entropy = 0.0
-    for byte_frequency in self._byte_frequency_counter.values():
-      byte_probability = byte_frequency / self._file_length
-      if byte_probability:
-        entropy += - byte_probability * math.log(byte_probability, 2)
+    if numpy:
+      byte_frequencies = self._byte_frequency_counter[
+          self._byte_frequency_counter > 0]
+      byte_probabilities = byte_frequencies / self._file_length
+      # Note that the sum is subtracted from 0.0 so that the entropy of data
+      # with a single byte value is 0.0 and not -0.0.
+      entropy = 0.0 - float(numpy.sum(
+          byte_probabilities * numpy.log2(byte_probabilities)))
+
+    else:
+      entropy = 0.0
+      for byte_frequency in self._byte_frequency_counter.values():
+        byte_probability = byte_frequency / self._file_length
+        if byte_probability:
+          entropy += - byte_probability * math.log(byte_probability, 2)
+
     return '{0:.6f}'.format(entropy)
 
   def Update(self, data):
@@ -51,9 +75,14 @@ class EntropyHasher(interface.BaseHasher):
       data(bytes): block of data with which to update the context of the entropy
           calculator.
     """
-    # The call to update() determines the number of occurrences of a byte value
-    # within data.
-    self._byte_frequency_counter.update(data)
+    # The byte frequency counter is updated with the number of occurrences
+    # of each byte value within data.
+    if numpy:
+      self._byte_frequency_counter += numpy.bincount(
+          numpy.frombuffer(data, dtype=numpy.uint8), minlength=256)
+    else:
+      self._byte_frequency_counter.update(data)
+
     self._file_length += len(data)
 
 
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """The hashing analyzer implementation."""
 
+from concurrent import futures
+
 from plaso.analyzers import interface
 from plaso.analyzers import logger
 from plaso.analyzers import manager
@@ -23,11 +25,17 @@ class HashingAnalyzer(interface.BaseAnalyzer):
 
   INCREMENTAL_ANALYZER = True
 
+  # Minimum size of a block of data to update the hashers in parallel. For
+  # smaller blocks the overhead of the threads outweighs the benefit.
+  _THREADED_UPDATE_MINIMUM_SIZE = 64 * 1024
+
   def __init__(self):
     """Initializes a hashing analyzer."""
     super(HashingAnalyzer, self).__init__()
     self._hasher_names_string = ''
     self._hashers = []
+    self._number_of_threads = 0
+    self._thread_pool = None
 
   def Analyze(self, data):
     """Updates the internal state of the analyzer, processing a block of data.
@@ -38,8 +46,29 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     Args:
       data (bytes): block of data from the data stream.
     """
-    for hasher in self._hashers:
-      hasher.Update(data)
+    if (self._number_of_threads < 2 or len(self._hashers) < 2 or
+        len(data) < self._THREADED_UPDATE_MINIMUM_SIZE):
+      for hasher in self._hashers:
+        hasher.Update(data)
+
+    else:
+      if not self._thread_pool:
+        self._thread_pool = futures.ThreadPoolExecutor(
+            max_workers=self._number_of_threads,
+            thread_name_prefix='hasher')
+
+      # Note that hashlib releases the GIL while hashing large blocks of data
+      # hence the hashers can run in parallel. The results are retrieved to
+      # wait for all the hashers to finish and to raise their exceptions.
+      for _ in self._thread_pool.map(
+          lambda hasher: hasher.Update(data), self._hashers):
+        pass
+
+  def Close(self):
+    """Closes the analyzer and stops the threads that update the hashers."""
+    if self._thread_pool:
+      self._thread_pool.shutdown()
+      self._thread_pool = None
 
   def GetResults(self):
     """Retrieves the hashing results.
@@ -78,5 +107,16 @@ class HashingAnalyzer(interface.BaseAnalyzer):
     self._hashers = hashers_manager.HashersManager.GetHashers(hasher_names)
     self._hasher_names_string = hasher_names_string
 
+  def SetNumberOfThreads(self, number_of_threads):
+    """Sets the number of threads to update the hashers with.
+
+    Args:
+      number_of_threads (int): number of threads to update the hashers with,
+          where 0 or 1 represents the hashers are updated sequentially.
+    """
+    self.Close()
+
+    self._number_of_threads = number_of_threads or 0
+
 
 manager.AnalyzersManager.RegisterAnalyzer(HashingAnalyzer)
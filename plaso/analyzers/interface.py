@@ -26,6 +26,26 @@ class BaseAnalyzer(object):
       data(bytes): block of data to process.
     """
 
+  def AnalyzeFile(self, path):
+    """Analyzes a file stored on the operating system by path.
+
+    Analyzers that can read a file by themselves override this function, so
+    that the data of the file does not need to be read by the worker.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      bool: True if the file was analyzed, False if the data of the file needs
+          to be passed to Analyze() instead.
+    """
+    # pylint: disable=unused-argument
+    return False
+
+  def Close(self):
+    """Closes the analyzer and releases the resources it uses."""
+    return
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def GetResults(self):
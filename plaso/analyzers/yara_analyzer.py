@@ -21,7 +21,16 @@ from plaso.lib import definitions
 
 
 class YaraAnalyzer(interface.BaseAnalyzer):
-  """Analyzer that matches Yara rules."""
+  """Analyzer that matches Yara rules.
+
+  Files stored on the operating system are matched by path, which lets Yara
+  map the file into memory itself. Other data is matched block by block,
+  where the end of the preceding block is matched together with the start of
+  the next block so that strings that span the boundary between blocks are
+  found. Note that conditions that rely on absolute offsets, such as
+  "$mz at 0", or on the file size are evaluated relative to the start of each
+  block that is matched, hence they only hold for the first block of a file.
+  """
 
   # pylint: disable=no-member
 
@@ -30,36 +39,80 @@ class YaraAnalyzer(interface.BaseAnalyzer):
 
   PROCESSING_STATUS_HINT = definitions.STATUS_INDICATOR_YARA_SCAN
 
-  INCREMENTAL_ANALYZER = False
+  INCREMENTAL_ANALYZER = True
 
   _ATTRIBUTE_NAME = 'yara_match'
+
+  # Number of bytes at the end of a block of data that are matched together
+  # with the start of the next block of data.
+  _BLOCK_OVERLAP_SIZE = 64 * 1024
+
   _MATCH_TIMEOUT = 60
 
   def __init__(self):
     """Initializes the Yara analyzer."""
     super(YaraAnalyzer, self).__init__()
-    self._matches = []
+    self._matched_rules = []
+    self._preceding_data = b''
     self._rules = None
 
-  def Analyze(self, data):
-    """Analyzes a block of data, attempting to match Yara rules to it.
+  def _MatchRules(self, **kwargs):
+    """Matches the Yara rules and adds the names of the matching rules.
 
     Args:
-      data(bytes): a block of data.
+      kwargs (dict[str, object]): keyword arguments, such as data or filepath,
+          that define what Yara should match.
     """
-    if not self._rules:
-      return
-
     try:
-      self._matches = self._rules.match(data=data, timeout=self._MATCH_TIMEOUT)
+      matches = self._rules.match(timeout=self._MATCH_TIMEOUT, **kwargs)
 
     except YaraTimeoutError:
       logger.error('Could not process file within timeout: {0:d}'.format(
           self._MATCH_TIMEOUT))
+      return
 
     except YaraError as exception:
       logger.error('Error processing file with Yara: {0!s}.'.format(
           exception))
+      return
+
+    for match in matches:
+      if match.rule not in self._matched_rules:
+        self._matched_rules.append(match.rule)
+
+  def Analyze(self, data):
+    """Analyzes a block of data, attempting to match Yara rules to it.
+
+    Args:
+      data(bytes): a block of data.
+    """
+    if not self._rules or not data:
+      return
+
+    if self._preceding_data:
+      self._MatchRules(data=b''.join([
+          self._preceding_data, data[:self._BLOCK_OVERLAP_SIZE]]))
+
+    self._MatchRules(data=data)
+
+    if len(data) < self._BLOCK_OVERLAP_SIZE:
+      data = b''.join([self._preceding_data, data])
+
+    self._preceding_data = data[-self._BLOCK_OVERLAP_SIZE:]
+
+  def AnalyzeFile(self, path):
+    """Analyzes a file stored on the operating system by path.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      bool: True, since Yara can match rules against the file directly.
+    """
+    if self._rules:
+      self._MatchRules(filepath=path)
+
+    return True
 
   def GetResults(self):
     """Retrieves results of the most recent analysis.
@@ -70,12 +123,13 @@ class YaraAnalyzer(interface.BaseAnalyzer):
     result = analyzer_result.AnalyzerResult()
     result.analyzer_name = self.NAME
     result.attribute_name = self._ATTRIBUTE_NAME
-    result.attribute_value = [match.rule for match in self._matches]
+    result.attribute_value = list(self._matched_rules)
     return [result]
 
   def Reset(self):
     """Resets the internal state of the analyzer."""
-    self._matches = []
+    self._matched_rules = []
+    self._preceding_data = b''
 
   def SetRules(self, rules_string):
     """Sets the rules that the Yara analyzer will use.
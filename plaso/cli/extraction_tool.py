@@ -3,6 +3,7 @@
 
 import datetime
 import os
+import tempfile
 import time
 
 import pytz
@@ -28,6 +29,7 @@ from plaso.cli.helpers import manager as helpers_manager
 from plaso.containers import artifacts
 from plaso.engine import configurations
 from plaso.engine import engine
+from plaso.engine import extracted_file_index
 from plaso.single_process import extraction_engine as single_extraction_engine
 from plaso.filters import parser_filter
 from plaso.helpers import language_tags
@@ -88,6 +90,8 @@ class ExtractionTool(
     self._enable_sigsegv_handler = False
     self._expanded_parser_filter_expression = None
     self._extract_winevt_resources = True
+    self._extracted_file_index_path = None
+    self._incremental_extraction = False
     self._number_of_extraction_workers = 0
     self._parser_filter_expression = None
     self._preferred_codepage = None
@@ -103,6 +107,7 @@ class ExtractionTool(
     self._queue_size = self._DEFAULT_QUEUE_SIZE
     self._resolver_context = dfvfs_context.Context()
     self._single_process_mode = False
+    self._skip_duplicate_data_streams = False
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
     self._status_view_interval = 0.5
@@ -110,8 +115,11 @@ class ExtractionTool(
     self._storage_file_path = None
     self._storage_format = definitions.STORAGE_FORMAT_SQLITE
     self._task_storage_format = definitions.STORAGE_FORMAT_SQLITE
+    self._task_storage_serialization_format = (
+        definitions.SERIALIZER_FORMAT_JSON)
     self._temporary_directory = None
     self._worker_memory_limit = None
+    self._worker_timelining = False
     self._worker_timeout = None
     self._yara_rules_string = None
 
@@ -149,6 +157,42 @@ class ExtractionTool(
       raise errors.BadConfigOption(
           'Unable to write to storage file: {0:s}'.format(storage_file_path))
 
+  def _CreateExtractedFileIndex(self):
+    """Creates an index of the previously extracted file entries.
+
+    The index is stored in a temporary SQLite database file so that it can be
+    shared by the worker processes.
+
+    Raises:
+      BadConfigOption: if the storage file is not supported.
+      IOError: if the index cannot be created.
+      OSError: if the index cannot be created.
+    """
+    storage_reader = (
+        storage_factory.StorageFactory.CreateStorageReaderForFile(
+            self._storage_file_path))
+    if not storage_reader:
+      raise errors.BadConfigOption(
+          'Format of storage file: {0:s} not supported'.format(
+              self._storage_file_path))
+
+    # An empty file is a valid SQLite database file.
+    file_descriptor, extracted_file_index_path = tempfile.mkstemp(
+        suffix='.sqlite', dir=self._temporary_directory or None)
+    os.close(file_descriptor)
+
+    self._extracted_file_index_path = extracted_file_index_path
+
+    file_index = extracted_file_index.ExtractedFileIndex()
+    file_index.Open(path=extracted_file_index_path)
+
+    try:
+      file_index.ReadFromStorage(storage_reader)
+
+    finally:
+      file_index.Close()
+      storage_reader.Close()
+
   def _CreateExtractionEngine(self, single_process_mode):
     """Creates an extraction engine.
 
@@ -194,9 +238,16 @@ class ExtractionTool(
         self._hasher_file_size_limit)
     configuration.extraction.extract_winevt_resources = (
         self._extract_winevt_resources)
+    configuration.extraction.extracted_file_index_path = (
+        self._extracted_file_index_path)
     configuration.extraction.hasher_names_string = self._hasher_names_string
+    configuration.extraction.number_of_hasher_threads = (
+        self._number_of_hasher_threads)
     configuration.extraction.process_compressed_streams = (
         self._process_compressed_streams)
+    configuration.extraction.skip_duplicate_data_streams = (
+        self._skip_duplicate_data_streams)
+    configuration.extraction.worker_timelining = self._worker_timelining
     configuration.extraction.yara_rules_string = self._yara_rules_string
     configuration.filter_file = self._filter_file
     configuration.log_filename = self._log_file
@@ -210,6 +261,8 @@ class ExtractionTool(
     configuration.profiling.sample_rate = self._profiling_sample_rate
     configuration.profiling.profilers = self._profilers
     configuration.task_storage_format = self._task_storage_format
+    configuration.task_storage_serialization_format = (
+        self._task_storage_serialization_format)
     configuration.temporary_directory = self._temporary_directory
 
     return configuration
@@ -299,6 +352,18 @@ class ExtractionTool(
 
     return ','.join(sorted(parser_elements))
 
+  def _DeleteExtractedFileIndex(self):
+    """Deletes the index of the previously extracted file entries."""
+    if self._extracted_file_index_path:
+      try:
+        os.remove(self._extracted_file_index_path)
+      except (IOError, OSError) as exception:
+        logger.error((
+            'Unable to remove extracted file index: {0:s} with error: '
+            '{1!s}').format(self._extracted_file_index_path, exception))
+
+    self._extracted_file_index_path = None
+
   def _ParseExtractionOptions(self, options):
     """Parses the extraction options.
 
@@ -754,6 +819,11 @@ class ExtractionTool(
     number_of_extraction_warnings = 0
 
     try:
+      # The file entries extracted in previous sessions are indexed before
+      # the storage file is written to.
+      if self._incremental_extraction:
+        self._CreateExtractedFileIndex()
+
       stored_number_of_extraction_warnings = (
           storage_writer.GetNumberOfAttributeContainers('extraction_warning'))
 
@@ -772,6 +842,8 @@ class ExtractionTool(
     finally:
       storage_writer.Close()
 
+      self._DeleteExtractedFileIndex()
+
     self._status_view.PrintExtractionSummary(
         processing_status, number_of_extraction_warnings)
 
@@ -24,6 +24,16 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
       argument_group (argparse._ArgumentGroup|argparse.ArgumentParser):
           argparse group.
     """
+    argument_group.add_argument(
+        '--incremental', dest='incremental_extraction', action='store_true',
+        default=False, help=(
+            'Only extract file entries that are new or have changed since '
+            'they were extracted into an existing storage file. File entries '
+            'with the same size and modification time are skipped and the '
+            'content of data streams with the same SHA-256 hash is not '
+            'extracted again. The results are added as a new session to the '
+            'storage file.'))
+
     argument_group.add_argument(
         '--preferred_year', '--preferred-year', dest='preferred_year',
         type=int, action='store', default=None, metavar='YEAR', help=(
@@ -46,6 +56,25 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
             'Skip processing file content within compressed streams, such as '
             'syslog.gz and syslog.bz2.'))
 
+    argument_group.add_argument(
+        '--skip_duplicate_data_streams', '--skip-duplicate-data-streams',
+        dest='skip_duplicate_data_streams', action='store_true',
+        default=False, help=(
+            'Skip extracting the content of data streams with the same SHA-256 '
+            'hash as a data stream that already has been extracted, such as '
+            'copies of the same executable in multiple volume shadow '
+            'snapshots. Only file system metadata events are generated for '
+            'these data streams. Their SHA-256 hash can be used to find the '
+            'events of the content of the data stream that was extracted.'))
+
+    argument_group.add_argument(
+        '--worker_timelining', '--worker-timelining', dest='worker_timelining',
+        action='store_true', default=False, help=(
+            'Generate events from event data in the worker processes instead '
+            'of in the main (foreman) process. This reduces the amount of '
+            'work the main process needs to do to merge the results of '
+            'the worker processes.'))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -62,17 +91,28 @@ class ExtractionArgumentsHelper(interface.ArgumentsHelper):
       raise errors.BadConfigObject(
           'Configuration object is not an instance of CLITool')
 
+    incremental_extraction = getattr(options, 'incremental_extraction', False)
     preferred_year = cls._ParseNumericOption(options, 'preferred_year')
 
     process_archives = getattr(options, 'process_archives', False)
     process_compressed_streams = getattr(
         options, 'process_compressed_streams', True)
+    skip_duplicate_data_streams = getattr(
+        options, 'skip_duplicate_data_streams', False)
+    worker_timelining = getattr(options, 'worker_timelining', False)
 
+    setattr(
+        configuration_object, '_incremental_extraction',
+        incremental_extraction)
     setattr(configuration_object, '_preferred_year', preferred_year)
     setattr(configuration_object, '_process_archives', process_archives)
     setattr(
         configuration_object, '_process_compressed_streams',
         process_compressed_streams)
+    setattr(
+        configuration_object, '_skip_duplicate_data_streams',
+        skip_duplicate_data_streams)
+    setattr(configuration_object, '_worker_timelining', worker_timelining)
 
 
 manager.ArgumentHelperManager.RegisterHelper(ExtractionArgumentsHelper)
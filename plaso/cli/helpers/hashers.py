@@ -34,6 +34,13 @@ class HashersArgumentsHelper(interface.ArgumentsHelper):
             'process. Any larger file will be skipped. A size of 0 represents '
             'no limit.'))
 
+    argument_group.add_argument(
+        '--hasher_threads', '--hasher-threads', dest='hasher_threads',
+        type=int, action='store', default=0, metavar='NUMBER', help=(
+            'Define the number of threads each worker uses to run the '
+            'hashers in parallel on large blocks of data. A number of 0 '
+            'represents the hashers are run sequentially.'))
+
     argument_group.add_argument(
         '--hashers', dest='hashers', type=str, action='store',
         default=cls._DEFAULT_HASHER_STRING, metavar='HASHER_LIST', help=(
@@ -66,15 +73,23 @@ class HashersArgumentsHelper(interface.ArgumentsHelper):
     hasher_file_size_limit = cls._ParseNumericOption(
         options, 'hasher_file_size_limit', default_value=0)
 
+    hasher_threads = cls._ParseNumericOption(
+        options, 'hasher_threads', default_value=0)
+
     # TODO: validate hasher names.
 
     if hasher_file_size_limit < 0:
       raise errors.BadConfigOption(
           'Invalid hasher file size limit value cannot be negative.')
 
+    if hasher_threads < 0:
+      raise errors.BadConfigOption(
+          'Invalid number of hasher threads value cannot be negative.')
+
     setattr(configuration_object, '_hasher_names_string', hashers)
     setattr(
         configuration_object, '_hasher_file_size_limit', hasher_file_size_limit)
+    setattr(configuration_object, '_number_of_hasher_threads', hasher_threads)
 
 
 manager.ArgumentHelperManager.RegisterHelper(HashersArgumentsHelper)
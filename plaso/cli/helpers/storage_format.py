@@ -6,6 +6,7 @@ from plaso.cli.helpers import interface
 from plaso.cli.helpers import manager
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.serializer import msgpack_serializer
 
 
 class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
@@ -27,6 +28,7 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
     """
     session_storage_formats = sorted(definitions.SESSION_STORAGE_FORMATS)
     task_storage_formats = sorted(definitions.TASK_STORAGE_FORMATS)
+    serialization_formats = sorted(definitions.SERIALIZER_FORMATS)
 
     argument_group.add_argument(
         '--storage_format', '--storage-format', action='store',
@@ -46,6 +48,20 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
                 definitions.DEFAULT_STORAGE_FORMAT,
                 ', '.join(task_storage_formats))))
 
+    argument_group.add_argument(
+        '--task_storage_serialization_format',
+        '--task-storage-serialization-format', action='store',
+        choices=serialization_formats,
+        dest='task_storage_serialization_format', type=str, metavar='FORMAT',
+        default=definitions.SERIALIZER_FORMAT_JSON, help=(
+            'Serialization format for task storage, the default is: {0:s}. '
+            'Supported options: {1:s}. The {2:s} format is only supported by '
+            'the {3:s} task storage format and requires msgpack.'.format(
+                definitions.SERIALIZER_FORMAT_JSON,
+                ', '.join(serialization_formats),
+                definitions.SERIALIZER_FORMAT_MSGPACK,
+                definitions.STORAGE_FORMAT_SQLITE)))
+
   @classmethod
   def ParseOptions(cls, options, configuration_object):
     """Parses and validates options.
@@ -57,8 +73,8 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     Raises:
       BadConfigObject: when the configuration object is of the wrong type.
-      BadConfigOption: if the storage format or task storage is not defined
-          or supported.
+      BadConfigOption: if the storage format, task storage format or task
+          storage serialization format is not defined or supported.
     """
     if not isinstance(configuration_object, tools.CLITool):
       raise errors.BadConfigObject(
@@ -84,5 +100,30 @@ class StorageFormatArgumentsHelper(interface.ArgumentsHelper):
 
     setattr(configuration_object, '_task_storage_format', task_storage_format)
 
+    serialization_format = cls._ParseStringOption(
+        options, 'task_storage_serialization_format',
+        default_value=definitions.SERIALIZER_FORMAT_JSON)
+
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise errors.BadConfigOption(
+          'Unsupported task storage serialization format: {0:s}'.format(
+              serialization_format))
+
+    if serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+      if task_storage_format != definitions.STORAGE_FORMAT_SQLITE:
+        raise errors.BadConfigOption((
+            'Task storage serialization format: {0:s} not supported by task '
+            'storage format: {1:s}').format(
+                serialization_format, task_storage_format))
+
+      if not msgpack_serializer.msgpack:
+        raise errors.BadConfigOption((
+            'Task storage serialization format: {0:s} requires msgpack').format(
+                serialization_format))
+
+    setattr(
+        configuration_object, '_task_storage_serialization_format',
+        serialization_format)
+
 
 manager.ArgumentHelperManager.RegisterHelper(StorageFormatArgumentsHelper)
@@ -60,11 +60,14 @@ class PsortTool(
     super(PsortTool, self).__init__(
         input_reader=input_reader, output_writer=output_writer)
     self._deduplicate_events = True
+    self._number_of_output_workers = 0
     self._preferred_language = None
+    self._preload_winevt_message_strings = False
     self._process_memory_limit = None
     self._status_view = status_view.StatusView(self._output_writer, self.NAME)
     self._status_view_file = 'status.info'
     self._status_view_mode = status_view.StatusView.MODE_WINDOW
+    self._temporary_directory = None
     self._time_slice = None
     self._use_time_slicer = False
 
@@ -132,9 +135,12 @@ class PsortTool(
     configuration.log_filename = self._log_file
     configuration.preferred_language = self._preferred_language
     configuration.preferred_time_zone = self._output_time_zone
+    configuration.preload_winevt_message_strings = (
+        self._preload_winevt_message_strings)
     configuration.profiling.directory = self._profiling_directory
     configuration.profiling.profilers = self._profilers
     configuration.profiling.sample_rate = self._profiling_sample_rate
+    configuration.temporary_directory = self._temporary_directory
 
     return configuration
 
@@ -224,6 +230,13 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.ParseOptions(
         options, self, names=argument_helper_names)
 
+    number_of_output_workers = getattr(options, 'output_workers', None) or 0
+
+    if number_of_output_workers < 0:
+      raise errors.BadConfigOption((
+          'Invalid number of output workers: {0:d}, value must be 0 or '
+          'greater.').format(number_of_output_workers))
+
     worker_memory_limit = getattr(options, 'worker_memory_limit', None)
 
     if worker_memory_limit and worker_memory_limit < 0:
@@ -238,6 +251,9 @@ class PsortTool(
           'Invalid worker timeout: {0:f}, value must be greater than '
           '0.0 minutes.').format(worker_timeout))
 
+    self._number_of_output_workers = number_of_output_workers
+    self._preload_winevt_message_strings = getattr(
+        options, 'preload_winevt_message_strings', False)
     self._worker_memory_limit = worker_memory_limit
     self._worker_timeout = worker_timeout
 
@@ -253,6 +269,27 @@ class PsortTool(
     helpers_manager.ArgumentHelperManager.AddCommandLineArguments(
         argument_group, names=argument_helper_names)
 
+    argument_group.add_argument(
+        '--output_workers', '--output-workers', dest='output_workers',
+        action='store', type=int, default=0, metavar='WORKERS', help=(
+            'Number of worker processes used to export events. The default '
+            'is 0, which represents the events are exported by the main '
+            '(foreman) process. Worker processes are only used by output '
+            'formats that support exporting time ranges of events in '
+            'parallel and are not used together with a time slice or an '
+            'event filter with a limit.'))
+
+    argument_group.add_argument(
+        '--preload_winevt_message_strings',
+        '--preload-winevt-message-strings',
+        dest='preload_winevt_message_strings', action='store_true',
+        default=False, help=(
+            'Read the Windows EventLog message strings in the storage into '
+            'memory before formatting the first Windows EventLog event, '
+            'instead of reading them per event. This uses more memory but '
+            'speeds up formatting storages with many Windows EventLog '
+            'events.'))
+
     argument_group.add_argument(
         '--worker_memory_limit', '--worker-memory-limit',
         dest='worker_memory_limit', action='store', type=int,
@@ -501,7 +538,8 @@ class PsortTool(
 
       # TODO: add single process output and formatting engine support.
       output_engine = (
-          multi_output_engine.OutputAndFormattingMultiProcessEngine())
+          multi_output_engine.OutputAndFormattingMultiProcessEngine(
+              number_of_worker_processes=self._number_of_output_workers))
 
       output_engine.SetStatusUpdateInterval(self._status_view_interval)
 
@@ -510,6 +548,7 @@ class PsortTool(
           deduplicate_events=self._deduplicate_events,
           event_filter=self._event_filter,
           status_update_callback=status_update_callback,
+          storage_file_path=self._storage_file_path,
           time_slice=self._time_slice, use_time_slicer=self._use_time_slicer)
 
       self._output_module.Close()
@@ -74,6 +74,7 @@ class HashersOptions(object):
     super(HashersOptions, self).__init__()
     self._hasher_file_size_limit = None
     self._hasher_names_string = None
+    self._number_of_hasher_threads = 0
 
   def ListHashers(self):
     """Lists information about the available hashers."""
@@ -15,6 +15,9 @@ class EventSource(interface.AttributeContainer):
   Attributes:
     data_type (str): attribute container type indicator.
     file_entry_type (str): dfVFS file entry type.
+    file_size (int): size of the file entry or data range, in bytes, used to
+        estimate the cost of processing the event source, where None
+        represents the size is not known.
     path_spec (dfvfs.PathSpec): path specification.
   """
   CONTAINER_TYPE = 'event_source'
@@ -23,18 +26,22 @@ class EventSource(interface.AttributeContainer):
   SCHEMA = {
       'data_type': 'str',
       'file_entry_type': 'str',
+      'file_size': 'int',
       'path_spec': 'dfvfs.PathSpec'}
 
-  def __init__(self, file_entry_type=None, path_spec=None):
+  def __init__(self, file_entry_type=None, file_size=None, path_spec=None):
     """Initializes an event source.
 
     Args:
       file_entry_type (Optional[str]): dfVFS file entry type.
+      file_size (Optional[int]): size of the file entry or data range,
+          in bytes.
       path_spec (Optional[dfvfs.PathSpec]): path specification.
     """
     super(EventSource, self).__init__()
     self.data_type = self.DATA_TYPE
     self.file_entry_type = file_entry_type
+    self.file_size = file_size
     self.path_spec = path_spec
 
   # This method is necessary for heap sort.
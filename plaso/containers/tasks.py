@@ -22,6 +22,10 @@ class Task(interface.AttributeContainer):
         number of micro seconds since January 1, 1970, 00:00:00 UTC.
     file_entry_type (str): dfVFS type of the file entry the path specification
         is referencing.
+    file_size (int): size of the file entry or data range the path
+        specification is referencing, in bytes, where None represents
+        the size is not known. For a task with multiple path specifications
+        this is the total size.
     has_retry (bool): True if the task was previously abandoned and a retry
         task was created, False otherwise.
     identifier (str): unique identifier of the task.
@@ -30,6 +34,9 @@ class Task(interface.AttributeContainer):
     merge_priority (int): priority used for the task storage file merge, where
         a lower value indicates a higher priority to merge.
     path_spec (dfvfs.PathSpec): path specification.
+    path_specs (list[dfvfs.PathSpec]): path specifications of a task that
+        processes multiple file entries, where None represents a task that
+        processes the path specification in path_spec.
     session_identifier (str): the identifier of the session the task is part of.
     start_time (int): time that the task was started. Contains the number
         of micro seconds since January 1, 1970, 00:00:00 UTC.
@@ -43,11 +50,13 @@ class Task(interface.AttributeContainer):
       'aborted': 'bool',
       'completion_time': 'int',
       'file_entry_type': 'str',
+      'file_size': 'int',
       'has_retry': 'bool',
       'identifier': 'str',
       'last_processing_time': 'int',
       'merge_priority': 'int',
       'path_spec': 'dfvfs.PathSpec',
+      'path_specs': 'List[dfvfs.PathSpec]',
       'session_identifier': 'str',
       'start_time': 'int',
       'storage_file_size': 'int',
@@ -64,11 +73,13 @@ class Task(interface.AttributeContainer):
     self.aborted = False
     self.completion_time = None
     self.file_entry_type = None
+    self.file_size = None
     self.has_retry = False
     self.identifier = '{0:s}'.format(uuid.uuid4().hex)
     self.last_processing_time = None
     self.merge_priority = None
     self.path_spec = None
+    self.path_specs = None
     self.session_identifier = session_identifier
     self.start_time = int(time.time() * definitions.MICROSECONDS_PER_SECOND)
     self.storage_file_size = None
@@ -97,8 +108,10 @@ class Task(interface.AttributeContainer):
     """
     retry_task = Task(session_identifier=self.session_identifier)
     retry_task.file_entry_type = self.file_entry_type
+    retry_task.file_size = self.file_size
     retry_task.merge_priority = self.merge_priority
     retry_task.path_spec = self.path_spec
+    retry_task.path_specs = self.path_specs
     retry_task.storage_file_size = self.storage_file_size
     retry_task.storage_format = self.storage_format
 
@@ -106,6 +119,47 @@ class Task(interface.AttributeContainer):
 
     return retry_task
 
+  def CreateRetryTasks(self):
+    """Creates new tasks to retry a previously abandoned task.
+
+    A task with multiple path specifications is retried with a task per path
+    specification, so that a path specification that causes a worker to fail
+    does not prevent the other path specifications from being processed.
+
+    Returns:
+      list[Task]: tasks to retry a previously abandoned task.
+    """
+    if not self.path_specs:
+      return [self.CreateRetryTask()]
+
+    retry_tasks = []
+    for path_spec in self.path_specs:
+      retry_task = Task(session_identifier=self.session_identifier)
+      retry_task.file_entry_type = self.file_entry_type
+      retry_task.merge_priority = self.merge_priority
+      retry_task.path_spec = path_spec
+      retry_task.storage_format = self.storage_format
+
+      retry_tasks.append(retry_task)
+
+    self.has_retry = True
+
+    return retry_tasks
+
+  def GetPathSpecs(self):
+    """Retrieves the path specifications the task is to process.
+
+    Returns:
+      list[dfvfs.PathSpec]: path specifications.
+    """
+    if self.path_specs:
+      return list(self.path_specs)
+
+    if self.path_spec:
+      return [self.path_spec]
+
+    return []
+
   def UpdateProcessingTime(self):
     """Updates the processing time to now."""
     self.last_processing_time = int(
@@ -17,6 +17,7 @@ import re
 # property or method.
 PYTHON_DEPENDENCIES = {
     'acstore': ('__version__', '20230519', None, True),
+    'apsw': ('apswversion()', '3.37.0', None, False),
     'artifacts': ('__version__', '20220219', None, True),
     'bencode': ('', '', None, True),
     'certifi': ('__version__', '2016.9.26', None, True),
@@ -30,6 +31,8 @@ PYTHON_DEPENDENCIES = {
     'flor': ('__version__', '1.1.3', None, False),
     'future': ('__version__', '0.16.0', None, True),
     'lz4': ('__version__', '0.10.0', None, True),
+    'msgpack': ('__version__', '1.0.0', None, False),
+    'numpy': ('__version__', '1.17.0', None, False),
     'opensearchpy': ('__versionstr__', '', None, False),
     'pefile': ('__version__', '2021.5.24', None, True),
     'psutil': ('__version__', '5.4.3', None, True),
@@ -54,14 +54,31 @@ class ExtractionConfiguration(interface.AttributeContainer):
   Attributes:
     archive_types_string (str): comma separated archive types for which embedded
         file entries should be processed.
+    content_hash_cache_path (str): path of the content hash cache that is
+        shared by the workers, where None represents a cache per worker.
     extract_winevt_resources (bool): True if Windows EventLog resources should
         be extracted.
+    extracted_file_index_path (str): path of the index of file entries that
+        have been extracted in a previous session, where None represents
+        all file entries should be extracted.
     hasher_file_size_limit (int): maximum file size that hashers
         should process, where 0 or None represents unlimited.
     hasher_names_string (str): comma separated names of hashers to use during
         processing.
+    number_of_hasher_threads (int): number of threads per worker to run
+        the hashers in parallel, where 0 or None represents the hashers
+        are run sequentially.
     process_compressed_streams (bool): True if file content in compressed
         streams should be processed.
+    skip_duplicate_data_streams (bool): True if the content of data streams
+        with the same content hash as a previously extracted data stream
+        should not be extracted.
+    text_log_range_size (int): size of the data ranges, in bytes, that large
+        line-based text log files are split into so that the ranges can be
+        parsed by multiple workers, where 0 or None represents no splitting.
+    worker_timelining (bool): True if events should be generated from event
+        data by the extraction workers instead of by the main (foreman)
+        process when merging the task results.
     yara_rules_string (str): Yara rule definitions.
   """
   CONTAINER_TYPE = 'extraction_configuration'
@@ -70,10 +87,16 @@ class ExtractionConfiguration(interface.AttributeContainer):
     """Initializes an extraction configuration object."""
     super(ExtractionConfiguration, self).__init__()
     self.archive_types_string = None
+    self.content_hash_cache_path = None
     self.extract_winevt_resources = True
+    self.extracted_file_index_path = None
     self.hasher_file_size_limit = None
     self.hasher_names_string = None
+    self.number_of_hasher_threads = 0
     self.process_compressed_streams = True
+    self.skip_duplicate_data_streams = False
+    self.text_log_range_size = 256 * 1024 * 1024
+    self.worker_timelining = False
     self.yara_rules_string = None
 
 
@@ -210,8 +233,13 @@ class ProcessingConfiguration(interface.AttributeContainer):
     preferred_time_zone (str): preferred time zone.
     preferred_year (int): preferred initial year value for year-less date and
         time values.
+    preload_winevt_message_strings (bool): True if the Windows EventLog
+        message strings in the storage should be read into memory on the first
+        lookup.
     profiling (ProfilingConfiguration): profiling configuration.
     task_storage_format (str): format to use for storing task results.
+    task_storage_serialization_format (str): serialization format of
+        attribute containers in the task storage.
     task_storage_path (str): path of the directory containing SQLite task
         storage files.
     temporary_directory (str): path of the directory for temporary files.
@@ -239,7 +267,9 @@ class ProcessingConfiguration(interface.AttributeContainer):
     self.preferred_language = None
     self.preferred_time_zone = None
     self.preferred_year = None
+    self.preload_winevt_message_strings = False
     self.profiling = ProfilingConfiguration()
     self.task_storage_format = None
+    self.task_storage_serialization_format = None
     self.task_storage_path = None
     self.temporary_directory = None
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Cache of content hashes of data streams that have been extracted."""
+
+import sqlite3
+
+
+class ContentHashCache(object):
+  """Cache of content hashes of data streams that have been extracted.
+
+  The cache is stored in a SQLite database file so that it can be shared by
+  multiple worker processes. A worker that processes a task claims the
+  content extraction of a data stream by adding its content hash for the task.
+  The claim is pending until the results of the task have been merged and the
+  claims of the task are committed. Workers only skip the content extraction
+  of data streams of which the content hash was committed, or claimed by the
+  same task, so that the content of a data stream is not lost when the task
+  that claimed it is abandoned.
+  """
+
+  _CREATE_CONTENT_HASHES_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS content_hashes ('
+      'sha256_hash TEXT PRIMARY KEY)')
+
+  _CREATE_PENDING_CONTENT_HASHES_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS pending_content_hashes ('
+      'sha256_hash TEXT, task_identifier TEXT, '
+      'PRIMARY KEY (sha256_hash, task_identifier))')
+
+  _COMMIT_QUERY = (
+      'INSERT OR IGNORE INTO content_hashes (sha256_hash) '
+      'SELECT sha256_hash FROM pending_content_hashes '
+      'WHERE task_identifier = ?')
+
+  _DELETE_PENDING_QUERY = (
+      'DELETE FROM pending_content_hashes WHERE task_identifier = ?')
+
+  _HAS_CONTENT_HASH_QUERY = (
+      'SELECT 1 FROM content_hashes WHERE sha256_hash = ?')
+
+  _INSERT_QUERY = (
+      'INSERT OR IGNORE INTO content_hashes (sha256_hash) VALUES (?)')
+
+  _INSERT_PENDING_QUERY = (
+      'INSERT OR IGNORE INTO pending_content_hashes '
+      '(sha256_hash, task_identifier) VALUES (?, ?)')
+
+  # Maximum number of seconds to wait on a lock held by another process.
+  _LOCK_TIMEOUT = 60.0
+
+  def __init__(self):
+    """Initializes a content hash cache."""
+    super(ContentHashCache, self).__init__()
+    self._connection = None
+
+  def AddContentHash(self, sha256_hash, task_identifier=None):
+    """Adds a content hash to the cache.
+
+    Args:
+      sha256_hash (str): SHA-256 digest hash of the content of a data stream.
+      task_identifier (Optional[str]): identifier of the task that extracts
+          the content of the data stream, where None represents the content
+          hash is committed immediately, such as in single process mode.
+
+    Returns:
+      bool: True if the content of the data stream should be extracted, False
+          if the content hash was committed or already claimed by the task.
+
+    Raises:
+      RuntimeError: if the cache is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot add content hash cache not opened.')
+
+    if not task_identifier:
+      cursor = self._connection.execute(self._INSERT_QUERY, (sha256_hash, ))
+      return cursor.rowcount == 1
+
+    cursor = self._connection.execute(
+        self._HAS_CONTENT_HASH_QUERY, (sha256_hash, ))
+    if cursor.fetchone():
+      return False
+
+    cursor = self._connection.execute(
+        self._INSERT_PENDING_QUERY, (sha256_hash, task_identifier))
+    return cursor.rowcount == 1
+
+  def Close(self):
+    """Closes the cache.
+
+    Raises:
+      RuntimeError: if the cache is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot close cache not opened.')
+
+    self._connection.close()
+    self._connection = None
+
+  def CommitContentHashes(self, task_identifier):
+    """Commits the content hashes claimed by a task.
+
+    This function should only be called after the results of the task have
+    been merged.
+
+    Args:
+      task_identifier (str): identifier of the task.
+
+    Raises:
+      IOError: if the content hashes cannot be committed.
+      OSError: if the content hashes cannot be committed.
+      RuntimeError: if the cache is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot commit content hashes cache not opened.')
+
+    try:
+      self._connection.execute('BEGIN IMMEDIATE')
+      try:
+        self._connection.execute(self._COMMIT_QUERY, (task_identifier, ))
+        self._connection.execute(
+            self._DELETE_PENDING_QUERY, (task_identifier, ))
+
+      except sqlite3.Error:
+        self._connection.execute('ROLLBACK')
+        raise
+
+      self._connection.execute('COMMIT')
+
+    except sqlite3.Error as exception:
+      raise IOError((
+          'Unable to commit content hashes of task: {0:s} with error: '
+          '{1!s}').format(task_identifier, exception))
+
+  def Open(self, path=None):
+    """Opens the cache.
+
+    Args:
+      path (Optional[str]): path of the SQLite database file of the cache,
+          where None represents a cache in memory that is not shared.
+
+    Raises:
+      IOError: if the cache cannot be opened.
+      OSError: if the cache cannot be opened.
+      RuntimeError: if the cache is already opened.
+    """
+    if self._connection:
+      raise RuntimeError('Cannot open cache already opened.')
+
+    try:
+      # Each content hash is committed as it is added, so that it is visible
+      # to other processes immediately.
+      connection = sqlite3.connect(
+          path or ':memory:', isolation_level=None,
+          timeout=self._LOCK_TIMEOUT)
+      connection.execute(self._CREATE_CONTENT_HASHES_TABLE_QUERY)
+      connection.execute(self._CREATE_PENDING_CONTENT_HASHES_TABLE_QUERY)
+
+    except sqlite3.Error as exception:
+      raise IOError((
+          'Unable to open content hash cache with error: {0!s}').format(
+              exception))
+
+    self._connection = connection
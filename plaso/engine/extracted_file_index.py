@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Index of file entries that have been extracted in a previous session."""
+
+import sqlite3
+
+
+class ExtractedFileIndex(object):
+  """Index of file entries that have been extracted in a previous session.
+
+  The index maps the path specification of the data stream of a previously
+  extracted file entry to its size, modification date and time and content
+  hash. It is stored in a SQLite database file so that it can be shared by
+  multiple worker processes.
+  """
+
+  _CREATE_TABLE_QUERY = (
+      'CREATE TABLE IF NOT EXISTS extracted_files ('
+      'path_spec TEXT PRIMARY KEY, file_size INTEGER, '
+      'modification_time TEXT, sha256_hash TEXT)')
+
+  _INSERT_QUERY = (
+      'INSERT OR REPLACE INTO extracted_files (path_spec, file_size, '
+      'modification_time, sha256_hash) VALUES (?, ?, ?, ?)')
+
+  _SELECT_QUERY = (
+      'SELECT file_size, modification_time, sha256_hash FROM extracted_files '
+      'WHERE path_spec = ?')
+
+  _UPDATE_QUERY = (
+      'UPDATE extracted_files SET file_size = ?, modification_time = ? '
+      'WHERE path_spec = ?')
+
+  _FILE_STAT_DATA_TYPE = 'fs:stat'
+
+  # Maximum number of seconds to wait on a lock held by another process.
+  _LOCK_TIMEOUT = 60.0
+
+  def __init__(self):
+    """Initializes an extracted file index."""
+    super(ExtractedFileIndex, self).__init__()
+    self._connection = None
+
+  def _GetModificationTimeString(self, date_time):
+    """Retrieves a string representation of a modification date and time.
+
+    Args:
+      date_time (dfdatetime.DateTimeValues): modification date and time.
+
+    Returns:
+      str: modification date and time or None if not available.
+    """
+    if date_time is None:
+      return None
+
+    return date_time.CopyToDateTimeString()
+
+  def _GetValues(self, path_spec):
+    """Retrieves the indexed values of a path specification.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of a data stream.
+
+    Returns:
+      tuple[int, str, str]: file size, modification date and time and
+          SHA-256 hash, or None if the path specification is not indexed.
+
+    Raises:
+      RuntimeError: if the index is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot read from index not opened.')
+
+    cursor = self._connection.execute(
+        self._SELECT_QUERY, (path_spec.comparable, ))
+    return cursor.fetchone()
+
+  def Close(self):
+    """Closes the index.
+
+    Raises:
+      RuntimeError: if the index is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot close index not opened.')
+
+    self._connection.close()
+    self._connection = None
+
+  def HasUnchangedContent(self, path_spec, sha256_hash):
+    """Determines if the content of a data stream has not changed.
+
+    Args:
+      path_spec (dfvfs.PathSpec): path specification of the data stream.
+      sha256_hash (str): SHA-256 digest hash of the content of the data
+          stream.
+
+    Returns:
+      bool: True if the data stream was extracted previously with the same
+          content hash.
+
+    Raises:
+      RuntimeError: if the index is not opened.
+    """
+    if not sha256_hash:
+      return False
+
+    values = self._GetValues(path_spec)
+    return bool(values and values[2] == sha256_hash)
+
+  def HasUnchangedFileEntry(self, file_entry):
+    """Determines if a file entry has not changed.
+
+    A file entry is considered unchanged if it was extracted previously with
+    the same size and modification date and time.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+
+    Returns:
+      bool: True if the file entry was extracted previously and has not
+          changed.
+
+    Raises:
+      RuntimeError: if the index is not opened.
+    """
+    values = self._GetValues(file_entry.path_spec)
+    if not values or values[0] is None or values[1] is None:
+      return False
+
+    modification_time = self._GetModificationTimeString(
+        file_entry.modification_time)
+
+    return values[0] == file_entry.size and values[1] == modification_time
+
+  def Open(self, path=None):
+    """Opens the index.
+
+    Args:
+      path (Optional[str]): path of the SQLite database file of the index,
+          where None represents an index in memory that is not shared.
+
+    Raises:
+      IOError: if the index cannot be opened.
+      OSError: if the index cannot be opened.
+      RuntimeError: if the index is already opened.
+    """
+    if self._connection:
+      raise RuntimeError('Cannot open index already opened.')
+
+    try:
+      connection = sqlite3.connect(
+          path or ':memory:', isolation_level=None,
+          timeout=self._LOCK_TIMEOUT)
+      connection.execute(self._CREATE_TABLE_QUERY)
+
+    except sqlite3.Error as exception:
+      raise IOError((
+          'Unable to open extracted file index with error: {0!s}').format(
+              exception))
+
+    self._connection = connection
+
+  def ReadFromStorage(self, storage_reader):
+    """Reads the previously extracted file entries from a storage.
+
+    The path specifications and content hashes are read from the event data
+    streams. The sizes and modification dates and times are read from
+    the file system stat event data, hence file entries that were extracted
+    without the filestat parser are only indexed by content hash.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+
+    Raises:
+      RuntimeError: if the index is not opened.
+    """
+    if not self._connection:
+      raise RuntimeError('Cannot write to index not opened.')
+
+    self._connection.execute('BEGIN TRANSACTION')
+
+    try:
+      # Event data streams of later sessions replace those of earlier sessions
+      # with the same path specification.
+      for event_data_stream in storage_reader.GetAttributeContainers(
+          'event_data_stream'):
+        if event_data_stream.path_spec:
+          self._connection.execute(self._INSERT_QUERY, (
+              event_data_stream.path_spec.comparable, None, None,
+              event_data_stream.sha256_hash))
+
+      for event_data in storage_reader.GetAttributeContainers('event_data'):
+        if event_data.data_type != self._FILE_STAT_DATA_TYPE:
+          continue
+
+        event_data_stream_identifier = (
+            event_data.GetEventDataStreamIdentifier())
+        if not event_data_stream_identifier:
+          continue
+
+        event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
+            'event_data_stream', event_data_stream_identifier)
+        if not event_data_stream or not event_data_stream.path_spec:
+          continue
+
+        modification_time = self._GetModificationTimeString(
+            getattr(event_data, 'modification_time', None))
+
+        self._connection.execute(self._UPDATE_QUERY, (
+            getattr(event_data, 'file_size', None), modification_time,
+            event_data_stream.path_spec.comparable))
+
+    finally:
+      self._connection.execute('COMMIT')
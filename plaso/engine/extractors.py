@@ -299,6 +299,43 @@ class EventDataExtractor(object):
           parser_mediator, self._usnjrnl_parser, file_entry,
           file_object=file_object)
 
+  def ParseDataRange(
+      self, parser_mediator, file_entry, file_object, data_range_file_object):
+    """Parses a data range of a text log file with the text log parser.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry of the text log file.
+      file_object (dfvfs.FileIO): file-like object of the text log file.
+      data_range_file_object (dfvfs.FileIO): file-like object of the data
+          range of the text log file.
+    """
+    text_parser = self._parsers.get('text', None)
+    if not text_parser:
+      return
+
+    parser_mediator.ClearParserChain()
+
+    try:
+      text_parser.ParseDataRange(
+          parser_mediator, file_object, data_range_file_object)
+
+    # We catch IOError so we can determine the parser that generated the error.
+    except (IOError, dfvfs_errors.BackEndError) as exception:
+      display_name = parser_mediator.GetDisplayName(file_entry=file_entry)
+      logger.warning(
+          '{0:s} unable to parse data range of file: {1:s} with error: '
+          '{2!s}'.format(text_parser.NAME, display_name, exception))
+
+    except errors.WrongParser as exception:
+      display_name = parser_mediator.GetDisplayName(file_entry=file_entry)
+      logger.debug(
+          '{0:s} unable to parse data range of file: {1:s} with error: '
+          '{2!s}'.format(text_parser.NAME, display_name, exception))
+
+    parser_mediator.SampleMemoryUsage(text_parser.NAME)
+
   def ParseFileEntryMetadata(self, parser_mediator, file_entry):
     """Parses the file entry metadata such as file system data.
 
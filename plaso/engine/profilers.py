@@ -254,16 +254,25 @@ class TasksProfiler(SampleFileProfiler):
 
   _FILENAME_PREFIX = 'tasks'
 
-  _FILE_HEADER = 'Time\tIdentifier\tStatus\n'
+  _FILE_HEADER = 'Time\tIdentifier\tStatus\tFile size\n'
 
   def Sample(self, task, status):
     """Takes a sample of the status of a task for profiling.
 
+    The file size of the task, or -1 if not known, is included so that
+    the order in which tasks of different sizes are processed can be
+    evaluated.
+
     Args:
       task (Task): a task.
       status (str): status.
     """
     sample_time = time.time()
-    sample = '{0:f}\t{1:s}\t{2:s}\n'.format(
-        sample_time, task.identifier, status)
+
+    file_size = getattr(task, 'file_size', None)
+    if file_size is None:
+      file_size = -1
+
+    sample = '{0:f}\t{1:s}\t{2:s}\t{3:d}\n'.format(
+        sample_time, task.identifier, status, file_size)
     self._WritesString(sample)
@@ -398,6 +398,19 @@ class EventDataTimeliner(object):
 
       self.number_of_produced_events += 1
 
+  def Reset(self):
+    """Resets the state that is specific to a storage writer.
+
+    The base years are cached per event data stream identifier, which is only
+    unique within a single storage writer. The timeliner must be reset before
+    it is used to generate events for another storage writer, such as
+    the storage writer of another task.
+    """
+    self._base_years = {}
+
+    self.number_of_produced_events = 0
+    self.parsers_counter = collections.Counter()
+
   def SetPreferredTimeZone(self, time_zone_string):
     """Sets the preferred time zone for zone-less date and time values.
 
@@ -17,6 +17,7 @@ from dfvfs.resolver import resolver as path_spec_resolver
 
 from plaso.analyzers import hashing_analyzer
 from plaso.analyzers import manager as analyzers_manager
+from plaso.analyzers.hashers import manager as hashers_manager
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.engine import extractors
@@ -73,6 +74,10 @@ class EventExtractionWorker(object):
         'Extracting', 'Hashing'.
   """
 
+  # Maximum number of bytes of data that is passed at once to incremental
+  # analyzers, which bounds the amount of data read into memory per file.
+  _INCREMENTAL_ANALYZER_BLOCK_SIZE = 4 * 1024 * 1024
+
   # NTFS metadata files that need special handling.
   _METADATA_FILE_LOCATIONS_NTFS = frozenset([
       '\\$AttrDef',
@@ -151,6 +156,8 @@ class EventExtractionWorker(object):
     self._analyzers_profiler = None
     self._achive_type_scanner = self._CreateArchiveTypeScanner([])
     self._archive_types = []
+    self._content_hash_cache = None
+    self._extracted_file_index = None
     self._event_data_extractor = extractors.EventDataExtractor(
         force_parser=force_parser,
         parser_filter_expression=parser_filter_expression)
@@ -159,6 +166,7 @@ class EventExtractionWorker(object):
     self._path_spec_extractor = extractors.PathSpecExtractor()
     self._process_compressed_streams = None
     self._processing_profiler = None
+    self._task_identifier = None
 
     self.last_activity_timestamp = 0.0
     self.processing_status = definitions.STATUS_INDICATOR_IDLE
@@ -197,7 +205,13 @@ class EventExtractionWorker(object):
             'Unable to retrieve file-like object for file entry: '
             '{0:s}.').format(display_name))
 
-      self._AnalyzeFileObject(file_object, display_name, event_data_stream)
+      file_path = None
+      if (file_entry.type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS and
+          not data_stream_name):
+        file_path = getattr(file_entry.path_spec, 'location', None)
+
+      self._AnalyzeFileObject(
+          file_object, display_name, event_data_stream, file_path=file_path)
 
     finally:
       if self._processing_profiler:
@@ -206,7 +220,8 @@ class EventExtractionWorker(object):
     logger.debug('[AnalyzeDataStream] completed analyzing file: {0:s}'.format(
         display_name))
 
-  def _AnalyzeFileObject(self, file_object, display_name, event_data_stream):
+  def _AnalyzeFileObject(
+      self, file_object, display_name, event_data_stream, file_path=None):
     """Processes a file-like object with analyzers.
 
     Args:
@@ -215,10 +230,9 @@ class EventExtractionWorker(object):
           currently being analyzed.
       event_data_stream (EventDataStream): event data stream attribute
            container.
+      file_path (Optional[str]): path of the file on the operating system,
+          which is passed to analyzers that can analyze a file by path.
     """
-    maximum_read_size = max(
-        analyzer_object.SIZE_LIMIT for analyzer_object in self._analyzers)
-
     hashers_only = True
     for analyzer_object in self._analyzers:
       if not isinstance(analyzer_object, hashing_analyzer.HashingAnalyzer):
@@ -231,14 +245,47 @@ class EventExtractionWorker(object):
         file_size > self._hasher_file_size_limit):
       return
 
-    file_object.seek(0, os.SEEK_SET)
+    data_analyzers = self._analyzers
+    if file_path:
+      data_analyzers = []
+      for analyzer_object in self._analyzers:
+        if self._abort:
+          break
+
+        self.processing_status = analyzer_object.PROCESSING_STATUS_HINT
+
+        if self._analyzers_profiler:
+          self._analyzers_profiler.StartTiming(analyzer_object.NAME)
+
+        try:
+          file_analyzed = analyzer_object.AnalyzeFile(file_path)
+        finally:
+          if self._analyzers_profiler:
+            self._analyzers_profiler.StopTiming(analyzer_object.NAME)
+
+        if not file_analyzed:
+          data_analyzers.append(analyzer_object)
+
+        self.last_activity_timestamp = time.time()
+
+    data = None
+    if data_analyzers:
+      # Non-incremental analyzers need all the data up to their size limit
+      # at once.
+      maximum_read_size = self._INCREMENTAL_ANALYZER_BLOCK_SIZE
+      for analyzer_object in data_analyzers:
+        if not analyzer_object.INCREMENTAL_ANALYZER:
+          maximum_read_size = max(
+              maximum_read_size, analyzer_object.SIZE_LIMIT)
+
+      file_object.seek(0, os.SEEK_SET)
+      data = file_object.read(maximum_read_size)
 
-    data = file_object.read(maximum_read_size)
     while data:
       if self._abort:
         break
 
-      for analyzer_object in self._analyzers:
+      for analyzer_object in data_analyzers:
         if self._abort:
           break
 
@@ -704,6 +751,61 @@ class EventExtractionWorker(object):
 
         self.last_activity_timestamp = time.time()
 
+  def _ProcessDataRange(self, parser_mediator, file_entry):
+    """Processes a data range of a text log file.
+
+    Data ranges are produced by the text log parser when it splits a large
+    text log file, so that the data ranges can be parsed by multiple workers.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_entry (dfvfs.FileEntry): file entry of the data range.
+    """
+    path_spec = file_entry.path_spec.parent
+
+    parent_file_entry = path_spec_resolver.Resolver.OpenFileEntry(
+        path_spec, resolver_context=parser_mediator.resolver_context)
+    if not parent_file_entry:
+      parser_mediator.ProduceExtractionWarning(
+          'unable to open file entry of data range', path_spec=path_spec)
+      return
+
+    data_stream_name = getattr(path_spec, 'data_stream', None) or ''
+
+    # Events of the data range are attributed to the text log file.
+    parser_mediator.SetFileEntry(parent_file_entry)
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = path_spec
+
+    parser_mediator.ProduceEventDataStream(event_data_stream)
+
+    file_object = parent_file_entry.GetFileObject(
+        data_stream_name=data_stream_name)
+    data_range_file_object = file_entry.GetFileObject()
+    if not file_object or not data_range_file_object:
+      parser_mediator.ProduceExtractionWarning(
+          'unable to open file object of data range',
+          path_spec=file_entry.path_spec)
+      return
+
+    self.processing_status = definitions.STATUS_INDICATOR_EXTRACTING
+
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('extracting')
+
+    self._event_data_extractor.ParseDataRange(
+        parser_mediator, parent_file_entry, file_object,
+        data_range_file_object)
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('extracting')
+
+    self.processing_status = definitions.STATUS_INDICATOR_RUNNING
+
+    self.last_activity_timestamp = time.time()
+
   def _ProcessDirectory(self, parser_mediator, file_entry):
     """Processes a directory file entry.
 
@@ -739,8 +841,12 @@ class EventExtractionWorker(object):
         if file_entry.IsRoot() and sub_file_entry.name == '$OrphanFiles':
           continue
 
+      file_size = None
+      if sub_file_entry.entry_type == dfvfs_definitions.FILE_ENTRY_TYPE_FILE:
+        file_size = sub_file_entry.size
+
       event_source = event_sources.FileEntryEventSource(
-          file_entry_type=sub_file_entry.entry_type,
+          file_entry_type=sub_file_entry.entry_type, file_size=file_size,
           path_spec=sub_file_entry.path_spec)
 
       parser_mediator.ProduceEventSource(event_source)
@@ -767,6 +873,12 @@ class EventExtractionWorker(object):
     if self._IsMetadataFile(file_entry):
       self._ProcessMetadataFile(parser_mediator, file_entry)
 
+    elif (self._extracted_file_index and
+          self._extracted_file_index.HasUnchangedFileEntry(file_entry)):
+      logger.debug((
+          '[ProcessFileEntry] Skipping file entry: {0:s} that has not changed '
+          'since it was previously extracted.').format(display_name))
+
     else:
       file_entry_processed = False
       for data_stream in file_entry.data_streams:
@@ -844,6 +956,35 @@ class EventExtractionWorker(object):
       self.processing_status = definitions.STATUS_INDICATOR_IDLE
       return
 
+    # The content of a data stream with the same content hash as a previously
+    # extracted data stream is not extracted again. The event data stream,
+    # which contains the content hash, and the file entry metadata are still
+    # extracted. The content hash is claimed for the current task and is only
+    # skipped by other tasks after the results of the task have been merged.
+    sha256_hash = getattr(event_data_stream, 'sha256_hash', None)
+    if (self._content_hash_cache and sha256_hash and
+        not self._content_hash_cache.AddContentHash(
+            sha256_hash, task_identifier=self._task_identifier)):
+      display_name = parser_mediator.GetDisplayName()
+      logger.debug((
+          'Skipping content extraction of: {0:s} with duplicate content hash: '
+          '{1:s}').format(display_name, sha256_hash))
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
+
+    # The content of a data stream that was previously extracted with the same
+    # content hash is not extracted again. The file entry metadata is still
+    # extracted since it has changed.
+    if (self._extracted_file_index and
+        self._extracted_file_index.HasUnchangedContent(
+            event_data_stream.path_spec, sha256_hash)):
+      display_name = parser_mediator.GetDisplayName()
+      logger.debug((
+          'Skipping content extraction of: {0:s} with unchanged content hash: '
+          '{1:s}').format(display_name, sha256_hash))
+      self.processing_status = definitions.STATUS_INDICATOR_IDLE
+      return
+
     # TODO: merge with previous deepcopy
     path_spec = copy.deepcopy(file_entry.path_spec)
     if data_stream and not data_stream.IsDefault():
@@ -954,12 +1095,14 @@ class EventExtractionWorker(object):
     self._achive_type_scanner = self._CreateArchiveTypeScanner(
         self._archive_types)
 
-  def _SetHashers(self, hasher_names_string):
+  def _SetHashers(self, hasher_names_string, number_of_threads=0):
     """Sets the hasher names.
 
     Args:
       hasher_names_string (str): comma separated names of the hashers
           to enable, where 'none' disables the hashing analyzer.
+      number_of_threads (Optional[int]): number of threads to run the hashers
+          in parallel, where 0 represents the hashers are run sequentially.
     """
     if not hasher_names_string or hasher_names_string == 'none':
       return
@@ -967,6 +1110,7 @@ class EventExtractionWorker(object):
     analyzer_object = analyzers_manager.AnalyzersManager.GetAnalyzerInstance(
         'hashing')
     analyzer_object.SetHasherNames(hasher_names_string)
+    analyzer_object.SetNumberOfThreads(number_of_threads)
     self._analyzers.append(analyzer_object)
 
   def _SetYaraRules(self, yara_rules_string):
@@ -983,6 +1127,11 @@ class EventExtractionWorker(object):
     analyzer_object.SetRules(yara_rules_string)
     self._analyzers.append(analyzer_object)
 
+  def Close(self):
+    """Closes the analyzers."""
+    for analyzer_object in self._analyzers:
+      analyzer_object.Close()
+
   def GetAnalyzerNames(self):
     """Gets the names of the active analyzers.
 
@@ -1005,10 +1154,15 @@ class EventExtractionWorker(object):
     parser_mediator.SetFileEntry(file_entry)
 
     try:
-      if file_entry.IsDirectory():
-        self._ProcessDirectory(parser_mediator, file_entry)
+      if file_entry.type_indicator == (
+          dfvfs_definitions.TYPE_INDICATOR_DATA_RANGE):
+        self._ProcessDataRange(parser_mediator, file_entry)
 
-      self._ProcessFileEntry(parser_mediator, file_entry)
+      else:
+        if file_entry.IsDirectory():
+          self._ProcessDirectory(parser_mediator, file_entry)
+
+        self._ProcessFileEntry(parser_mediator, file_entry)
 
     finally:
       parser_mediator.ResetFileEntry()
@@ -1036,6 +1190,26 @@ class EventExtractionWorker(object):
     self.ProcessFileEntry(parser_mediator, file_entry)
 
   # TODO: move the functionality of this method into the constructor.
+  def SetContentHashCache(self, content_hash_cache):
+    """Sets the content hash cache.
+
+    Args:
+      content_hash_cache (ContentHashCache): cache of content hashes of data
+          streams that have been extracted, where None represents content of
+          duplicate data streams should be extracted.
+    """
+    self._content_hash_cache = content_hash_cache
+
+  def SetExtractedFileIndex(self, extracted_file_index):
+    """Sets the index of previously extracted file entries.
+
+    Args:
+      extracted_file_index (ExtractedFileIndex): index of file entries that
+          have been extracted in a previous session, where None represents
+          unchanged file entries should be extracted again.
+    """
+    self._extracted_file_index = extracted_file_index
+
   def SetExtractionConfiguration(self, configuration):
     """Sets the extraction configuration settings.
 
@@ -1044,7 +1218,19 @@ class EventExtractionWorker(object):
     """
     self._SetArchiveTypes(configuration.archive_types_string)
     self._hasher_file_size_limit = configuration.hasher_file_size_limit
-    self._SetHashers(configuration.hasher_names_string)
+
+    hasher_names_string = configuration.hasher_names_string
+    if configuration.skip_duplicate_data_streams:
+      # The SHA-256 hasher is required to detect duplicate data streams.
+      hasher_names = hashers_manager.HashersManager.GetHasherNamesFromString(
+          hasher_names_string)
+      if 'sha256' not in hasher_names:
+        hasher_names.append('sha256')
+        hasher_names_string = ','.join(hasher_names)
+
+    self._SetHashers(
+        hasher_names_string,
+        number_of_threads=configuration.number_of_hasher_threads)
     self._process_compressed_streams = configuration.process_compressed_streams
     self._SetYaraRules(configuration.yara_rules_string)
 
@@ -1064,6 +1250,15 @@ class EventExtractionWorker(object):
     """
     self._processing_profiler = processing_profiler
 
+  def SetTaskIdentifier(self, task_identifier):
+    """Sets the identifier of the task being processed.
+
+    Args:
+      task_identifier (str): identifier of the task being processed, where None
+          represents the data streams are not processed as part of a task.
+    """
+    self._task_identifier = task_identifier
+
   def SignalAbort(self):
     """Signals the extraction worker to abort."""
     self._abort = True
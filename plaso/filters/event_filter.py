@@ -2,21 +2,52 @@
 """The event filter."""
 
 from plaso.filters import expression_parser
+from plaso.filters import filters
 
 
 class EventObjectFilter(object):
-  """Event filter."""
+  """Event filter.
+
+  Attributes:
+    storage_filter_expression (str): expression that the storage can use to
+        only read the events that match part of the filter or None if no part
+        of the filter can be evaluated by the storage.
+  """
 
   def __init__(self):
     """Initializes an event filter."""
     super(EventObjectFilter, self).__init__()
     self._event_filter = None
     self._filter_expression = None
+    self._match_function = None
+    self._remaining_match_function = None
+
+    self.storage_filter_expression = None
+
+  def _GetConjunctions(self, filter_object):
+    """Retrieves the filters that are combined with a boolean AND.
+
+    Args:
+      filter_object (Filter): filter.
+
+    Returns:
+      list[Filter]: filters that all need to match.
+    """
+    if not isinstance(filter_object, filters.AndFilter):
+      return [filter_object]
+
+    conjunctions = []
+    for sub_filter in filter_object.args:
+      conjunctions.extend(self._GetConjunctions(sub_filter))
+
+    return conjunctions
 
   def CompileFilter(self, filter_expression):
     """Compiles the filter expression.
 
-    The filter expression contains an object filter expression.
+    The filter expression contains an object filter expression. The parts of
+    the filter that are combined with a boolean AND and can be evaluated by
+    the storage are combined into the storage filter expression.
 
     Args:
       filter_expression (str): filter expression.
@@ -29,8 +60,35 @@ class EventObjectFilter(object):
 
     self._event_filter = expression.Compile()
     self._filter_expression = filter_expression
+    self._match_function = self._event_filter.CompileMatchFunction()
+
+    remaining_filters = []
+    storage_filter_expressions = []
+    for filter_object in self._GetConjunctions(self._event_filter):
+      storage_filter_expression = filter_object.GetStorageFilterExpression()
+      if storage_filter_expression:
+        storage_filter_expressions.append(
+            '({0:s})'.format(storage_filter_expression))
+      else:
+        remaining_filters.append(filter_object)
+
+    if not storage_filter_expressions:
+      self._remaining_match_function = self._match_function
+      self.storage_filter_expression = None
 
-  def Match(self, event, event_data, event_data_stream, event_tag):
+    else:
+      if remaining_filters:
+        remaining_filter = filters.AndFilter(arguments=remaining_filters)
+        self._remaining_match_function = (
+            remaining_filter.CompileMatchFunction())
+      else:
+        self._remaining_match_function = None
+
+      self.storage_filter_expression = ' and '.join(storage_filter_expressions)
+
+  def Match(
+      self, event, event_data, event_data_stream, event_tag,
+      storage_filter_applied=False):
     """Determines if an event matches the filter.
 
     Args:
@@ -38,12 +96,19 @@ class EventObjectFilter(object):
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
       event_tag (EventTag): event tag.
+      storage_filter_applied (Optional[bool]): True if the event was read
+          from a storage that applied the storage filter expression, in which
+          case only the remaining part of the filter is evaluated.
 
     Returns:
       bool: True if the event matches the filter, False otherwise.
     """
-    if not self._event_filter:
+    if storage_filter_applied:
+      match_function = self._remaining_match_function
+    else:
+      match_function = self._match_function
+
+    if not match_function:
       return True
 
-    return self._event_filter.Matches(
-        event, event_data, event_data_stream, event_tag)
+    return match_function(event, event_data, event_data_stream, event_tag)
@@ -3,6 +3,8 @@
 
 import abc
 import codecs
+import math
+import operator
 import re
 
 from dfdatetime import interface as dfdatetime_interface
@@ -10,6 +12,7 @@ from dfdatetime import interface as dfdatetime_interface
 from plaso.containers import artifacts
 from plaso.filters import logger
 from plaso.filters import value_types
+from plaso.lib import definitions
 from plaso.lib import errors
 
 
@@ -53,6 +56,58 @@ class Filter(object):
       return codecs.decode(value, 'utf8', 'ignore')
     return value
 
+  def _GetStorageFilterExpression(self, sub_filters, boolean_operator):
+    """Retrieves a storage filter expression that combines sub filters.
+
+    Args:
+      sub_filters (list[Filter]): sub filters.
+      boolean_operator (str): Python boolean operator, such as "and" or "or",
+          used to combine the storage filter expressions of the sub filters.
+
+    Returns:
+      str: storage filter expression or None if one of the sub filters cannot
+          be evaluated by the storage.
+    """
+    if not sub_filters:
+      return None
+
+    expressions = []
+    for sub_filter in sub_filters:
+      expression = sub_filter.GetStorageFilterExpression()
+      if not expression:
+        return None
+
+      expressions.append('({0:s})'.format(expression))
+
+    separator = ' {0:s} '.format(boolean_operator)
+    return separator.join(expressions)
+
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    The match function is compiled once and can be used instead of Matches()
+    to match many events against the filter.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns True if they match the
+          filter, False otherwise.
+    """
+    return self.Matches
+
+  def GetStorageFilterExpression(self):
+    """Retrieves an expression that the storage can use to filter events.
+
+    The storage filter expression is a Python expression on the attributes
+    of the event attribute container, which allows the storage to only read
+    the events that match the filter.
+
+    Returns:
+      str: storage filter expression or None if the filter cannot be
+          evaluated by the storage.
+    """
+    return None
+
   @abc.abstractmethod
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
@@ -74,6 +129,50 @@ class AndFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def _CompileMatchFunctions(self):
+    """Compiles the sub filters into match functions.
+
+    Sub filters that are AND filters themselves are flattened.
+
+    Returns:
+      list[function]: match functions of the sub filters.
+    """
+    match_functions = []
+    for sub_filter in self.args:
+      if isinstance(sub_filter, AndFilter):
+        match_functions.extend(sub_filter._CompileMatchFunctions())  # pylint: disable=protected-access
+      else:
+        match_functions.append(sub_filter.CompileMatchFunction())
+
+    return match_functions
+
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns True if they match the
+          filter, False otherwise.
+    """
+    match_functions = tuple(self._CompileMatchFunctions())
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if not match_function(event, event_data, event_data_stream, event_tag):
+          return False
+      return True
+
+    return _Matches
+
+  def GetStorageFilterExpression(self):
+    """Retrieves an expression that the storage can use to filter events.
+
+    Returns:
+      str: storage filter expression or None if the filter cannot be
+          evaluated by the storage.
+    """
+    return self._GetStorageFilterExpression(self.args, 'and')
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -100,6 +199,53 @@ class OrFilter(Filter):
   Note that if no conditions are passed, all objects will pass.
   """
 
+  def _CompileMatchFunctions(self):
+    """Compiles the sub filters into match functions.
+
+    Sub filters that are OR filters themselves are flattened.
+
+    Returns:
+      list[function]: match functions of the sub filters.
+    """
+    match_functions = []
+    for sub_filter in self.args:
+      if isinstance(sub_filter, OrFilter) and sub_filter.args:
+        match_functions.extend(sub_filter._CompileMatchFunctions())  # pylint: disable=protected-access
+      else:
+        match_functions.append(sub_filter.CompileMatchFunction())
+
+    return match_functions
+
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns True if they match the
+          filter, False otherwise.
+    """
+    if not self.args:
+      return IdentityFilter().CompileMatchFunction()
+
+    match_functions = tuple(self._CompileMatchFunctions())
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      for match_function in match_functions:
+        if match_function(event, event_data, event_data_stream, event_tag):
+          return True
+      return False
+
+    return _Matches
+
+  def GetStorageFilterExpression(self):
+    """Retrieves an expression that the storage can use to filter events.
+
+    Returns:
+      str: storage filter expression or None if the filter cannot be
+          evaluated by the storage.
+    """
+    return self._GetStorageFilterExpression(self.args, 'or')
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -144,6 +290,19 @@ class Operator(Filter):
 class IdentityFilter(Operator):
   """A filter which always evaluates to True."""
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and always returns True.
+    """
+    # pylint: disable=unused-argument
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      return True
+
+    return _Matches
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -204,6 +363,20 @@ class BinaryOperator(Operator):
 class GenericBinaryOperator(BinaryOperator):
   """Shared functionality for common binary operators."""
 
+  # Function that compares the event value with the filter value, such as
+  # operator.eq, which allows timestamps to be compared as integers.
+  _COMPARE_FUNCTION = None
+
+  # Python comparison operators of the compare functions, which are used in
+  # storage filter expressions.
+  _COMPARE_FUNCTION_OPERATORS = {
+      operator.eq: '==',
+      operator.ge: '>=',
+      operator.gt: '>',
+      operator.le: '<=',
+      operator.lt: '<',
+      operator.ne: '!='}
+
   # Attributes that are stored in the event attribute container.
   _EVENT_ATTRIBUTE_NAMES = frozenset(['timestamp', 'timestamp_desc'])
 
@@ -231,6 +404,160 @@ class GenericBinaryOperator(BinaryOperator):
       bool: True if the values match according to the operator, False otherwise.
     """
 
+  def _CompileCompareFunction(self):
+    """Compiles the function that compares an event value with the filter value.
+
+    Returns:
+      function: function that takes the value retrieved from the event as
+          argument and returns True if the value matches the filter value
+          according to the operator, False otherwise.
+    """
+    compare_function = self._COMPARE_FUNCTION or self._CompareValue
+    filter_value = self.right_operand
+
+    def _CompareValue(event_value):
+      return compare_function(event_value, filter_value)
+
+    return _CompareValue
+
+  def _CompileGetValueFunction(self, attribute_name):
+    """Compiles the function that retrieves the value of an attribute.
+
+    The source of the attribute value, such as the event, event data or event
+    tag, is determined once instead of for every event.
+
+    Args:
+      attribute_name (str): name of the attribute to retrieve the value from.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns the attribute value or None
+          if not available.
+    """
+    # pylint: disable=unused-argument
+    if attribute_name in self._UNSUPPORTED_ATTRIBUTE_NAMES:
+      logger.warning(
+          'Expansion of {0:s} in event filter no longer supported'.format(
+              attribute_name))
+
+    if attribute_name in self._EVENT_ATTRIBUTE_NAMES:
+      if attribute_name != 'timestamp':
+        def _GetEventValue(event, event_data, event_data_stream, event_tag):
+          return getattr(event, attribute_name, None)
+
+        return _GetEventValue
+
+      def _GetTimestampValue(event, event_data, event_data_stream, event_tag):
+        attribute_value = getattr(event, 'timestamp', None)
+        if attribute_value is not None and not isinstance(attribute_value, (
+            dfdatetime_interface.DateTimeValues,
+            value_types.DateTimeValueType)):
+          attribute_value = value_types.DateTimeValueType(attribute_value)
+        return attribute_value
+
+      return _GetTimestampValue
+
+    if attribute_name.startswith('_'):
+      # Protected attribute names are not stored in the attribute container
+      # dictionary, hence fall back to the uncompiled implementation.
+      def _GetValue(event, event_data, event_data_stream, event_tag):
+        return self._GetValue(
+            attribute_name, event, event_data, event_data_stream, event_tag)
+
+      return _GetValue
+
+    if attribute_name == 'tag':
+      def _GetTagValue(event, event_data, event_data_stream, event_tag):
+        if event_data_stream and 'tag' in event_data_stream.__dict__:
+          return getattr(event_data_stream, 'tag', None)
+        return getattr(event_tag, 'labels', None)
+
+      return _GetTagValue
+
+    event_data_attribute_name = attribute_name
+    if attribute_name == 'parser':
+      logger.warning(
+          'Expansion of {0:s} in event filter is deprecated'.format(
+              attribute_name))
+      event_data_attribute_name = '_parser_chain'
+
+    def _GetEventDataValue(event, event_data, event_data_stream, event_tag):
+      if event_data_stream and attribute_name in event_data_stream.__dict__:
+        return getattr(event_data_stream, attribute_name, None)
+      return getattr(event_data, event_data_attribute_name, None)
+
+    return _GetEventDataValue
+
+  def _CompileTimestampMatchFunction(self, match_function):
+    """Compiles a match function that compares timestamps as integers.
+
+    Args:
+      match_function (function): match function used for timestamps that are
+          not stored as integers.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns True if they match the
+          filter, False otherwise, or None if the filter value cannot be
+          compared as an integer.
+    """
+    # pylint: disable=protected-access
+    normalized_timestamp = self.right_operand._GetNormalizedTimestamp()
+    if normalized_timestamp is None:
+      return None
+
+    bool_value = self._bool_value
+    compare_function = self._COMPARE_FUNCTION
+    # Note that the filter timestamp is a decimal.Decimal, which allows for
+    # an exact comparison with an integer timestamp in microseconds.
+    filter_timestamp = (
+        normalized_timestamp * definitions.MICROSECONDS_PER_SECOND)
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      timestamp = getattr(event, 'timestamp', None)
+      if not isinstance(timestamp, int):
+        return match_function(event, event_data, event_data_stream, event_tag)
+
+      if compare_function(timestamp, filter_timestamp):
+        return bool_value
+      return not bool_value
+
+    return _Matches
+
+  def _GetTimestampStorageFilterExpression(self):
+    """Retrieves a storage filter expression that compares the timestamp.
+
+    Returns:
+      str: storage filter expression or None if the filter value cannot be
+          compared as an integer timestamp.
+    """
+    if not isinstance(self.right_operand, dfdatetime_interface.DateTimeValues):
+      return None
+
+    # pylint: disable=protected-access
+    normalized_timestamp = self.right_operand._GetNormalizedTimestamp()
+    if normalized_timestamp is None:
+      return None
+
+    filter_timestamp = (
+        normalized_timestamp * definitions.MICROSECONDS_PER_SECOND)
+
+    # Note that the event timestamps are stored as integers in microseconds,
+    # hence a filter timestamp with a fraction of a microsecond is rounded
+    # such that the comparison gives the same result.
+    if self._COMPARE_FUNCTION in (operator.ge, operator.lt):
+      filter_timestamp = math.ceil(filter_timestamp)
+
+    elif self._COMPARE_FUNCTION in (operator.gt, operator.le):
+      filter_timestamp = math.floor(filter_timestamp)
+
+    elif filter_timestamp != math.floor(filter_timestamp):
+      return None
+
+    return 'timestamp {0:s} {1:d}'.format(
+        self._COMPARE_FUNCTION_OPERATORS[self._COMPARE_FUNCTION],
+        int(filter_timestamp))
+
   def _GetValue(
       self, attribute_name, event, event_data, event_data_stream, event_tag):
     """Retrieves the value of a specific event, data or tag attribute.
@@ -287,6 +614,59 @@ class GenericBinaryOperator(BinaryOperator):
     logger.debug('Negative matching.')
     self._bool_value = not self._bool_value
 
+  def CompileMatchFunction(self):
+    """Compiles the filter into a match function.
+
+    Returns:
+      function: function that takes an event, event data, event data stream
+          and event tag as arguments and returns True if they match the
+          filter, False otherwise.
+    """
+    bool_value = self._bool_value
+    compare_function = self._CompileCompareFunction()
+    get_value_function = self._CompileGetValueFunction(self.left_operand)
+
+    def _Matches(event, event_data, event_data_stream, event_tag):
+      value = get_value_function(
+          event, event_data, event_data_stream, event_tag)
+
+      if value and compare_function(value):
+        return bool_value
+      return not bool_value
+
+    if (self.left_operand == 'timestamp' and self._COMPARE_FUNCTION and
+        isinstance(self.right_operand, dfdatetime_interface.DateTimeValues)):
+      return self._CompileTimestampMatchFunction(_Matches) or _Matches
+
+    return _Matches
+
+  def GetStorageFilterExpression(self):
+    """Retrieves an expression that the storage can use to filter events.
+
+    Only comparisons of the timestamp and timestamp description, which are
+    stored in the event attribute container, are supported.
+
+    Returns:
+      str: storage filter expression or None if the filter cannot be
+          evaluated by the storage.
+    """
+    # Note that a negated filter also matches events without the attribute,
+    # which is not supported by the storage filter expression.
+    if not self._bool_value or not self._COMPARE_FUNCTION:
+      return None
+
+    if self.left_operand == 'timestamp':
+      return self._GetTimestampStorageFilterExpression()
+
+    # Note that an event with an empty timestamp description does not match
+    # the filter, hence only equality with a non-empty string is supported.
+    if (self.left_operand == 'timestamp_desc' and
+        self._COMPARE_FUNCTION == operator.eq and
+        isinstance(self.right_operand, str) and self.right_operand):
+      return 'timestamp_desc == {0!r}'.format(self.right_operand)
+
+    return None
+
   def Matches(self, event, event_data, event_data_stream, event_tag):
     """Determines if the event, data and tag match the filter.
 
@@ -310,6 +690,8 @@ class GenericBinaryOperator(BinaryOperator):
 class EqualsOperator(GenericBinaryOperator):
   """Equals (==) operator."""
 
+  _COMPARE_FUNCTION = operator.eq
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are equal.
 
@@ -326,6 +708,8 @@ class EqualsOperator(GenericBinaryOperator):
 class NotEqualsOperator(GenericBinaryOperator):
   """Not equals (!=) operator."""
 
+  _COMPARE_FUNCTION = operator.ne
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if two values are not equal.
 
@@ -342,6 +726,8 @@ class NotEqualsOperator(GenericBinaryOperator):
 class LessThanOperator(GenericBinaryOperator):
   """Less than (<) operator."""
 
+  _COMPARE_FUNCTION = operator.lt
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than the second.
 
@@ -358,6 +744,8 @@ class LessThanOperator(GenericBinaryOperator):
 class LessEqualOperator(GenericBinaryOperator):
   """Less than or equals (<=) operator."""
 
+  _COMPARE_FUNCTION = operator.le
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is less than or equals the second.
 
@@ -375,6 +763,8 @@ class LessEqualOperator(GenericBinaryOperator):
 class GreaterThanOperator(GenericBinaryOperator):
   """Greater than (>) operator."""
 
+  _COMPARE_FUNCTION = operator.gt
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than the second.
 
@@ -391,6 +781,8 @@ class GreaterThanOperator(GenericBinaryOperator):
 class GreaterEqualOperator(GenericBinaryOperator):
   """Greater than or equals (>=) operator."""
 
+  _COMPARE_FUNCTION = operator.ge
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the event value is greater than or equals the second.
 
@@ -408,6 +800,31 @@ class GreaterEqualOperator(GenericBinaryOperator):
 class Contains(GenericBinaryOperator):
   """Operator to determine if a value contains another value."""
 
+  def _CompileCompareFunction(self):
+    """Compiles the function that compares an event value with the filter value.
+
+    Returns:
+      function: function that takes the value retrieved from the event as
+          argument and returns True if the value contains the filter value,
+          False otherwise.
+    """
+    filter_value = self.right_operand
+    if not isinstance(filter_value, str):
+      return super(Contains, self)._CompileCompareFunction()
+
+    lower_case_filter_value = filter_value.lower()
+
+    def _CompareValue(event_value):
+      try:
+        if isinstance(event_value, str):
+          return lower_case_filter_value in event_value.lower()
+
+        return filter_value in event_value
+      except (AttributeError, TypeError):
+        return False
+
+    return _CompareValue
+
   def _CompareValue(self, event_value, filter_value):
     """Compares if the second value is part of the first.
 
@@ -41,8 +41,11 @@ OPERATING_SYSTEM_FAMILIES = frozenset([
     OPERATING_SYSTEM_FAMILY_WINDOWS_NT])
 
 SERIALIZER_FORMAT_JSON = 'json'
+SERIALIZER_FORMAT_MSGPACK = 'msgpack'
 
-SERIALIZER_FORMATS = frozenset([SERIALIZER_FORMAT_JSON])
+SERIALIZER_FORMATS = frozenset([
+    SERIALIZER_FORMAT_JSON,
+    SERIALIZER_FORMAT_MSGPACK])
 
 STATUS_INDICATOR_ABORTED = 'aborted'
 STATUS_INDICATOR_ANALYZING = 'analyzing'
@@ -3,6 +3,7 @@
 
 import collections
 import os
+import pickle
 import time
 
 from plaso.containers import counts
@@ -33,6 +34,15 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   _CONTAINER_TYPE_ANALYSIS_REPORT = reports.AnalysisReport.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # Maximum number of events pushed onto the event queues as a single item.
+  _MAXIMUM_EVENTS_PER_BATCH = 500
+
+  # Maximum number of batches of events to queue on each end of an event
+  # queue. The ZeroMQ high-water mark counts items, not events, hence it is
+  # set so that an event queue buffers a similar number of events as before
+  # the events were batched.
+  _MAXIMUM_QUEUED_EVENTS_BATCHES = 2
+
   _PROCESS_JOIN_TIMEOUT = 5.0
 
   _QUEUE_TIMEOUT = 10 * 60
@@ -113,25 +123,24 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     logger.debug('Processing events.')
 
     filter_limit = getattr(event_filter, 'limit', None)
+    filter_limit_reached = False
 
-    for event in storage_writer.GetSortedEvents():
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_writer.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
+    storage_filter_expression = getattr(
+        event_filter, 'storage_filter_expression', None)
+    storage_filter_applied = bool(storage_filter_expression)
 
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
+    events_batch = []
+    number_of_events = 0
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_writer.GetEventTagByEventIdentifer(event_identifier)
+    for event, event_data, event_data_stream, event_tag in (
+        storage_writer.GetSortedJoinedEvents(
+            filter_expression=storage_filter_expression)):
+      number_of_events += 1
 
       if event_filter:
         filter_match = event_filter.Match(
-            event, event_data, event_data_stream, event_tag)
+            event, event_data, event_data_stream, event_tag,
+            storage_filter_applied=storage_filter_applied)
       else:
         filter_match = None
 
@@ -140,16 +149,27 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         number_of_filtered_events += 1
         continue
 
-      for event_queue in self._event_queues.values():
-        # TODO: Check for premature exit of analysis plugins.
-        event_queue.PushItem((event, event_data, event_data_stream))
+      events_batch.append((event, event_data, event_data_stream))
+      if len(events_batch) >= self._MAXIMUM_EVENTS_PER_BATCH:
+        self._PushEventsBatch(events_batch)
+        events_batch = []
 
       self._number_of_consumed_events += 1
 
       if (event_filter and filter_limit and
           filter_limit == self._number_of_consumed_events):
+        filter_limit_reached = True
         break
 
+    # The events that did not match the storage filter expression were not
+    # read and are counted as filtered events.
+    if storage_filter_applied and not filter_limit_reached:
+      number_of_filtered_events += (
+          storage_writer.GetNumberOfEvents() - number_of_events)
+
+    if events_batch:
+      self._PushEventsBatch(events_batch)
+
     logger.debug('Finished pushing events to analysis plugins.')
     # Signal that we have finished adding events.
     for event_queue in self._event_queues.values():
@@ -328,6 +348,24 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return number_of_containers
 
+  def _PushEventsBatch(self, events_batch):
+    """Pushes a batch of events onto the event queues.
+
+    The batch is serialized once and the resulting data is pushed onto the
+    event queue of every analysis process, which prevents the events from
+    being serialized for every analysis plugin.
+
+    Args:
+      events_batch (list[tuple[EventObject, EventData, EventDataStream]]):
+          events with their event data and event data stream.
+    """
+    serialized_events_batch = pickle.dumps(
+        events_batch, protocol=pickle.HIGHEST_PROTOCOL)
+
+    for event_queue in self._event_queues.values():
+      # TODO: Check for premature exit of analysis plugins.
+      event_queue.PushItem(serialized_events_batch)
+
   def _StartAnalysisProcesses(self, analysis_plugins):
     """Starts the analysis processes.
 
@@ -363,7 +401,8 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     queue_name = '{0:s} output event queue'.format(process_name)
     output_event_queue = zeromq_queue.ZeroMQPushBindQueue(
-        name=queue_name, timeout_seconds=self._QUEUE_TIMEOUT)
+        maximum_items=self._MAXIMUM_QUEUED_EVENTS_BATCHES, name=queue_name,
+        timeout_seconds=self._QUEUE_TIMEOUT)
     # Open the queue so it can bind to a random port, and we can get the
     # port number to use in the input queue.
     output_event_queue.Open()
@@ -372,7 +411,8 @@ class AnalysisMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     queue_name = '{0:s} input event queue'.format(process_name)
     input_event_queue = zeromq_queue.ZeroMQPullConnectQueue(
-        name=queue_name, delay_open=True, port=output_event_queue.port,
+        delay_open=True, maximum_items=self._MAXIMUM_QUEUED_EVENTS_BATCHES,
+        name=queue_name, port=output_event_queue.port,
         timeout_seconds=self._QUEUE_TIMEOUT)
 
     process = analysis_process.AnalysisProcess(
@@ -7,6 +7,7 @@ import logging
 import multiprocessing
 import os
 import re
+import tempfile
 import time
 import traceback
 
@@ -18,6 +19,7 @@ from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import warnings
+from plaso.engine import content_hash_cache
 from plaso.engine import extractors
 from plaso.engine import path_helper
 from plaso.engine import timeliner
@@ -34,7 +36,14 @@ from plaso.multi_process import zeromq_queue
 
 
 class _EventSourceHeap(object):
-  """Class that defines an event source heap."""
+  """Class that defines an event source heap.
+
+  Directories are popped first, since processing them produces more event
+  sources. Other event sources are popped in order of decreasing size, so
+  that the largest and likely most time consuming tasks are scheduled first
+  and do not hold up the end of the extraction (largest processing time
+  first). Event sources of the same size are popped in order of addition.
+  """
 
   def __init__(self, maximum_number_of_items=50000):
     """Initializes an event source heap.
@@ -55,6 +64,17 @@ class _EventSourceHeap(object):
     """
     return len(self._heap) >= self._maximum_number_of_items
 
+  def PeekEventSource(self):
+    """Retrieves the event source that would be popped next from the heap.
+
+    Returns:
+      EventSource: an event source or None on if no event source is available.
+    """
+    if not self._heap:
+      return None
+
+    return self._heap[0][-1]
+
   def PopEventSource(self):
     """Pops an event source from the heap.
 
@@ -62,7 +82,7 @@ class _EventSourceHeap(object):
       EventSource: an event source or None on if no event source is available.
     """
     try:
-      _, _, event_source = heapq.heappop(self._heap)
+      _, _, _, event_source = heapq.heappop(self._heap)
 
     except IndexError:
       return None
@@ -81,7 +101,11 @@ class _EventSourceHeap(object):
     else:
       weight = 100
 
-    heap_values = (weight, time.time(), event_source)
+    # Event sources of which the size is not known are popped after those
+    # of which the size is known.
+    file_size = getattr(event_source, 'file_size', None) or 0
+
+    heap_values = (weight, -file_size, time.time(), event_source)
     heapq.heappush(self._heap, heap_values)
 
 
@@ -93,11 +117,23 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
   * merge results returned by extraction worker processes.
   """
 
+  _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_SOURCE = event_sources.EventSource.CONTAINER_TYPE
+  _CONTAINER_TYPE_PARSER_COUNT = counts.ParserCount.CONTAINER_TYPE
   _CONTAINER_TYPE_YEAR_LESS_LOG_HELPER = events.YearLessLogHelper.CONTAINER_TYPE
 
+  # Maximum size, in bytes, of a file entry to be processed together with
+  # other small file entries in a single task.
+  _BATCH_MAXIMUM_FILE_SIZE = 64 * 1024
+
+  # Maximum number of path specifications of a single task.
+  _BATCH_MAXIMUM_NUMBER_OF_PATH_SPECS = 256
+
+  # Maximum total size, in bytes, of the file entries of a single task.
+  _BATCH_MAXIMUM_TOTAL_FILE_SIZE = 4 * 1024 * 1024
+
   # Maximum number of concurrent tasks.
   _MAXIMUM_NUMBER_OF_TASKS = 10000
 
@@ -164,6 +200,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       worker_timeout = definitions.DEFAULT_WORKER_TIMEOUT
 
     super(ExtractionMultiProcessEngine, self).__init__()
+    self._content_hash_cache = None
     self._enable_sigsegv_handler = False
     self._event_data_timeliner = None
     self._extraction_worker = None
@@ -188,9 +225,46 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._task_queue_port = None
     self._task_storage_format = None
     self._worker_memory_limit = worker_memory_limit
+    self._worker_timelining = False
     self._worker_timeout = worker_timeout
     self._system_configurations = None
 
+  def _BatchEventSources(self, task, event_source_heap):
+    """Adds small file entry event sources from the heap to a task.
+
+    Processing many small file entries in a single task reduces the overhead
+    of creating, merging and removing a task storage per file entry.
+
+    Args:
+      task (Task): task to process a single event source.
+      event_source_heap (_EventSourceHeap): event source heap.
+    """
+    if not self._IsSmallFileEventSource(task):
+      return
+
+    path_specs = [task.path_spec]
+    total_file_size = task.file_size
+
+    while len(path_specs) < self._BATCH_MAXIMUM_NUMBER_OF_PATH_SPECS:
+      event_source = event_source_heap.PeekEventSource()
+      if not event_source or not self._IsSmallFileEventSource(event_source):
+        break
+
+      if (total_file_size + event_source.file_size >
+          self._BATCH_MAXIMUM_TOTAL_FILE_SIZE):
+        break
+
+      event_source_heap.PopEventSource()
+      self._number_of_consumed_sources += 1
+
+      path_specs.append(event_source.path_spec)
+      total_file_size += event_source.file_size
+
+    if len(path_specs) > 1:
+      task.file_size = total_file_size
+      task.path_spec = None
+      task.path_specs = path_specs
+
   def _CheckExcludedPathSpec(self, file_system, path_spec):
     """Determines if the path specification should be excluded from extraction.
 
@@ -253,37 +327,25 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         if self._status_update_callback:
           self._status_update_callback(self._processing_status)
 
-  def _CreateTask(self, storage_writer, session_identifier, event_source):
+  def _CreateTask(self, session_identifier, event_source):
     """Creates a task to processes an event source.
 
+    The task is created without accessing the source. Determining if the
+    path specification of the event source should be excluded is left to
+    the worker, which opens the file entry to process it.
+
     Args:
-      storage_writer (StorageWriter): storage writer for a session storage.
       session_identifier (str): the identifier of the session the tasks are
           part of.
       event_source (EventSource): event source.
 
     Returns:
-      Task: task or None if no task could be created.
+      Task: task.
     """
-    file_entry = path_spec_resolver.Resolver.OpenFileEntry(
-        event_source.path_spec, resolver_context=self._resolver_context)
-    if file_entry is None:
-      self._ProduceExtractionWarning(
-          storage_writer, 'Unable to open file entry', event_source.path_spec)
-      return None
-
-    file_system = file_entry.GetFileSystem()
-
-    if self._CheckExcludedPathSpec(file_system, event_source.path_spec):
-      display_name = path_helper.PathHelper.GetDisplayNameForPathSpec(
-          event_source.path_spec)
-      logger.debug('Excluded from extraction: {0:s}.'.format(
-          display_name))
-      return None
-
     task = self._task_manager.CreateTask(
         session_identifier, storage_format=self._task_storage_format)
     task.file_entry_type = event_source.file_entry_type
+    task.file_size = event_source.file_size
     task.path_spec = event_source.path_spec
 
     return task
@@ -348,6 +410,22 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return path_spec_string
 
+  def _IsSmallFileEventSource(self, event_source):
+    """Determines if an event source or task references a small file entry.
+
+    Args:
+      event_source (EventSource|Task): event source or task.
+
+    Returns:
+      bool: True if the event source or task references a file entry of which
+          the size does not exceed the maximum file size of a batch.
+    """
+    if event_source.file_entry_type != dfvfs_definitions.FILE_ENTRY_TYPE_FILE:
+      return False
+
+    return (event_source.file_size is not None and
+            event_source.file_size <= self._BATCH_MAXIMUM_FILE_SIZE)
+
   def _MergeAttributeContainer(self, storage_writer, merge_helper, container):
     """Merges an attribute container from a task store into the storage writer.
 
@@ -388,6 +466,36 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
                 event_data_stream_lookup_key))
         return
 
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+      event_data_identifier = container.GetEventDataIdentifier()
+      event_data_lookup_key = event_data_identifier.CopyToString()
+
+      event_data_identifier = merge_helper.GetAttributeContainerIdentifier(
+          event_data_lookup_key)
+
+      if event_data_identifier:
+        container.SetEventDataIdentifier(event_data_identifier)
+      else:
+        identifier = container.GetIdentifier()
+        identifier_string = identifier.CopyToString()
+
+        # TODO: store this as a merge warning so this is preserved
+        # in the storage file.
+        logger.error((
+            'Unable to merge event attribute container: {0:s} since '
+            'corresponding event data: {1:s} could not be found.').format(
+                identifier_string, event_data_lookup_key))
+        return
+
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_PARSER_COUNT:
+      # The number of events per parser of the task is added to the counter
+      # that is stored when processing completes.
+      self._event_data_timeliner.parsers_counter[container.name] += (
+          container.number_of_events)
+
+      self._status = definitions.STATUS_INDICATOR_RUNNING
+      return
+
     elif container.CONTAINER_TYPE in (
         'windows_eventlog_message_string', 'windows_wevt_template_event'):
       message_file_identifier = container.GetMessageFileIdentifier()
@@ -432,9 +540,17 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
       identifier = container.GetIdentifier()
       merge_helper.SetAttributeContainerIdentifier(lookup_key, identifier)
 
-    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+    if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT:
+      self._number_of_produced_events += 1
+
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
       self._number_of_produced_event_data += 1
 
+      # Events were already generated by the worker.
+      if self._worker_timelining:
+        self._status = definitions.STATUS_INDICATOR_RUNNING
+        return
+
       self._status = definitions.STATUS_INDICATOR_TIMELINING
 
       event_data_stream_identifier = container.GetEventDataStreamIdentifier()
@@ -606,6 +722,19 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         self._RemoveMergeTaskStorage(
             self._task_storage_format, self._merge_task)
 
+        # Content hashes claimed by the task are only committed after its
+        # results have been merged, so that other tasks do not skip content
+        # of which the results are lost when the task is abandoned.
+        if self._content_hash_cache:
+          try:
+            self._content_hash_cache.CommitContentHashes(
+                self._merge_task.identifier)
+
+          except IOError as exception:
+            logger.error((
+                'Unable to commit content hashes of task: {0:s} with error: '
+                '{1!s}').format(self._merge_task.identifier, exception))
+
         try:
           self._task_manager.CompleteTask(self._merge_task)
 
@@ -679,22 +808,35 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
           task = self._task_manager.CreateRetryTask()
 
         if not task and event_source:
-          task = self._CreateTask(
-              storage_writer, session_identifier, event_source)
+          if self._processing_profiler:
+            self._processing_profiler.StartTiming('create_task')
+
+          task = self._CreateTask(session_identifier, event_source)
 
           event_source = None
 
           self._number_of_consumed_sources += 1
 
+          self._BatchEventSources(task, event_source_heap)
+
+          if self._processing_profiler:
+            self._processing_profiler.StopTiming('create_task')
+
         if task:
           if not self._ScheduleTask(task):
             self._task_manager.SampleTaskStatus(task, 'schedule_attempted')
 
           else:
-            path_spec_string = self._GetPathSpecificationString(task.path_spec)
-            logger.debug(
-                'Scheduled task: {0:s} for path specification: {1:s}'.format(
-                    task.identifier, path_spec_string.replace('\n', ' ')))
+            if task.path_specs:
+              logger.debug(
+                  'Scheduled task: {0:s} for {1:d} path specifications'.format(
+                      task.identifier, len(task.path_specs)))
+            else:
+              path_spec_string = self._GetPathSpecificationString(
+                  task.path_spec)
+              logger.debug(
+                  'Scheduled task: {0:s} for path specification: {1:s}'.format(
+                      task.identifier, path_spec_string.replace('\n', ' ')))
 
             self._task_manager.SampleTaskStatus(task, 'scheduled')
 
@@ -730,9 +872,10 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
         event_source = None
 
     for task in self._task_manager.GetFailedTasks():
-      self._ProduceExtractionWarning(
-          storage_writer, 'Worker failed to process path specification',
-          task.path_spec)
+      for path_spec in task.GetPathSpecs():
+        self._ProduceExtractionWarning(
+            storage_writer, 'Worker failed to process path specification',
+            path_spec)
 
     self._status = definitions.STATUS_INDICATOR_IDLE
 
@@ -824,6 +967,29 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return is_scheduled
 
+  def _StartContentHashCache(self):
+    """Starts the content hash cache shared by the worker processes.
+
+    Raises:
+      IOError: if the content hash cache file cannot be created.
+      OSError: if the content hash cache file cannot be created.
+    """
+    if self._storage_file_path:
+      output_directory = os.path.dirname(self._storage_file_path)
+    else:
+      output_directory = self._processing_configuration.temporary_directory
+
+    # An empty file is a valid SQLite database file.
+    file_descriptor, content_hash_cache_path = tempfile.mkstemp(
+        suffix='.sqlite', dir=output_directory or None)
+    os.close(file_descriptor)
+
+    self._content_hash_cache = content_hash_cache.ContentHashCache()
+    self._content_hash_cache.Open(path=content_hash_cache_path)
+
+    self._processing_configuration.extraction.content_hash_cache_path = (
+        content_hash_cache_path)
+
   def _StartWorkerProcess(self, process_name):
     """Creates, starts, monitors and registers a worker process.
 
@@ -844,7 +1010,7 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     process = extraction_process.ExtractionWorkerProcess(
         task_queue, self._processing_configuration, self._system_configurations,
-        self._registry_find_specs,
+        self._excluded_file_system_find_specs, self._registry_find_specs,
         enable_sigsegv_handler=self._enable_sigsegv_handler, name=process_name)
 
     # Remove all possible log handlers to prevent a child process from logging
@@ -879,6 +1045,24 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
 
     return process
 
+  def _StopContentHashCache(self):
+    """Stops the content hash cache shared by the worker processes."""
+    if self._content_hash_cache:
+      self._content_hash_cache.Close()
+      self._content_hash_cache = None
+
+    content_hash_cache_path = (
+        self._processing_configuration.extraction.content_hash_cache_path)
+    if content_hash_cache_path:
+      try:
+        os.remove(content_hash_cache_path)
+      except (IOError, OSError) as exception:
+        logger.error((
+            'Unable to remove content hash cache: {0:s} with error: '
+            '{1!s}').format(content_hash_cache_path, exception))
+
+    self._processing_configuration.extraction.content_hash_cache_path = None
+
   def _StopExtractionProcesses(self, abort=False):
     """Stops the extraction processes.
 
@@ -1091,6 +1275,8 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     self._storage_file_path = storage_file_path
     self._storage_writer = storage_writer
     self._task_storage_format = processing_configuration.task_storage_format
+    self._worker_timelining = (
+        processing_configuration.extraction.worker_timelining)
 
     # Set up the task queue.
     task_outbound_queue = zeromq_queue.ZeroMQBufferedReplyBindQueue(
@@ -1108,6 +1294,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # Set up the task storage before the worker processes.
     self._StartTaskStorage(self._task_storage_format)
 
+    if processing_configuration.extraction.skip_duplicate_data_streams:
+      self._StartContentHashCache()
+
     for worker_number in range(self._number_of_worker_processes):
       process_name = 'Worker_{0:02d}'.format(self._last_worker_number)
       worker_process = self._StartWorkerProcess(process_name)
@@ -1159,6 +1348,9 @@ class ExtractionMultiProcessEngine(task_engine.TaskMultiProcessEngine):
     # close is a failsafe.
     self._task_queue.Close(abort=True)
 
+    if processing_configuration.extraction.skip_duplicate_data_streams:
+      self._StopContentHashCache()
+
     if self._processing_status.error_path_specs:
       task_storage_abort = True
     else:
@@ -5,6 +5,11 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.resolver import context
 from dfvfs.resolver import resolver as path_spec_resolver
 
+from plaso.containers import counts
+from plaso.containers import events
+from plaso.engine import content_hash_cache
+from plaso.engine import extracted_file_index
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.lib import errors
@@ -23,7 +28,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
 
   def __init__(
       self, task_queue, processing_configuration, system_configurations,
-      registry_find_specs, **kwargs):
+      excluded_find_specs, registry_find_specs, **kwargs):
     """Initializes an extraction worker process.
 
     Non-specified keyword arguments (kwargs) are directly passed to
@@ -35,6 +40,8 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
           configuration.
       system_configurations (list[SystemConfigurationArtifact]): system
           configurations.
+      excluded_find_specs (list[dfvfs.FindSpec]): file system find
+          specifications of paths to exclude from extraction.
      registry_find_specs (list[dfwinreg.FindSpec]): Windows Registry find
          specifications.
       kwargs: keyword arguments to pass to multiprocessing.Process.
@@ -44,9 +51,12 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._abort = False
     self._buffer_size = 0
     self._current_display_name = ''
+    self._event_data_timeliner = None
+    self._excluded_find_specs = excluded_find_specs
     self._extraction_worker = None
     self._file_system_cache = []
     self._number_of_consumed_sources = 0
+    self._number_of_produced_events = 0
     self._parser_mediator = None
     self._registry_find_specs = registry_find_specs
     self._resolver_context = None
@@ -76,6 +86,23 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       self._file_system_cache.remove(file_system)
       self._file_system_cache.append(file_system)
 
+  def _CheckExcludedPathSpec(self, file_system, path_spec):
+    """Determines if the path specification should be excluded from extraction.
+
+    Args:
+      file_system (dfvfs.FileSystem): file system which the path specification
+          is part of.
+      path_spec (dfvfs.PathSpec): path specification.
+
+    Returns:
+      bool: True if the path specification should be excluded from extraction.
+    """
+    for find_spec in self._excluded_find_specs or []:
+      if find_spec.ComparePathSpecLocation(path_spec, file_system):
+        return True
+
+    return False
+
   def _CreateParserMediator(
       self, resolver_context, processing_configuration, system_configurations):
     """Creates a parser mediator.
@@ -100,6 +127,8 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     mediator.SetPreferredCodepage(processing_configuration.preferred_codepage)
     mediator.SetPreferredLanguage(processing_configuration.preferred_language)
     mediator.SetTemporaryDirectory(processing_configuration.temporary_directory)
+    mediator.SetTextLogRangeSize(
+        processing_configuration.extraction.text_log_range_size)
 
     return mediator
 
@@ -118,6 +147,10 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       number_of_produced_event_data = None
       number_of_produced_sources = None
 
+    number_of_produced_events = None
+    if self._event_data_timeliner:
+      number_of_produced_events = self._number_of_produced_events
+
     if self._extraction_worker and self._parser_mediator:
       last_activity_timestamp = max(
           self._extraction_worker.last_activity_timestamp,
@@ -151,7 +184,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
         'number_of_consumed_sources': self._number_of_consumed_sources,
         'number_of_produced_event_data': number_of_produced_event_data,
         'number_of_produced_event_tags': None,
-        'number_of_produced_events': None,
+        'number_of_produced_events': number_of_produced_events,
         'number_of_produced_sources': number_of_produced_sources,
         'processing_status': processing_status,
         'task_identifier': task_identifier,
@@ -196,6 +229,28 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     if self._processing_profiler:
       self._extraction_worker.SetProcessingProfiler(self._processing_profiler)
 
+    extraction_configuration = self._processing_configuration.extraction
+
+    hash_cache = None
+    if extraction_configuration.skip_duplicate_data_streams:
+      hash_cache = content_hash_cache.ContentHashCache()
+      hash_cache.Open(path=extraction_configuration.content_hash_cache_path)
+      self._extraction_worker.SetContentHashCache(hash_cache)
+
+    file_index = None
+    if extraction_configuration.extracted_file_index_path:
+      file_index = extracted_file_index.ExtractedFileIndex()
+      file_index.Open(path=extraction_configuration.extracted_file_index_path)
+      self._extraction_worker.SetExtractedFileIndex(file_index)
+
+    if extraction_configuration.worker_timelining:
+      self._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=self._processing_configuration.data_location,
+          preferred_year=self._processing_configuration.preferred_year,
+          system_configurations=self._system_configurations)
+      self._event_data_timeliner.SetPreferredTimeZone(
+          self._processing_configuration.preferred_time_zone)
+
     logger.debug('Worker: {0!s} (PID: {1:d}) started.'.format(
         self._name, self._pid))
 
@@ -238,9 +293,20 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     if self._processing_profiler:
       self._extraction_worker.SetProcessingProfiler(None)
 
+    if hash_cache:
+      self._extraction_worker.SetContentHashCache(None)
+      hash_cache.Close()
+
+    if file_index:
+      self._extraction_worker.SetExtractedFileIndex(None)
+      file_index.Close()
+
+    self._extraction_worker.Close()
+
     self._StopProfiling()
     self._parser_mediator.StopProfiling()
 
+    self._event_data_timeliner = None
     self._extraction_worker = None
     self._file_system_cache = []
     self._parser_mediator = None
@@ -259,6 +325,48 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     except errors.QueueAlreadyClosed:
       logger.error('Queue for {0:s} was already closed.'.format(self.name))
 
+  def _ProcessEventData(self, storage_writer):
+    """Generate events from the event data of a task.
+
+    The events and the number of events per parser are written to the task
+    storage, from where they are merged by the main (foreman) process.
+
+    Args:
+      storage_writer (StorageWriter): task storage writer.
+    """
+    if self._processing_profiler:
+      self._processing_profiler.StartTiming('process_event_data')
+
+    self._event_data_timeliner.Reset()
+
+    event_data = storage_writer.GetFirstWrittenEventData()
+    while event_data:
+      if self._abort:
+        break
+
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+
+      event_data_stream = None
+      if event_data_stream_identifier:
+        event_data_stream = storage_writer.GetAttributeContainerByIdentifier(
+            events.EventDataStream.CONTAINER_TYPE,
+            event_data_stream_identifier)
+
+      self._event_data_timeliner.ProcessEventData(
+          storage_writer, event_data, event_data_stream)
+
+      self._number_of_produced_events += (
+          self._event_data_timeliner.number_of_produced_events)
+
+      event_data = storage_writer.GetNextWrittenEventData()
+
+    for key, value in self._event_data_timeliner.parsers_counter.items():
+      parser_count = counts.ParserCount(name=key, number_of_events=value)
+      storage_writer.AddAttributeContainer(parser_count)
+
+    if self._processing_profiler:
+      self._processing_profiler.StopTiming('process_event_data')
+
   def _ProcessPathSpec(self, extraction_worker, parser_mediator, path_spec):
     """Processes a path specification.
 
@@ -274,15 +382,24 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       file_entry = path_spec_resolver.Resolver.OpenFileEntry(
           path_spec, resolver_context=parser_mediator.resolver_context)
       if file_entry is None:
-        logger.warning('Unable to open file entry: {0:s}'.format(
-            self._current_display_name))
+        parser_mediator.ProduceExtractionWarning(
+            'unable to open file entry', path_spec=path_spec)
         return
 
+      file_system = file_entry.GetFileSystem()
+
       if (path_spec and not path_spec.IsSystemLevel() and
           path_spec.type_indicator != dfvfs_definitions.TYPE_INDICATOR_GZIP):
-        file_system = file_entry.GetFileSystem()
         self._CacheFileSystem(file_system)
 
+      # Exclusion is checked by the worker, which opens the file entry
+      # regardless, so that the foreman does not have to access the source
+      # to create a task.
+      if self._CheckExcludedPathSpec(file_system, path_spec):
+        logger.debug('Excluded from extraction: {0:s}.'.format(
+            self._current_display_name))
+        return
+
       extraction_worker.ProcessFileEntry(parser_mediator, file_entry)
 
     except Exception as exception:  # pylint: disable=broad-except
@@ -312,7 +429,9 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
     self._task = task
 
     task_storage_writer = self._storage_factory.CreateTaskStorageWriter(
-        self._processing_configuration.task_storage_format)
+        self._processing_configuration.task_storage_format,
+        serialization_format=(
+            self._processing_configuration.task_storage_serialization_format))
 
     if self._serializers_profiler:
       task_storage_writer.SetSerializersProfiler(self._serializers_profiler)
@@ -321,6 +440,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       task_storage_writer.SetStorageProfiler(self._storage_profiler)
 
     self._parser_mediator.SetStorageWriter(task_storage_writer)
+    self._extraction_worker.SetTaskIdentifier(task.identifier)
 
     storage_file_path = self._GetTaskStorageFilePath(
         self._processing_configuration.task_storage_format, task)
@@ -332,9 +452,18 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       task_storage_writer.AddAttributeContainer(task)
 
       # TODO: add support for more task types.
-      self._ProcessPathSpec(
-          self._extraction_worker, self._parser_mediator, task.path_spec)
-      self._number_of_consumed_sources += 1
+      # The results of all the path specifications of a task are stored in
+      # the same task storage.
+      for path_spec in task.GetPathSpecs():
+        if self._abort:
+          break
+
+        self._ProcessPathSpec(
+            self._extraction_worker, self._parser_mediator, path_spec)
+        self._number_of_consumed_sources += 1
+
+      if self._event_data_timeliner and not self._abort:
+        self._ProcessEventData(task_storage_writer)
 
     finally:
       task.aborted = self._abort
@@ -343,6 +472,7 @@ class ExtractionWorkerProcess(task_process.MultiProcessTaskProcess):
       task_storage_writer.Close()
 
     self._parser_mediator.SetStorageWriter(None)
+    self._extraction_worker.SetTaskIdentifier(None)
 
     try:
       self._FinalizeTaskStorageWriter(
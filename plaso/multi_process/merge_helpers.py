@@ -3,6 +3,7 @@
 
 from plaso.containers import analysis_results
 from plaso.containers import artifacts
+from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
 from plaso.containers import reports
@@ -121,8 +122,13 @@ class ExtractionTaskMergeHelper(BaseTaskMergeHelper):
       # data containers.
       events.YearLessLogHelper.CONTAINER_TYPE,
       events.EventData.CONTAINER_TYPE,
+      # Events and parser counts are only produced by the extraction worker
+      # processes when events are generated from event data by the workers.
+      events.EventObject.CONTAINER_TYPE,
+      counts.ParserCount.CONTAINER_TYPE,
       warnings.ExtractionWarning.CONTAINER_TYPE,
       warnings.RecoveryWarning.CONTAINER_TYPE,
+      warnings.TimeliningWarning.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageFileArtifact.CONTAINER_TYPE,
       artifacts.WindowsEventLogMessageStringArtifact.CONTAINER_TYPE,
       artifacts.WindowsWevtTemplateEvent.CONTAINER_TYPE)
@@ -4,15 +4,20 @@
 import collections
 import heapq
 import os
+import shutil
+import tempfile
+import threading
 
 from plaso.containers import events
 from plaso.engine import processing_status
 from plaso.lib import bufferlib
 from plaso.lib import definitions
 from plaso.lib import errors
+from plaso.multi_process import base_process
 from plaso.multi_process import engine
 from plaso.multi_process import logger
 from plaso.output import mediator as output_mediator
+from plaso.storage import factory as storage_factory
 from plaso.storage import time_range as storage_time_range
 
 
@@ -44,11 +49,13 @@ class PsortEventHeap(object):
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
+        EventTag: event tag or None if not available.
     """
     try:
-      (event_values_hash, _, event, event_data,
-       event_data_stream) = heapq.heappop(self._heap)
-      return event_values_hash, event, event_data, event_data_stream
+      (event_values_hash, _, event, event_data, event_data_stream,
+       event_tag) = heapq.heappop(self._heap)
+      return (
+          event_values_hash, event, event_data, event_data_stream, event_tag)
 
     except IndexError:
       return None
@@ -65,19 +72,21 @@ class PsortEventHeap(object):
         EventObject: event.
         EventData: event data.
         EventDataStream: event data stream.
+        EventTag: event tag or None if not available.
     """
     heap_values = self.PopEvent()
     while heap_values:
       yield heap_values
       heap_values = self.PopEvent()
 
-  def PushEvent(self, event, event_data, event_data_stream):
+  def PushEvent(self, event, event_data, event_data_stream, event_tag=None):
     """Pushes an event onto the heap.
 
     Args:
       event (EventObject): event.
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
+      event_tag (Optional[EventTag]): event tag.
     """
     event_values_hash = getattr(event_data, '_event_values_hash', None)
 
@@ -108,35 +117,348 @@ class PsortEventHeap(object):
     # similar event values.
     heapq.heappush(self._heap, (
         event_values_hash, timestamp_desc, event, event_data,
-        event_data_stream))
+        event_data_stream, event_tag))
+
+
+class OutputWorkerProcess(base_process.MultiProcessBaseProcess):
+  """Multi-processing output worker process.
+
+  The output worker process exports the events of a time range to a separate
+  output file.
+  """
+
+  # Number of seconds to wait for the completion status to be queried
+  # by the foreman process.
+  _FOREMAN_STATUS_WAIT = 5 * 60
+
+  def __init__(
+      self, storage_file_path, output_module, output_path, time_range,
+      processing_configuration, deduplicate_events=True, event_filter=None,
+      **kwargs):
+    """Initializes an output worker process.
+
+    Non-specified keyword arguments (kwargs) are directly passed to
+    multiprocessing.Process.
+
+    Args:
+      storage_file_path (str): path of the storage file to read the events
+          from.
+      output_module (OutputModule): output module, which must support
+          parallel export.
+      output_path (str): path of the output file of the time range.
+      time_range (TimeRange): time range of the events to export.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[EventObjectFilter]): event filter.
+    """
+    super(OutputWorkerProcess, self).__init__(
+        processing_configuration, **kwargs)
+    self._abort = False
+    self._deduplicate_events = deduplicate_events
+    self._event_filter = event_filter
+    self._export_engine = None
+    self._foreman_status_wait_event = None
+    self._output_module = output_module
+    self._output_path = output_path
+    self._status = definitions.STATUS_INDICATOR_INITIALIZED
+    self._storage_file_path = storage_file_path
+    self._time_range = time_range
+
+  def _GetStatus(self):
+    """Retrieves status information.
+
+    Returns:
+      dict[str, object]: status attributes, indexed by name.
+    """
+    logger.debug('Status update requested')
+
+    number_of_consumed_events = None
+    number_of_duplicate_events = None
+    number_of_filtered_events = None
+    number_of_macb_grouped_events = None
+
+    if self._export_engine:
+      events_status = self._export_engine.events_status
+      number_of_consumed_events = (
+          self._export_engine.number_of_consumed_events)
+      number_of_duplicate_events = events_status.number_of_duplicate_events
+      number_of_filtered_events = events_status.number_of_filtered_events
+      number_of_macb_grouped_events = (
+          events_status.number_of_macb_grouped_events)
+
+    if self._process_information:
+      used_memory = self._process_information.GetUsedMemory() or 0
+    else:
+      used_memory = 0
+
+    if self._memory_profiler:
+      self._memory_profiler.Sample('main', used_memory)
+
+    # XML RPC does not support integer values > 2 GiB so we format them
+    # as a string.
+    used_memory = '{0:d}'.format(used_memory)
+
+    status = {
+        'display_name': '',
+        'identifier': self._name,
+        'number_of_consumed_event_data': None,
+        'number_of_consumed_event_tags': None,
+        'number_of_consumed_events': number_of_consumed_events,
+        'number_of_consumed_reports': None,
+        'number_of_consumed_sources': None,
+        'number_of_duplicate_events': number_of_duplicate_events,
+        'number_of_filtered_events': number_of_filtered_events,
+        'number_of_macb_grouped_events': number_of_macb_grouped_events,
+        'number_of_produced_event_data': None,
+        'number_of_produced_event_tags': None,
+        'number_of_produced_events': None,
+        'number_of_produced_reports': None,
+        'number_of_produced_sources': None,
+        'processing_status': self._status,
+        'task_identifier': None,
+        'used_memory': used_memory}
+
+    if self._status in (
+        definitions.STATUS_INDICATOR_ABORTED,
+        definitions.STATUS_INDICATOR_COMPLETED):
+      logger.debug('Set foreman status wait event')
+      self._foreman_status_wait_event.set()
+
+    return status
+
+  def _Main(self):
+    """The main loop."""
+    self._StartProfiling(self._processing_configuration.profiling)
+
+    logger.debug('Output worker: {0!s} (PID: {1:d}) started'.format(
+        self._name, self._pid))
+
+    # Creating the threading event in the constructor will cause a pickle
+    # error on Windows when an output worker process is created.
+    self._foreman_status_wait_event = threading.Event()
+    self._status = definitions.STATUS_INDICATOR_EXPORTING
+
+    self._export_engine = OutputAndFormattingMultiProcessEngine()
+
+    storage_reader = None
+
+    try:
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              self._storage_file_path))
+      if not storage_reader:
+        raise IOError('Unable to open storage file: {0:s}'.format(
+            self._storage_file_path))
+
+      self._output_module.Open(path=self._output_path)
+
+      self._export_engine.ExportEventsInTimeRange(
+          storage_reader, self._output_module, self._processing_configuration,
+          self._time_range, deduplicate_events=self._deduplicate_events,
+          event_filter=self._event_filter)
+
+    # All exceptions need to be caught here to prevent the process
+    # from being killed by an uncaught exception.
+    except Exception as exception:  # pylint: disable=broad-except
+      logger.warning(
+          'Unhandled exception in process: {0!s} (PID: {1:d}).'.format(
+              self._name, self._pid))
+      logger.exception(exception)
+
+      self._abort = True
+
+    finally:
+      self._output_module.Close()
+
+      if storage_reader:
+        storage_reader.Close()
+
+    if self._abort:
+      self._status = definitions.STATUS_INDICATOR_ABORTED
+    else:
+      self._status = definitions.STATUS_INDICATOR_COMPLETED
+
+    logger.debug('Wait for foreman status wait event')
+    self._foreman_status_wait_event.clear()
+    self._foreman_status_wait_event.wait(self._FOREMAN_STATUS_WAIT)
+
+    logger.debug('Output worker: {0!s} (PID: {1:d}) stopped'.format(
+        self._name, self._pid))
+
+    self._StopProfiling()
+
+    self._export_engine = None
+    self._foreman_status_wait_event = None
+
+  def SignalAbort(self):
+    """Signals the process to abort."""
+    self._abort = True
+
+    if self._foreman_status_wait_event:
+      logger.debug('Abort foreman status wait event')
+      self._foreman_status_wait_event.set()
 
 
 class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
   """Output and formatting multi-processing engine."""
 
-  # TODO: move this to a single process engine.
-  # pylint: disable=abstract-method
-
   _HEAP_MAXIMUM_EVENTS = 100000
 
   _MESSAGE_FORMATTERS_DIRECTORY_NAME = 'formatters'
 
   _MESSAGE_FORMATTERS_FILE_NAME = 'formatters.yaml'
 
-  def __init__(self):
-    """Initializes an output and formatting multi-processing engine."""
+  # Size of the chunks in which the output of the output worker processes
+  # is copied to the output.
+  _OUTPUT_COPY_CHUNK_SIZE = 16 * 1024 * 1024
+
+  def __init__(self, number_of_worker_processes=0):
+    """Initializes an output and formatting multi-processing engine.
+
+    Args:
+      number_of_worker_processes (Optional[int]): number of output worker
+          processes, where 0 or 1 represents the events are exported by
+          the main (foreman) process.
+    """
     super(OutputAndFormattingMultiProcessEngine, self).__init__()
+    self._completed_output_processes = set()
     # The export event heap is used to make sure the events are sorted in
     # a deterministic way.
     self._events_status = processing_status.EventsStatus()
     self._export_event_heap = PsortEventHeap()
     self._export_event_timestamp = 0
     self._number_of_consumed_events = 0
+    self._number_of_worker_processes = number_of_worker_processes
     self._output_mediator = None
+    self._output_worker_settings = {}
     self._processing_configuration = None
     self._status = definitions.STATUS_INDICATOR_IDLE
     self._status_update_callback = None
 
+  @property
+  def events_status(self):
+    """EventsStatus: status of the exported events."""
+    return self._events_status
+
+  @property
+  def number_of_consumed_events(self):
+    """int: number of events consumed by the export."""
+    return self._number_of_consumed_events
+
+  def _CheckStatusOutputProcess(self, pid):
+    """Checks the status of an output worker process.
+
+    Args:
+      pid (int): process ID (PID) of a registered output worker process.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    self._RaiseIfNotRegistered(pid)
+
+    process = self._processes_per_pid[pid]
+
+    process_information = self._process_information_per_pid.get(pid, None)
+    if not process_information:
+      # The process is no longer monitored.
+      return
+
+    process_status = self._QueryProcessStatus(process)
+    if process_status is None:
+      process_is_alive = False
+    else:
+      process_is_alive = True
+
+    used_memory = process_information.GetUsedMemory() or 0
+
+    if self._worker_memory_limit and used_memory > self._worker_memory_limit:
+      logger.warning((
+          'Process: {0:s} (PID: {1:d}) killed because it exceeded the '
+          'memory limit: {2:d}.').format(
+              process.name, pid, self._worker_memory_limit))
+      self._KillProcess(pid)
+
+    if isinstance(process_status, dict):
+      self._rpc_errors_per_pid[pid] = 0
+      status_indicator = process_status.get('processing_status', None)
+
+    else:
+      rpc_errors = self._rpc_errors_per_pid.get(pid, 0) + 1
+      self._rpc_errors_per_pid[pid] = rpc_errors
+
+      if rpc_errors > self._MAXIMUM_RPC_ERRORS:
+        process_is_alive = False
+
+      if process_is_alive:
+        rpc_port = process.rpc_port.value
+        logger.warning((
+            'Unable to retrieve process: {0:s} (PID: {1:d}) status via '
+            'RPC socket: http://localhost:{2:d}').format(
+                process.name, pid, rpc_port))
+
+        processing_status_string = 'RPC error'
+        status_indicator = definitions.STATUS_INDICATOR_RUNNING
+      else:
+        processing_status_string = 'killed'
+        status_indicator = definitions.STATUS_INDICATOR_KILLED
+
+      process_status = {
+          'processing_status': processing_status_string}
+
+    self._UpdateProcessingStatus(pid, process_status, used_memory)
+
+    if status_indicator == definitions.STATUS_INDICATOR_COMPLETED:
+      self._completed_output_processes.add(process.name)
+
+      self._events_status.number_of_duplicate_events += process_status.get(
+          'number_of_duplicate_events', None) or 0
+      self._events_status.number_of_filtered_events += process_status.get(
+          'number_of_filtered_events', None) or 0
+      self._events_status.number_of_macb_grouped_events += process_status.get(
+          'number_of_macb_grouped_events', None) or 0
+      self._number_of_consumed_events += process_status.get(
+          'number_of_consumed_events', None) or 0
+
+      self._StopMonitoringProcess(process)
+
+    elif status_indicator in definitions.ERROR_STATUS_INDICATORS:
+      logger.error((
+          'Process {0:s} (PID: {1:d}) is not functioning correctly. '
+          'Status code: {2!s}.').format(
+              process.name, pid, status_indicator))
+
+      self._TerminateProcessByPid(pid)
+
+  def _CopyWorkerOutput(self, output_module, output_path):
+    """Copies the output of an output worker process to the output module.
+
+    The output file is read without newline translation, so that carriage
+    returns in event values are preserved. Line separators that were
+    translated to the platform specific line separator when the output file
+    was written are translated back.
+
+    Args:
+      output_module (OutputModule): output module.
+      output_path (str): path of the output file of the output worker process.
+    """
+    with open(output_path, 'rt', encoding='utf-8', newline='') as file_object:
+      text = file_object.read(self._OUTPUT_COPY_CHUNK_SIZE)
+      while text:
+        if os.linesep != '\n':
+          # Make sure a line separator is not split over multiple chunks.
+          while text[-1] == '\r':
+            next_character = file_object.read(1)
+            if not next_character:
+              break
+            text = ''.join([text, next_character])
+
+          text = text.replace(os.linesep, '\n')
+
+        output_module.WriteText(text)
+        text = file_object.read(self._OUTPUT_COPY_CHUNK_SIZE)
+
   def _CreateOutputMediator(self, storage_reader, processing_configuration):
     """Creates an output mediator.
 
@@ -156,7 +478,9 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     mediator = output_mediator.OutputMediator(
         storage_reader, data_location=processing_configuration.data_location,
         dynamic_time=processing_configuration.dynamic_time,
-        preferred_encoding=processing_configuration.preferred_encoding)
+        preferred_encoding=processing_configuration.preferred_encoding,
+        preload_winevt_message_strings=(
+            processing_configuration.preload_winevt_message_strings))
 
     if processing_configuration.preferred_language:
       try:
@@ -174,30 +498,32 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     return mediator
 
   def _ExportEvent(
-      self, storage_reader, output_module, event, event_data, event_data_stream,
+      self, output_module, event, event_data, event_data_stream, event_tag,
       deduplicate_events=True):
     """Exports an event using an output module.
 
     Args:
-      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       event (EventObject): event.
       event_data (EventData): event data.
       event_data_stream (EventDataStream): event data stream.
+      event_tag (EventTag): event tag.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
     """
     if (event.timestamp != self._export_event_timestamp or
         self._export_event_heap.number_of_events > self._HEAP_MAXIMUM_EVENTS):
       self._FlushExportBuffer(
-          storage_reader, output_module, deduplicate_events=deduplicate_events)
+          output_module, deduplicate_events=deduplicate_events)
       self._export_event_timestamp = event.timestamp
 
-    self._export_event_heap.PushEvent(event, event_data, event_data_stream)
+    self._export_event_heap.PushEvent(
+        event, event_data, event_data_stream, event_tag=event_tag)
 
   def _ExportEvents(
       self, storage_reader, output_module, deduplicate_events=True,
-      event_filter=None, time_slice=None, use_time_slicer=False):
+      event_filter=None, time_range=None, time_slice=None,
+      use_time_slicer=False):
     """Exports events using an output module.
 
     Args:
@@ -206,6 +532,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
       event_filter (Optional[EventObjectFilter]): event filter.
+      time_range (Optional[TimeRange]): time range of the events to export,
+          which is ignored when a time slice is specified.
       time_slice (Optional[TimeRange]): time range that defines a time slice
           to filter events.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
@@ -228,30 +556,31 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     filter_limit = getattr(event_filter, 'limit', None)
     forward_entries = 0
 
-    self._events_status.number_of_filtered_events = 0
-    self._events_status.number_of_events_from_time_slice = 0
-
-    for event in storage_reader.GetSortedEvents(time_range=time_slice_range):
-      event_data_identifier = event.GetEventDataIdentifier()
-      event_data = storage_reader.GetAttributeContainerByIdentifier(
-          events.EventData.CONTAINER_TYPE, event_data_identifier)
+    # Note that the time slicer needs the events that do not match the event
+    # filter, hence the storage filter expression is not applied.
+    storage_filter_expression = None
+    if not time_slice:
+      storage_filter_expression = getattr(
+          event_filter, 'storage_filter_expression', None)
 
-      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
-      if event_data_stream_identifier:
-        event_data_stream = storage_reader.GetAttributeContainerByIdentifier(
-            events.EventDataStream.CONTAINER_TYPE, event_data_stream_identifier)
-      else:
-        event_data_stream = None
+    storage_filter_applied = bool(storage_filter_expression)
+    events_time_range = time_slice_range or time_range
+    filter_limit_reached = False
+    number_of_events = 0
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
+    for event, event_data, event_data_stream, event_tag in (
+        storage_reader.GetSortedJoinedEvents(
+            filter_expression=storage_filter_expression,
+            time_range=events_time_range)):
+      number_of_events += 1
 
       if time_slice_range and event.timestamp != time_slice.event_timestamp:
         self._events_status.number_of_events_from_time_slice += 1
 
       if event_filter:
         filter_match = event_filter.Match(
-            event, event_data, event_data_stream, event_tag)
+            event, event_data, event_data_stream, event_tag,
+            storage_filter_applied=storage_filter_applied)
       else:
         filter_match = None
 
@@ -261,13 +590,14 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries == 0:
-          time_slice_buffer.Append((event, event_data))
+          time_slice_buffer.Append(
+              (event, event_data, event_data_stream, event_tag))
           self._events_status.number_of_filtered_events += 1
 
         elif forward_entries <= time_slice_buffer.size:
           self._ExportEvent(
-              storage_reader, output_module, event, event_data,
-              event_data_stream, deduplicate_events=deduplicate_events)
+              output_module, event, event_data, event_data_stream, event_tag,
+              deduplicate_events=deduplicate_events)
           self._number_of_consumed_events += 1
           self._events_status.number_of_events_from_time_slice += 1
           forward_entries += 1
@@ -282,11 +612,12 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         # pylint: disable=singleton-comparison
         if filter_match == True and time_slice_buffer:
           # Empty the time slice buffer.
-          for event_in_buffer, event_data_in_buffer in (
-              time_slice_buffer.Flush()):
+          for (event_in_buffer, event_data_in_buffer,
+               event_data_stream_in_buffer, event_tag_in_buffer) in (
+                   time_slice_buffer.Flush()):
             self._ExportEvent(
-                storage_reader, output_module, event_in_buffer,
-                event_data_in_buffer, event_data_stream,
+                output_module, event_in_buffer, event_data_in_buffer,
+                event_data_stream_in_buffer, event_tag_in_buffer,
                 deduplicate_events=deduplicate_events)
             self._number_of_consumed_events += 1
             self._events_status.number_of_filtered_events += 1
@@ -295,23 +626,118 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
           forward_entries = 1
 
         self._ExportEvent(
-            storage_reader, output_module, event, event_data, event_data_stream,
+            output_module, event, event_data, event_data_stream, event_tag,
             deduplicate_events=deduplicate_events)
         self._number_of_consumed_events += 1
 
         # pylint: disable=singleton-comparison
         if (filter_match == True and filter_limit and
             filter_limit == self._number_of_consumed_events):
+          filter_limit_reached = True
           break
 
-    self._FlushExportBuffer(storage_reader, output_module)
+    # The events that did not match the storage filter expression were not
+    # read and are counted as filtered events.
+    if storage_filter_applied and not filter_limit_reached:
+      self._events_status.number_of_filtered_events += (
+          storage_reader.GetNumberOfEvents(time_range=events_time_range) -
+          number_of_events)
+
+    self._FlushExportBuffer(
+        output_module, deduplicate_events=deduplicate_events)
+
+  def _ExportEventsWithWorkers(
+      self, storage_reader, output_module, storage_file_path,
+      deduplicate_events=True, event_filter=None):
+    """Exports events using output worker processes.
+
+    The events are partitioned into consecutive time ranges with approximately
+    the same number of events, where events with the same timestamp are never
+    split over multiple time ranges. Every time range is exported by an output
+    worker process to a separate file, after which the files are appended to
+    the output in chronological order. Since the deduplication and MACB
+    grouping are applied per timestamp, the result is the same as when the
+    events are exported by a single process.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      output_module (OutputModule): output module.
+      storage_file_path (str): path of the storage file.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[EventObjectFilter]): event filter.
+
+    Raises:
+      KeyboardInterrupt: if a keyboard interrupt was raised.
+    """
+    time_ranges = self._GetExportTimeRanges(
+        storage_reader, self._number_of_worker_processes)
+
+    temporary_directory = tempfile.mkdtemp(
+        prefix='psort-', dir=self._processing_configuration.temporary_directory)
+
+    self._completed_output_processes = set()
+    self._output_worker_settings = {}
 
-  def _FlushExportBuffer(
-      self, storage_reader, output_module, deduplicate_events=True):
+    try:
+      process_names = []
+      for time_range_index, time_range in enumerate(time_ranges):
+        process_name = 'Output worker {0:02d}'.format(time_range_index)
+        output_path = os.path.join(
+            temporary_directory, 'time_range{0:06d}.txt'.format(
+                time_range_index))
+
+        self._output_worker_settings[process_name] = (
+            storage_file_path, output_module, output_path, time_range,
+            deduplicate_events, event_filter)
+
+        process_names.append(process_name)
+        self._StartWorkerProcess(process_name)
+
+      # Note that the header is written after the output worker processes
+      # have been started to make sure the output buffers of the output module
+      # are empty when the processes are forked.
+      output_module.WriteHeader(self._output_mediator)
+
+      for process in list(self._processes_per_pid.values()):
+        process.join()
+
+      self._StopMonitoringProcesses()
+
+      for process_name in process_names:
+        _, _, output_path, time_range, _, _ = self._output_worker_settings[
+            process_name]
+
+        if process_name in self._completed_output_processes:
+          self._CopyWorkerOutput(output_module, output_path)
+
+        else:
+          logger.warning((
+              'Process: {0:s} did not complete, exporting its time range in '
+              'the main (foreman) process.').format(process_name))
+
+          self._ExportEvents(
+              storage_reader, output_module,
+              deduplicate_events=deduplicate_events, event_filter=event_filter,
+              time_range=time_range)
+
+          output_module.Flush()
+
+    except KeyboardInterrupt:
+      self._StopMonitoringProcesses()
+      self._AbortTerminate()
+      self._AbortKill()
+      raise
+
+    finally:
+      self._output_worker_settings = {}
+
+      shutil.rmtree(temporary_directory, ignore_errors=True)
+
+  def _FlushExportBuffer(self, output_module, deduplicate_events=True):
     """Flushes buffered events and writes them to the output module.
 
     Args:
-      storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
       deduplicate_events (Optional[bool]): True if events should be
           deduplicated.
@@ -321,8 +747,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     last_timestamp_desc = None
     macb_group = []
 
-    for (event_values_hash, event, event_data,
-         event_data_stream) in self._export_event_heap.PopEvents():
+    for (event_values_hash, event, event_data, event_data_stream,
+         event_tag) in self._export_event_heap.PopEvents():
       timestamp_desc = event.timestamp_desc
 
       if (deduplicate_events and timestamp_desc == last_timestamp_desc and
@@ -330,9 +756,6 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
         self._events_status.number_of_duplicate_events += 1
         continue
 
-      event_identifier = event.GetIdentifier()
-      event_tag = storage_reader.GetEventTagByEventIdentifer(event_identifier)
-
       if timestamp_desc in (
           definitions.TIME_DESCRIPTION_LAST_ACCESS,
           definitions.TIME_DESCRIPTION_CREATION,
@@ -372,6 +795,48 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       output_module.WriteFieldValuesOfMACBGroup(
           self._output_mediator, macb_group)
 
+  def _GetExportTimeRanges(self, storage_reader, number_of_time_ranges):
+    """Determines time ranges with approximately the same number of events.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      number_of_time_ranges (int): maximum number of time ranges.
+
+    Returns:
+      list[TimeRange]: consecutive time ranges in chronological order.
+    """
+    number_of_events = storage_reader.GetNumberOfAttributeContainers('event')
+    number_of_events_per_time_range, remainder = divmod(
+        number_of_events, number_of_time_ranges)
+    if remainder:
+      number_of_events_per_time_range += 1
+
+    time_ranges = []
+    last_timestamp = None
+    number_of_events_in_time_range = 0
+    start_timestamp = None
+
+    for timestamp in storage_reader.GetSortedEventTimestamps():
+      if start_timestamp is None:
+        start_timestamp = timestamp
+
+      elif (timestamp != last_timestamp and
+            number_of_events_in_time_range >= number_of_events_per_time_range):
+        time_ranges.append(storage_time_range.TimeRange(
+            start_timestamp, timestamp - 1))
+
+        number_of_events_in_time_range = 0
+        start_timestamp = timestamp
+
+      last_timestamp = timestamp
+      number_of_events_in_time_range += 1
+
+    if start_timestamp is not None:
+      time_ranges.append(storage_time_range.TimeRange(
+          start_timestamp, last_timestamp))
+
+    return time_ranges
+
   def _ReadMessageFormatters(self, output_mediator_object, data_location):
     """Reads the message formatters from a formatters file or directory.
 
@@ -409,6 +874,48 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     else:
       raise errors.BadConfigOption('Missing formatters file and directory.')
 
+  def _StartWorkerProcess(self, process_name):
+    """Creates, starts, monitors and registers a worker process.
+
+    Args:
+      process_name (str): process name.
+
+    Returns:
+      MultiProcessWorkerProcess: output worker process or None on error.
+    """
+    output_worker_settings = self._output_worker_settings.get(
+        process_name, None)
+    if not output_worker_settings:
+      logger.error('Missing output worker settings: {0:s}'.format(
+          process_name))
+      return None
+
+    (storage_file_path, output_module, output_path, time_range,
+     deduplicate_events, event_filter) = output_worker_settings
+
+    process = OutputWorkerProcess(
+        storage_file_path, output_module, output_path, time_range,
+        self._processing_configuration, deduplicate_events=deduplicate_events,
+        event_filter=event_filter, name=process_name)
+
+    process.start()
+
+    logger.info('Started output worker: {0:s} (PID: {1:d}).'.format(
+        process_name, process.pid))
+
+    try:
+      self._StartMonitoringProcess(process)
+    except (IOError, KeyError) as exception:
+      logger.error((
+          'Unable to monitor output worker: {0:s} (PID: {1:d}) '
+          'with error: {2!s}').format(process_name, process.pid, exception))
+
+      process.terminate()
+      return None
+
+    self._RegisterProcess(process)
+    return process
+
   def _UpdateForemanProcessStatus(self):
     """Update the foreman process status."""
     used_memory = self._process_information.GetUsedMemory() or 0
@@ -419,8 +926,40 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
 
     self._processing_status.UpdateEventsStatus(self._events_status)
 
+  def _UpdateProcessingStatus(self, pid, process_status, used_memory):
+    """Updates the processing status.
+
+    Args:
+      pid (int): process identifier (PID) of the worker process.
+      process_status (dict[str, object]): status values received from
+          the worker process.
+      used_memory (int): size of used memory in bytes.
+
+    Raises:
+      KeyError: if the process is not registered with the engine.
+    """
+    self._RaiseIfNotRegistered(pid)
+
+    if not process_status:
+      return
+
+    process = self._processes_per_pid[pid]
+
+    status_indicator = process_status.get('processing_status', None)
+    number_of_consumed_events = process_status.get(
+        'number_of_consumed_events', None)
+
+    self._processing_status.UpdateWorkerStatus(
+        process.name, status_indicator, pid, used_memory, '', None, None,
+        None, None, number_of_consumed_events, None, None, None, None, None)
+
   def _UpdateStatus(self):
     """Update the status."""
+    # Make a local copy of the PIDs in case the dict is changed by
+    # the main thread.
+    for pid in list(self._process_information_per_pid.keys()):
+      self._CheckStatusOutputProcess(pid)
+
     self._UpdateForemanProcessStatus()
 
     if self._status_update_callback:
@@ -429,9 +968,15 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
   def ExportEvents(
       self, storage_reader, output_module, processing_configuration,
       deduplicate_events=True, event_filter=None, status_update_callback=None,
-      time_slice=None, use_time_slicer=False):
+      storage_file_path=None, time_slice=None, use_time_slicer=False):
     """Exports events using an output module.
 
+    The events are exported by output worker processes if more than 1 worker
+    process was configured, a storage file path is provided, the output module
+    supports parallel export and neither a time slice nor an event filter
+    with a limit is used. Otherwise the events are exported by the main
+    (foreman) process.
+
     Args:
       storage_reader (StorageReader): storage reader.
       output_module (OutputModule): output module.
@@ -442,6 +987,8 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
       event_filter (Optional[EventObjectFilter]): event filter.
       status_update_callback (Optional[function]): callback function for status
           updates.
+      storage_file_path (Optional[str]): path of the storage file, which is
+          needed by the output worker processes to read the events.
       time_slice (Optional[TimeSlice]): slice of time to output.
       use_time_slicer (Optional[bool]): True if the 'time slicer' should be
           used. The 'time slicer' will provide a context of events around
@@ -469,17 +1016,28 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._output_mediator = self._CreateOutputMediator(
         storage_reader, processing_configuration)
 
-    output_module.WriteHeader(output_mediator)
+    use_worker_processes = bool(
+        self._number_of_worker_processes > 1 and storage_file_path and
+        output_module.SUPPORTS_PARALLEL_EXPORT and not time_slice and
+        not getattr(event_filter, 'limit', None))
+
+    if not use_worker_processes:
+      output_module.WriteHeader(self._output_mediator)
 
     self._StartStatusUpdateThread()
 
     self._StartProfiling(self._processing_configuration.profiling)
 
     try:
-      self._ExportEvents(
-          storage_reader, output_module, deduplicate_events=deduplicate_events,
-          event_filter=event_filter, time_slice=time_slice,
-          use_time_slicer=use_time_slicer)
+      if use_worker_processes:
+        self._ExportEventsWithWorkers(
+            storage_reader, output_module, storage_file_path,
+            deduplicate_events=deduplicate_events, event_filter=event_filter)
+      else:
+        self._ExportEvents(
+            storage_reader, output_module,
+            deduplicate_events=deduplicate_events, event_filter=event_filter,
+            time_slice=time_slice, use_time_slicer=use_time_slicer)
 
       self._status = definitions.STATUS_INDICATOR_COMPLETED
 
@@ -500,3 +1058,45 @@ class OutputAndFormattingMultiProcessEngine(engine.MultiProcessEngine):
     self._output_mediator = None
     self._processing_configuration = None
     self._status_update_callback = None
+
+  def ExportEventsInTimeRange(
+      self, storage_reader, output_module, processing_configuration,
+      time_range, deduplicate_events=True, event_filter=None):
+    """Exports the events in a time range using an output module.
+
+    This is used by output worker processes to export part of the events,
+    as such no header and footer are written. The output buffered by the
+    output module is flushed after the events have been exported.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+      output_module (OutputModule): output module.
+      processing_configuration (ProcessingConfiguration): processing
+          configuration.
+      time_range (TimeRange): time range of the events to export.
+      deduplicate_events (Optional[bool]): True if events should be
+          deduplicated.
+      event_filter (Optional[EventObjectFilter]): event filter.
+
+    Raises:
+      BadConfigOption: if the message formatters file or directory cannot be
+          read.
+    """
+    self._events_status = processing_status.EventsStatus()
+    self._processing_configuration = processing_configuration
+
+    self._output_mediator = self._CreateOutputMediator(
+        storage_reader, processing_configuration)
+
+    try:
+      self._ExportEvents(
+          storage_reader, output_module, deduplicate_events=deduplicate_events,
+          event_filter=event_filter, time_range=time_range)
+
+      output_module.Flush()
+
+      self._status = definitions.STATUS_INDICATOR_COMPLETED
+
+    finally:
+      self._output_mediator = None
+      self._processing_configuration = None
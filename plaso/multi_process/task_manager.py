@@ -124,6 +124,11 @@ class TaskManager(object):
 
   Abandoned tasks without corresponding retry tasks are considered "failed"
   when the foreman is done processing.
+
+  An abandoned task with multiple path specifications is retried with a task
+  per path specification, so that a single path specification that causes
+  a worker to fail does not cause the entire task to fail. These retry tasks
+  are handed out one at a time by CreateRetryTask.
   """
 
   # Stop pylint from reporting:
@@ -164,6 +169,10 @@ class TaskManager(object):
 
     self._tasks_profiler = None
 
+    # Retry tasks of an abandoned task with multiple path specifications
+    # that have been created but not yet handed out by CreateRetryTask.
+    self._retry_tasks = collections.deque()
+
     # TODO: implement a limit on the number of tasks.
     self._total_number_of_tasks = 0
 
@@ -245,7 +254,7 @@ class TaskManager(object):
     Returns:
       bool: True if there are abandoned tasks that need to be retried.
     """
-    return bool(self._GetTaskPendingRetry())
+    return bool(self._retry_tasks) or bool(self._GetTaskPendingRetry())
 
   def _UpdateLatestProcessingTime(self, task):
     """Updates the latest processing time of the task manager from the task.
@@ -290,16 +299,22 @@ class TaskManager(object):
           no abandoned tasks that should be retried.
     """
     with self._lock:
-      abandoned_task = self._GetTaskPendingRetry()
-      if not abandoned_task:
-        return None
+      if not self._retry_tasks:
+        abandoned_task = self._GetTaskPendingRetry()
+        if not abandoned_task:
+          return None
+
+        # The abandoned task is kept in _tasks_abandoned so it can be still
+        # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
+
+        retry_tasks = abandoned_task.CreateRetryTasks()
+        for retry_task in retry_tasks:
+          logger.debug('Retrying task {0:s} as {1:s}.'.format(
+              abandoned_task.identifier, retry_task.identifier))
 
-      # The abandoned task is kept in _tasks_abandoned so it can be still
-      # identified in CheckTaskToMerge and UpdateTaskAsPendingMerge.
+        self._retry_tasks.extend(retry_tasks)
 
-      retry_task = abandoned_task.CreateRetryTask()
-      logger.debug('Retrying task {0:s} as {1:s}.'.format(
-          abandoned_task.identifier, retry_task.identifier))
+      retry_task = self._retry_tasks.popleft()
 
       self._tasks_queued[retry_task.identifier] = retry_task
       self._total_number_of_tasks += 1
@@ -2,7 +2,9 @@
 """Output module field formatting helper."""
 
 import abc
+import collections
 import datetime
+import decimal
 import math
 import pytz
 
@@ -12,6 +14,7 @@ from dfvfs.lib import definitions as dfvfs_definitions
 from plaso.containers import events
 from plaso.lib import errors
 from plaso.output import logger
+from plaso.output import time_zone
 
 
 class EventFormattingHelper(object):
@@ -41,14 +44,20 @@ class FieldFormattingHelper(object):
   # Maps the name of a field to callback function that formats the field value.
   _FIELD_FORMAT_CALLBACKS = {}
 
+  # Maximum number of event data of which the formatted event values and
+  # messages are cached.
+  _MAXIMUM_CACHED_EVENT_DATA = 16384
+
   def __init__(self):
     """Initializes a field formatting helper."""
     event_data_stream = events.EventDataStream()
 
     super(FieldFormattingHelper, self).__init__()
     self._callback_functions = {}
+    self._event_data_cache = collections.OrderedDict()
     self._event_data_stream_field_names = event_data_stream.GetAttributeNames()
     self._event_tag_field_names = []
+    self._time_zone_converter = None
 
     for field_name, callback_name in self._FIELD_FORMAT_CALLBACKS.items():
       if callback_name == '_FormatTag':
@@ -100,24 +109,25 @@ class FieldFormattingHelper(object):
       if output_mediator.time_zone != pytz.UTC or date_time.time_zone_offset:
         # For output in a specific time zone overwrite the date, time in
         # seconds and time zone offset in the UTC ISO8601 string.
-        year, month, day_of_month, hours, minutes, seconds = (
-            date_time.GetDateWithTimeOfDay())
+        time_zone_converter = self._GetTimeZoneConverter(output_mediator)
 
         try:
-          datetime_object = datetime.datetime(
-              year, month, day_of_month, hours, minutes, seconds,
-              tzinfo=pytz.UTC)
-
-          datetime_object = datetime_object.astimezone(
-              output_mediator.time_zone)
-
-          isoformat_string = datetime_object.isoformat()
-          iso8601_string = ''.join([
-              isoformat_string[:19], iso8601_string[19:-6],
-              isoformat_string[-6:]])
-        except (OSError, OverflowError, TypeError, ValueError):
+          timestamp = date_time.CopyToPosixTimestamp()
+          if timestamp is None or timestamp < 0:
+            # Before 1970 the date values of dfdatetime can differ from those
+            # derived from the POSIX timestamp.
+            timestamp = time_zone_converter.GetTimestamp(
+                *date_time.GetDateWithTimeOfDay())
+
+          date_time_string, utc_offset_string = (
+              time_zone_converter.CopyToDateTimeString(timestamp))
+
+        except (OverflowError, TypeError, ValueError):
           return 'Invalid'
 
+        iso8601_string = ''.join([
+            date_time_string, iso8601_string[19:-6], utc_offset_string])
+
     else:
       if not event.date_time or event.date_time.is_local_time:
         timestamp = event.timestamp
@@ -140,16 +150,15 @@ class FieldFormattingHelper(object):
       if not timestamp:
         return '0000-00-00T00:00:00.000000+00:00'
 
-      try:
-        datetime_object = datetime.datetime(1970, 1, 1) + datetime.timedelta(
-            microseconds=timestamp)
+      time_zone_converter = self._GetTimeZoneConverter(output_mediator)
 
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
+      try:
+        timestamp, microseconds = divmod(timestamp, 1000000)
+        date_time_string, utc_offset_string = (
+            time_zone_converter.CopyToDateTimeString(timestamp))
 
-        iso8601_string = datetime_object.isoformat()
         iso8601_string = '{0:s}.{1:06d}{2:s}'.format(
-            iso8601_string[:19], datetime_object.microsecond,
-            iso8601_string[-6:])
+            date_time_string, microseconds, utc_offset_string)
 
       except (OSError, OverflowError, TypeError, ValueError) as exception:
         iso8601_string = '0000-00-00T00:00:00.000000+00:00'
@@ -305,17 +314,17 @@ class FieldFormattingHelper(object):
       NoFormatterFound: if no message formatter can be found to match the data
           type in the event data.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      raise errors.NoFormatterFound((
-          'Unable to find message formatter event with data type: '
-          '{0:s}.').format(event_data.data_type))
+    formatted_event_data = self._GetFormattedEventData(
+        output_mediator, event_data)
 
-    event_values = event_data.CopyToDict()
-    message_formatter.FormatEventValues(output_mediator, event_values)
+    message = formatted_event_data.get('message', None)
+    if message is None:
+      message_formatter = formatted_event_data['message_formatter']
+      message = message_formatter.GetMessage(
+          formatted_event_data['event_values'])
+      formatted_event_data['message'] = message
 
-    return message_formatter.GetMessage(event_values)
+    return message
 
   def _FormatMessageShort(
       self, output_mediator, event, event_data, event_data_stream):
@@ -335,17 +344,17 @@ class FieldFormattingHelper(object):
       NoFormatterFound: if no message formatter can be found to match the data
           type in the event data.
     """
-    message_formatter = output_mediator.GetMessageFormatter(
-        event_data.data_type)
-    if not message_formatter:
-      raise errors.NoFormatterFound((
-          'Unable to find message formatter event with data type: '
-          '{0:s}.').format(event_data.data_type))
+    formatted_event_data = self._GetFormattedEventData(
+        output_mediator, event_data)
 
-    event_values = event_data.CopyToDict()
-    message_formatter.FormatEventValues(output_mediator, event_values)
+    message_short = formatted_event_data.get('message_short', None)
+    if message_short is None:
+      message_formatter = formatted_event_data['message_formatter']
+      message_short = message_formatter.GetMessageShort(
+          formatted_event_data['event_values'])
+      formatted_event_data['message_short'] = message_short
 
-    return message_formatter.GetMessageShort(event_values)
+    return message_short
 
   def _FormatSource(
       self, output_mediator, event, event_data, event_data_stream):
@@ -425,28 +434,8 @@ class FieldFormattingHelper(object):
     if not event.timestamp:
       return '--:--:--'
 
-    date_time = event.date_time
-    if not date_time or date_time.is_local_time:
-      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-          timestamp=event.timestamp)
-
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
-
-    if output_mediator.time_zone != pytz.UTC:
-      try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
-
-        hours, minutes, seconds = (
-            datetime_object.hour, datetime_object.minute,
-            datetime_object.second)
-
-      except (OSError, OverflowError, TypeError, ValueError):
-        hours, minutes, seconds = (None, None, None)
+    _, _, _, hours, minutes, seconds = self._GetDateWithTimeOfDay(
+        output_mediator, event)
 
     if None in (hours, minutes, seconds):
       self._ReportEventError(event, event_data, (
@@ -540,6 +529,127 @@ class FieldFormattingHelper(object):
 
   # pylint: enable=unused-argument
 
+  def _GetFormattedEventData(self, output_mediator, event_data):
+    """Retrieves the formatted event values and messages of event data.
+
+    Multiple events, such as the MACB timestamps of a file entry, typically
+    share the same event data, therefore the formatted event values and
+    messages are cached per event data identifier.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      event_data (EventData): event data.
+
+    Returns:
+      dict[str, object]: formatted event data, that contains the message
+          formatter, the formatted event values and the messages that have
+          been formatted so far.
+
+    Raises:
+      NoFormatterFound: if no message formatter can be found to match the data
+          type in the event data.
+    """
+    event_data_identifier = event_data.GetIdentifier()
+    lookup_key = event_data_identifier.CopyToString()
+
+    formatted_event_data = self._event_data_cache.get(lookup_key, None)
+    if not formatted_event_data:
+      message_formatter = output_mediator.GetMessageFormatter(
+          event_data.data_type)
+      if not message_formatter:
+        raise errors.NoFormatterFound((
+            'Unable to find message formatter event with data type: '
+            '{0:s}.').format(event_data.data_type))
+
+      event_values = event_data.CopyToDict()
+      message_formatter.FormatEventValues(output_mediator, event_values)
+
+      # Note that the identifier of event data that was not read from storage
+      # is based on the Python object identifier, which can be reused once
+      # the object has been freed. A reference to the event data is kept
+      # while it is cached to prevent this.
+      formatted_event_data = {
+          'event_data': event_data,
+          'event_values': event_values,
+          'message_formatter': message_formatter}
+
+      if len(self._event_data_cache) >= self._MAXIMUM_CACHED_EVENT_DATA:
+        self._event_data_cache.popitem(last=True)
+
+      self._event_data_cache[lookup_key] = formatted_event_data
+
+    self._event_data_cache.move_to_end(lookup_key, last=False)
+
+    return formatted_event_data
+
+  def _GetDateWithTimeOfDay(self, output_mediator, event):
+    """Retrieves the date with time of day of an event in the output time zone.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+      event (EventObject): event.
+
+    Returns:
+      tuple[int, int, int, int, int, int]: year, month, day of month, hours,
+          minutes, seconds or (None, None, None, None, None, None) if the
+          date and time of the event cannot be represented.
+    """
+    date_time = event.date_time
+    if not date_time or date_time.is_local_time:
+      # Note that dfdatetime truncates the timestamp to seconds.
+      timestamp = int(decimal.Decimal(event.timestamp) / 1000000)
+    else:
+      timestamp = date_time.CopyToPosixTimestamp()
+
+    time_zone_converter = self._GetTimeZoneConverter(output_mediator)
+
+    if timestamp is not None and timestamp >= 0:
+      try:
+        return time_zone_converter.GetDateWithTimeOfDay(timestamp)
+      except OverflowError:
+        pass
+
+    # Before 1970 the date values of dfdatetime can differ from those derived
+    # from the POSIX timestamp and date and time values outside the range
+    # supported by datetime can still be represented in UTC.
+    if not date_time or date_time.is_local_time:
+      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+          timestamp=event.timestamp)
+
+    date_with_time_of_day = date_time.GetDateWithTimeOfDay()
+    if output_mediator.time_zone == pytz.UTC:
+      return date_with_time_of_day
+
+    try:
+      timestamp = time_zone_converter.GetTimestamp(*date_with_time_of_day)
+      return time_zone_converter.GetDateWithTimeOfDay(timestamp)
+
+    except (OverflowError, TypeError, ValueError):
+      return None, None, None, None, None, None
+
+  def _GetTimeZoneConverter(self, output_mediator):
+    """Retrieves the converter of the output time zone.
+
+    Args:
+      output_mediator (OutputMediator): mediates interactions between output
+          modules and other components, such as storage and dfVFS.
+
+    Returns:
+      TimeZoneConverter: time zone converter.
+
+    Raises:
+      ValueError: if the output time zone is not supported.
+    """
+    output_time_zone = output_mediator.time_zone
+    if (not self._time_zone_converter or
+        self._time_zone_converter.time_zone != output_time_zone):
+      self._time_zone_converter = time_zone.TimeZoneConverter(
+          output_time_zone)
+
+    return self._time_zone_converter
+
   def _ReportEventError(self, event, event_data, error_message):
     """Reports an event related error.
 
@@ -19,6 +19,11 @@ class OutputModule(object):
   # Value to indicate the output module supports outputting custom fields.
   SUPPORTS_CUSTOM_FIELDS = False
 
+  # Value to indicate the output module supports exporting consecutive time
+  # ranges in parallel. This requires that the output of the time ranges,
+  # without header and footer, can be concatenated.
+  SUPPORTS_PARALLEL_EXPORT = False
+
   # Value to indicate the output module writes to an output file.
   WRITES_OUTPUT_FILE = False
 
@@ -86,6 +91,10 @@ class OutputModule(object):
     """
     return []
 
+  def Flush(self):
+    """Flushes output buffered by the output module."""
+    return
+
   def Open(self, **kwargs):  # pylint: disable=unused-argument
     """Opens the output."""
     return
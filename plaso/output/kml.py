@@ -20,6 +20,9 @@ class KMLOutputModule(rawpy.NativePythonOutputModule):
   NAME = 'kml'
   DESCRIPTION = 'Saves events with geography data into a KML format.'
 
+  # The placemarks are written into a single XML document.
+  SUPPORTS_PARALLEL_EXPORT = False
+
   def _WriteFieldValues(self, output_mediator, field_values):
     """Writes field values to the output.
 
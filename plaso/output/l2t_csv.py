@@ -5,13 +5,9 @@ For documentation on the L2T CSV format see:
   https://forensics.wiki/l2t_csv
 """
 
-import datetime
-import pytz
-
 from acstore.containers import interface as containers_interface
 
 from dfdatetime import interface as dfdatetime_interface
-from dfdatetime import posix_time as dfdatetime_posix_time
 
 from plaso.lib import errors
 from plaso.output import formatting_helper
@@ -135,30 +131,8 @@ class L2TCSVFieldFormattingHelper(formatting_helper.FieldFormattingHelper):
     if not event.timestamp:
       return '00/00/0000'
 
-    date_time = event.date_time
-    if not date_time or date_time.is_local_time:
-      date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
-          timestamp=event.timestamp)
-
-    # Note that GetDateWithTimeOfDay will return the date and time in UTC,
-    # so no adjustment for date_time.time_zone_offset is needed.
-    year, month, day_of_month, hours, minutes, seconds = (
-        date_time.GetDateWithTimeOfDay())
-
-    if output_mediator.time_zone != pytz.UTC:
-      try:
-        datetime_object = datetime.datetime(
-            year, month, day_of_month, hours, minutes, seconds,
-            tzinfo=pytz.UTC)
-
-        datetime_object = datetime_object.astimezone(output_mediator.time_zone)
-
-        year = datetime_object.year
-        month = datetime_object.month
-        day_of_month = datetime_object.day
-
-      except (OSError, OverflowError, TypeError, ValueError):
-        year, month, day_of_month = (None, None, None)
+    year, month, day_of_month, _, _, _ = self._GetDateWithTimeOfDay(
+        output_mediator, event)
 
     if None in (year, month, day_of_month):
       self._ReportEventError(event, event_data, (
@@ -35,7 +35,7 @@ class OutputMediator(object):
 
   def __init__(
       self, storage_reader, data_location=None, dynamic_time=False,
-      preferred_encoding='utf-8'):
+      preferred_encoding='utf-8', preload_winevt_message_strings=False):
     """Initializes an output mediator.
 
     Args:
@@ -44,6 +44,9 @@ class OutputMediator(object):
       dynamic_time (Optional[bool]): True if date and time values should be
           represented in their granularity or semantically.
       preferred_encoding (Optional[str]): preferred encoding to output.
+      preload_winevt_message_strings (Optional[bool]): True if the Windows
+          EventLog message strings in the storage should be read into memory
+          on the first lookup.
     """
     super(OutputMediator, self).__init__()
     self._dynamic_time = dynamic_time
@@ -52,6 +55,7 @@ class OutputMediator(object):
     self._lcid = None
     self._message_formatters = {}
     self._preferred_encoding = preferred_encoding
+    self._preload_winevt_message_strings = preload_winevt_message_strings
     self._source_mappings = {}
     self._storage_reader = storage_reader
     self._system_configurations = None
@@ -356,7 +360,8 @@ class OutputMediator(object):
       lcid = self._DEFAULT_LCID
 
     return winevt_rc.WinevtResourcesHelper(
-        self._storage_reader, self.data_location, lcid)
+        self._storage_reader, self.data_location, lcid,
+        preload_message_strings=self._preload_winevt_message_strings)
 
   def ReadMessageFormattersFromDirectory(self, path):
     """Reads message formatters from a directory.
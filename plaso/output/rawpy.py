@@ -18,6 +18,8 @@ class NativePythonOutputModule(text_file.TextFileOutputModule):
   NAME = 'rawpy'
   DESCRIPTION = 'native (or "raw") Python output.'
 
+  SUPPORTS_PARALLEL_EXPORT = True
+
   # TODO: remove attributes that are no longer considered reserved.
   _RESERVED_ATTRIBUTES = frozenset([
       'body',
@@ -146,6 +146,8 @@ class TextFileOutputModule(interface.OutputModule):
 class SortedTextFileOutputModule(TextFileOutputModule):
   """Shared functionality of an output module that writes to a text file."""
 
+  SUPPORTS_PARALLEL_EXPORT = True
+
   _SORT_KEY_FIELD_NAMES = []
 
   def __init__(self, event_formatting_helper):
@@ -212,6 +214,10 @@ class SortedTextFileOutputModule(TextFileOutputModule):
           for field_name in self._SORT_KEY_FIELD_NAMES])
       self._sorted_strings_heap.PushString(sort_key, output_text)
 
+  def Flush(self):
+    """Flushes output buffered by the output module."""
+    self._FlushSortedStringsHeap()
+
   def WriteFieldValues(
       self, output_mediator, event, event_data, event_data_stream, event_tag):
     """Writes field values to the output.
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""Time zone conversion helper for output modules."""
+
+import bisect
+import datetime
+
+
+class TimeZoneConverter(object):
+  """Converts POSIX timestamps to date and time values in a time zone.
+
+  Converting a timestamp with datetime.astimezone() for every event is
+  relatively expensive. A pytz time zone stores its UTC offsets as a table of
+  transitions in UTC. The converter copies this table once, looks up the UTC
+  offset of a timestamp with a binary search and caches the date and time
+  values per minute in the time zone.
+
+  The date and time values are identical to those of datetime.astimezone(),
+  including the rounding of UTC offsets to minutes done by pytz.
+
+  Attributes:
+    time_zone (datetime.tzinfo): time zone.
+  """
+
+  _EPOCH = datetime.datetime(1970, 1, 1)
+
+  _ONE_SECOND = datetime.timedelta(seconds=1)
+
+  # Range of POSIX timestamps, in seconds, supported by datetime.datetime.
+  _MAXIMUM_TIMESTAMP = 253402300799
+  _MINIMUM_TIMESTAMP = -62135596800
+
+  # Maximum number of minutes of which the date and time values are cached.
+  _MAXIMUM_CACHED_MINUTES = 8192
+
+  def __init__(self, time_zone):
+    """Initializes a time zone converter.
+
+    Args:
+      time_zone (datetime.tzinfo): pytz time zone.
+
+    Raises:
+      ValueError: if the time zone is not supported.
+    """
+    super(TimeZoneConverter, self).__init__()
+    self._cached_minutes = {}
+    self._transition_times = []
+    self._utc_offset_strings = {}
+    self._utc_offsets = []
+
+    self.time_zone = time_zone
+
+    utc_transition_times = getattr(time_zone, '_utc_transition_times', None)
+    transition_info = getattr(time_zone, '_transition_info', None)
+    if utc_transition_times and transition_info:
+      for transition_time, (utc_offset, _, _) in zip(
+          utc_transition_times, transition_info):
+        self._transition_times.append(
+            (transition_time - self._EPOCH) // self._ONE_SECOND)
+        self._utc_offsets.append(utc_offset // self._ONE_SECOND)
+
+    else:
+      # A time zone without transitions, such as UTC, has a fixed UTC offset.
+      utc_offset = time_zone.utcoffset(None)
+      if utc_offset is None:
+        raise ValueError('Unsupported time zone: {0!s}'.format(time_zone))
+
+      self._transition_times.append(self._MINIMUM_TIMESTAMP)
+      self._utc_offsets.append(utc_offset // self._ONE_SECOND)
+
+  def _FormatUTCOffset(self, utc_offset):
+    """Formats an UTC offset.
+
+    Args:
+      utc_offset (int): UTC offset in seconds.
+
+    Returns:
+      str: UTC offset formatted as "+HH:MM".
+    """
+    utc_offset_string = self._utc_offset_strings.get(utc_offset, None)
+    if not utc_offset_string:
+      # Mimic datetime.isoformat(), which adds seconds to the UTC offset if
+      # present, of which only the last 6 characters are used.
+      sign = '-' if utc_offset < 0 else '+'
+      minutes, seconds = divmod(abs(utc_offset), 60)
+      hours, minutes = divmod(minutes, 60)
+
+      utc_offset_string = '{0:s}{1:02d}:{2:02d}'.format(sign, hours, minutes)
+      if seconds:
+        utc_offset_string = '{0:s}:{1:02d}'.format(utc_offset_string, seconds)
+
+      utc_offset_string = utc_offset_string[-6:]
+      self._utc_offset_strings[utc_offset] = utc_offset_string
+
+    return utc_offset_string
+
+  def _GetMinuteValues(self, timestamp):
+    """Retrieves the date and time values of a minute in the time zone.
+
+    Args:
+      timestamp (int): number of seconds since January 1, 1970 00:00:00 UTC.
+
+    Returns:
+      tuple[tuple[int, int, int, int, int, str], int, int]: year, month, day
+          of month, hours, minutes and date and time formatted as
+          "YYYY-MM-DDTHH:MM" of the minute, the seconds within the minute and
+          the UTC offset in seconds.
+
+    Raises:
+      OverflowError: if the timestamp or the corresponding date and time in
+          the time zone are out of bounds.
+    """
+    if not self._MINIMUM_TIMESTAMP <= timestamp <= self._MAXIMUM_TIMESTAMP:
+      raise OverflowError('Timestamp: {0:d} out of bounds.'.format(timestamp))
+
+    index = bisect.bisect_right(self._transition_times, timestamp)
+    utc_offset = self._utc_offsets[max(index - 1, 0)]
+
+    minutes, seconds = divmod(timestamp + utc_offset, 60)
+
+    minute_values = self._cached_minutes.get(minutes, None)
+    if not minute_values:
+      local_timestamp = minutes * 60
+      if not (self._MINIMUM_TIMESTAMP <= local_timestamp <=
+              self._MAXIMUM_TIMESTAMP):
+        raise OverflowError((
+            'Timestamp: {0:d} with UTC offset: {1:d} out of bounds.').format(
+                timestamp, utc_offset))
+
+      datetime_object = self._EPOCH + datetime.timedelta(
+          seconds=local_timestamp)
+
+      if len(self._cached_minutes) >= self._MAXIMUM_CACHED_MINUTES:
+        self._cached_minutes = {}
+
+      minute_values = (
+          datetime_object.year, datetime_object.month, datetime_object.day,
+          datetime_object.hour, datetime_object.minute,
+          '{0:04d}-{1:02d}-{2:02d}T{3:02d}:{4:02d}'.format(
+              datetime_object.year, datetime_object.month,
+              datetime_object.day, datetime_object.hour,
+              datetime_object.minute))
+      self._cached_minutes[minutes] = minute_values
+
+    return minute_values, seconds, utc_offset
+
+  def CopyToDateTimeString(self, timestamp):
+    """Copies a timestamp to a date and time string in the time zone.
+
+    Args:
+      timestamp (int): number of seconds since January 1, 1970 00:00:00 UTC.
+
+    Returns:
+      tuple[str, str]: date and time formatted as "YYYY-MM-DDTHH:MM:SS" and
+          UTC offset formatted as "+HH:MM".
+
+    Raises:
+      OverflowError: if the timestamp or the corresponding date and time in
+          the time zone are out of bounds.
+    """
+    minute_values, seconds, utc_offset = self._GetMinuteValues(timestamp)
+
+    date_time_string = '{0:s}:{1:02d}'.format(minute_values[5], seconds)
+    return date_time_string, self._FormatUTCOffset(utc_offset)
+
+  def GetDateWithTimeOfDay(self, timestamp):
+    """Retrieves the date with time of day in the time zone.
+
+    Args:
+      timestamp (int): number of seconds since January 1, 1970 00:00:00 UTC.
+
+    Returns:
+      tuple[int, int, int, int, int, int]: year, month, day of month, hours,
+          minutes, seconds.
+
+    Raises:
+      OverflowError: if the timestamp or the corresponding date and time in
+          the time zone are out of bounds.
+    """
+    minute_values, seconds, _ = self._GetMinuteValues(timestamp)
+
+    return minute_values[:5] + (seconds, )
+
+  def GetTimestamp(
+      self, year, month, day_of_month, hours, minutes, seconds):
+    """Retrieves the POSIX timestamp of a date with time of day in UTC.
+
+    Args:
+      year (int): year.
+      month (int): month, where 1 represents January.
+      day_of_month (int): day of month, where 1 represents the first day.
+      hours (int): hours.
+      minutes (int): minutes.
+      seconds (int): seconds.
+
+    Returns:
+      int: number of seconds since January 1, 1970 00:00:00 UTC.
+
+    Raises:
+      TypeError: if a date or time value is not set.
+      ValueError: if a date or time value is out of bounds.
+    """
+    datetime_object = datetime.datetime(
+        year, month, day_of_month, hours, minutes, seconds)
+
+    return (datetime_object - self._EPOCH) // self._ONE_SECOND
@@ -4,6 +4,7 @@
 import collections
 import os
 import sqlite3
+import sys
 
 from plaso.engine import path_helper
 from plaso.helpers.windows import languages
@@ -341,15 +342,25 @@ class WinevtResourcesHelper(object):
   # The maximum number of cached message strings
   _MAXIMUM_CACHED_MESSAGE_STRINGS = 32 * 1024
 
+  # The maximum number of cached message strings that are not available.
+  _MAXIMUM_CACHED_MISSING_MESSAGE_STRINGS = 32 * 1024
+
+  # The maximum size of the preloaded message strings, in bytes.
+  _MAXIMUM_PRELOADED_MESSAGE_STRINGS_SIZE = 128 * 1024 * 1024
+
   _WINEVT_RC_DATABASE = 'winevt-rc.db'
 
-  def __init__(self, storage_reader, data_location, lcid):
+  def __init__(
+      self, storage_reader, data_location, lcid, preload_message_strings=False):
     """Initializes Windows EventLog resources helper.
 
     Args:
       storage_reader (StorageReader): storage reader.
       data_location (str): data location of the winevt-rc database.
       lcid (int): Windows Language Code Identifier (LCID).
+      preload_message_strings (Optional[bool]): True if the message strings
+          of the Windows EventLog providers in the storage should be read
+          into memory on the first lookup.
     """
     language_tag = languages.WindowsLanguageHelper.GetLanguageTagForLCID(
         lcid or self.DEFAULT_LCID)
@@ -360,7 +371,11 @@ class WinevtResourcesHelper(object):
     self._language_tag = language_tag.lower()
     self._lcid = lcid or self.DEFAULT_LCID
     self._message_string_cache = collections.OrderedDict()
+    self._message_strings_index = None
+    self._missing_message_string_cache = collections.OrderedDict()
+    self._preload_message_strings = preload_message_strings
     self._storage_reader = storage_reader
+    self._wevt_template_events_index = None
     self._windows_eventlog_message_files = None
     self._windows_eventlog_providers = None
     self._winevt_database_reader = None
@@ -395,6 +410,26 @@ class WinevtResourcesHelper(object):
       self._message_string_cache[lookup_key] = message_string
       self._message_string_cache.move_to_end(lookup_key, last=False)
 
+  def _CacheMissingMessageString(
+      self, provider_identifier, log_source, message_identifier,
+      event_version):
+    """Caches that a specific message string is not available.
+
+    Args:
+      provider_identifier (str): EventLog provider identifier.
+      log_source (str): EventLog source, such as "Application Error".
+      message_identifier (int): message identifier.
+      event_version (int): event version or None if not set.
+    """
+    if (len(self._missing_message_string_cache) >=
+        self._MAXIMUM_CACHED_MISSING_MESSAGE_STRINGS):
+      self._missing_message_string_cache.popitem(last=True)
+
+    lookup_key = (
+        provider_identifier, log_source, message_identifier, event_version)
+    self._missing_message_string_cache[lookup_key] = None
+    self._missing_message_string_cache.move_to_end(lookup_key, last=False)
+
   def _GetCachedMessageString(
       self, provider_identifier, log_source, message_identifier, event_version):
     """Retrieves a specific cached message string.
@@ -429,6 +464,38 @@ class WinevtResourcesHelper(object):
 
     return message_string
 
+  def _GetMessageFileIdentifiers(self, provider):
+    """Retrieves the identifiers of the message files of a provider.
+
+    Args:
+      provider (WindowsEventLogProviderArtifact): Windows EventLog provider.
+
+    Returns:
+      list[str]: identifiers of the message files, including the language
+          specific MUI message files.
+    """
+    message_file_identifiers = []
+    for windows_path in provider.event_message_files or []:
+      path, filename = path_helper.PathHelper.GetWindowsSystemPath(
+          windows_path, self._environment_variables)
+
+      lookup_path = '\\'.join([path, filename]).lower()
+      message_file_identifier = self._windows_eventlog_message_files.get(
+          lookup_path, None)
+      if message_file_identifier:
+        message_file_identifier = message_file_identifier.CopyToString()
+        message_file_identifiers.append(message_file_identifier)
+
+      mui_filename = '{0:s}.mui'.format(filename)
+      lookup_path = '\\'.join([path, self._language_tag, mui_filename]).lower()
+      message_file_identifier = self._windows_eventlog_message_files.get(
+          lookup_path, None)
+      if message_file_identifier:
+        message_file_identifier = message_file_identifier.CopyToString()
+        message_file_identifiers.append(message_file_identifier)
+
+    return message_file_identifiers
+
   def _GetWinevtRcDatabaseReader(self):
     """Opens the Windows EventLog resource database reader.
 
@@ -543,13 +610,22 @@ class WinevtResourcesHelper(object):
     if not provider:
       return None
 
+    if self._preload_message_strings:
+      self._preload_message_strings = False
+      self._ReadWindowsEventLogMessageStrings(storage_reader)
+
     if not storage_reader.HasAttributeContainers(
         'windows_eventlog_message_string'):
       return None
 
     # Map the event identifier to a message identifier as defined by the
     # WEVT_TEMPLATE event definition.
-    if provider_identifier and storage_reader.HasAttributeContainers(
+    event_message_identifier = None
+    if provider_identifier and self._wevt_template_events_index is not None:
+      event_message_identifier = self._wevt_template_events_index.get(
+          (provider_identifier, message_identifier, event_version), None)
+
+    elif provider_identifier and storage_reader.HasAttributeContainers(
         'windows_wevt_template_event'):
       # TODO: add message_file_identifiers to filter_expression
       filter_expression = (
@@ -561,33 +637,17 @@ class WinevtResourcesHelper(object):
 
       for event_definition in storage_reader.GetAttributeContainers(
           'windows_wevt_template_event', filter_expression=filter_expression):
-        logger.debug(
-            'Message: 0x{0:08x} of provider: {1:s} maps to: 0x{2:08x}'.format(
-                message_identifier, provider_identifier,
-                event_definition.message_identifier))
-        message_identifier = event_definition.message_identifier
+        event_message_identifier = event_definition.message_identifier
         break
 
-    message_file_identifiers = []
-    for windows_path in provider.event_message_files or []:
-      path, filename = path_helper.PathHelper.GetWindowsSystemPath(
-          windows_path, self._environment_variables)
-
-      lookup_path = '\\'.join([path, filename]).lower()
-      message_file_identifier = self._windows_eventlog_message_files.get(
-          lookup_path, None)
-      if message_file_identifier:
-        message_file_identifier = message_file_identifier.CopyToString()
-        message_file_identifiers.append(message_file_identifier)
-
-      mui_filename = '{0:s}.mui'.format(filename)
-      lookup_path = '\\'.join([path, self._language_tag, mui_filename]).lower()
-      message_file_identifier = self._windows_eventlog_message_files.get(
-          lookup_path, None)
-      if message_file_identifier:
-        message_file_identifier = message_file_identifier.CopyToString()
-        message_file_identifiers.append(message_file_identifier)
+    if event_message_identifier is not None:
+      logger.debug(
+          'Message: 0x{0:08x} of provider: {1:s} maps to: 0x{2:08x}'.format(
+              message_identifier, provider_identifier,
+              event_message_identifier))
+      message_identifier = event_message_identifier
 
+    message_file_identifiers = self._GetMessageFileIdentifiers(provider)
     if not message_file_identifiers:
       logger.warning(
           'No message file for message: 0x{0:08x} of provider: {1:s}'.format(
@@ -595,19 +655,26 @@ class WinevtResourcesHelper(object):
       return None
 
     message_strings = []
-    # TODO: add message_file_identifiers to filter_expression
-    filter_expression = (
-        'language_identifier == {0:d} and '
-        'message_identifier == {1:d}').format(
-            self._lcid, message_identifier)
-
-    for message_string in storage_reader.GetAttributeContainers(
-        'windows_eventlog_message_string',
-        filter_expression=filter_expression):
-      identifier = message_string.GetMessageFileIdentifier()
-      identifier = identifier.CopyToString()
-      if identifier in message_file_identifiers:
-        message_strings.append(message_string)
+    if self._message_strings_index is not None:
+      for identifier, string in self._message_strings_index.get(
+          message_identifier, []):
+        if identifier in message_file_identifiers:
+          message_strings.append(string)
+
+    else:
+      # TODO: add message_file_identifiers to filter_expression
+      filter_expression = (
+          'language_identifier == {0:d} and '
+          'message_identifier == {1:d}').format(
+              self._lcid, message_identifier)
+
+      for message_string in storage_reader.GetAttributeContainers(
+          'windows_eventlog_message_string',
+          filter_expression=filter_expression):
+        identifier = message_string.GetMessageFileIdentifier()
+        identifier = identifier.CopyToString()
+        if identifier in message_file_identifiers:
+          message_strings.append(message_string.string)
 
     if not message_strings:
       logger.warning((
@@ -615,7 +682,86 @@ class WinevtResourcesHelper(object):
           '{1:s}').format(message_identifier, lookup_key))
       return None
 
-    return message_strings[0].string
+    return message_strings[0]
+
+  def _ReadWindowsEventLogMessageStrings(self, storage_reader):
+    """Reads the Windows EventLog message strings into memory.
+
+    Only the message strings, in the preferred language, of the message files
+    of the Windows EventLog providers in the storage are read. If the
+    approximate size of the message strings exceeds the maximum, they are read
+    from the storage per lookup instead.
+
+    Args:
+      storage_reader (StorageReader): storage reader.
+    """
+    message_file_identifiers = set()
+    for provider in self._windows_eventlog_providers.values():
+      message_file_identifiers.update(
+          self._GetMessageFileIdentifiers(provider))
+
+    size = 0
+
+    wevt_template_events_index = {}
+    if storage_reader.HasAttributeContainers('windows_wevt_template_event'):
+      for event_definition in storage_reader.GetAttributeContainers(
+          'windows_wevt_template_event'):
+        lookup_key = (
+            event_definition.provider_identifier, event_definition.identifier,
+            event_definition.version)
+        if lookup_key not in wevt_template_events_index:
+          wevt_template_events_index[lookup_key] = (
+              event_definition.message_identifier)
+          size += sys.getsizeof(lookup_key)
+
+        # Lookups without event version use the first event definition, as
+        # the filter expression in _ReadWindowsEventLogMessageString does.
+        lookup_key = (
+            event_definition.provider_identifier, event_definition.identifier,
+            None)
+        if lookup_key not in wevt_template_events_index:
+          wevt_template_events_index[lookup_key] = (
+              event_definition.message_identifier)
+          size += sys.getsizeof(lookup_key)
+
+    message_strings_index = {}
+    number_of_message_strings = 0
+
+    if message_file_identifiers and storage_reader.HasAttributeContainers(
+        'windows_eventlog_message_string'):
+      filter_expression = 'language_identifier == {0:d}'.format(self._lcid)
+
+      for message_string in storage_reader.GetAttributeContainers(
+          'windows_eventlog_message_string',
+          filter_expression=filter_expression):
+        identifier = message_string.GetMessageFileIdentifier()
+        identifier = identifier.CopyToString()
+        if identifier not in message_file_identifiers:
+          continue
+
+        # Share the message file identifier strings between index values.
+        index_value = (sys.intern(identifier), message_string.string)
+
+        size += sys.getsizeof(index_value) + sys.getsizeof(
+            message_string.string)
+        if size > self._MAXIMUM_PRELOADED_MESSAGE_STRINGS_SIZE:
+          logger.warning((
+              'Windows EventLog message strings exceed: {0:d} bytes, '
+              'reading message strings per lookup instead.').format(
+                  self._MAXIMUM_PRELOADED_MESSAGE_STRINGS_SIZE))
+          return
+
+        message_strings_index.setdefault(
+            message_string.message_identifier, []).append(index_value)
+        number_of_message_strings += 1
+
+    logger.debug((
+        'Preloaded {0:d} Windows EventLog message strings and {1:d} event '
+        'definitions of approximately {2:d} bytes.').format(
+            number_of_message_strings, len(wevt_template_events_index), size))
+
+    self._message_strings_index = message_strings_index
+    self._wevt_template_events_index = wevt_template_events_index
 
   def _ReadWindowsEventLogProviders(self, storage_reader):
     """Reads the Windows EventLog providers.
@@ -651,20 +797,31 @@ class WinevtResourcesHelper(object):
     """
     message_string = self._GetCachedMessageString(
         provider_identifier, log_source, message_identifier, event_version)
-    if not message_string:
-      # TODO: change this logic.
-      if self._storage_reader and self._storage_reader.HasAttributeContainers(
-          'windows_eventlog_provider'):
-        message_string = self._ReadWindowsEventLogMessageString(
-            self._storage_reader, provider_identifier, log_source,
-            message_identifier, event_version)
-      else:
-        message_string = self._GetWinevtRcDatabaseMessageString(
-            log_source, message_identifier)
+    if message_string:
+      return message_string
 
-      if message_string:
-        self._CacheMessageString(
-            provider_identifier, log_source, message_identifier, event_version,
-            message_string)
+    lookup_key = (
+        provider_identifier, log_source, message_identifier, event_version)
+    if lookup_key in self._missing_message_string_cache:
+      self._missing_message_string_cache.move_to_end(lookup_key, last=False)
+      return None
+
+    # TODO: change this logic.
+    if self._storage_reader and self._storage_reader.HasAttributeContainers(
+        'windows_eventlog_provider'):
+      message_string = self._ReadWindowsEventLogMessageString(
+          self._storage_reader, provider_identifier, log_source,
+          message_identifier, event_version)
+    else:
+      message_string = self._GetWinevtRcDatabaseMessageString(
+          log_source, message_identifier)
+
+    if message_string:
+      self._CacheMessageString(
+          provider_identifier, log_source, message_identifier, event_version,
+          message_string)
+    else:
+      self._CacheMissingMessageString(
+          provider_identifier, log_source, message_identifier, event_version)
 
     return message_string
@@ -75,6 +75,7 @@ class ParserMediator(object):
     self._resolver_context = resolver_context
     self._storage_writer = None
     self._temporary_directory = None
+    self._text_log_range_size = 0
     self._windows_event_log_providers_per_path = None
 
     self.registry_find_specs = registry_find_specs
@@ -118,6 +119,11 @@ class ParserMediator(object):
     """str: path of the directory for temporary files."""
     return self._temporary_directory
 
+  @property
+  def text_log_range_size(self):
+    """int: size of the data ranges large text log files are split into."""
+    return self._text_log_range_size
+
   def _CreateEnvironmentVariablesPerPathSpec(self, system_configurations):
     """Creates the environment variables per path specification lookup table.
 
@@ -273,6 +279,15 @@ class ParserMediator(object):
     """
     return path_helper.PathHelper.GetDisplayNameForPathSpec(path_spec)
 
+  def GetEventDataStreamPathSpec(self):
+    """Retrieves the path specification of the active event data stream.
+
+    Returns:
+      dfvfs.PathSpec: path specification of the active event data stream or
+          None if not available.
+    """
+    return getattr(self._event_data_stream, 'path_spec', None)
+
   def GetFileEntry(self):
     """Retrieves the active file entry.
 
@@ -662,6 +677,15 @@ class ParserMediator(object):
     """
     self._temporary_directory = temporary_directory
 
+  def SetTextLogRangeSize(self, text_log_range_size):
+    """Sets the size of the data ranges large text log files are split into.
+
+    Args:
+      text_log_range_size (int): size of the data ranges, in bytes, where 0 or
+          None represents no splitting.
+    """
+    self._text_log_range_size = text_log_range_size or 0
+
   def SignalAbort(self):
     """Signals the parsers to abort."""
     self._abort = True
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 """SQLite parser."""
 
+import collections
 import os
 import sqlite3
 import tempfile
@@ -14,6 +15,11 @@ from plaso.parsers import logger
 from plaso.parsers import manager
 from plaso.parsers import plugins
 
+try:
+  from plaso.parsers import sqlite_vfs
+except ImportError:
+  sqlite_vfs = None
+
 
 class SQLiteCache(plugins.BasePluginCache):
   """Cache for storing results of SQL queries."""
@@ -118,8 +124,8 @@ class SQLiteDatabase(object):
   SCHEMA_QUERY = (
       'SELECT tbl_name, sql '
       'FROM sqlite_master '
-      'WHERE type = "table" AND tbl_name != "xp_proc" '
-      'AND tbl_name != "sqlite_sequence"')
+      'WHERE type = \'table\' AND tbl_name != \'xp_proc\' '
+      'AND tbl_name != \'sqlite_sequence\'')
 
   def __init__(self, filename, temporary_directory=None):
     """Initializes a SQLite database.
@@ -157,11 +163,44 @@ class SQLiteDatabase(object):
       temporary_file.write(data)
       data = file_object.read(self._READ_BUFFER_SIZE)
 
-  def Close(self):
-    """Closes the database connection and cleans up the temporary file."""
-    self.schema = {}
-    self._database = None
+  def _CopyToTemporaryFiles(self, file_object, wal_file_object=None):
+    """Copies the database and its Write-Ahead Log (WAL) to temporary files.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+      wal_file_object (Optional[dfvfs.FileIO]): file-like object for the
+          Write-Ahead Log (WAL) file.
+
+    Raises:
+      IOError: if the file-like object cannot be read.
+      OSError: if the file-like object cannot be read.
+    """
+    with tempfile.NamedTemporaryFile(
+        delete=False, dir=self._temporary_directory) as temporary_file:
+      try:
+        self._CopyFileObjectToTemporaryFile(file_object, temporary_file)
+        self._temp_db_file_path = temporary_file.name
+
+      except IOError:
+        os.remove(temporary_file.name)
+        raise
+
+    if wal_file_object:
+      # Create WAL file using same filename so it is available for
+      # sqlite3.connect()
+      temporary_filename = '{0:s}-wal'.format(self._temp_db_file_path)
+
+      with open(temporary_filename, 'wb') as temporary_file:
+        try:
+          self._CopyFileObjectToTemporaryFile(wal_file_object, temporary_file)
+          self._temp_wal_file_path = temporary_filename
+
+        except IOError:
+          os.remove(temporary_filename)
+          raise
 
+  def _RemoveTemporaryFiles(self):
+    """Removes the temporary copies of the database and its WAL."""
     if os.path.exists(self._temp_db_file_path):
       try:
         os.remove(self._temp_db_file_path)
@@ -184,13 +223,25 @@ class SQLiteDatabase(object):
 
     self._temp_wal_file_path = ''
 
+  def Close(self):
+    """Closes the database connection and cleans up the temporary files."""
+    self.schema = {}
+
+    if self._database:
+      self._database.close()
+      self._database = None
+
+    self._RemoveTemporaryFiles()
+
   def Open(self, file_object, wal_file_object=None):
     """Opens a SQLite database file.
 
-    Since pysqlite cannot read directly from a file-like object a temporary
-    copy of the file is made. After creating a copy the database file this
-    function sets up a connection with the database and determines the names
-    of the tables.
+    If APSW is available the database is read directly from the file-like
+    objects, which therefore must remain open until the database is closed.
+    Otherwise, since pysqlite cannot read directly from a file-like object,
+    a temporary copy of the database and its WAL is made. After opening the
+    database this function determines the names of the tables and their
+    columns.
 
     Args:
       file_object (dfvfs.FileIO): file-like object.
@@ -206,46 +257,18 @@ class SQLiteDatabase(object):
     if not file_object:
       raise ValueError('Missing file object.')
 
-    # TODO: Current design copies the entire file into a buffer
-    # that is parsed by each SQLite parser. This is not very efficient,
-    # especially when many SQLite parsers are ran against a relatively
-    # large SQLite database. This temporary file that is created should
-    # be usable by all SQLite parsers so the file should only be read
-    # once in memory and then deleted when all SQLite parsers have completed.
-
-    # TODO: Change this into a proper implementation using APSW
-    # and virtual filesystems when that will be available.
-    # Info: http://apidoc.apsw.googlecode.com/hg/vfs.html#vfs and
-    # http://apidoc.apsw.googlecode.com/hg/example.html#example-vfs
-    # Until then, just copy the file into a tempfile and parse it.
-
-    with tempfile.NamedTemporaryFile(
-        delete=False, dir=self._temporary_directory) as temporary_file:
-      try:
-        self._CopyFileObjectToTemporaryFile(file_object, temporary_file)
-        self._temp_db_file_path = temporary_file.name
-
-      except IOError:
-        os.remove(temporary_file.name)
-        raise
-
-    if wal_file_object:
-      # Create WAL file using same filename so it is available for
-      # sqlite3.connect()
-      temporary_filename = '{0:s}-wal'.format(self._temp_db_file_path)
+    try:
+      if sqlite_vfs:
+        self._database = sqlite_vfs.Connect(
+            file_object, wal_file_object=wal_file_object)
 
-      with open(temporary_filename, 'wb') as temporary_file:
-        try:
-          self._CopyFileObjectToTemporaryFile(wal_file_object, temporary_file)
-          self._temp_wal_file_path = temporary_filename
+      else:
+        self._CopyToTemporaryFiles(
+            file_object, wal_file_object=wal_file_object)
 
-        except IOError:
-          os.remove(temporary_filename)
-          raise
+        self._database = sqlite3.connect(self._temp_db_file_path)
+        self._database.row_factory = sqlite3.Row
 
-    self._database = sqlite3.connect(self._temp_db_file_path)
-    try:
-      self._database.row_factory = sqlite3.Row
       cursor = self._database.cursor()
 
       sql_results = cursor.execute(self.SCHEMA_QUERY)
@@ -266,14 +289,7 @@ class SQLiteDatabase(object):
           self.columns_per_table[table_name].append(pragma_result['name'])
 
     except sqlite3.DatabaseError as exception:
-      self._database.close()
-      self._database = None
-
-      os.remove(self._temp_db_file_path)
-      self._temp_db_file_path = ''
-      if self._temp_wal_file_path:
-        os.remove(self._temp_wal_file_path)
-        self._temp_wal_file_path = ''
+      self.Close()
 
       logger.debug(
           'Unable to parse SQLite database: {0:s} with error: {1!s}'.format(
@@ -287,7 +303,7 @@ class SQLiteDatabase(object):
       query (str): SQL query.
 
     Returns:
-      sqlite3.Cursor: results.
+      sqlite3.Cursor|SQLiteCursor: results.
 
     Raises:
       sqlite3.DatabaseError: if querying the database fails.
@@ -305,6 +321,36 @@ class SQLiteParser(interface.FileEntryParser):
 
   _plugin_classes = {}
 
+  def __init__(self):
+    """Initializes a SQLite database file parser."""
+    # Note that the index is set before the superclass initializer, since
+    # the superclass initializer enables the plugins.
+    self._plugins_per_table_name = {}
+    super(SQLiteParser, self).__init__()
+
+  def _GetPluginsForDatabase(self, database):
+    """Retrieves the plugins that could parse the database.
+
+    The plugins are determined with the index of the plugins per table name.
+    The plugins are returned in the same order as in _plugins_per_name.
+
+    Args:
+      database (SQLiteDatabase): database.
+
+    Returns:
+      list[SQLitePlugin]: plugins whose index table is in the database.
+    """
+    plugin_names = set()
+    for table_name in database.tables:
+      plugin_names.update(self._plugins_per_table_name.get(table_name, []))
+
+    if not plugin_names:
+      return []
+
+    return [
+        plugin for plugin_name, plugin in self._plugins_per_name.items()
+        if plugin_name in plugin_names]
+
   def _OpenDatabaseWithWAL(
       self, parser_mediator, database_file_entry, database_file_object,
       filename):
@@ -404,6 +450,39 @@ class SQLiteParser(interface.FileEntryParser):
     finally:
       parser_mediator.SampleStopTiming(profiling_name)
 
+  def EnablePlugins(self, plugin_includes):
+    """Enables parser plugins.
+
+    Each plugin with a required structure is indexed by the table name of its
+    required structure that is required by the least number of enabled
+    plugins. Plugins without a required structure are not indexed, since
+    they cannot parse a database.
+
+    Args:
+      plugin_includes (set[str]): names of the plugins to enable, where
+          set(['*']) represents all plugins. Note the default plugin, if
+          it exists, is always enabled and cannot be disabled.
+    """
+    super(SQLiteParser, self).EnablePlugins(plugin_includes)
+
+    self._plugins_per_table_name = {}
+
+    number_of_plugins_per_table_name = collections.Counter()
+    for plugin in self._plugins_per_name.values():
+      number_of_plugins_per_table_name.update(
+          plugin.REQUIRED_STRUCTURE.keys())
+
+    for plugin_name, plugin in self._plugins_per_name.items():
+      if not plugin.REQUIRED_STRUCTURE:
+        continue
+
+      table_name = min(
+          plugin.REQUIRED_STRUCTURE.keys(), key=lambda name: (
+              number_of_plugins_per_table_name[name], name))
+
+      self._plugins_per_table_name.setdefault(table_name, []).append(
+          plugin_name)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification.
@@ -441,7 +520,7 @@ class SQLiteParser(interface.FileEntryParser):
     display_name = parser_mediator.GetDisplayName(file_entry=file_entry)
 
     try:
-      for plugin in self._plugins_per_name.values():
+      for plugin in self._GetPluginsForDatabase(database):
         self._ParseFileEntryWithPlugin(
             parser_mediator, plugin, database, display_name, cache)
     finally:
@@ -468,7 +547,7 @@ class SQLiteParser(interface.FileEntryParser):
     display_name = parser_mediator.GetDisplayName(file_entry=wal_file_entry)
 
     try:
-      for plugin in self._plugins_per_name.values():
+      for plugin in self._GetPluginsForDatabase(database_wal):
         self._ParseFileEntryWithPlugin(
             parser_mediator, plugin, database_wal, display_name, cache)
     finally:
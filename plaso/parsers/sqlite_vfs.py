@@ -0,0 +1,525 @@
+# -*- coding: utf-8 -*-
+"""SQLite virtual file system (VFS) that reads from file-like objects.
+
+The VFS allows APSW to read a SQLite database and its Write-Ahead Log (WAL)
+directly from dfVFS file-like objects, without a temporary copy.
+"""
+
+import io
+import itertools
+import os
+import sqlite3
+
+import apsw
+
+
+class SQLiteRow(object):
+  """Row of a SQLite query result.
+
+  The row provides access to values by index and by column name, similar to
+  sqlite3.Row.
+  """
+
+  __slots__ = ('_column_indexes', '_column_names', '_values')
+
+  def __init__(self, column_names, column_indexes, values):
+    """Initializes a row.
+
+    Args:
+      column_names (tuple[str]): column names.
+      column_indexes (dict[str, int]): index of the value per column name
+          and per lower case column name.
+      values (tuple[object]): values of the row.
+    """
+    super(SQLiteRow, self).__init__()
+    self._column_indexes = column_indexes
+    self._column_names = column_names
+    self._values = values
+
+  def __getitem__(self, key):
+    """Retrieves a value by index or by case-insensitive column name.
+
+    Args:
+      key (int|slice|str): index, slice or column name.
+
+    Returns:
+      object: value.
+
+    Raises:
+      IndexError: if no column with the name exists.
+    """
+    if isinstance(key, str):
+      index = self._column_indexes.get(key, None)
+      if index is None:
+        index = self._column_indexes.get(key.lower(), None)
+        if index is None:
+          raise IndexError('No item with that key')
+
+      key = index
+
+    return self._values[key]
+
+  def __iter__(self):
+    """Iterates over the values of the row.
+
+    Returns:
+      iterator: values of the row.
+    """
+    return iter(self._values)
+
+  def __len__(self):
+    """Retrieves the number of values in the row.
+
+    Returns:
+      int: number of values in the row.
+    """
+    return len(self._values)
+
+  def keys(self):
+    """Retrieves the column names.
+
+    Returns:
+      list[str]: column names in the order of the values.
+    """
+    return list(self._column_names)
+
+
+class SQLiteCursor(object):
+  """Cursor of a SQLite database.
+
+  The cursor provides the subset of the sqlite3.Cursor interface used by
+  the SQLite parser and its plugins. APSW errors and TEXT values that cannot
+  be decoded as UTF-8 are raised as sqlite3.DatabaseError.
+  """
+
+  def __init__(self, cursor):
+    """Initializes a cursor.
+
+    Args:
+      cursor (apsw.Cursor): APSW cursor.
+    """
+    super(SQLiteCursor, self).__init__()
+    self._column_indexes = {}
+    self._column_names = ()
+    self._cursor = cursor
+
+  def __iter__(self):
+    """Iterates over the rows.
+
+    Returns:
+      SQLiteCursor: cursor.
+    """
+    return self
+
+  def __next__(self):
+    """Retrieves the next row.
+
+    Returns:
+      SQLiteRow: row.
+
+    Raises:
+      sqlite3.DatabaseError: if the row cannot be retrieved.
+      StopIteration: if there are no more rows.
+    """
+    try:
+      values = next(self._cursor)
+    except (apsw.Error, UnicodeDecodeError) as exception:
+      raise sqlite3.DatabaseError(str(exception))
+
+    return SQLiteRow(self._column_names, self._column_indexes, values)
+
+  def execute(self, query):
+    """Executes a query.
+
+    Args:
+      query (str): SQL query.
+
+    Returns:
+      SQLiteCursor: cursor.
+
+    Raises:
+      sqlite3.DatabaseError: if the query cannot be executed.
+    """
+    try:
+      self._cursor.execute(query)
+    except (apsw.Error, UnicodeDecodeError) as exception:
+      raise sqlite3.DatabaseError(str(exception))
+
+    try:
+      description = self._cursor.description
+    except apsw.ExecutionCompleteError:
+      # Note that APSW has no description when the query has no results.
+      description = ()
+
+    self._column_names = tuple(
+        column_description[0] for column_description in description)
+
+    # Note that the first column with a specific name takes precedence. The
+    # names are stored as-is as well so that the common case of a name with
+    # the same case as in the query does not need to be converted.
+    self._column_indexes = {}
+    for index, name in enumerate(self._column_names):
+      lower_case_name = name.lower()
+      index = self._column_indexes.setdefault(lower_case_name, index)
+      self._column_indexes.setdefault(name, index)
+
+    return self
+
+  def fetchall(self):
+    """Retrieves all remaining rows.
+
+    Returns:
+      list[SQLiteRow]: rows.
+
+    Raises:
+      sqlite3.DatabaseError: if the rows cannot be retrieved.
+    """
+    return list(self)
+
+  def fetchone(self):
+    """Retrieves the next row.
+
+    Returns:
+      SQLiteRow: row or None if there are no more rows.
+
+    Raises:
+      sqlite3.DatabaseError: if the row cannot be retrieved.
+    """
+    return next(self, None)
+
+
+class SQLiteConnection(object):
+  """Connection to a SQLite database in the file-like object VFS.
+
+  The connection provides the subset of the sqlite3.Connection interface used
+  by the SQLite parser.
+  """
+
+  def __init__(self, connection, vfs, path):
+    """Initializes a connection.
+
+    Args:
+      connection (apsw.Connection): APSW connection.
+      vfs (FileObjectVFS): file-like object VFS.
+      path (str): path of the database in the VFS.
+    """
+    super(SQLiteConnection, self).__init__()
+    self._connection = connection
+    self._path = path
+    self._vfs = vfs
+
+  def close(self):
+    """Closes the connection."""
+    if self._connection:
+      self._connection.close()
+      self._connection = None
+
+      self._vfs.DeregisterDatabase(self._path)
+
+  def cursor(self):
+    """Creates a cursor.
+
+    Returns:
+      SQLiteCursor: cursor.
+    """
+    return SQLiteCursor(self._connection.cursor())
+
+
+class FileObjectVFSFile(object):
+  """SQLite VFS file that reads from a file-like object."""
+
+  def __init__(self, file_object, read_only=True):
+    """Initializes a VFS file.
+
+    Args:
+      file_object (dfvfs.FileIO|io.BytesIO): file-like object.
+      read_only (Optional[bool]): True if the file is read-only.
+    """
+    super(FileObjectVFSFile, self).__init__()
+    self._file_object = file_object
+    self._read_only = read_only
+
+  # pylint: disable=invalid-name,unused-argument
+
+  def xCheckReservedLock(self):
+    """Checks if a reserved lock is held.
+
+    Returns:
+      bool: False since the file is only read by this process.
+    """
+    return False
+
+  def xClose(self):
+    """Closes the file.
+
+    The file-like object is owned by the caller and is not closed.
+    """
+    self._file_object = None
+
+  def xDeviceCharacteristics(self):
+    """Retrieves the device characteristics.
+
+    Returns:
+      int: device characteristics.
+    """
+    return 0
+
+  def xFileControl(self, operation, pointer):
+    """Handles a file control operation.
+
+    Args:
+      operation (int): file control operation.
+      pointer (int): pointer to the file control operation arguments.
+
+    Returns:
+      bool: False since no file control operations are supported.
+    """
+    return False
+
+  def xFileSize(self):
+    """Retrieves the size of the file.
+
+    Returns:
+      int: size of the file.
+    """
+    self._file_object.seek(0, os.SEEK_END)
+    return self._file_object.tell()
+
+  def xLock(self, level):
+    """Increases the lock on the file.
+
+    Args:
+      level (int): lock level.
+    """
+    return
+
+  def xRead(self, amount, offset):
+    """Reads data from the file.
+
+    Args:
+      amount (int): number of bytes to read.
+      offset (int): offset to read from.
+
+    Returns:
+      bytes: data read, where less data than requested is read beyond
+          the end of the file.
+    """
+    self._file_object.seek(offset, os.SEEK_SET)
+    return self._file_object.read(amount)
+
+  def xSectorSize(self):
+    """Retrieves the sector size.
+
+    Returns:
+      int: sector size.
+    """
+    return 4096
+
+  def xSync(self, flags):
+    """Synchronizes the file.
+
+    Args:
+      flags (int): synchronization flags.
+    """
+    return
+
+  def xTruncate(self, newsize):
+    """Truncates the file.
+
+    Args:
+      newsize (int): new size of the file.
+
+    Raises:
+      apsw.ReadOnlyError: if the file is read-only.
+    """
+    if self._read_only:
+      raise apsw.ReadOnlyError('File is read-only.')
+
+    self._file_object.truncate(newsize)
+
+  def xUnlock(self, level):
+    """Decreases the lock on the file.
+
+    Args:
+      level (int): lock level.
+    """
+    return
+
+  def xWrite(self, data, offset):
+    """Writes data to the file.
+
+    Args:
+      data (bytes): data to write.
+      offset (int): offset to write to.
+
+    Raises:
+      apsw.ReadOnlyError: if the file is read-only.
+    """
+    if self._read_only:
+      raise apsw.ReadOnlyError('File is read-only.')
+
+    self._file_object.seek(offset, os.SEEK_SET)
+    self._file_object.write(data)
+
+
+class FileObjectVFS(apsw.VFS):
+  """SQLite VFS that reads databases from file-like objects.
+
+  Databases are registered with the file-like object of the database and
+  optionally that of its Write-Ahead Log (WAL). The registered file-like
+  objects are only read. Other files of a registered database, such as
+  a missing WAL or a rollback journal, are substituted by empty in-memory
+  files. Temporary files are handled by the default VFS.
+  """
+
+  NAME = 'plaso_file_object'
+
+  def __init__(self):
+    """Initializes a VFS and registers it with SQLite."""
+    self._database_paths = itertools.count()
+    self._file_objects = {}
+    super(FileObjectVFS, self).__init__(self.NAME, base='')
+
+  def _GetPath(self, name):
+    """Retrieves the path of a file opened by SQLite.
+
+    Args:
+      name (str|apsw.URIFilename): name of the file.
+
+    Returns:
+      str: path of the file.
+    """
+    if isinstance(name, apsw.URIFilename):
+      return name.filename()
+
+    return name
+
+  def DeregisterDatabase(self, path):
+    """Deregisters the file-like objects of a database.
+
+    Args:
+      path (str): path of the database in the VFS.
+    """
+    self._file_objects.pop(path, None)
+    self._file_objects.pop('{0:s}-wal'.format(path), None)
+
+  def RegisterDatabase(self, file_object, wal_file_object=None):
+    """Registers the file-like objects of a database.
+
+    The file-like objects must remain open until the database is closed.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object of the database.
+      wal_file_object (Optional[dfvfs.FileIO]): file-like object of
+          the Write-Ahead Log (WAL) file.
+
+    Returns:
+      str: path of the database in the VFS.
+    """
+    path = '/{0:d}.db'.format(next(self._database_paths))
+
+    self._file_objects[path] = file_object
+    if wal_file_object:
+      self._file_objects['{0:s}-wal'.format(path)] = wal_file_object
+
+    return path
+
+  # pylint: disable=invalid-name,unused-argument
+
+  def xAccess(self, pathname, flags):
+    """Checks if a file exists.
+
+    Args:
+      pathname (str): path of the file.
+      flags (int): access flags.
+
+    Returns:
+      bool: True if the file is registered.
+    """
+    return pathname in self._file_objects
+
+  def xDelete(self, filename, syncdir):
+    """Deletes a file.
+
+    Args:
+      filename (str): path of the file.
+      syncdir (bool): True if the directory should be synchronized.
+    """
+    return
+
+  def xFullPathname(self, name):
+    """Retrieves the full path of a file.
+
+    Args:
+      name (str): name of the file.
+
+    Returns:
+      str: full path of the file, which is the same as the name.
+    """
+    return name
+
+  def xOpen(self, name, flags):
+    """Opens a file.
+
+    Args:
+      name (str|apsw.URIFilename): name of the file or None for a temporary
+          file.
+      flags (list[int]): input and output open flags.
+
+    Returns:
+      FileObjectVFSFile|apsw.VFSFile: file.
+    """
+    path = self._GetPath(name)
+    if path is None:
+      return apsw.VFSFile('', name, flags)
+
+    file_object = self._file_objects.get(path, None)
+    if file_object:
+      flags[1] = apsw.SQLITE_OPEN_READONLY
+      return FileObjectVFSFile(file_object)
+
+    flags[1] = flags[0]
+    return FileObjectVFSFile(io.BytesIO(), read_only=False)
+
+
+_file_object_vfs = None
+
+
+def Connect(file_object, wal_file_object=None):
+  """Connects to a SQLite database stored in file-like objects.
+
+  The database is opened read-only and in exclusive locking mode. In
+  exclusive locking mode SQLite keeps the WAL index in memory, which is needed
+  since the VFS does not support shared memory.
+
+  Args:
+    file_object (dfvfs.FileIO): file-like object of the database, which must
+        remain open until the connection is closed.
+    wal_file_object (Optional[dfvfs.FileIO]): file-like object of
+        the Write-Ahead Log (WAL) file, which must remain open until
+        the connection is closed.
+
+  Returns:
+    SQLiteConnection: connection.
+
+  Raises:
+    sqlite3.DatabaseError: if the database cannot be opened.
+  """
+  global _file_object_vfs  # pylint: disable=global-statement
+
+  if not _file_object_vfs:
+    _file_object_vfs = FileObjectVFS()
+
+  path = _file_object_vfs.RegisterDatabase(
+      file_object, wal_file_object=wal_file_object)
+
+  try:
+    connection = apsw.Connection(
+        path, flags=apsw.SQLITE_OPEN_READONLY, vfs=FileObjectVFS.NAME)
+    connection.execute('PRAGMA locking_mode=EXCLUSIVE')
+
+  except apsw.Error as exception:
+    _file_object_vfs.DeregisterDatabase(path)
+    raise sqlite3.DatabaseError(str(exception))
+
+  return SQLiteConnection(connection, _file_object_vfs, path)
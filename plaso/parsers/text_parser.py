@@ -4,26 +4,126 @@
 import codecs
 import io
 import os
+import re
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
 
 import pysigscan
 
+from plaso.containers import event_sources
 from plaso.lib import errors
 from plaso.parsers import interface
 from plaso.parsers import logger
 from plaso.parsers import manager
 
 
+class DataRangeFileObject(object):
+  """File-like object that maps a data range of another file-like object."""
+
+  def __init__(self, file_object, range_offset, range_size):
+    """Initializes a data range file-like object.
+
+    Args:
+      file_object (dfvfs.FileIO): file-like object that contains the data range.
+      range_offset (int): offset of the data range.
+      range_size (int): size of the data range.
+    """
+    super(DataRangeFileObject, self).__init__()
+    self._current_offset = 0
+    self._file_object = file_object
+    self._range_offset = range_offset
+    self._range_size = range_size
+
+  def get_offset(self):
+    """Retrieves the current offset into the data range.
+
+    Returns:
+      int: current offset into the data range.
+    """
+    return self._current_offset
+
+  def get_size(self):
+    """Retrieves the size of the data range.
+
+    Returns:
+      int: size of the data range.
+    """
+    return self._range_size
+
+  def read(self, size=None):
+    """Reads a byte string from the data range.
+
+    Args:
+      size (Optional[int]): number of bytes to read, where None is all
+          remaining data.
+
+    Returns:
+      bytes: data read.
+    """
+    if self._current_offset >= self._range_size:
+      return b''
+
+    remaining_size = self._range_size - self._current_offset
+    if size is None or size > remaining_size:
+      size = remaining_size
+
+    self._file_object.seek(
+        self._range_offset + self._current_offset, os.SEEK_SET)
+    data = self._file_object.read(size)
+
+    self._current_offset += len(data)
+
+    return data
+
+  def seek(self, offset, whence=os.SEEK_SET):
+    """Seeks to an offset within the data range.
+
+    Args:
+      offset (int): offset to seek to.
+      whence (Optional(int)): value that indicates whether offset is an absolute
+          or relative position within the data range.
+
+    Raises:
+      IOError: if the seek failed.
+      OSError: if the seek failed.
+    """
+    if whence == os.SEEK_CUR:
+      offset += self._current_offset
+    elif whence == os.SEEK_END:
+      offset += self._range_size
+    elif whence != os.SEEK_SET:
+      raise IOError('Unsupported whence.')
+
+    if offset < 0:
+      raise IOError('Invalid offset value less than zero.')
+
+    self._current_offset = offset
+
+  def tell(self):
+    """Retrieves the current offset into the data range.
+
+    Returns:
+      int: current offset into the data range.
+    """
+    return self._current_offset
+
+
 class EncodedTextReader(object):
   """Encoded text reader.
 
+  The decoded text is kept in a buffer together with the offset of the
+  current read position in that buffer, so that reading a line or skipping
+  ahead does not require the remainder of the buffer to be copied.
+
   Attributes:
     line_number (int): current line number.
-    lines (str): lines of text.
-    lines_size (int): size of the lines of text.
   """
 
   BUFFER_SIZE = 65536
 
+  _CARRIAGE_RETURNS_RE = re.compile('\r+(?=\n)|\r+\\Z')
+
   _READ_BUFFER_SIZE = 16 * BUFFER_SIZE
 
   def __init__(
@@ -39,12 +139,55 @@ class EncodedTextReader(object):
 
     super(EncodedTextReader, self).__init__()
     self._file_object = file_object
+    self._lines_buffer = ''
+    self._lines_buffer_offset = 0
     self._stream_reader = stream_reader_class(
         file_object, errors=encoding_errors)
 
     self.line_number = 0
-    self.lines = ''
-    self.lines_size = 0
+
+  @property
+  def lines(self):
+    """str: lines of text remaining in the lines buffer."""
+    if self._lines_buffer_offset == 0:
+      return self._lines_buffer
+
+    return self._lines_buffer[self._lines_buffer_offset:]
+
+  @property
+  def lines_size(self):
+    """int: size of the lines of text remaining in the lines buffer."""
+    return len(self._lines_buffer) - self._lines_buffer_offset
+
+  def PeekLines(self, maximum_size=None):
+    """Retrieves lines of text from the lines buffer without consuming them.
+
+    Args:
+      maximum_size (Optional[int]): maximum number of characters to retrieve,
+          where None represents all the remaining characters. The lines are
+          extended up to and including the next end-of-line character, so
+          that the last line is not truncated.
+
+    Returns:
+      str: lines of text.
+    """
+    buffer_size = len(self._lines_buffer)
+
+    end_offset = buffer_size
+    if maximum_size is not None:
+      end_offset = self._lines_buffer_offset + maximum_size
+
+    if end_offset < buffer_size:
+      end_offset = self._lines_buffer.find('\n', end_offset)
+      if end_offset == -1:
+        end_offset = buffer_size
+      else:
+        end_offset += 1
+
+    if self._lines_buffer_offset == 0 and end_offset == buffer_size:
+      return self._lines_buffer
+
+    return self._lines_buffer[self._lines_buffer_offset:end_offset]
 
   def ReadLine(self):
     """Reads a line.
@@ -52,11 +195,18 @@ class EncodedTextReader(object):
     Returns:
       str: line read from the lines buffer.
     """
-    if not self.lines:
+    if self._lines_buffer_offset >= len(self._lines_buffer):
       self.ReadLines()
 
-    line, _, self.lines = self.lines.partition('\n')
-    self.lines_size += len(line) + 1
+    buffer_size = len(self._lines_buffer)
+
+    end_offset = self._lines_buffer.find('\n', self._lines_buffer_offset)
+    if end_offset == -1:
+      end_offset = buffer_size
+
+    line = self._lines_buffer[self._lines_buffer_offset:end_offset]
+
+    self._lines_buffer_offset = min(end_offset + 1, buffer_size)
     self.line_number += 1
 
     return line
@@ -74,12 +224,15 @@ class EncodedTextReader(object):
         if current_offset == 0 and decoded_data[0] == '\ufeff':
           decoded_data = decoded_data[1:]
 
-        # Strip carriage returns from the text.
-        decoded_data = '\n'.join([
-            line.rstrip('\r') for line in decoded_data.split('\n')])
+        # Strip carriage returns from the end of the lines.
+        if '\r' in decoded_data:
+          decoded_data = self._CARRIAGE_RETURNS_RE.sub('', decoded_data)
 
-        self.lines = ''.join([self.lines, decoded_data])
-        self.lines_size += len(decoded_data)
+        # Only the remainder of the lines buffer is retained, which keeps
+        # the copy per read bounded by BUFFER_SIZE.
+        self._lines_buffer = ''.join([
+            self._lines_buffer[self._lines_buffer_offset:], decoded_data])
+        self._lines_buffer_offset = 0
 
   def SkipAhead(self, number_of_characters):
     """Skips ahead a number of characters.
@@ -90,17 +243,22 @@ class EncodedTextReader(object):
     while number_of_characters >= self.lines_size:
       number_of_characters -= self.lines_size
 
-      self.lines = ''
-      self.lines_size = 0
+      self.line_number += self._lines_buffer.count(
+          '\n', self._lines_buffer_offset)
+
+      self._lines_buffer = ''
+      self._lines_buffer_offset = 0
 
       self.ReadLines()
 
-      if self.lines_size == 0:
+      if not self._lines_buffer:
         return
 
-    self.line_number += self.lines[:number_of_characters].count('\n')
-    self.lines = self.lines[number_of_characters:]
-    self.lines_size -= number_of_characters
+    end_offset = self._lines_buffer_offset + number_of_characters
+
+    self.line_number += self._lines_buffer.count(
+        '\n', self._lines_buffer_offset, end_offset)
+    self._lines_buffer_offset = end_offset
 
   # Note: that the following functions do not follow the style guide
   # because they are part of the file-like object interface.
@@ -121,6 +279,17 @@ class TextLogParser(interface.FileObjectParser):
   NAME = 'text'
   DATA_FORMAT = 'text-based log file'
 
+  # Type indicators of path specification layers that do not support
+  # efficient seeking and therefore are not split into data ranges.
+  _NON_SPLITTABLE_TYPE_INDICATORS = frozenset([
+      dfvfs_definitions.TYPE_INDICATOR_BZIP2,
+      dfvfs_definitions.TYPE_INDICATOR_COMPRESSED_STREAM,
+      dfvfs_definitions.TYPE_INDICATOR_DATA_RANGE,
+      dfvfs_definitions.TYPE_INDICATOR_ENCODED_STREAM,
+      dfvfs_definitions.TYPE_INDICATOR_GZIP,
+      dfvfs_definitions.TYPE_INDICATOR_XZ,
+      dfvfs_definitions.TYPE_INDICATOR_ZIP])
+
   _NON_TEXT_CHARACTERS = frozenset([
       '\x00', '\x01', '\x02', '\x03', '\x04', '\x05', '\x06', '\x0b', '\x0e',
       '\x0f', '\x10', '\x11', '\x12', '\x13', '\x14', '\x15', '\x16', '\x17',
@@ -180,44 +349,123 @@ class TextLogParser(interface.FileObjectParser):
     if self._plugin_name_per_format_identifier:
       self._format_scanner = scanner_object
 
-  def EnablePlugins(self, plugin_includes):
-    """Enables parser plugins.
+  def _GetDataRangeFileObject(
+      self, parser_mediator, plugin, encoding, file_object):
+    """Splits a text log file into data ranges if supported.
+
+    The data ranges, except for the first, are produced as event sources so
+    that they can be parsed by other workers.
 
     Args:
-      plugin_includes (set[str]): names of the plugins to enable, where
-          set(['*']) represents all plugins. Note the default plugin, if
-          it exists, is always enabled and cannot be disabled.
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      plugin (TextPlugin): text plugin that matches the text log file.
+      encoding (str): encoding of the text log file.
+      file_object (dfvfs.FileIO): file-like object.
+
+    Returns:
+      dfvfs.FileIO: file-like object of the first data range or None if the
+          text log file is not split into data ranges.
     """
-    self._plugins_per_name = {}
-    self._plugins_per_encoding = {}
-    if not self._plugin_classes:
-      return
+    range_size = parser_mediator.text_log_range_size
+    if (not range_size or not plugin.IS_LINE_SPLITTABLE or
+        file_object.get_size() <= range_size):
+      return None
+
+    # Data ranges are aligned on the end-of-line byte, which requires that
+    # the encoding stores the end-of-line character as a single byte.
+    try:
+      if '\n'.encode(encoding) != b'\n':
+        return None
+    except LookupError:
+      return None
+
+    path_spec = parser_mediator.GetEventDataStreamPathSpec()
+    if not path_spec:
+      return None
+
+    parent_path_spec = path_spec
+    while parent_path_spec:
+      if parent_path_spec.type_indicator in (
+          self._NON_SPLITTABLE_TYPE_INDICATORS):
+        return None
+      parent_path_spec = getattr(parent_path_spec, 'parent', None)
+
+    data_ranges = self._GetDataRanges(file_object, range_size)
+    if len(data_ranges) < 2:
+      return None
+
+    for data_range_offset, data_range_size in data_ranges[1:]:
+      data_range_path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_DATA_RANGE,
+          range_offset=data_range_offset, range_size=data_range_size,
+          parent=path_spec)
+
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          file_size=data_range_size, path_spec=data_range_path_spec)
+      parser_mediator.ProduceEventSource(event_source)
+
+    logger.debug((
+        'Split text log file: {0:s} into {1:d} data ranges for plugin: '
+        '{2:s}').format(
+            parser_mediator.GetDisplayName(), len(data_ranges), plugin.NAME))
+
+    data_range_offset, data_range_size = data_ranges[0]
+    return DataRangeFileObject(file_object, data_range_offset, data_range_size)
+
+  def _GetDataRanges(self, file_object, range_size):
+    """Determines the data ranges a text log file-like object is split into.
+
+    The end of each data range is aligned with the end of a line so that a
+    line is never split across data ranges.
 
-    for plugin_name, plugin_class in self._plugin_classes.items():
-      if plugin_name == self._default_plugin_name:
-        self._default_plugin = plugin_class()
-        continue
+    Args:
+      file_object (dfvfs.FileIO): file-like object.
+      range_size (int): minimum size of a data range.
 
-      if (plugin_includes != self.ALL_PLUGINS and
-          plugin_name not in plugin_includes):
-        continue
+    Returns:
+      list[tuple[int, int]]: offset and size of the data ranges.
+    """
+    file_size = file_object.get_size()
 
-      plugin_object = plugin_class()
-      self._plugins_per_name[plugin_name] = plugin_object
+    data_ranges = []
+    range_offset = 0
+    while range_offset < file_size:
+      range_end_offset = file_size
 
-      encoding = plugin_class.ENCODING or 'default'
-      if encoding not in self._plugins_per_encoding:
-        self._plugins_per_encoding[encoding] = []
+      search_offset = range_offset + range_size - 1
+      if search_offset < file_size:
+        file_object.seek(search_offset, os.SEEK_SET)
 
-      self._plugins_per_encoding[encoding].append(plugin_object)
+        while search_offset < file_size:
+          encoded_data = file_object.read(EncodedTextReader.BUFFER_SIZE)
+          if not encoded_data:
+            break
 
-  def ParseFileObject(self, parser_mediator, file_object):
+          newline_index = encoded_data.find(b'\n')
+          if newline_index >= 0:
+            range_end_offset = search_offset + newline_index + 1
+            break
+
+          search_offset += len(encoded_data)
+
+      data_ranges.append((range_offset, range_end_offset - range_offset))
+      range_offset = range_end_offset
+
+    return data_ranges
+
+  def _ParseFileObject(
+      self, parser_mediator, file_object, data_range_file_object=None):
     """Parses a text log file-like object.
 
     Args:
       parser_mediator (ParserMediator): mediates interactions between parsers
           and other components, such as storage and dfVFS.
       file_object (dfvfs.FileIO): file-like object.
+      data_range_file_object (Optional[dfvfs.FileIO]): file-like object of
+          the data range of the text log file to parse, where None represents
+          the entire text log file.
 
     Raises:
       WrongParser: when the file cannot be parsed.
@@ -302,15 +550,26 @@ class TextLogParser(interface.FileObjectParser):
         if result:
           matching_plugin = True
 
+          plugin_file_object = data_range_file_object
+          if not plugin_file_object:
+            plugin_file_object = self._GetDataRangeFileObject(
+                parser_mediator, plugin, encoding, file_object)
+
           parser_mediator.SampleStartTiming(profiling_name)
 
           try:
             plugin.UpdateChainAndProcess(
-                parser_mediator, file_object=file_object)
+                parser_mediator, file_object=plugin_file_object or file_object)
           except Exception as exception:  # pylint: disable=broad-except
             parser_mediator.ProduceExtractionWarning((
                 'plugin: {0:s} unable to parse text file with error: '
                 '{1!s}').format(plugin.NAME, exception))
+
+            # The remaining data ranges have already been produced as event
+            # sources and should not be parsed by another plugin.
+            if plugin_file_object:
+              break
+
             continue
 
           finally:
@@ -328,5 +587,87 @@ class TextLogParser(interface.FileObjectParser):
     if not matching_plugin:
       raise errors.WrongParser('No matching text-based log plugin found.')
 
+  def EnablePlugins(self, plugin_includes):
+    """Enables parser plugins.
+
+    Args:
+      plugin_includes (set[str]): names of the plugins to enable, where
+          set(['*']) represents all plugins. Note the default plugin, if
+          it exists, is always enabled and cannot be disabled.
+    """
+    self._plugins_per_name = {}
+    self._plugins_per_encoding = {}
+    if not self._plugin_classes:
+      return
+
+    for plugin_name, plugin_class in self._plugin_classes.items():
+      if plugin_name == self._default_plugin_name:
+        self._default_plugin = plugin_class()
+        continue
+
+      if (plugin_includes != self.ALL_PLUGINS and
+          plugin_name not in plugin_includes):
+        continue
+
+      plugin_object = plugin_class()
+      self._plugins_per_name[plugin_name] = plugin_object
+
+      encoding = plugin_class.ENCODING or 'default'
+      if encoding not in self._plugins_per_encoding:
+        self._plugins_per_encoding[encoding] = []
+
+      self._plugins_per_encoding[encoding].append(plugin_object)
+
+  def ParseDataRange(
+      self, parser_mediator, file_object, data_range_file_object):
+    """Parses a data range of a text log file-like object.
+
+    The plugin is determined from the start of the text log file, since the
+    data range can start anywhere in the text log file.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_object (dfvfs.FileIO): file-like object of the text log file.
+      data_range_file_object (dfvfs.FileIO): file-like object of the data
+          range of the text log file.
+
+    Raises:
+      WrongParser: when the data range cannot be parsed.
+    """
+    if not file_object or not data_range_file_object:
+      raise errors.WrongParser('Invalid file object')
+
+    if data_range_file_object.get_size() == 0:
+      return
+
+    parser_mediator.AppendToParserChain(self.NAME)
+
+    parser_chain = parser_mediator.GetParserChain()
+    parser_mediator.SampleStartTiming(parser_chain)
+
+    try:
+      self._ParseFileObject(
+          parser_mediator, file_object,
+          data_range_file_object=data_range_file_object)
+
+    finally:
+      parser_mediator.SampleStopTiming(parser_chain)
+
+      parser_mediator.PopFromParserChain()
+
+  def ParseFileObject(self, parser_mediator, file_object):
+    """Parses a text log file-like object.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      file_object (dfvfs.FileIO): file-like object.
+
+    Raises:
+      WrongParser: when the file cannot be parsed.
+    """
+    self._ParseFileObject(parser_mediator, file_object)
+
 
 manager.ParsersManager.RegisterParser(TextLogParser)
@@ -5,6 +5,8 @@ Parser based on the two default apache formats, common and combined log format
 defined in https://httpd.apache.org/docs/2.4/logs.html
 """
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -57,6 +59,8 @@ class ApacheAccessLogTextPlugin(interface.TextPlugin):
   NAME = 'apache_access'
   DATA_FORMAT = 'Apache access log (access.log) file'
 
+  IS_LINE_SPLITTABLE = True
+
   _MONTH_DICT = {
       'jan': 1,
       'feb': 2,
@@ -181,6 +185,43 @@ class ApacheAccessLogTextPlugin(interface.TextPlugin):
       ('common_log_format', _COMMON_LOG_FORMAT_LINE),
       ('vhost_combined_log_format', _VHOST_COMBINED_LOG_FORMAT_LINE)]
 
+  # Regular expressions that match the common case of the line structures
+  # above, in which tokens are separated by spaces or tabs, quoted strings do
+  # not contain escape characters and IP addresses are IPv4.
+
+  _IPV4_ADDRESS_PATTERN = (
+      r'(?P<ip_address>(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+      r'(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3})')
+
+  _COMMON_LOG_FORMAT_PATTERN = (
+      _IPV4_ADDRESS_PATTERN +
+      r'[ \t]+(?P<remote_name>[0-9A-Za-z]+|-)'
+      r'[ \t]+(?P<user_name>[0-9A-Za-z@.]+|-)'
+      r'[ \t]+\[(?P<day_of_month>[0-9]{2})/(?P<month>[A-Za-z]{3})/'
+      r'(?P<year>[0-9]{4}):(?P<hours>[0-9]{2}):(?P<minutes>[0-9]{2}):'
+      r'(?P<seconds>[0-9]{2})[ \t]+(?P<time_zone_sign>[+-])'
+      r'(?P<time_zone_hours>[0-9]{2})(?P<time_zone_minutes>[0-9]{2})\]'
+      r'[ \t]+"(?P<http_method>CONNECT|DELETE|GET|HEAD|OPTIONS|PATCH|POST|PUT|'
+      r'TRACE)[ \t]+(?P<http_path>\S+)[ \t]+(?P<http_version>HTTP/[0-9.]+)"'
+      r'[ \t]+(?P<response_code>[0-9]+)'
+      r'[ \t]+(?P<response_bytes>-|[0-9]+)')
+
+  _COMBINED_LOG_FORMAT_PATTERN = (
+      _COMMON_LOG_FORMAT_PATTERN +
+      r'[ \t]+"(?P<referer>[^"\n\r\\]+)"'
+      r'[ \t]+"(?P<user_agent>[^"\n]+)"')
+
+  _END_OF_LINE_PATTERN = r'[ \t]*(?:\n|\Z)'
+
+  _LINE_REGEXES = [
+      ('combined_log_format', re.compile(
+          _COMBINED_LOG_FORMAT_PATTERN + _END_OF_LINE_PATTERN)),
+      ('common_log_format', re.compile(
+          _COMMON_LOG_FORMAT_PATTERN + _END_OF_LINE_PATTERN)),
+      ('vhost_combined_log_format', re.compile(
+          r'(?P<server_name>[0-9A-Za-z.-]+):(?P<port_number>[0-9]+)[ \t]+' +
+          _COMBINED_LOG_FORMAT_PATTERN + _END_OF_LINE_PATTERN))]
+
   VERIFICATION_GRAMMAR = (
       _COMBINED_LOG_FORMAT_LINE ^ _COMMON_LOG_FORMAT_LINE ^
       _VHOST_COMBINED_LOG_FORMAT_LINE)
@@ -189,6 +230,48 @@ class ApacheAccessLogTextPlugin(interface.TextPlugin):
       '"CONNECT ', '"DELETE ', '"GET ', '"HEAD ', ' HTTP/', '"OPTIONS ',
       '"PATCH ', '"POST ', '"PUT ', '"TRACE ']
 
+  def _GetStructureFromRegexMatch(self, key, match):
+    """Retrieves a structure from a line regular expression match.
+
+    Args:
+      key (str): name of the matched line regular expression.
+      match (re.Match): line regular expression match.
+
+    Returns:
+      dict[str, object]: structure equivalent to that of the corresponding
+          line structure.
+    """
+    response_bytes = match.group('response_bytes')
+    if response_bytes != '-':
+      response_bytes = int(response_bytes, 10)
+
+    structure = {
+        'date_time': [
+            int(match.group('day_of_month'), 10), match.group('month'),
+            int(match.group('year'), 10), int(match.group('hours'), 10),
+            int(match.group('minutes'), 10), int(match.group('seconds'), 10),
+            match.group('time_zone_sign'),
+            int(match.group('time_zone_hours'), 10),
+            int(match.group('time_zone_minutes'), 10)],
+        'http_request': [
+            match.group('http_method'), match.group('http_path'),
+            match.group('http_version')],
+        'ip_address': match.group('ip_address'),
+        'remote_name': match.group('remote_name'),
+        'response_bytes': response_bytes,
+        'response_code': int(match.group('response_code'), 10),
+        'user_name': match.group('user_name')}
+
+    if key in ('combined_log_format', 'vhost_combined_log_format'):
+      structure['referer'] = match.group('referer')
+      structure['user_agent'] = match.group('user_agent')
+
+    if key == 'vhost_combined_log_format':
+      structure['port_number'] = int(match.group('port_number'), 10)
+      structure['server_name'] = match.group('server_name')
+
+    return structure
+
   def _ParseRecord(self, parser_mediator, key, structure):
     """Parses a pyparsing structure.
 
@@ -62,6 +62,8 @@ class ConfluenceAccessTextPlugin(interface.TextPlugin):
   NAME = 'confluence_access'
   DATA_FORMAT = 'Confluence access log (access.log) file'
 
+  IS_LINE_SPLITTABLE = True
+
   _INTEGER = pyparsing.Word(pyparsing.nums).setParseAction(
       lambda tokens: int(tokens[0], 10))
 
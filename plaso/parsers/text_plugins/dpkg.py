@@ -58,6 +58,8 @@ class DpkgTextPlugin(interface.TextPlugin):
 
   ENCODING = 'utf-8'
 
+  IS_LINE_SPLITTABLE = True
+
   _TWO_DIGITS = pyparsing.Word(pyparsing.nums, exact=2).setParseAction(
       lambda tokens: int(tokens[0], 10))
 
@@ -21,10 +21,25 @@ class TextPlugin(plugins.BasePlugin):
 
   ENCODING = None
 
+  # True if every line of the text log is a self-contained record, such that
+  # the text log can be split at the end of any line and the resulting data
+  # ranges can be parsed independently of each other. Plugins that depend on
+  # a header, multi-line records or state from previous lines must not set
+  # this.
+  IS_LINE_SPLITTABLE = False
+
   # List of tuples of pyparsing expression per unique identifier that define
   # the supported grammar.
   _LINE_STRUCTURES = []
 
+  # List of tuples of compiled regular expression per unique identifier that
+  # define an optional fast path for the supported grammar. A regular
+  # expression should match a single line, including its end-of-line
+  # character, and only lines for which the pyparsing grammar produces
+  # the same structure. Lines that do not match are parsed with the pyparsing
+  # grammar.
+  _LINE_REGEXES = []
+
   # PyParsing grammer used to verify the text-log file format. Note that since
   # this is called often it should optimize on failing fast.
   VERIFICATION_GRAMMAR = None
@@ -38,12 +53,14 @@ class TextPlugin(plugins.BasePlugin):
     """Initializes a parser."""
     super(TextPlugin, self).__init__()
     self._current_offset = 0
+    self._line_regexes = []
     self._parser_mediator = None
     self._pyparsing_grammar = None
 
     codecs.register_error('text_parser_handler', self._EncodingErrorHandler)
 
-    self._SetLineStructures(self._LINE_STRUCTURES)
+    self._SetLineStructures(
+        self._LINE_STRUCTURES, line_regexes=self._LINE_REGEXES)
 
   def _EncodingErrorHandler(self, exception):
     """Encoding error handler.
@@ -89,6 +106,22 @@ class TextPlugin(plugins.BasePlugin):
 
     return None
 
+  def _GetStructureFromRegexMatch(self, key, match):  # pylint: disable=unused-argument
+    """Retrieves a structure from a line regular expression match.
+
+    Args:
+      key (str): name of the matched line regular expression.
+      match (re.Match): line regular expression match.
+
+    Returns:
+      dict[str, object]: values of the named groups that participated in
+          the match or None if the match cannot be converted into a structure,
+          in which case the line is parsed with the pyparsing grammar.
+    """
+    return {
+        name: value for name, value in match.groupdict().items()
+        if value is not None}
+
   def _GetStringValueFromStructure(self, structure, name):
     """Retrieves a string value from a Pyparsing structure.
 
@@ -168,7 +201,7 @@ class TextPlugin(plugins.BasePlugin):
           '{1!s}').format(self._current_offset, exception))
       return
 
-    while text_reader.lines:
+    while text_reader.lines_size:
       if parser_mediator.abort:
         break
 
@@ -179,7 +212,19 @@ class TextPlugin(plugins.BasePlugin):
         break
 
       try:
-        key, structure, _, end = self._ParseString(text_reader.lines)
+        # Only a window of the lines buffer is passed to pyparsing to prevent
+        # the remainder of the buffer from being copied for every record.
+        lines = text_reader.PeekLines(maximum_size=text_reader.BUFFER_SIZE)
+        try:
+          key, structure, _, end = self._ParseString(lines)
+
+        except errors.ParseError:
+          # A record that spans multiple lines can extend beyond the window
+          # hence the remainder of the lines buffer is parsed as well.
+          if len(lines) == text_reader.lines_size:
+            raise
+
+          key, structure, _, end = self._ParseString(text_reader.lines)
 
       except errors.ParseError as exception:
         line = text_reader.ReadLine()
@@ -241,16 +286,26 @@ class TextPlugin(plugins.BasePlugin):
   def _ParseString(self, string):
     """Parses a string for known grammar.
 
+    The line regular expressions, if any, are tried first since these are
+    considerably faster than the pyparsing grammar.
+
     Args:
       string (str): string.
 
     Returns:
-      tuple[str, pyparsing.ParseResults, int, int]: key, parsed tokens, start
-          and end offset.
+      tuple[str, pyparsing.ParseResults|dict[str, object], int, int]: key,
+          parsed tokens, start and end offset.
 
     Raises:
       ParseError: when the string cannot be parsed by the grammar.
     """
+    for key, line_regex in self._line_regexes:
+      match = line_regex.match(string)
+      if match:
+        structure = self._GetStructureFromRegexMatch(key, match)
+        if structure is not None:
+          return key, structure, 0, match.end()
+
     try:
       structure_generator = self._pyparsing_grammar.scanString(
           string, maxMatches=1)
@@ -275,13 +330,18 @@ class TextPlugin(plugins.BasePlugin):
 
     return keys[0], structure[0], start, end
 
-  def _SetLineStructures(self, line_structures):
+  def _SetLineStructures(self, line_structures, line_regexes=None):
     """Sets the line structures.
 
     Args:
       line_structures ([(str, pyparsing.ParserElement)]): tuples of pyparsing
           expressions to parse a line and their names.
+      line_regexes (Optional[list[tuple[str, re.Pattern]]]): tuples of
+          compiled regular expressions to parse a line and their names, where
+          None represents that lines are only parsed with the pyparsing
+          expressions.
     """
+    self._line_regexes = line_regexes or []
     self._pyparsing_grammar = None
 
     for key, expression in line_structures:
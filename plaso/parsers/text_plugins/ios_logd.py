@@ -37,6 +37,8 @@ class IOSSysdiagnoseLogdTextPlugin(interface.TextPlugin):
   NAME = 'ios_logd'
   DATA_FORMAT = 'iOS sysdiagnose logd file'
 
+  IS_LINE_SPLITTABLE = True
+
   _TWO_DIGITS = pyparsing.Word(pyparsing.nums, exact=2).setParseAction(
       lambda tokens: int(tokens[0], 10))
 
@@ -53,6 +53,8 @@ class SELinuxTextPlugin(interface.TextPlugin):
   NAME = 'selinux'
   DATA_FORMAT = 'SELinux audit log (audit.log) file'
 
+  IS_LINE_SPLITTABLE = True
+
   _INTEGER = pyparsing.Word(pyparsing.nums).setParseAction(
       lambda tokens: int(tokens[0], 10))
 
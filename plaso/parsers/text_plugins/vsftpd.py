@@ -35,6 +35,8 @@ class VsftpdLogTextPlugin(interface.TextPlugin):
   NAME = 'vsftpd'
   DATA_FORMAT = 'vsftpd log file'
 
+  IS_LINE_SPLITTABLE = True
+
   _MONTH_DICT = {
       'jan': 1,
       'feb': 2,
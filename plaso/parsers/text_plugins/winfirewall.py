@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Text parser plugin for Windows Firewall Log files."""
 
+import re
+
 import pyparsing
 
 from dfdatetime import time_elements as dfdatetime_time_elements
@@ -159,6 +161,43 @@ class WinFirewallLogTextPlugin(interface.TextPlugin):
       'tcpwin': _INTEGER_OR_BLANK.setResultsName('tcp_window_size'),
       'time': _TIME.setResultsName('time')}
 
+  # Regular expressions that match the common case of the log line structures
+  # above, in which tokens are separated by spaces or tabs and IP addresses
+  # are IPv4.
+
+  _INTEGER_OR_BLANK_PATTERN = r'[0-9]+|-'
+
+  _IPV4_ADDRESS_OR_BLANK_PATTERN = (
+      r'(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})'
+      r'(?:\.(?:25[0-5]|2[0-4][0-9]|1?[0-9]{1,2})){3}|-')
+
+  _PORT_NUMBER_OR_BLANK_PATTERN = r'[0-9]{1,6}|-'
+
+  _WORD_OR_BLANK_PATTERN = r'[0-9A-Za-z]+|-'
+
+  _LOG_LINE_PATTERNS = {
+      'action': ('action', r'[0-9A-Za-z-]{2,}'),
+      'date': ('date', r'[0-9]{4}-[0-9]{2}-[0-9]{2}'),
+      'dst-ip': ('destination_ip', _IPV4_ADDRESS_OR_BLANK_PATTERN),
+      'dst-port': ('destination_port', _PORT_NUMBER_OR_BLANK_PATTERN),
+      'icmpcode': ('icmp_code', _INTEGER_OR_BLANK_PATTERN),
+      'icmptype': ('icmp_type', _INTEGER_OR_BLANK_PATTERN),
+      'info': ('information', _WORD_OR_BLANK_PATTERN),
+      'path': ('path', _WORD_OR_BLANK_PATTERN),
+      'protocol': ('protocol', _WORD_OR_BLANK_PATTERN),
+      'size': ('packet_size', _INTEGER_OR_BLANK_PATTERN),
+      'src-ip': ('source_ip', _IPV4_ADDRESS_OR_BLANK_PATTERN),
+      'src-port': ('source_port', _PORT_NUMBER_OR_BLANK_PATTERN),
+      'tcpack': ('tcp_ack', _INTEGER_OR_BLANK_PATTERN),
+      'tcpflags': ('tcp_flags', _WORD_OR_BLANK_PATTERN),
+      'tcpsyn': ('tcp_sequence_number', _INTEGER_OR_BLANK_PATTERN),
+      'tcpwin': ('tcp_window_size', _INTEGER_OR_BLANK_PATTERN),
+      'time': ('time', r'[0-9]{2}:[0-9]{2}:[0-9]{2}')}
+
+  _INTEGER_VALUE_NAMES = frozenset([
+      'destination_port', 'icmp_code', 'icmp_type', 'packet_size',
+      'source_port', 'tcp_ack', 'tcp_sequence_number', 'tcp_window_size'])
+
   _HEADER_GRAMMAR = pyparsing.OneOrMore(_COMMENT_LOG_LINE)
 
   _LINE_STRUCTURES = [('log_line', _LOG_LINE_1_5)]
@@ -175,6 +214,34 @@ class WinFirewallLogTextPlugin(interface.TextPlugin):
     super(WinFirewallLogTextPlugin, self).__init__()
     self._use_local_time = False
 
+  def _GetStructureFromRegexMatch(self, key, match):
+    """Retrieves a structure from a line regular expression match.
+
+    Args:
+      key (str): name of the matched line regular expression.
+      match (re.Match): line regular expression match.
+
+    Returns:
+      dict[str, object]: structure equivalent to that of the corresponding
+          line structure.
+    """
+    structure = {}
+    for name, value in match.groupdict().items():
+      # Note that blank values are suppressed by the line structure.
+      if value == '-':
+        continue
+
+      if name == 'date':
+        value = [int(element, 10) for element in value.split('-')]
+      elif name == 'time':
+        value = [int(element, 10) for element in value.split(':')]
+      elif name in self._INTEGER_VALUE_NAMES:
+        value = int(value, 10)
+
+      structure[name] = value
+
+    return structure
+
   def _ParseFieldsMetadata(self, parser_mediator, fields):
     """Parses the fields metadata and updates the log line definition to match.
 
@@ -183,6 +250,7 @@ class WinFirewallLogTextPlugin(interface.TextPlugin):
           and other components, such as storage and dfVFS.
       fields (str): field definitions.
     """
+    log_line_patterns = []
     log_line_structure = pyparsing.Empty()
     for member in fields.split(' '):
       if not member:
@@ -197,9 +265,29 @@ class WinFirewallLogTextPlugin(interface.TextPlugin):
 
       log_line_structure += field_structure
 
+      name, pattern = self._LOG_LINE_PATTERNS.get(
+          member, (None, self._WORD_OR_BLANK_PATTERN))
+      if name:
+        pattern = '(?P<{0:s}>{1:s})'.format(name, pattern)
+      else:
+        pattern = '(?:{0:s})'.format(pattern)
+
+      log_line_patterns.append(pattern)
+
     log_line_structure += self._END_OF_LINE
 
-    self._SetLineStructures([('log_line', log_line_structure)])
+    line_regexes = None
+    try:
+      log_line_regex = re.compile(
+          r'[ \t]+'.join(log_line_patterns) + r'[ \t]*(?:\n|\Z)')
+      line_regexes = [('log_line', log_line_regex)]
+    except re.error:
+      # Fields that are defined more than once cannot be mapped onto named
+      # groups, hence only the pyparsing grammar is used.
+      pass
+
+    self._SetLineStructures(
+        [('log_line', log_line_structure)], line_regexes=line_regexes)
 
   def _ParseHeader(self, parser_mediator, text_reader):
     """Parses a text-log file header.
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Parser for Windows NT Registry (REGF) files."""
 
+import collections
+
 from dfwinreg import errors as dfwinreg_errors
 from dfwinreg import regf as dfwinreg_regf
 from dfwinreg import registry as dfwinreg_registry
@@ -38,30 +40,54 @@ class WinRegistryParser(interface.FileObjectParser):
   def __init__(self):
     """Initializes a parser."""
     super(WinRegistryParser, self).__init__()
+    self._filters_per_value_name = {}
+    self._filters_without_value_names = []
     self._path_filter = None
     self._plugins_per_key_path = {}
     self._plugins_without_key_paths = []
 
-  def _CanProcessKeyWithPlugin(self, registry_key, plugin):
-    """Determines if a plugin can process a Windows Registry key or its values.
+  def _GetPluginWithoutKeyPath(self, parser_mediator, registry_key):
+    """Retrieves a plugin without key paths that can process a Registry key.
+
+    Only the filters without key paths are matched, since filters with key
+    paths are checked by the path filter. Filters that define value names
+    are only matched if the key contains the value name they are indexed by.
 
     Args:
+      parser_mediator (ParserMediator): parser mediator.
       registry_key (dfwinreg.WinRegistryKey): Windows Registry key.
-      plugin (WindowsRegistryPlugin): Windows Registry plugin.
 
     Returns:
-      bool: True if the Registry key can be processed with the plugin.
+      WindowsRegistryPlugin: plugin that can process the Registry key or None
+          if not available.
     """
-    for registry_key_filter in plugin.FILTERS:
-      # Skip filters that define key paths since they are already
-      # checked by the path filter.
-      if getattr(registry_key_filter, 'key_paths', []):
-        continue
+    candidate_filters = list(self._filters_without_value_names)
 
-      if registry_key_filter.Match(registry_key):
-        return True
+    # Note that looking up the indexed value names by name is cheaper than
+    # retrieving all the values of the key.
+    if registry_key.number_of_values:
+      for value_name, filters in self._filters_per_value_name.items():
+        if registry_key.GetValueByName(value_name):
+          candidate_filters.extend(filters)
+
+    # Match the filters in order of the plugins, so that the first plugin that
+    # can process the key is used.
+    candidate_filters.sort(key=lambda candidate_filter: candidate_filter[0])
+
+    for _, plugin, registry_key_filter in candidate_filters:
+      profiling_name = '/'.join([self.NAME, plugin.NAME])
+
+      parser_mediator.SampleFormatCheckStartTiming(profiling_name)
+
+      try:
+        result = registry_key_filter.Match(registry_key)
+      finally:
+        parser_mediator.SampleFormatCheckStopTiming(profiling_name)
 
-    return False
+      if result:
+        return plugin
+
+    return None
 
   def EnablePlugins(self, plugin_includes):
     """Enables parser plugins.
@@ -71,6 +97,8 @@ class WinRegistryParser(interface.FileObjectParser):
           set(['*']) represents all plugins. Note the default plugin, if
           it exists, is always enabled and cannot be disabled.
     """
+    self._filters_per_value_name = {}
+    self._filters_without_value_names = []
     self._plugins_per_name = {}
     self._plugins_per_key_path = {}
     self._plugins_without_key_paths = []
@@ -78,6 +106,7 @@ class WinRegistryParser(interface.FileObjectParser):
     if not self._plugin_classes:
       return
 
+    filters_without_key_paths = []
     key_paths = []
 
     for plugin_name, plugin_class in self._plugin_classes.items():
@@ -94,9 +123,13 @@ class WinRegistryParser(interface.FileObjectParser):
 
       for registry_key_filter in plugin_object.FILTERS:
         plugin_key_paths = getattr(registry_key_filter, 'key_paths', [])
-        if (not plugin_key_paths and
-            plugin_object not in self._plugins_without_key_paths):
-          self._plugins_without_key_paths.append(plugin_object)
+        if not plugin_key_paths:
+          if plugin_object not in self._plugins_without_key_paths:
+            self._plugins_without_key_paths.append(plugin_object)
+
+          filters_without_key_paths.append((
+              len(self._plugins_without_key_paths) - 1, plugin_object,
+              registry_key_filter))
           continue
 
         for plugin_key_path in plugin_key_paths:
@@ -116,6 +149,25 @@ class WinRegistryParser(interface.FileObjectParser):
     self._path_filter = path_filter.PathFilterScanTree(
         key_paths, case_sensitive=False, path_segment_separator='\\')
 
+    # Filters that define value names are indexed by the value name that is
+    # defined by the least number of filters.
+    number_of_filters_per_value_name = collections.Counter()
+    for _, _, registry_key_filter in filters_without_key_paths:
+      value_names = getattr(registry_key_filter, 'value_names', None) or []
+      number_of_filters_per_value_name.update(value_names)
+
+    for filter_tuple in filters_without_key_paths:
+      value_names = getattr(filter_tuple[2], 'value_names', None)
+      if not value_names:
+        self._filters_without_value_names.append(filter_tuple)
+        continue
+
+      value_name = min(value_names, key=lambda name: (
+          number_of_filters_per_value_name[name], name))
+
+      self._filters_per_value_name.setdefault(value_name, []).append(
+          filter_tuple)
+
   @classmethod
   def GetFormatSpecification(cls):
     """Retrieves the format specification."""
@@ -175,18 +227,8 @@ class WinRegistryParser(interface.FileObjectParser):
     if self._path_filter and self._path_filter.CheckPath(normalized_key_path):
       matching_plugin = self._plugins_per_key_path[normalized_key_path]
     else:
-      for plugin in self._plugins_without_key_paths:
-        profiling_name = '/'.join([self.NAME, plugin.NAME])
-
-        parser_mediator.SampleFormatCheckStartTiming(profiling_name)
-
-        try:
-          if self._CanProcessKeyWithPlugin(registry_key, plugin):
-            matching_plugin = plugin
-            break
-
-        finally:
-          parser_mediator.SampleFormatCheckStopTiming(profiling_name)
+      matching_plugin = self._GetPluginWithoutKeyPath(
+          parser_mediator, registry_key)
 
     if not matching_plugin:
       matching_plugin = self._default_plugin
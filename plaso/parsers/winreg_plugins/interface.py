@@ -17,6 +17,11 @@ class BaseWindowsRegistryKeyFilter(object):
     """list[str]: key paths defined by the filter."""
     return []
 
+  @property
+  def value_names(self):
+    """frozenset[str]: names of the values the key must contain to match."""
+    return frozenset()
+
   # pylint: disable=redundant-returns-doc
   @abc.abstractmethod
   def Match(self, registry_key):
@@ -185,6 +190,11 @@ class WindowsRegistryKeyWithValuesFilter(BaseWindowsRegistryKeyFilter):
     super(WindowsRegistryKeyWithValuesFilter, self).__init__()
     self._value_names = frozenset(value_names)
 
+  @property
+  def value_names(self):
+    """frozenset[str]: names of the values the key must contain to match."""
+    return self._value_names
+
   def Match(self, registry_key):
     """Determines if a Windows Registry key matches the filter.
 
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+"""MessagePack attribute container serializer."""
+
+import collections
+
+from acstore.containers import interface as containers_interface
+from acstore.containers import manager as containers_manager
+
+from dfdatetime import interface as dfdatetime_interface
+from dfdatetime import serializer as dfdatetime_serializer
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import path_spec as dfvfs_path_spec
+from dfvfs.path import factory as dfvfs_path_spec_factory
+
+# The following import is needed to make sure TSKTime is registered with
+# the dfDateTime factory.
+from dfvfs.vfs import tsk_file_entry  # pylint: disable=unused-import
+
+try:
+  import msgpack
+except ImportError:
+  msgpack = None
+
+from plaso.serializer import logger
+
+
+class MessagePackAttributeContainerSerializer(object):
+  """MessagePack attribute container serializer.
+
+  Values that MessagePack supports natively, such as bytes, dict, list and
+  str, are stored as is. Other values are stored as MessagePack extension
+  types, where the extension data contains the MessagePack serialized
+  properties of the value.
+  """
+
+  _EXTENSION_TYPE_ATTRIBUTE_CONTAINER = 1
+  _EXTENSION_TYPE_ATTRIBUTE_CONTAINER_IDENTIFIER = 2
+  _EXTENSION_TYPE_COLLECTIONS_COUNTER = 3
+  _EXTENSION_TYPE_DATE_TIME_VALUES = 4
+  _EXTENSION_TYPE_PATH_SPEC = 5
+  _EXTENSION_TYPE_TUPLE = 6
+
+  _convert_extension_type_to_value = {}
+
+  @classmethod
+  def _ConvertAttributeContainerToExtensionType(cls, attribute_container):
+    """Converts an attribute container into a MessagePack extension type.
+
+    The extension data contains a list of the container type and a dictionary
+    of the attributes of the container.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      msgpack.ExtType: MessagePack extension type.
+    """
+    attributes = dict(attribute_container.GetAttributes())
+    return msgpack.ExtType(
+        cls._EXTENSION_TYPE_ATTRIBUTE_CONTAINER, cls._Pack([
+            attribute_container.CONTAINER_TYPE, attributes]))
+
+  @classmethod
+  def _ConvertExtensionDataToAttributeContainer(cls, extension_data):
+    """Converts MessagePack extension data into an attribute container.
+
+    Args:
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      AttributeContainer: attribute container.
+
+    Raises:
+      ValueError: if the attribute type of an event data attribute container
+          is not supported.
+    """
+    container_type, attributes = cls._Unpack(extension_data)
+
+    attribute_container = (
+        containers_manager.AttributeContainersManager.CreateAttributeContainer(
+            container_type))
+
+    supported_attribute_names = attribute_container.GetAttributeNames()
+    for attribute_name, attribute_value in attributes.items():
+      if container_type == 'event_data':
+        if isinstance(attribute_value, (bytes, dict)):
+          raise ValueError((
+              'Event data attribute value: {0:s} of type {1:s} is not '
+              'supported.').format(attribute_name, type(
+                  attribute_value).__name__))
+
+      # Be strict about which attributes to set in non event data attribute
+      # containers.
+      elif attribute_name not in supported_attribute_names:
+        logger.debug((
+            '[_ConvertExtensionDataToAttributeContainer] unsupported '
+            'attribute name: {0:s}.{1:s}').format(
+                container_type, attribute_name))
+        continue
+
+      setattr(attribute_container, attribute_name, attribute_value)
+
+    return attribute_container
+
+  @classmethod
+  def _ConvertExtensionDataToAttributeContainerIdentifier(cls, extension_data):
+    """Converts MessagePack extension data into a container identifier.
+
+    Args:
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      AttributeContainerIdentifier: attribute container identifier.
+    """
+    name, sequence_number = cls._Unpack(extension_data)
+    return containers_interface.AttributeContainerIdentifier(
+        name=name, sequence_number=sequence_number)
+
+  @classmethod
+  def _ConvertExtensionDataToCollectionsCounter(cls, extension_data):
+    """Converts MessagePack extension data into a collections.Counter.
+
+    Args:
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      collections.Counter: a collections.Counter value.
+    """
+    return collections.Counter(cls._Unpack(extension_data))
+
+  @classmethod
+  def _ConvertExtensionDataToDateTimeValues(cls, extension_data):
+    """Converts MessagePack extension data into a date time values object.
+
+    Args:
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      dfdatetime.DateTimeValues: date and time values.
+    """
+    json_dict = cls._Unpack(extension_data)
+    return dfdatetime_serializer.Serializer.ConvertDictToDateTimeValues(
+        json_dict)
+
+  @classmethod
+  def _ConvertExtensionDataToPathSpec(cls, extension_data):
+    """Converts MessagePack extension data into a path specification.
+
+    Args:
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      dfvfs.PathSpec: path specification.
+    """
+    properties = cls._Unpack(extension_data)
+
+    type_indicator = properties.pop('type_indicator', None)
+
+    path_spec = dfvfs_path_spec_factory.Factory.NewPathSpec(
+        type_indicator, **properties)
+
+    if type_indicator == dfvfs_definitions.TYPE_INDICATOR_OS:
+      # dfvfs.OSPathSpec() will change the location to an absolute path
+      # here we want to preserve the original location.
+      path_spec.location = properties.get('location', None)
+
+    return path_spec
+
+  @classmethod
+  def _ConvertExtensionDataToTuple(cls, extension_data):
+    """Converts MessagePack extension data into a tuple.
+
+    Args:
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      tuple: a tuple value.
+    """
+    return tuple(cls._Unpack(extension_data))
+
+  # Pylint is confused by the formatting of the return type.
+  # pylint: disable=missing-return-type-doc
+  @classmethod
+  def _ConvertExtensionTypeToValue(cls, code, extension_data):
+    """Converts a MessagePack extension type into a value.
+
+    Args:
+      code (int): MessagePack extension type code.
+      extension_data (bytes): MessagePack extension data.
+
+    Returns:
+      object: deserialized value.
+
+    Raises:
+      ValueError: if the extension type is not supported.
+    """
+    if not cls._convert_extension_type_to_value:
+      cls._convert_extension_type_to_value = {
+          cls._EXTENSION_TYPE_ATTRIBUTE_CONTAINER: (
+              cls._ConvertExtensionDataToAttributeContainer),
+          cls._EXTENSION_TYPE_ATTRIBUTE_CONTAINER_IDENTIFIER: (
+              cls._ConvertExtensionDataToAttributeContainerIdentifier),
+          cls._EXTENSION_TYPE_COLLECTIONS_COUNTER: (
+              cls._ConvertExtensionDataToCollectionsCounter),
+          cls._EXTENSION_TYPE_DATE_TIME_VALUES: (
+              cls._ConvertExtensionDataToDateTimeValues),
+          cls._EXTENSION_TYPE_PATH_SPEC: cls._ConvertExtensionDataToPathSpec,
+          cls._EXTENSION_TYPE_TUPLE: cls._ConvertExtensionDataToTuple}
+
+    convert_function = cls._convert_extension_type_to_value.get(code, None)
+    if not convert_function:
+      raise ValueError('Unsupported MessagePack extension type: {0:d}'.format(
+          code))
+
+    return convert_function(extension_data)
+
+  @classmethod
+  def _ConvertPathSpecToExtensionType(cls, path_spec_object):
+    """Converts a path specification into a MessagePack extension type.
+
+    The extension data contains a dictionary of the path specification
+    properties, where the parent path specification is stored as a nested
+    extension type.
+
+    Args:
+      path_spec_object (dfvfs.PathSpec): path specification.
+
+    Returns:
+      msgpack.ExtType: MessagePack extension type.
+    """
+    properties = {'type_indicator': path_spec_object.type_indicator}
+    for property_name in dfvfs_path_spec_factory.Factory.PROPERTY_NAMES:
+      property_value = getattr(path_spec_object, property_name, None)
+      if property_value is not None:
+        properties[property_name] = property_value
+
+    if path_spec_object.HasParent():
+      properties['parent'] = path_spec_object.parent
+
+    return msgpack.ExtType(
+        cls._EXTENSION_TYPE_PATH_SPEC, cls._Pack(properties))
+
+  @classmethod
+  def _ConvertValueToExtensionType(cls, value):
+    """Converts a value not natively supported by MessagePack.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      msgpack.ExtType: MessagePack extension type.
+
+    Raises:
+      TypeError: if the type of the value is not supported.
+    """
+    if isinstance(value, tuple):
+      return msgpack.ExtType(cls._EXTENSION_TYPE_TUPLE, cls._Pack(list(value)))
+
+    if isinstance(value, collections.Counter):
+      return msgpack.ExtType(
+          cls._EXTENSION_TYPE_COLLECTIONS_COUNTER, cls._Pack(dict(value)))
+
+    if isinstance(value, dfdatetime_interface.DateTimeValues):
+      json_dict = dfdatetime_serializer.Serializer.ConvertDateTimeValuesToDict(
+          value)
+      return msgpack.ExtType(
+          cls._EXTENSION_TYPE_DATE_TIME_VALUES, cls._Pack(json_dict))
+
+    if isinstance(value, dfvfs_path_spec.PathSpec):
+      return cls._ConvertPathSpecToExtensionType(value)
+
+    if isinstance(value, containers_interface.AttributeContainerIdentifier):
+      return msgpack.ExtType(
+          cls._EXTENSION_TYPE_ATTRIBUTE_CONTAINER_IDENTIFIER,
+          cls._Pack([value.name, value.sequence_number]))
+
+    if isinstance(value, containers_interface.AttributeContainer):
+      return cls._ConvertAttributeContainerToExtensionType(value)
+
+    # Other subclasses of types natively supported by MessagePack, such as
+    # collections.OrderedDict, are stored as their base type.
+    if isinstance(value, dict):
+      return dict(value)
+
+    if isinstance(value, list):
+      return list(value)
+
+    raise TypeError('Unsupported value type: {0:s}'.format(
+        type(value).__name__))
+
+  @classmethod
+  def _Pack(cls, value):
+    """Packs a value into MessagePack serialized form.
+
+    Args:
+      value (object): value.
+
+    Returns:
+      bytes: MessagePack serialized value.
+    """
+    # Strict types are needed to store tuples and collections.Counter as
+    # extension types instead of lists and dictionaries.
+    return msgpack.packb(
+        value, default=cls._ConvertValueToExtensionType, strict_types=True,
+        use_bin_type=True)
+
+  @classmethod
+  def _Unpack(cls, serialized_data):
+    """Unpacks a value from MessagePack serialized form.
+
+    Args:
+      serialized_data (bytes): MessagePack serialized value.
+
+    Returns:
+      object: value.
+    """
+    return msgpack.unpackb(
+        serialized_data, ext_hook=cls._ConvertExtensionTypeToValue, raw=False,
+        strict_map_key=False)
+
+  @classmethod
+  def ReadSerialized(cls, serialized_data):
+    """Reads an attribute container from serialized form.
+
+    Args:
+      serialized_data (bytes): MessagePack serialized attribute container.
+
+    Returns:
+      AttributeContainer: attribute container or None.
+
+    Raises:
+      TypeError: if the serialized data does not contain an attribute
+          container.
+      ValueError: if the serialized data cannot be unpacked.
+    """
+    if not serialized_data:
+      return None
+
+    attribute_container = cls._Unpack(serialized_data)
+    if not isinstance(
+        attribute_container, containers_interface.AttributeContainer):
+      raise TypeError('{0!s} is not an attribute container type.'.format(
+          type(attribute_container)))
+
+    return attribute_container
+
+  @classmethod
+  def WriteSerialized(cls, attribute_container):
+    """Writes an attribute container to serialized form.
+
+    Args:
+      attribute_container (AttributeContainer): attribute container.
+
+    Returns:
+      bytes: MessagePack serialized attribute container.
+
+    Raises:
+      TypeError: if an attribute value type is not supported.
+    """
+    return cls._Pack(attribute_container)
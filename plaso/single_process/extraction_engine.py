@@ -13,7 +13,9 @@ from dfvfs.resolver import resolver as path_spec_resolver
 from plaso.containers import counts
 from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.engine import content_hash_cache
 from plaso.engine import engine
+from plaso.engine import extracted_file_index
 from plaso.engine import extractors
 from plaso.engine import logger
 from plaso.engine import process_info
@@ -477,6 +479,21 @@ class SingleProcessEngine(engine.BaseEngine):
     if self._processing_profiler:
       self._extraction_worker.SetProcessingProfiler(self._processing_profiler)
 
+    hash_cache = None
+    if processing_configuration.extraction.skip_duplicate_data_streams:
+      hash_cache = content_hash_cache.ContentHashCache()
+      hash_cache.Open(
+          path=processing_configuration.extraction.content_hash_cache_path)
+      self._extraction_worker.SetContentHashCache(hash_cache)
+
+    file_index = None
+    extracted_file_index_path = (
+        processing_configuration.extraction.extracted_file_index_path)
+    if extracted_file_index_path:
+      file_index = extracted_file_index.ExtractedFileIndex()
+      file_index.Open(path=extracted_file_index_path)
+      self._extraction_worker.SetExtractedFileIndex(file_index)
+
     if self._serializers_profiler:
       self._storage_writer.SetSerializersProfiler(self._serializers_profiler)
 
@@ -506,6 +523,16 @@ class SingleProcessEngine(engine.BaseEngine):
       if self._processing_profiler:
         self._extraction_worker.SetProcessingProfiler(None)
 
+      if hash_cache:
+        self._extraction_worker.SetContentHashCache(None)
+        hash_cache.Close()
+
+      if file_index:
+        self._extraction_worker.SetExtractedFileIndex(None)
+        file_index.Close()
+
+      self._extraction_worker.Close()
+
       if self._serializers_profiler:
         self._storage_writer.SetSerializersProfiler(None)
 
@@ -108,18 +108,32 @@ class StorageFactory(object):
     return None
 
   @classmethod
-  def CreateTaskStorageWriter(cls, storage_format):
+  def CreateTaskStorageWriter(cls, storage_format, serialization_format=None):
     """Creates a task storage writer.
 
     Args:
       storage_format (str): storage format.
+      serialization_format (Optional[str]): serialization format of attribute
+          containers without a schema, where None represents JSON. Only the
+          SQLite storage format supports other serialization formats.
 
     Returns:
       StorageWriter: a storage writer or None if the storage file cannot be
           opened or the storage format is not supported.
     """
     if storage_format == definitions.STORAGE_FORMAT_SQLITE:
+      # MessagePack serialized attribute containers are not compressed, which
+      # makes a task storage file about 17% larger than with zlib compressed
+      # JSON serialized ones, but faster to write and read.
+      compression_format = definitions.COMPRESSION_FORMAT_ZLIB
+      if serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+        compression_format = definitions.COMPRESSION_FORMAT_NONE
+      elif not serialization_format:
+        serialization_format = definitions.SERIALIZER_FORMAT_JSON
+
       return sqlite_writer.SQLiteStorageFileWriter(
+          compression_format=compression_format,
+          serialization_format=serialization_format,
           storage_type=definitions.STORAGE_TYPE_TASK)
 
     if storage_format == definitions.STORAGE_FORMAT_REDIS and redis_writer:
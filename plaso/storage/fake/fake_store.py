@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Fake (in-memory only) store for testing."""
 
+import ast
+
 from acstore import fake_store as acstore_fake_store
 
 from plaso.containers import events
@@ -15,6 +17,8 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
   """
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
   def __init__(self):
@@ -23,12 +27,41 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
     self._serializers_profiler = None
     self.serialization_format = None
 
-  def GetSortedEvents(self, time_range=None):
+  def CreateEventTimestampIndex(self):
+    """Creates an index of the event timestamps.
+
+    The fake store sorts the events when they are retrieved, as such no
+    index is created.
+    """
+    return
+
+  def GetNumberOfEvents(self, time_range=None):
+    """Retrieves the number of events.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Returns:
+      int: number of events.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    if not time_range:
+      return self.GetNumberOfAttributeContainers(self._CONTAINER_TYPE_EVENT)
+
+    return len(list(self.GetSortedEvents(time_range=time_range)))
+
+  def GetSortedEvents(self, time_range=None, filter_expression=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
 
     Returns:
       generator(EventObject): event generator.
@@ -40,6 +73,11 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
     if not self._is_open:
       raise IOError('Unable to read from closed storage writer.')
 
+    compiled_filter = None
+    if filter_expression:
+      expression_ast = ast.parse(filter_expression, mode='eval')
+      compiled_filter = compile(expression_ast, '<string>', mode='eval')
+
     generator = self.GetAttributeContainers(self._CONTAINER_TYPE_EVENT)
     sorted_events = event_heap.EventHeap()
 
@@ -49,12 +87,80 @@ class FakeStore(acstore_fake_store.FakeAttributeContainerStore):
           event.timestamp > time_range.end_timestamp)):
         continue
 
+      if compiled_filter and not event.MatchesExpression(compiled_filter):
+        continue
+
       # The event index is used to ensure to sort events with the same date and
       # time and description in the order they were added to the store.
       sorted_events.PushEvent(event, event_index)
 
     return iter(sorted_events.PopEvents())
 
+  def GetSortedEventTimestamps(self):
+    """Retrieves the timestamps of the events in increasing order.
+
+    Returns:
+      generator(int): timestamp generator.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    if not self._is_open:
+      raise IOError('Unable to read from closed storage writer.')
+
+    timestamps = sorted(
+        event.timestamp for event in self.GetAttributeContainers(
+            self._CONTAINER_TYPE_EVENT))
+
+    return iter(timestamps)
+
+  def GetSortedJoinedEvents(self, time_range=None, filter_expression=None):
+    """Retrieves the events joined with related containers in order.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
+
+    Yields:
+      tuple[EventObject, EventData, EventDataStream, EventTag]: event, event
+          data, event data stream or None if not available and event tag or
+          None if not available.
+
+    Raises:
+      IOError: when the storage writer is closed.
+      OSError: when the storage writer is closed.
+    """
+    # The first event tag of an event is joined with the event.
+    event_tag_per_event_identifier = {}
+    for event_tag in self.GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_TAG):
+      event_identifier = event_tag.GetEventIdentifier()
+      if event_identifier:
+        lookup_key = event_identifier.CopyToString()
+        event_tag_per_event_identifier.setdefault(lookup_key, event_tag)
+
+    for event in self.GetSortedEvents(
+        time_range=time_range, filter_expression=filter_expression):
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = self.GetAttributeContainerByIdentifier(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      event_identifier = event.GetIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tag = event_tag_per_event_identifier.get(lookup_key, None)
+
+      yield event, event_data, event_data_stream, event_tag
+
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
 
@@ -192,6 +192,18 @@ class StorageReader(object):
     """
     return self._store.GetNumberOfAttributeContainers(container_type)
 
+  def GetNumberOfEvents(self, time_range=None):
+    """Retrieves the number of events.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Returns:
+      int: number of events.
+    """
+    return self._store.GetNumberOfEvents(time_range=time_range)
+
   def GetSerializationFormat(self):
     """Retrieves the serialization format of the underlying storage file.
 
@@ -220,7 +232,7 @@ class StorageReader(object):
 
     yield from containers
 
-  def GetSortedEvents(self, time_range=None):
+  def GetSortedEvents(self, time_range=None, filter_expression=None):
     """Retrieves the events in increasing chronological order.
 
     This includes all events written to the storage including those pending
@@ -229,11 +241,43 @@ class StorageReader(object):
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
 
     Returns:
       generator(EventObject): event generator.
     """
-    return self._store.GetSortedEvents(time_range=time_range)
+    return self._store.GetSortedEvents(
+        time_range=time_range, filter_expression=filter_expression)
+
+  def GetSortedEventTimestamps(self):
+    """Retrieves the timestamps of the events in increasing order.
+
+    Returns:
+      generator(int): timestamp generator.
+    """
+    return self._store.GetSortedEventTimestamps()
+
+  def GetSortedJoinedEvents(self, time_range=None, filter_expression=None):
+    """Retrieves the events joined with related containers in order.
+
+    The events are retrieved in increasing chronological order together with
+    their event data, event data stream and event tag, which is more efficient
+    than looking up the related attribute containers per event.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
+
+    Returns:
+      generator(tuple[EventObject, EventData, EventDataStream, EventTag]):
+          generator of event, event data, event data stream or None if not
+          available and event tag or None if not available.
+    """
+    return self._store.GetSortedJoinedEvents(
+        time_range=time_range, filter_expression=filter_expression)
 
   def HasAttributeContainers(self, container_type):
     """Determines if a store contains a specific type of attribute container.
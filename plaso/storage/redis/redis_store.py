@@ -4,6 +4,7 @@
 Only supports task storage at the moment.
 """
 
+import ast
 import uuid
 
 import redis  # pylint: disable=import-error
@@ -28,10 +29,14 @@ class RedisStore(interface.AttributeContainerStore):
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
   _FORMAT_VERSION = '20181013'
   _EVENT_INDEX_NAME = 'sorted_event_identifier'
 
+  # Maximum number of event index items to retrieve per Redis query.
+  _MAXIMUM_NUMBER_OF_EVENT_INDEX_ITEMS = 1000
+
   DEFAULT_REDIS_URL = 'redis://127.0.0.1/0'
 
   def __init__(self):
@@ -94,6 +99,31 @@ class RedisStore(interface.AttributeContainerStore):
     return '{0:s}-{1:s}-{2:s}'.format(
         self._session_identifier, self._task_identifier, container_type)
 
+  def _GetSortedEventIndexItems(self):
+    """Retrieves the items of the event index in increasing timestamp order.
+
+    The items are retrieved in pages with ZRANGE, since ZSCAN does not return
+    the items of a sorted set in order.
+
+    Yields:
+      tuple[bytes, float]: Redis key of the event and its timestamp.
+    """
+    event_index_name = self._GetRedisHashName(self._EVENT_INDEX_NAME)
+
+    start_index = 0
+    while True:
+      end_index = start_index + self._MAXIMUM_NUMBER_OF_EVENT_INDEX_ITEMS - 1
+      items = self._redis_client.zrange(
+          event_index_name, start_index, end_index, withscores=True)
+
+      for item in items:
+        yield item
+
+      if len(items) < self._MAXIMUM_NUMBER_OF_EVENT_INDEX_ITEMS:
+        break
+
+      start_index = end_index + 1
+
   def _RaiseIfNotReadable(self):
     """Checks that the store is ready to for reading.
 
@@ -192,6 +222,13 @@ class RedisStore(interface.AttributeContainerStore):
                 sequence_number=identifier))
         container.SetEventDataStreamIdentifier(event_data_stream_identifier)
 
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
+      identifier = getattr(container, '_event_identifier', None)
+      if identifier:
+        event_identifier = containers_interface.AttributeContainerIdentifier(
+            name=self._CONTAINER_TYPE_EVENT, sequence_number=identifier)
+        container.SetEventIdentifier(event_identifier)
+
   def _UpdateAttributeContainerBeforeSerialize(self, container):
     """Updates an attribute container before serialization.
 
@@ -214,6 +251,12 @@ class RedisStore(interface.AttributeContainerStore):
         setattr(container, '_event_data_stream_identifier',
                 event_data_stream_identifier.sequence_number)
 
+    elif container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_TAG:
+      event_identifier = container.GetEventIdentifier()
+      if event_identifier:
+        setattr(container, '_event_identifier',
+                event_identifier.sequence_number)
+
   def _WriteExistingAttributeContainer(self, container):
     """Writes an existing attribute container to the store.
 
@@ -284,6 +327,14 @@ class RedisStore(interface.AttributeContainerStore):
 
     self._redis_client = None
 
+  def CreateEventTimestampIndex(self):
+    """Creates an index of the event timestamps.
+
+    The Redis store maintains a sorted set of the events per timestamp when
+    the events are written, as such no additional index is created.
+    """
+    return
+
   def GetAttributeContainerByIdentifier(self, container_type, identifier):
     """Retrieves a specific type of container with a specific identifier.
 
@@ -413,12 +464,32 @@ class RedisStore(interface.AttributeContainerStore):
         name, cursor=cursor, count=maximum_number_of_items)
     return cursor, items
 
-  def GetSortedEvents(self, time_range=None):
+  def GetNumberOfEvents(self, time_range=None):
+    """Retrieves the number of events.
+
+    Args:
+      time_range (Optional[TimeRange]): This argument is not supported by the
+          Redis store.
+
+    Returns:
+      int: number of events.
+
+    Raises:
+      RuntimeError: if a time_range argument is specified.
+    """
+    if time_range:
+      raise RuntimeError('Not supported')
+
+    return self.GetNumberOfAttributeContainers(self._CONTAINER_TYPE_EVENT)
+
+  def GetSortedEvents(self, time_range=None, filter_expression=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): This argument is not supported by the
           Redis store.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
 
     Yields:
       EventObject: event.
@@ -426,20 +497,81 @@ class RedisStore(interface.AttributeContainerStore):
     Raises:
       RuntimeError: if a time_range argument is specified.
     """
-    event_index_name = self._GetRedisHashName(self._EVENT_INDEX_NAME)
     if time_range:
       raise RuntimeError('Not supported')
 
-    for redis_key, _ in self._redis_client.zscan_iter(event_index_name):
+    compiled_filter = None
+    if filter_expression:
+      expression_ast = ast.parse(filter_expression, mode='eval')
+      compiled_filter = compile(expression_ast, '<string>', mode='eval')
+
+    for redis_key, _ in self._GetSortedEventIndexItems():
       redis_key = redis_key.decode('utf-8')
 
       container_type, sequence_number = redis_key.split('.')
       sequence_number = int(sequence_number, 10)
       identifier = containers_interface.AttributeContainerIdentifier(
           name=container_type, sequence_number=sequence_number)
-      yield self.GetAttributeContainerByIdentifier(
+      event = self.GetAttributeContainerByIdentifier(
           self._CONTAINER_TYPE_EVENT, identifier)
 
+      if event.MatchesExpression(compiled_filter):
+        yield event
+
+  def GetSortedEventTimestamps(self):
+    """Retrieves the timestamps of the events in increasing order.
+
+    Yields:
+      int: timestamp of an event.
+    """
+    for _, timestamp in self._GetSortedEventIndexItems():
+      yield int(timestamp)
+
+  def GetSortedJoinedEvents(self, time_range=None, filter_expression=None):
+    """Retrieves the events joined with related containers in order.
+
+    Args:
+      time_range (Optional[TimeRange]): This argument is not supported by the
+          Redis store.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
+
+    Yields:
+      tuple[EventObject, EventData, EventDataStream, EventTag]: event, event
+          data, event data stream or None if not available and event tag or
+          None if not available.
+
+    Raises:
+      RuntimeError: if a time_range argument is specified.
+    """
+    # The first event tag of an event is joined with the event.
+    event_tag_per_event_identifier = {}
+    for event_tag in self.GetAttributeContainers(
+        self._CONTAINER_TYPE_EVENT_TAG):
+      event_identifier = event_tag.GetEventIdentifier()
+      if event_identifier:
+        lookup_key = event_identifier.CopyToString()
+        event_tag_per_event_identifier.setdefault(lookup_key, event_tag)
+
+    for event in self.GetSortedEvents(
+        time_range=time_range, filter_expression=filter_expression):
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = self.GetAttributeContainerByIdentifier(
+          self._CONTAINER_TYPE_EVENT_DATA, event_data_identifier)
+
+      event_data_stream = None
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream = self.GetAttributeContainerByIdentifier(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_identifier)
+
+      event_identifier = event.GetIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tag = event_tag_per_event_identifier.get(lookup_key, None)
+
+      yield event, event_data, event_data_stream, event_tag
+
   def HasAttributeContainers(self, container_type):
     """Determines if the store contains a specific type of attribute container.
 
@@ -103,6 +103,42 @@ class JSONPathSpecAttributeSerializer(acstore_interface.AttributeSerializer):
     return json.dumps(json_dict)
 
 
+class JSONPathSpecsListAttributeSerializer(
+    acstore_interface.AttributeSerializer):
+  """JSON path specifications list attribute serializer."""
+
+  def __init__(self):
+    """Initializes a path specifications list attribute serializer."""
+    super(JSONPathSpecsListAttributeSerializer, self).__init__()
+    self._path_spec_serializer = JSONPathSpecAttributeSerializer()
+
+  def DeserializeValue(self, value):
+    """Deserializes a value.
+
+    Args:
+      value (str): serialized value.
+
+    Returns:
+      list[dfvfs.PathSpec]: runtime value.
+    """
+    return [
+        self._path_spec_serializer.DeserializeValue(path_spec_value)
+        for path_spec_value in json.loads(value)]
+
+  def SerializeValue(self, value):
+    """Serializes a value.
+
+    Args:
+      value (list[dfvfs.PathSpec]): runtime value.
+
+    Returns:
+      str: serialized value.
+    """
+    return json.dumps([
+        self._path_spec_serializer.SerializeValue(path_spec)
+        for path_spec in value])
+
+
 class JSONStringsListAttributeSerializer(acstore_interface.AttributeSerializer):
   """JSON strings list attribute serializer."""
 
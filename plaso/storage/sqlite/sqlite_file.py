@@ -12,6 +12,7 @@ from acstore.containers import interface as containers_interface
 from plaso.containers import events
 from plaso.lib import definitions
 from plaso.serializer import json_serializer
+from plaso.serializer import msgpack_serializer
 
 
 class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
@@ -21,7 +22,7 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     compression_format (str): compression format.
   """
 
-  _FORMAT_VERSION = 20230327
+  _FORMAT_VERSION = 20261017
 
   _APPEND_COMPATIBLE_FORMAT_VERSION = 20230327
 
@@ -35,16 +36,68 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
   _CONTAINER_TYPE_EVENT = events.EventObject.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_DATA = events.EventData.CONTAINER_TYPE
+  _CONTAINER_TYPE_EVENT_DATA_STREAM = events.EventDataStream.CONTAINER_TYPE
   _CONTAINER_TYPE_EVENT_TAG = events.EventTag.CONTAINER_TYPE
 
+  # The maximum number of events that are joined with their event data, event
+  # data stream and event tag per query. Note that this value should not
+  # exceed the maximum number of host parameters supported by SQLite (999 in
+  # versions before 3.32.0).
+  _MAXIMUM_JOINED_EVENTS_PER_PAGE = 500
+
+  # SQL comparison operators per Python AST comparison operator type.
+  _PYTHON_AST_COMPARE_OPERATORS = {
+      ast.Eq: '=',
+      ast.Gt: '>',
+      ast.GtE: '>=',
+      ast.Lt: '<',
+      ast.LtE: '<=',
+      ast.NotEq: '<>'}
+
+  # The maximum number of values that are written per multi-row INSERT query.
+  # Note that this value should not exceed the maximum number of host
+  # parameters supported by SQLite (999 in versions before 3.32.0).
+  _MAXIMUM_VALUES_PER_INSERT = 999
+
+  _SERIALIZERS = {
+      definitions.SERIALIZER_FORMAT_JSON: (
+          json_serializer.JSONAttributeContainerSerializer),
+      definitions.SERIALIZER_FORMAT_MSGPACK: (
+          msgpack_serializer.MessagePackAttributeContainerSerializer)}
+
   def __init__(self):
     """Initializes a SQLite-based storage file."""
     super(SQLiteStorageFile, self).__init__()
+    self._missing_column_names = {}
     self._serializer = json_serializer.JSONAttributeContainerSerializer
     self._serializers_profiler = None
 
     self.compression_format = definitions.COMPRESSION_FORMAT_ZLIB
 
+  def _CacheAttributeContainerForWrite(
+      self, container_type, column_names, values):
+    """Caches an attribute container for writing.
+
+    The number of cached attribute containers per container type depends on
+    the number of columns, so that attribute containers with few columns,
+    such as serialized event data, are written with fewer queries.
+
+    Args:
+      container_type (str): attribute container type.
+      column_names (list[str]): names of the columns.
+      values (list[object]): values for each of the columns.
+    """
+    write_cache = self._write_cache.get(container_type, [column_names])
+    write_cache.append(values)
+
+    maximum_write_cache_size = max(
+        self._MAXIMUM_VALUES_PER_INSERT // len(column_names), 1)
+    if len(write_cache) > maximum_write_cache_size:
+      self._FlushWriteCache(container_type, write_cache)
+      write_cache = [column_names]
+
+    self._write_cache[container_type] = write_cache
+
   def _CheckStorageMetadata(self, metadata_values, check_readable_only=False):
     """Checks the storage metadata.
 
@@ -58,8 +111,29 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       IOError: if the format version or the serializer format is not supported.
       OSError: if the format version or the serializer format is not supported.
     """
+    serialization_format = metadata_values.get('serialization_format', None)
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise IOError('Unsupported serialization format: {0!s}'.format(
+          serialization_format))
+
+    if (serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK and
+        not msgpack_serializer.msgpack):
+      raise IOError((
+          'Unsupported serialization format: {0:s} missing msgpack '
+          'support.').format(serialization_format))
+
+    # The attribute container store only supports the JSON serialization
+    # format, which is only used by attribute containers with a schema.
+    store_metadata_values = dict(
+        metadata_values,
+        serialization_format=definitions.SERIALIZER_FORMAT_JSON)
+
     super(SQLiteStorageFile, self)._CheckStorageMetadata(
-        metadata_values, check_readable_only=check_readable_only)
+        store_metadata_values, check_readable_only=check_readable_only)
+
+    # The attribute container store converts the format version into an
+    # integer.
+    metadata_values['format_version'] = store_metadata_values['format_version']
 
     compression_format = metadata_values.get('compression_format', None)
     if compression_format not in definitions.COMPRESSION_FORMATS:
@@ -170,8 +244,11 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       self._serializers_profiler.StartTiming(container_type)
 
     try:
-      serialized_string = serialized_data.decode('utf-8')
-      container = self._serializer.ReadSerialized(serialized_string)
+      if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+        container = self._serializer.ReadSerialized(serialized_data)
+      else:
+        serialized_string = serialized_data.decode('utf-8')
+        container = self._serializer.ReadSerialized(serialized_string)
 
     except UnicodeDecodeError as exception:
       raise IOError('Unable to decode serialized data: {0!s}'.format(exception))
@@ -187,7 +264,8 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
       serialized_identifier = getattr(
           container, '_event_data_stream_identifier', None)
-      if serialized_identifier:
+      # The MessagePack serializer stores the identifier natively.
+      if isinstance(serialized_identifier, str):
         event_data_stream_identifier = (
             containers_interface.AttributeContainerIdentifier())
         event_data_stream_identifier.CopyFromString(serialized_identifier)
@@ -195,6 +273,318 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
     return container
 
+  def _GetAttributeContainerSchema(self, container_type):
+    """Retrieves the schema of an attribute container.
+
+    Attributes without a column in the table of the attribute container,
+    such as attributes added to the schema after a store was written, are
+    not part of the schema and are left unset.
+
+    Args:
+      container_type (str): attribute container type.
+
+    Returns:
+      dict[str, str]: attribute container schema or an empty dictionary if
+          no schema available.
+    """
+    schema = super(SQLiteStorageFile, self)._GetAttributeContainerSchema(
+        container_type)
+
+    missing_column_names = self._missing_column_names.get(container_type, None)
+    if missing_column_names:
+      schema = {
+          name: data_type for name, data_type in schema.items()
+          if name not in missing_column_names}
+
+    return schema
+
+  def _GetAttributeContainersByRowIdentifiers(
+      self, container_type, row_identifiers):
+    """Retrieves attribute containers of a specific type by row identifiers.
+
+    Attribute containers that are cached are not read from the storage file.
+    The remaining attribute containers are read with a single query.
+
+    Args:
+      container_type (str): attribute container type.
+      row_identifiers (set[int]): row identifiers, which are the sequence
+          numbers of the attribute containers.
+
+    Returns:
+      dict[int, AttributeContainer]: attribute containers per row identifier.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    containers = {}
+    uncached_row_identifiers = []
+    for row_identifier in row_identifiers:
+      container = self._GetCachedAttributeContainer(
+          container_type, row_identifier - 1)
+      if container:
+        containers[row_identifier] = container
+      else:
+        uncached_row_identifiers.append(row_identifier)
+
+    if not uncached_row_identifiers:
+      return containers
+
+    self._CommitWriteCache(container_type)
+
+    if not self._attribute_container_sequence_numbers[container_type]:
+      return containers
+
+    if self.format_version > 20221023 or container_type not in (
+        self._READ_INCOMPATIBLE_CONTAINER_TYPES):
+      schema = self._GetAttributeContainerSchema(container_type)
+    else:
+      schema = None
+
+    if schema:
+      column_names = sorted(schema.keys())
+    else:
+      column_names = ['_data']
+
+    query = (
+        'SELECT _identifier, {0:s} FROM {1:s} WHERE _identifier '
+        'IN ({2:s})').format(
+            ', '.join(column_names), container_type,
+            ', '.join(['?'] * len(uncached_row_identifiers)))
+
+    # Use a local cursor to prevent another query interrupting the generator
+    # of sorted events.
+    cursor = self._connection.cursor()
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('get_containers_by_identifiers')
+
+    try:
+      cursor.execute(query, uncached_row_identifiers)
+      rows = cursor.fetchall()
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    finally:
+      if self._storage_profiler:
+        self._storage_profiler.StopTiming('get_containers_by_identifiers')
+
+    for row in rows:
+      row_identifier = row[0]
+
+      container = self._CreateAttributeContainerFromRow(
+          container_type, column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=container_type, sequence_number=row_identifier)
+      container.SetIdentifier(identifier)
+
+      self._CacheAttributeContainerByIndex(container, row_identifier - 1)
+
+      containers[row_identifier] = container
+
+    return containers
+
+  def _GetEventTagsByEventIdentifiers(self, event_identifiers):
+    """Retrieves the event tags of specific events.
+
+    Args:
+      event_identifiers (list[str]): string representations of the event
+          attribute container identifiers.
+
+    Returns:
+      dict[str, EventTag]: event tags per string representation of the event
+          attribute container identifier.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    event_tags = {}
+
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT_TAG)
+
+    if (not event_identifiers or
+        not self._attribute_container_sequence_numbers[
+            self._CONTAINER_TYPE_EVENT_TAG]):
+      return event_tags
+
+    schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT_TAG)
+    column_names = sorted(schema.keys())
+
+    query = (
+        'SELECT _identifier, {0:s} FROM {1:s} WHERE _event_identifier '
+        'IN ({2:s})').format(
+            ', '.join(column_names), self._CONTAINER_TYPE_EVENT_TAG,
+            ', '.join(['?'] * len(event_identifiers)))
+
+    cursor = self._connection.cursor()
+
+    if self._storage_profiler:
+      self._storage_profiler.StartTiming('get_containers_by_identifiers')
+
+    try:
+      cursor.execute(query, event_identifiers)
+      rows = cursor.fetchall()
+
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    finally:
+      if self._storage_profiler:
+        self._storage_profiler.StopTiming('get_containers_by_identifiers')
+
+    for row in rows:
+      event_tag = self._CreateAttributeContainerFromRow(
+          self._CONTAINER_TYPE_EVENT_TAG, column_names, row, 1)
+
+      identifier = containers_interface.AttributeContainerIdentifier(
+          name=self._CONTAINER_TYPE_EVENT_TAG, sequence_number=row[0])
+      event_tag.SetIdentifier(identifier)
+
+      event_identifier = event_tag.GetEventIdentifier()
+      lookup_key = event_identifier.CopyToString()
+      event_tags.setdefault(lookup_key, event_tag)
+
+    return event_tags
+
+  def _GetSortedEventsSQLFilterExpression(
+      self, time_range=None, filter_expression=None):
+    """Retrieves a SQL filter expression for the sorted events.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by.
+
+    Returns:
+      str: SQL filter expression or None if the events are not filtered.
+    """
+    sql_filter_expressions = []
+    if time_range:
+      # Note that a timestamp of 0 is a valid boundary of the time range.
+      sql_filter_expressions.append(
+          'timestamp >= {0:d} AND timestamp <= {1:d}'.format(
+              time_range.start_timestamp, time_range.end_timestamp))
+
+    if filter_expression:
+      expression_ast = ast.parse(filter_expression, mode='eval')
+      sql_filter_expression = self._PythonAST2SQL(expression_ast.body)
+      if sql_filter_expressions:
+        sql_filter_expression = '({0:s})'.format(sql_filter_expression)
+
+      sql_filter_expressions.append(sql_filter_expression)
+
+    return ' AND '.join(sql_filter_expressions) or None
+
+  def _JoinEvents(self, events_page):
+    """Joins events with their event data, event data stream and event tag.
+
+    Args:
+      events_page (list[EventObject]): events.
+
+    Yields:
+      tuple[EventObject, EventData, EventDataStream, EventTag]: event, event
+          data, event data stream or None if not available and event tag or
+          None if not available.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    event_data_row_identifiers = set()
+    for event in events_page:
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data_row_identifiers.add(event_data_identifier.sequence_number)
+
+    event_data_per_row_identifier = (
+        self._GetAttributeContainersByRowIdentifiers(
+            self._CONTAINER_TYPE_EVENT_DATA, event_data_row_identifiers))
+
+    event_data_stream_row_identifiers = set()
+    for event_data in event_data_per_row_identifier.values():
+      event_data_stream_identifier = event_data.GetEventDataStreamIdentifier()
+      if event_data_stream_identifier:
+        event_data_stream_row_identifiers.add(
+            event_data_stream_identifier.sequence_number)
+
+    event_data_stream_per_row_identifier = (
+        self._GetAttributeContainersByRowIdentifiers(
+            self._CONTAINER_TYPE_EVENT_DATA_STREAM,
+            event_data_stream_row_identifiers))
+
+    event_identifiers = [
+        event.GetIdentifier().CopyToString() for event in events_page]
+    event_tag_per_event_identifier = self._GetEventTagsByEventIdentifiers(
+        event_identifiers)
+
+    for event, event_identifier in zip(events_page, event_identifiers):
+      event_data_identifier = event.GetEventDataIdentifier()
+      event_data = event_data_per_row_identifier.get(
+          event_data_identifier.sequence_number, None)
+
+      event_data_stream = None
+      if event_data:
+        event_data_stream_identifier = (
+            event_data.GetEventDataStreamIdentifier())
+        if event_data_stream_identifier:
+          event_data_stream = event_data_stream_per_row_identifier.get(
+              event_data_stream_identifier.sequence_number, None)
+
+      event_tag = event_tag_per_event_identifier.get(event_identifier, None)
+
+      yield event, event_data, event_data_stream, event_tag
+
+  def _PythonAST2SQL(self, ast_node):
+    """Converts a Python AST to SQL.
+
+    This extends sqlite_store.PythonAST2SQL with support for ordering
+    comparisons, nested boolean operations and string values that contain
+    quotes.
+
+    Args:
+      ast_node (ast.Node): node of the Python AST.
+
+    Returns:
+      str: SQL statement that represents the node.
+
+    Raises:
+      TypeError: if the type of node is not supported.
+    """
+    if isinstance(ast_node, ast.BoolOp):
+      if isinstance(ast_node.op, ast.And):
+        operand = ' AND '
+      elif isinstance(ast_node.op, ast.Or):
+        operand = ' OR '
+      else:
+        raise TypeError(ast_node)
+
+      return operand.join([
+          '({0:s})'.format(self._PythonAST2SQL(ast_node_value))
+          for ast_node_value in ast_node.values])
+
+    if isinstance(ast_node, ast.Compare):
+      if len(ast_node.ops) != 1 or len(ast_node.comparators) != 1:
+        raise TypeError(ast_node)
+
+      operator = self._PYTHON_AST_COMPARE_OPERATORS.get(
+          type(ast_node.ops[0]), None)
+      if not operator:
+        raise TypeError(ast_node)
+
+      sql_left = self._PythonAST2SQL(ast_node.left)
+      sql_right = self._PythonAST2SQL(ast_node.comparators[0])
+
+      return ' '.join([sql_left, operator, sql_right])
+
+    if isinstance(ast_node, ast.Constant) and isinstance(ast_node.value, str):
+      return '\'{0:s}\''.format(ast_node.value.replace('\'', '\'\''))
+
+    return sqlite_store.PythonAST2SQL(ast_node)
+
   def _ReadAndCheckStorageMetadata(self, check_readable_only=False):
     """Reads storage metadata and checks that the values are valid.
 
@@ -216,6 +606,43 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     self.compression_format = metadata_values['compression_format']
     self.serialization_format = metadata_values['serialization_format']
 
+    self._serializer = self._SERIALIZERS[self.serialization_format]
+
+    self._missing_column_names = {}
+    if self.format_version < self._FORMAT_VERSION:
+      self._ReadMissingColumnNames()
+
+  def _ReadMissingColumnNames(self):
+    """Reads the names of the columns missing in attribute container tables.
+
+    Tables of stores with an older format version can lack columns of
+    attributes that were added to the schema of an attribute container
+    later, such as file_size of the event source.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    for container_type in self._containers_manager.GetContainerTypes():
+      schema = self._containers_manager.GetSchema(container_type)
+      if not schema or not self._HasTable(container_type):
+        continue
+
+      query = 'PRAGMA table_info({0:s})'.format(container_type)
+
+      try:
+        self._cursor.execute(query)
+        column_names = set(row[1] for row in self._cursor.fetchall())
+
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError((
+            'Unable to query attribute container store with error: '
+            '{0!s}').format(exception))
+
+      missing_column_names = set(schema.keys()).difference(column_names)
+      if missing_column_names:
+        self._missing_column_names[container_type] = missing_column_names
+
   def _SerializeAttributeContainer(self, container):
     """Serializes an attribute container.
 
@@ -233,32 +660,80 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
       self._serializers_profiler.StartTiming(container.CONTAINER_TYPE)
 
     try:
-      json_dict = self._serializer.WriteSerializedDict(container)
+      if self.serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK:
+        serialized_data = self._serializer.WriteSerialized(container)
 
-      if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
-        event_data_stream_identifier = container.GetEventDataStreamIdentifier()
-        if event_data_stream_identifier:
-          json_dict['_event_data_stream_identifier'] = (
-              event_data_stream_identifier.CopyToString())
+      else:
+        json_dict = self._serializer.WriteSerializedDict(container)
 
-      try:
-        serialized_string = json.dumps(json_dict)
-      except TypeError as exception:
-        raise IOError((
-            'Unable to serialize attribute container: {0:s} with error: '
-            '{1!s}.').format(container.CONTAINER_TYPE, exception))
+        if container.CONTAINER_TYPE == self._CONTAINER_TYPE_EVENT_DATA:
+          event_data_stream_identifier = (
+              container.GetEventDataStreamIdentifier())
+          if event_data_stream_identifier:
+            json_dict['_event_data_stream_identifier'] = (
+                event_data_stream_identifier.CopyToString())
 
-      if not serialized_string:
-        raise IOError('Unable to serialize attribute container: {0:s}.'.format(
-            container.CONTAINER_TYPE))
+        serialized_data = json.dumps(json_dict).encode('utf-8')
 
-      serialized_string = serialized_string.encode('utf-8')
+    except TypeError as exception:
+      raise IOError((
+          'Unable to serialize attribute container: {0:s} with error: '
+          '{1!s}.').format(container.CONTAINER_TYPE, exception))
 
     finally:
       if self._serializers_profiler:
         self._serializers_profiler.StopTiming(container.CONTAINER_TYPE)
 
-    return serialized_string
+    if not serialized_data:
+      raise IOError('Unable to serialize attribute container: {0:s}.'.format(
+          container.CONTAINER_TYPE))
+
+    return serialized_data
+
+  def _UpdateStorageMetadataFormatVersion(self):
+    """Updates the storage metadata format version.
+
+    The attribute container tables of a store with an older format version
+    are upgraded before the format version is updated.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    if self._UPGRADE_COMPATIBLE_FORMAT_VERSION <= self.format_version < (
+        self._FORMAT_VERSION):
+      self._UpgradeAttributeContainerTables()
+
+    super(SQLiteStorageFile, self)._UpdateStorageMetadataFormatVersion()
+
+  def _UpgradeAttributeContainerTables(self):
+    """Upgrades the attribute container tables to the current schemas.
+
+    Columns are added for attributes that were added to the schema of
+    an attribute container after its table was created, such as file_size
+    of the event source.
+
+    Raises:
+      IOError: when there is an error querying the attribute container store.
+      OSError: when there is an error querying the attribute container store.
+    """
+    for container_type, missing_column_names in sorted(
+        self._missing_column_names.items()):
+      schema = self._containers_manager.GetSchema(container_type)
+
+      try:
+        for name in sorted(missing_column_names):
+          data_type = self._schema_helper.GetStorageDataType(schema[name])
+          query = 'ALTER TABLE {0:s} ADD COLUMN {1:s} {2:s}'.format(
+              container_type, name, data_type)
+          self._cursor.execute(query)
+
+      except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+        raise IOError((
+            'Unable to query attribute container store with error: '
+            '{0!s}').format(exception))
+
+    self._missing_column_names = {}
 
   def _WriteExistingAttributeContainer(self, container):
     """Writes an existing attribute container to the store.
@@ -293,17 +768,17 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     values = []
     for name, data_type in sorted(schema.items()):
       attribute_value = getattr(container, name, None)
-      if attribute_value is not None:
-        if data_type == 'AttributeContainerIdentifier' and isinstance(
-            attribute_value, containers_interface.AttributeContainerIdentifier):
-          attribute_value = attribute_value.CopyToString()
-
-        elif data_type == 'bool':
-          attribute_value = int(attribute_value)
-
-        elif data_type not in self._CONTAINER_SCHEMA_TO_SQLITE_TYPE_MAPPINGS:
-          # TODO: add compression support
-          attribute_value = self._serializer.WriteSerialized(attribute_value)
+      # Note that the values are serialized the same way as for new attribute
+      # containers, independent of the serialization format of attribute
+      # containers without a schema.
+      try:
+        attribute_value = self._schema_helper.SerializeValue(
+            data_type, attribute_value)
+      except IOError:
+        raise IOError((
+            'Unsupported attribute container type: {0:s} attribute: {1:s} '
+            'data type: {2:s}').format(
+                container.CONTAINER_TYPE, name, data_type))
 
       column_names.append('{0:s} = ?'.format(name))
       values.append(attribute_value)
@@ -398,6 +873,33 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
 
       self._CacheAttributeContainerByIndex(container, next_sequence_number - 1)
 
+  def CreateEventTimestampIndex(self):
+    """Creates an index of the event timestamps.
+
+    The index allows events to be retrieved in chronological order and events
+    in a time range to be looked up without scanning and sorting the event
+    table.
+
+    Raises:
+      IOError: when the storage file is closed or read-only or when there is
+          an error querying the storage file.
+      OSError: when the storage file is closed or read-only or when there is
+          an error querying the storage file.
+    """
+    self._RaiseIfNotWritable()
+
+    if not self._HasTable(self._CONTAINER_TYPE_EVENT):
+      return
+
+    query = (
+        'CREATE INDEX IF NOT EXISTS event_per_timestamp '
+        'ON event (timestamp)')
+    try:
+      self._cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
   def GetAttributeContainerByIndex(self, container_type, index):
     """Retrieves a specific attribute container.
 
@@ -502,12 +1004,50 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
         container_type, column_names=['_data'],
         filter_expression=sql_filter_expression)
 
-  def GetSortedEvents(self, time_range=None):
+  def GetNumberOfEvents(self, time_range=None):
+    """Retrieves the number of events.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+
+    Returns:
+      int: number of events.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    if not time_range:
+      return self.GetNumberOfAttributeContainers(self._CONTAINER_TYPE_EVENT)
+
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return 0
+
+    query = 'SELECT COUNT(*) FROM {0:s} WHERE {1:s}'.format(
+        self._CONTAINER_TYPE_EVENT,
+        self._GetSortedEventsSQLFilterExpression(time_range=time_range))
+
+    try:
+      self._cursor.execute(query)
+      row = self._cursor.fetchone()
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    return row[0]
+
+  def GetSortedEvents(self, time_range=None, filter_expression=None):
     """Retrieves the events in increasing chronological order.
 
     Args:
       time_range (Optional[TimeRange]): time range used to filter events
           that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
 
     Returns:
       generator(EventObject): event generator.
@@ -515,23 +1055,112 @@ class SQLiteStorageFile(sqlite_store.SQLiteAttributeContainerStore):
     schema = self._GetAttributeContainerSchema(self._CONTAINER_TYPE_EVENT)
     column_names = sorted(schema.keys())
 
-    filter_expression = None
-    if time_range:
-      filter_expression = []
+    sql_filter_expression = self._GetSortedEventsSQLFilterExpression(
+        time_range=time_range, filter_expression=filter_expression)
 
-      if time_range.start_timestamp:
-        filter_expression.append('timestamp >= {0:d}'.format(
-            time_range.start_timestamp))
+    return self._GetAttributeContainersWithFilter(
+        self._CONTAINER_TYPE_EVENT, column_names=column_names,
+        filter_expression=sql_filter_expression, order_by='timestamp')
 
-      if time_range.end_timestamp:
-        filter_expression.append('timestamp <= {0:d}'.format(
-            time_range.end_timestamp))
+  def GetSortedEventTimestamps(self):
+    """Retrieves the timestamps of the events in increasing order.
 
-      filter_expression = ' AND '.join(filter_expression)
+    Only the timestamp column is read, the events are not deserialized.
 
-    return self._GetAttributeContainersWithFilter(
-        self._CONTAINER_TYPE_EVENT, column_names=column_names,
-        filter_expression=filter_expression, order_by='timestamp')
+    Yields:
+      int: timestamp of an event, which contains the number of microseconds
+          since January 1, 1970, 00:00:00 UTC.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    self._CommitWriteCache(self._CONTAINER_TYPE_EVENT)
+
+    if not self._attribute_container_sequence_numbers[
+        self._CONTAINER_TYPE_EVENT]:
+      return
+
+    query = 'SELECT timestamp FROM {0:s} ORDER BY timestamp'.format(
+        self._CONTAINER_TYPE_EVENT)
+
+    # Use a local cursor to prevent another query interrupting the generator.
+    cursor = self._connection.cursor()
+
+    try:
+      cursor.execute(query)
+    except (sqlite3.InterfaceError, sqlite3.OperationalError) as exception:
+      raise IOError('Unable to query storage file with error: {0!s}'.format(
+          exception))
+
+    row = cursor.fetchone()
+    while row:
+      yield row[0]
+      row = cursor.fetchone()
+
+  def GetSortedJoinedEvents(self, time_range=None, filter_expression=None):
+    """Retrieves the events joined with related containers in order.
+
+    The events are retrieved in increasing chronological order and joined
+    with their event data, event data stream and event tag per page of
+    events, which prevents a separate query per related attribute container.
+
+    Args:
+      time_range (Optional[TimeRange]): time range used to filter events
+          that fall in a specific period.
+      filter_expression (Optional[str]): expression to filter the events by,
+          such as the storage filter expression of an event filter.
+
+    Yields:
+      tuple[EventObject, EventData, EventDataStream, EventTag]: event, event
+          data, event data stream or None if not available and event tag or
+          None if not available.
+
+    Raises:
+      IOError: when there is an error querying the storage file.
+      OSError: when there is an error querying the storage file.
+    """
+    events_page = []
+    for event in self.GetSortedEvents(
+        time_range=time_range, filter_expression=filter_expression):
+      events_page.append(event)
+
+      if len(events_page) >= self._MAXIMUM_JOINED_EVENTS_PER_PAGE:
+        yield from self._JoinEvents(events_page)
+        events_page = []
+
+    if events_page:
+      yield from self._JoinEvents(events_page)
+
+  def SetSerializationFormat(self, serialization_format):
+    """Sets the serialization format.
+
+    The serialization format is used by attribute containers without a schema
+    and can only be set before a new storage file is opened.
+
+    Args:
+      serialization_format (str): serialization format.
+
+    Raises:
+      IOError: if the storage file is already opened.
+      OSError: if the storage file is already opened.
+      ValueError: if the serialization format is not supported.
+    """
+    if self._is_open:
+      raise IOError('Storage file already opened.')
+
+    if serialization_format not in definitions.SERIALIZER_FORMATS:
+      raise ValueError('Unsupported serialization format: {0!s}'.format(
+          serialization_format))
+
+    if (serialization_format == definitions.SERIALIZER_FORMAT_MSGPACK and
+        not msgpack_serializer.msgpack):
+      raise ValueError((
+          'Unsupported serialization format: {0:s} missing msgpack '
+          'support.').format(serialization_format))
+
+    self._serializer = self._SERIALIZERS[serialization_format]
+    self.serialization_format = serialization_format
 
   def SetSerializersProfiler(self, serializers_profiler):
     """Sets the serializers profiler.
@@ -9,13 +9,24 @@ from plaso.storage.sqlite import sqlite_file
 class SQLiteStorageFileWriter(writer.StorageWriter):
   """SQLite-based storage file writer."""
 
-  def __init__(self, storage_type=definitions.STORAGE_TYPE_SESSION):
+  def __init__(
+      self, compression_format=definitions.COMPRESSION_FORMAT_ZLIB,
+      serialization_format=definitions.SERIALIZER_FORMAT_JSON,
+      storage_type=definitions.STORAGE_TYPE_SESSION):
     """Initializes a storage writer.
 
     Args:
+      compression_format (Optional[str]): compression format of attribute
+          containers without a schema, that is used when a new storage file
+          is created.
+      serialization_format (Optional[str]): serialization format of attribute
+          containers without a schema, that is used when a new storage file
+          is created.
       storage_type (Optional[str]): storage type.
     """
-    super(SQLiteStorageFileWriter, self).__init__()
+    super(SQLiteStorageFileWriter, self).__init__(storage_type=storage_type)
+    self._compression_format = compression_format
+    self._serialization_format = serialization_format
     self._first_written_event_data_index = 0
     self._first_written_event_source_index = 0
     self._written_event_data_index = 0
@@ -122,6 +133,8 @@ class SQLiteStorageFileWriter(writer.StorageWriter):
       raise IOError('Storage writer already opened.')
 
     self._store = sqlite_file.SQLiteStorageFile()
+    self._store.compression_format = self._compression_format
+    self._store.SetSerializationFormat(self._serialization_format)
 
     if self._serializers_profiler:
       self._store.SetSerializersProfiler(self._serializers_profiler)
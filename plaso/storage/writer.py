@@ -152,12 +152,19 @@ class StorageWriter(reader.StorageReader):
   def Close(self):
     """Closes the storage writer.
 
+    The event timestamps of a session storage are indexed before it is closed,
+    which allows consumers, such as psort, to retrieve the events in
+    chronological order or in a time range without sorting all events.
+
     Raises:
       IOError: when the storage writer is closed.
       OSError: when the storage writer is closed.
     """
     self._RaiseIfNotWritable()
 
+    if self._storage_type == definitions.STORAGE_TYPE_SESSION:
+      self._store.CreateEventTimestampIndex()
+
     self._store.Close()
     self._store = None
 
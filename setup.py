@@ -268,5 +268,9 @@ setup(
             'ACKNOWLEDGEMENTS', 'AUTHORS', 'LICENSE', 'README']),
     ],
     install_requires=parse_requirements_from_file('requirements.txt'),
+    extras_require={
+        'apsw': ['apsw >= 3.37.0'],
+        'msgpack': ['msgpack >= 1.0.0'],
+        'numpy': ['numpy >= 1.17.0']},
     tests_require=parse_requirements_from_file('test_requirements.txt'),
 )
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """Tests for the Entropy hasher."""
 
+import os
 import unittest
 
 from plaso.analyzers.hashers import entropy
@@ -22,6 +23,30 @@ class EntropyHasherTest(test_lib.HasherTestCase):
     hasher = entropy.EntropyHasher()
     self._AssertTestPathStringDigestMatch(hasher, ['syslog.zip'], '7.264319')
 
+  @unittest.skipIf(entropy.numpy is None, 'missing numpy support')
+  def testGetStringDigestWithAndWithoutNumPy(self):
+    """Tests that the digest does not depend on NumPy being available."""
+    test_data = [
+        b'', b'a', b'ab', b'aaaab', bytes(range(256)), os.urandom(4096)]
+
+    for data in test_data:
+      hasher = entropy.EntropyHasher()
+      hasher.Update(data)
+      expected_digest = hasher.GetStringDigest()
+
+      numpy = entropy.numpy
+      try:
+        entropy.numpy = None
+
+        hasher = entropy.EntropyHasher()
+        hasher.Update(data)
+        digest = hasher.GetStringDigest()
+
+      finally:
+        entropy.numpy = numpy
+
+      self.assertEqual(digest, expected_digest)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -27,6 +27,22 @@ class HashingAnalyzerTest(shared_test_lib.BaseTestCase):
     """Cleans up after running all tests."""
     manager.HashersManager.DeregisterHasher(manager_test.TestHasher)
 
+  def testClose(self):
+    """Tests the Close function."""
+    analyzer = hashing_analyzer.HashingAnalyzer()
+    analyzer.SetHasherNames('md5,sha256')
+    analyzer.SetNumberOfThreads(2)
+    analyzer.Analyze(b'\x00' * analyzer._THREADED_UPDATE_MINIMUM_SIZE)
+
+    thread_pool = analyzer._thread_pool
+    self.assertIsNotNone(thread_pool)
+
+    analyzer.Close()
+    self.assertIsNone(analyzer._thread_pool)
+
+    with self.assertRaises(RuntimeError):
+      thread_pool.submit(len, b'')
+
   def testHasherInitialization(self):
     """Test the creation of the analyzer, and the enabling of hashers."""
     analyzer = hashing_analyzer.HashingAnalyzer()
@@ -46,6 +62,33 @@ class HashingAnalyzerTest(shared_test_lib.BaseTestCase):
     self.assertEqual(first_result.attribute_value, '4')
     self.assertEqual(len(results), 1)
 
+  def testHashFileWithThreads(self):
+    """Tests that results are the same when hashing with threads."""
+    data = bytes(range(256)) * 4096
+
+    analyzer = hashing_analyzer.HashingAnalyzer()
+    analyzer.SetHasherNames('entropy,md5,sha1,sha256')
+    analyzer.Analyze(data)
+    analyzer.Analyze(data[:1024])
+    expected_results = {
+        result.attribute_name: result.attribute_value
+        for result in analyzer.GetResults()}
+
+    analyzer = hashing_analyzer.HashingAnalyzer()
+    analyzer.SetHasherNames('entropy,md5,sha1,sha256')
+    analyzer.SetNumberOfThreads(4)
+    analyzer.Analyze(data)
+    analyzer.Analyze(data[:1024])
+    results = {
+        result.attribute_name: result.attribute_value
+        for result in analyzer.GetResults()}
+
+    self.assertIsNotNone(analyzer._thread_pool)
+    self.assertEqual(results, expected_results)
+
+    analyzer.SetNumberOfThreads(0)
+    self.assertIsNone(analyzer._thread_pool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -31,6 +31,52 @@ class YaraAnalyzerTest(shared_test_lib.BaseTestCase):
     with open(yara_rules_path, 'r', encoding='utf-8') as file_object:
       return file_object.read()
 
+  def testAnalyzeFile(self):
+    """Tests the AnalyzeFile function."""
+    test_yara_rules = self._ReadTestRuleFile()
+
+    test_file_path = self._GetTestFilePath(['test_pe.exe'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(test_yara_rules)
+
+    result = analyzer.AnalyzeFile(test_file_path)
+    self.assertTrue(result)
+
+    results = analyzer.GetResults()
+    self.assertEqual(len(results), 1)
+    self.assertEqual(results[0].attribute_value, ['PEfileBasic', 'PEfile'])
+
+    analyzer.Reset()
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, [])
+
+  def testAnalyzeInBlocks(self):
+    """Tests the Analyze function with data that spans multiple blocks."""
+    analyzer = yara_analyzer.YaraAnalyzer()
+    analyzer.SetRules(
+        'rule Boundary { strings: $a = "boundary" condition: $a }\n'
+        'rule Small { strings: $a = "small" condition: $a }')
+
+    block_size = analyzer._BLOCK_OVERLAP_SIZE * 2
+    analyzer.Analyze(b'\x00' * (block_size - 4) + b'boun')
+    analyzer.Analyze(b'dary' + b'\x00' * (block_size - 4))
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, ['Boundary'])
+
+    analyzer.Reset()
+
+    # Blocks smaller than the overlap size are also matched together.
+    analyzer.Analyze(b'sm')
+    analyzer.Analyze(b'a')
+    analyzer.Analyze(b'll')
+
+    results = analyzer.GetResults()
+    self.assertEqual(results[0].attribute_value, ['Small'])
+
   def testFileRuleParse(self):
     """Tests that the Yara analyzer can read rules."""
     test_yara_rules = self._ReadTestRuleFile()
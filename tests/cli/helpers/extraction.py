@@ -18,12 +18,20 @@ class ExtractionArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--preferred_year YEAR] [--process_archives]
-                     [--skip_compressed_streams]
+usage: cli_helper.py [--incremental] [--preferred_year YEAR]
+                     [--process_archives] [--skip_compressed_streams]
+                     [--skip_duplicate_data_streams] [--worker_timelining]
 
 Test argument parser.
 
 {0:s}:
+  --incremental         Only extract file entries that are new or have changed
+                        since they were extracted into an existing storage
+                        file. File entries with the same size and modification
+                        time are skipped and the content of data streams with
+                        the same SHA-256 hash is not extracted again. The
+                        results are added as a new session to the storage
+                        file.
   --preferred_year YEAR, --preferred-year YEAR
                         When a format\'s timestamp does not include a year,
                         e.g. syslog, use this as the initial year instead of
@@ -36,6 +44,19 @@ Test argument parser.
   --skip_compressed_streams, --skip-compressed-streams
                         Skip processing file content within compressed
                         streams, such as syslog.gz and syslog.bz2.
+  --skip_duplicate_data_streams, --skip-duplicate-data-streams
+                        Skip extracting the content of data streams with the
+                        same SHA-256 hash as a data stream that already has
+                        been extracted, such as copies of the same executable
+                        in multiple volume shadow snapshots. Only file system
+                        metadata events are generated for these data streams.
+                        Their SHA-256 hash can be used to find the events of
+                        the content of the data stream that was extracted.
+  --worker_timelining, --worker-timelining
+                        Generate events from event data in the worker
+                        processes instead of in the main (foreman) process.
+                        This reduces the amount of work the main process needs
+                        to do to merge the results of the worker processes.
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
 
   def testAddArguments(self):
@@ -57,9 +78,12 @@ Test argument parser.
     test_tool = tools.CLITool()
     extraction.ExtractionArgumentsHelper.ParseOptions(options, test_tool)
 
+    self.assertFalse(test_tool._incremental_extraction)
     self.assertIsNone(test_tool._preferred_year)
     self.assertFalse(test_tool._process_archives)
     self.assertTrue(test_tool._process_compressed_streams)
+    self.assertFalse(test_tool._skip_duplicate_data_streams)
+    self.assertFalse(test_tool._worker_timelining)
 
     with self.assertRaises(errors.BadConfigObject):
       extraction.ExtractionArgumentsHelper.ParseOptions(options, None)
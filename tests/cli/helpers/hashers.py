@@ -18,7 +18,8 @@ class HashersArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
   # pylint: disable=no-member,protected-access
 
   _EXPECTED_OUTPUT = """\
-usage: cli_helper.py [--hasher_file_size_limit SIZE] [--hashers HASHER_LIST]
+usage: cli_helper.py [--hasher_file_size_limit SIZE] [--hasher_threads NUMBER]
+                     [--hashers HASHER_LIST]
 
 Test argument parser.
 
@@ -27,6 +28,11 @@ Test argument parser.
                         Define the maximum file size in bytes that hashers
                         should process. Any larger file will be skipped. A
                         size of 0 represents no limit.
+  --hasher_threads NUMBER, --hasher-threads NUMBER
+                        Define the number of threads each worker uses to run
+                        the hashers in parallel on large blocks of data. A
+                        number of 0 represents the hashers are run
+                        sequentially.
   --hashers HASHER_LIST
                         Define a list of hashers to use by the tool. This is a
                         comma separated list where each entry is the name of a
@@ -53,11 +59,13 @@ Test argument parser.
     options = cli_test_lib.TestOptions()
     options.hashers = 'sha1'
     options.hasher_file_size_limit = 0
+    options.hasher_threads = 2
 
     test_tool = tools.CLITool()
     hashers.HashersArgumentsHelper.ParseOptions(options, test_tool)
 
     self.assertEqual(test_tool._hasher_names_string, options.hashers)
+    self.assertEqual(test_tool._number_of_hasher_threads, 2)
 
     with self.assertRaises(errors.BadConfigObject):
       hashers.HashersArgumentsHelper.ParseOptions(options, None)
@@ -70,6 +78,12 @@ Test argument parser.
       options.hasher_file_size_limit = -1
       hashers.HashersArgumentsHelper.ParseOptions(options, test_tool)
 
+    options.hasher_file_size_limit = 0
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.hasher_threads = -1
+      hashers.HashersArgumentsHelper.ParseOptions(options, test_tool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -8,6 +8,7 @@ import unittest
 from plaso.cli import tools
 from plaso.cli.helpers import storage_format
 from plaso.lib import errors
+from plaso.serializer import msgpack_serializer
 
 from tests.cli import test_lib as cli_test_lib
 
@@ -17,8 +18,10 @@ class StorageFormatArgumentsHelperTest(cli_test_lib.CLIToolTestCase):
 
   # pylint: disable=no-member,protected-access
 
+  # pylint: disable=line-too-long
   _EXPECTED_OUTPUT = """\
 usage: cli_helper.py [--storage_format FORMAT] [--task_storage_format FORMAT]
+                     [--task_storage_serialization_format FORMAT]
 
 Test argument parser.
 
@@ -29,7 +32,13 @@ Test argument parser.
   --task_storage_format FORMAT, --task-storage-format FORMAT
                         Format for task storage, the default is: sqlite.
                         Supported options: redis, sqlite
+  --task_storage_serialization_format FORMAT, --task-storage-serialization-format FORMAT
+                        Serialization format for task storage, the default is:
+                        json. Supported options: json, msgpack. The msgpack
+                        format is only supported by the sqlite task storage
+                        format and requires msgpack.
 """.format(cli_test_lib.ARGPARSE_OPTIONS)
+  # pylint: enable=line-too-long
 
   def testAddArguments(self):
     """Tests the AddArguments function."""
@@ -55,6 +64,14 @@ Test argument parser.
     self.assertEqual(test_tool._storage_format, options.storage_format)
     self.assertEqual(
         test_tool._task_storage_format, options.task_storage_format)
+    self.assertEqual(test_tool._task_storage_serialization_format, 'json')
+
+    if msgpack_serializer.msgpack:
+      options.task_storage_serialization_format = 'msgpack'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+      self.assertEqual(test_tool._task_storage_serialization_format, 'msgpack')
 
     with self.assertRaises(errors.BadConfigObject):
       storage_format.StorageFormatArgumentsHelper.ParseOptions(options, None)
@@ -64,6 +81,21 @@ Test argument parser.
       storage_format.StorageFormatArgumentsHelper.ParseOptions(
           options, test_tool)
 
+    options.storage_format = 'sqlite'
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_storage_format = 'redis'
+      options.task_storage_serialization_format = 'msgpack'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
+    options.task_storage_format = 'sqlite'
+
+    with self.assertRaises(errors.BadConfigOption):
+      options.task_storage_serialization_format = 'bogus'
+      storage_format.StorageFormatArgumentsHelper.ParseOptions(
+          options, test_tool)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -98,11 +98,27 @@ class PsortToolTest(test_lib.CLIToolTestCase):
   if resource is None:
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--temporary_directory DIRECTORY]
+                     [--output_workers WORKERS]
+                     [--preload_winevt_message_strings]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --output_workers WORKERS, --output-workers WORKERS
+                        Number of worker processes used to export events. The
+                        default is 0, which represents the events are exported
+                        by the main (foreman) process. Worker processes are
+                        only used by output formats that support exporting
+                        time ranges of events in parallel and are not used
+                        together with a time slice or an event filter with a
+                        limit.
+  --preload_winevt_message_strings, --preload-winevt-message-strings
+                        Read the Windows EventLog message strings in the
+                        storage into memory before formatting the first
+                        Windows EventLog event, instead of reading them per
+                        event. This uses more memory but speeds up formatting
+                        storages with many Windows EventLog events.
   --temporary_directory DIRECTORY, --temporary-directory DIRECTORY
                         Path to the directory that should be used to store
                         temporary files created during processing.
@@ -124,11 +140,27 @@ Test argument parser.
     _EXPECTED_PROCESSING_OPTIONS = """\
 usage: psort_test.py [--process_memory_limit SIZE]
                      [--temporary_directory DIRECTORY]
+                     [--output_workers WORKERS]
+                     [--preload_winevt_message_strings]
                      [--worker_memory_limit SIZE] [--worker_timeout MINUTES]
 
 Test argument parser.
 
 {0:s}:
+  --output_workers WORKERS, --output-workers WORKERS
+                        Number of worker processes used to export events. The
+                        default is 0, which represents the events are exported
+                        by the main (foreman) process. Worker processes are
+                        only used by output formats that support exporting
+                        time ranges of events in parallel and are not used
+                        together with a time slice or an event filter with a
+                        limit.
+  --preload_winevt_message_strings, --preload-winevt-message-strings
+                        Read the Windows EventLog message strings in the
+                        storage into memory before formatting the first
+                        Windows EventLog event, instead of reading them per
+                        event. This uses more memory but speeds up formatting
+                        storages with many Windows EventLog events.
   --process_memory_limit SIZE, --process-memory-limit SIZE
                         Maximum amount of memory (data segment) a process is
                         allowed to allocate in bytes, where 0 represents no
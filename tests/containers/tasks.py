@@ -46,6 +46,47 @@ class TaskTest(shared_test_lib.BaseTestCase):
     self.assertFalse(retry_task.has_retry)
     self.assertEqual(retry_task.path_spec, task.path_spec)
 
+  def testCreateRetryTasks(self):
+    """Tests the CreateRetryTasks function."""
+    session_identifier = '{0:s}'.format(uuid.uuid4().hex)
+    task = tasks.Task(session_identifier=session_identifier)
+    task.path_spec = 'test_path_spec'
+
+    retry_tasks = task.CreateRetryTasks()
+    self.assertEqual(len(retry_tasks), 1)
+    self.assertTrue(task.has_retry)
+    self.assertEqual(retry_tasks[0].path_spec, task.path_spec)
+
+    task = tasks.Task(session_identifier=session_identifier)
+    task.file_size = 64
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    retry_tasks = task.CreateRetryTasks()
+    self.assertEqual(len(retry_tasks), 2)
+    self.assertTrue(task.has_retry)
+
+    path_specs = [retry_task.path_spec for retry_task in retry_tasks]
+    self.assertEqual(path_specs, task.path_specs)
+
+    for retry_task in retry_tasks:
+      self.assertNotEqual(retry_task.identifier, task.identifier)
+      self.assertFalse(retry_task.has_retry)
+      self.assertIsNone(retry_task.path_specs)
+
+  def testGetPathSpecs(self):
+    """Tests the GetPathSpecs function."""
+    session_identifier = '{0:s}'.format(uuid.uuid4().hex)
+    task = tasks.Task(session_identifier=session_identifier)
+
+    self.assertEqual(task.GetPathSpecs(), [])
+
+    task.path_spec = 'test_path_spec'
+    self.assertEqual(task.GetPathSpecs(), ['test_path_spec'])
+
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+    self.assertEqual(
+        task.GetPathSpecs(), ['test_path_spec1', 'test_path_spec2'])
+
   def testUpdateProcessingTime(self):
     """Tests the UpdateProcessingTime function."""
     session_identifier = '{0:s}'.format(uuid.uuid4().hex)
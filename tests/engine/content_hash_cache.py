@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the content hash cache."""
+
+import os
+import unittest
+
+from plaso.engine import content_hash_cache
+
+from tests import test_lib as shared_test_lib
+
+
+class ContentHashCacheTest(shared_test_lib.BaseTestCase):
+  """Tests for the content hash cache."""
+
+  _SHA256_HASH = (
+      'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855')
+
+  def testAddContentHash(self):
+    """Tests the AddContentHash function."""
+    test_cache = content_hash_cache.ContentHashCache()
+    test_cache.Open()
+
+    try:
+      result = test_cache.AddContentHash(self._SHA256_HASH)
+      self.assertTrue(result)
+
+      result = test_cache.AddContentHash(self._SHA256_HASH)
+      self.assertFalse(result)
+
+    finally:
+      test_cache.Close()
+
+    with self.assertRaises(RuntimeError):
+      test_cache.AddContentHash(self._SHA256_HASH)
+
+  def testAddContentHashWithTaskIdentifier(self):
+    """Tests the AddContentHash function with task identifiers."""
+    test_cache = content_hash_cache.ContentHashCache()
+    test_cache.Open()
+
+    try:
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='task1')
+      self.assertTrue(result)
+
+      # A duplicate within the same task is skipped.
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='task1')
+      self.assertFalse(result)
+
+      # A pending claim of another task is not skipped.
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='task2')
+      self.assertTrue(result)
+
+      test_cache.CommitContentHashes('task1')
+
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='task3')
+      self.assertFalse(result)
+
+    finally:
+      test_cache.Close()
+
+  def testCommitContentHashes(self):
+    """Tests the CommitContentHashes function."""
+    test_cache = content_hash_cache.ContentHashCache()
+    test_cache.Open()
+
+    try:
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='abandoned')
+      self.assertTrue(result)
+
+      # The task that claimed the content hash is abandoned before its results
+      # are merged, hence its claim is never committed and the retry task
+      # extracts the content.
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='retry')
+      self.assertTrue(result)
+
+      test_cache.CommitContentHashes('retry')
+
+      result = test_cache.AddContentHash(
+          self._SHA256_HASH, task_identifier='other')
+      self.assertFalse(result)
+
+      # Committing the claims of a task without claims has no effect.
+      test_cache.CommitContentHashes('other')
+
+    finally:
+      test_cache.Close()
+
+    with self.assertRaises(RuntimeError):
+      test_cache.CommitContentHashes('retry')
+
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'content_hashes.sqlite')
+
+      test_cache = content_hash_cache.ContentHashCache()
+      test_cache.Open(path=test_path)
+
+      with self.assertRaises(RuntimeError):
+        test_cache.Open(path=test_path)
+
+      result = test_cache.AddContentHash(self._SHA256_HASH)
+      self.assertTrue(result)
+
+      # Content hashes are shared between caches that use the same file.
+      other_cache = content_hash_cache.ContentHashCache()
+      other_cache.Open(path=test_path)
+
+      try:
+        result = other_cache.AddContentHash(self._SHA256_HASH)
+        self.assertFalse(result)
+
+      finally:
+        other_cache.Close()
+
+      test_cache.Close()
+
+    with self.assertRaises(RuntimeError):
+      test_cache.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
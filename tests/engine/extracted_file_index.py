@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the extracted file index."""
+
+import os
+import unittest
+
+from plaso.containers import events
+from plaso.engine import extracted_file_index
+from plaso.parsers import filestat
+from plaso.storage.fake import writer as fake_writer
+
+from tests import test_lib as shared_test_lib
+
+
+class ExtractedFileIndexTest(shared_test_lib.BaseTestCase):
+  """Tests for the extracted file index."""
+
+  _SHA256_HASH = (
+      'e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855')
+
+  def _CreateTestStorageWriter(self, file_entry, file_size=None):
+    """Creates a storage writer with a previously extracted file entry.
+
+    Args:
+      file_entry (dfvfs.FileEntry): file entry.
+      file_size (Optional[int]): file size to store, where None represents
+          the size of the file entry.
+
+    Returns:
+      FakeStorageWriter: storage writer.
+    """
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.path_spec = file_entry.path_spec
+    event_data_stream.sha256_hash = self._SHA256_HASH
+
+    storage_writer.AddAttributeContainer(event_data_stream)
+
+    event_data = filestat.FileStatEventData()
+    event_data.file_size = file_entry.size if file_size is None else file_size
+    event_data.modification_time = file_entry.modification_time
+    event_data.SetEventDataStreamIdentifier(
+        event_data_stream.GetIdentifier())
+
+    storage_writer.AddAttributeContainer(event_data)
+
+    return storage_writer
+
+  def testHasUnchangedContent(self):
+    """Tests the HasUnchangedContent function."""
+    file_entry = self._GetTestFileEntry(['syslog'])
+    storage_writer = self._CreateTestStorageWriter(file_entry)
+
+    test_index = extracted_file_index.ExtractedFileIndex()
+    test_index.Open()
+
+    try:
+      test_index.ReadFromStorage(storage_writer)
+
+      result = test_index.HasUnchangedContent(
+          file_entry.path_spec, self._SHA256_HASH)
+      self.assertTrue(result)
+
+      result = test_index.HasUnchangedContent(
+          file_entry.path_spec, '0' * 64)
+      self.assertFalse(result)
+
+      result = test_index.HasUnchangedContent(file_entry.path_spec, None)
+      self.assertFalse(result)
+
+      path_spec = self._GetTestFilePathSpec(['syslog.gz'])
+      result = test_index.HasUnchangedContent(path_spec, self._SHA256_HASH)
+      self.assertFalse(result)
+
+    finally:
+      test_index.Close()
+      storage_writer.Close()
+
+    with self.assertRaises(RuntimeError):
+      test_index.HasUnchangedContent(file_entry.path_spec, self._SHA256_HASH)
+
+  def testHasUnchangedFileEntry(self):
+    """Tests the HasUnchangedFileEntry function."""
+    file_entry = self._GetTestFileEntry(['syslog'])
+    storage_writer = self._CreateTestStorageWriter(file_entry)
+
+    test_index = extracted_file_index.ExtractedFileIndex()
+    test_index.Open()
+
+    try:
+      test_index.ReadFromStorage(storage_writer)
+
+      result = test_index.HasUnchangedFileEntry(file_entry)
+      self.assertTrue(result)
+
+      other_file_entry = self._GetTestFileEntry(['syslog.gz'])
+      result = test_index.HasUnchangedFileEntry(other_file_entry)
+      self.assertFalse(result)
+
+    finally:
+      test_index.Close()
+      storage_writer.Close()
+
+    # Test with a file entry of which the size has changed.
+    storage_writer = self._CreateTestStorageWriter(file_entry, file_size=1)
+
+    test_index = extracted_file_index.ExtractedFileIndex()
+    test_index.Open()
+
+    try:
+      test_index.ReadFromStorage(storage_writer)
+
+      result = test_index.HasUnchangedFileEntry(file_entry)
+      self.assertFalse(result)
+
+    finally:
+      test_index.Close()
+      storage_writer.Close()
+
+  def testOpenClose(self):
+    """Tests the Open and Close functions."""
+    file_entry = self._GetTestFileEntry(['syslog'])
+    storage_writer = self._CreateTestStorageWriter(file_entry)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'extracted_files.sqlite')
+
+      test_index = extracted_file_index.ExtractedFileIndex()
+      test_index.Open(path=test_path)
+
+      with self.assertRaises(RuntimeError):
+        test_index.Open(path=test_path)
+
+      try:
+        test_index.ReadFromStorage(storage_writer)
+      finally:
+        storage_writer.Close()
+
+      test_index.Close()
+
+      # The index is shared between indexes that use the same file.
+      other_index = extracted_file_index.ExtractedFileIndex()
+      other_index.Open(path=test_path)
+
+      try:
+        result = other_index.HasUnchangedFileEntry(file_entry)
+        self.assertTrue(result)
+
+      finally:
+        other_index.Close()
+
+    with self.assertRaises(RuntimeError):
+      test_index.Close()
+
+
+if __name__ == '__main__':
+  unittest.main()
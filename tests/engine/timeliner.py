@@ -260,6 +260,32 @@ class EventDataTimelinerTest(test_lib.EngineTestCase):
 
     self.assertEqual(event_data_timeliner.number_of_produced_events, 0)
 
+  def testReset(self):
+    """Tests the Reset function."""
+    event_data_timeliner = timeliner.EventDataTimeliner(
+        data_location=shared_test_lib.TEST_DATA_PATH)
+
+    event_data = TestEventData1()
+    event_data.access_time = (
+        dfdatetime_time_elements.TimeElementsInMicroseconds(
+            time_elements_tuple=(2010, 8, 12, 20, 6, 31, 429876)))
+    event_data.value = 'MyValue'
+
+    storage_writer = self._CreateStorageWriter(event_data, base_year=2012)
+
+    event_data_timeliner.ProcessEventData(storage_writer, event_data, None)
+    event_data_timeliner._GetBaseYear(storage_writer, event_data)
+
+    self.assertEqual(event_data_timeliner.number_of_produced_events, 1)
+    self.assertEqual(event_data_timeliner.parsers_counter['total'], 1)
+    self.assertEqual(len(event_data_timeliner._base_years), 1)
+
+    event_data_timeliner.Reset()
+
+    self.assertEqual(event_data_timeliner.number_of_produced_events, 0)
+    self.assertEqual(event_data_timeliner.parsers_counter['total'], 0)
+    self.assertEqual(len(event_data_timeliner._base_years), 0)
+
   def testSetPreferredTimeZone(self):
     """Tests the SetPreferredTimeZone function."""
     event_data_timeliner = timeliner.EventDataTimeliner(
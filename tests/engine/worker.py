@@ -12,6 +12,8 @@ from dfvfs.path import factory as path_spec_factory
 from plaso.containers import events
 from plaso.containers import sessions
 from plaso.engine import configurations
+from plaso.engine import content_hash_cache
+from plaso.engine import extracted_file_index
 from plaso.engine import worker
 from plaso.parsers import mediator as parsers_mediator
 from plaso.storage.fake import writer as fake_writer
@@ -20,6 +22,32 @@ from tests.analyzers import manager as analyzers_manager_test
 from tests import test_lib as shared_test_lib
 
 
+class TestIncrementalAnalyzer(analyzers_manager_test.TestAnalyzer):
+  """Test analyzer that records the sizes of the blocks of data it analyzes.
+
+  Attributes:
+    block_sizes (list[int]): sizes of the blocks of data analyzed.
+  """
+
+  NAME = 'testincrementalanalyze'
+
+  INCREMENTAL_ANALYZER = True
+
+  def __init__(self):
+    """Initializes a test incremental analyzer."""
+    super(TestIncrementalAnalyzer, self).__init__()
+    self.block_sizes = []
+
+  def Analyze(self, data):
+    """Processes a block of data, updating the state of the analyzer
+
+    Args:
+      data(bytes): a block of data to process.
+    """
+    super(TestIncrementalAnalyzer, self).Analyze(data)
+    self.block_sizes.append(len(data))
+
+
 class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
   """Tests for the event extraction worker."""
 
@@ -75,7 +103,8 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
 
   def _TestProcessPathSpec(
       self, storage_writer, path_spec, expected_event_data_counts,
-      archive_types_string=None, extraction_worker=None):
+      archive_types_string=None, extraction_worker=None,
+      text_log_range_size=None):
     """Tests processing a path specification.
 
     Args:
@@ -87,6 +116,8 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
           which embedded file entries should be processed.
       extraction_worker (Optional[EventExtractionWorker]): worker to process
           the path specification. If None, a new worker will be created.
+      text_log_range_size (Optional[int]): size of the data ranges large text
+          log files are split into, where None represents no splitting.
     """
     session = sessions.Session()
 
@@ -95,6 +126,7 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
         resolver_context=resolver_context)
 
     parser_mediator.SetStorageWriter(storage_writer)
+    parser_mediator.SetTextLogRangeSize(text_log_range_size)
 
     if not extraction_worker:
       configuration = configurations.ExtractionConfiguration()
@@ -229,6 +261,57 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     event_attribute = getattr(event_data_stream, 'test_result', None)
     self.assertEqual(event_attribute, 'is_vegetable')
 
+  def testAnalyzeFileObjectInBlocks(self):
+    """Tests the _AnalyzeFileObject function with an incremental analyzer."""
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._INCREMENTAL_ANALYZER_BLOCK_SIZE = 128
+
+    test_analyzer = TestIncrementalAnalyzer()
+    extraction_worker._analyzers = [test_analyzer]
+
+    file_entry = self._GetTestFileEntry(['syslog.tgz'])
+    file_object = file_entry.GetFileObject()
+    event_data_stream = events.EventDataStream()
+
+    extraction_worker._AnalyzeFileObject(
+        file_object, 'syslog.tgz', event_data_stream)
+
+    file_size = file_object.get_size()
+    self.assertGreater(file_size, 128)
+
+    self.assertEqual(max(test_analyzer.block_sizes), 128)
+    self.assertEqual(sum(test_analyzer.block_sizes), file_size)
+
+  def testAnalyzeFileObjectWithFilePath(self):
+    """Tests the _AnalyzeFileObject function with a file path."""
+    yara_rule_path = self._GetTestFilePath(['rules.yara'])
+    self._SkipIfPathNotExists(yara_rule_path)
+
+    with open(yara_rule_path, 'r', encoding='utf-8') as file_object:
+      rule_string = file_object.read()
+
+    test_file_path = self._GetTestFilePath(['test_pe.exe'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._SetYaraRules(rule_string)
+
+    test_analyzer = analyzers_manager_test.TestAnalyzer()
+    extraction_worker._analyzers.append(test_analyzer)
+
+    # The Yara analyzer matches the file by path and the test analyzer
+    # analyzes the data read from the file-like object of the same file.
+    file_entry = self._GetTestFileEntry(['test_pe.exe'])
+    file_object = file_entry.GetFileObject()
+    event_data_stream = events.EventDataStream()
+
+    extraction_worker._AnalyzeFileObject(
+        file_object, 'test_pe.exe', event_data_stream,
+        file_path=test_file_path)
+
+    self.assertEqual(event_data_stream.yara_match, ['PEfileBasic', 'PEfile'])
+    self.assertEqual(event_data_stream.test_result, 'is_vegetable')
+
   def testCanSkipDataStream(self):
     """Tests the _CanSkipDataStream function."""
     extraction_worker = worker.EventExtractionWorker()
@@ -366,6 +449,20 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
   # TODO: add tests for _ProcessMetadataFile
   # TODO: add tests for _SetHashers
   # TODO: add tests for _SetYaraRules
+
+  def testClose(self):
+    """Tests the Close function."""
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker._SetHashers('md5,sha256', number_of_threads=2)
+
+    hashing_analyzer = extraction_worker._analyzers[0]
+    hashing_analyzer.Analyze(
+        b'\x00' * hashing_analyzer._THREADED_UPDATE_MINIMUM_SIZE)
+    self.assertIsNotNone(hashing_analyzer._thread_pool)
+
+    extraction_worker.Close()
+    self.assertIsNone(hashing_analyzer._thread_pool)
+
   # TODO: add tests for GetAnalyzerNames
 
   def testProcessPathSpecFile(self):
@@ -381,6 +478,165 @@ class EventExtractionWorkerTest(shared_test_lib.BaseTestCase):
     self._TestProcessPathSpec(
         storage_writer, path_spec, expected_event_data_counts)
 
+  def testProcessPathSpecFileDataRanges(self):
+    """Tests the ProcessPathSpec function on a file split into data ranges."""
+    path_spec = self._GetTestFilePathSpec(['selinux.log'])
+    storage_writer = fake_writer.FakeStorageWriter()
+
+    expected_event_data_counts = {
+        'fs:stat': 1,
+        'selinux:line': 7}
+
+    self._TestProcessPathSpec(
+        storage_writer, path_spec, expected_event_data_counts,
+        text_log_range_size=256)
+
+  def testProcessPathSpecFileDuplicate(self):
+    """Tests the ProcessPathSpec function on a file with duplicate content."""
+    path_spec = self._GetTestFilePathSpec(['syslog'])
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.skip_duplicate_data_streams = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    test_cache = content_hash_cache.ContentHashCache()
+    test_cache.Open()
+
+    extraction_worker.SetContentHashCache(test_cache)
+
+    try:
+      storage_writer = fake_writer.FakeStorageWriter()
+
+      expected_event_data_counts = {
+          'fs:stat': 1,
+          'syslog:cron:task_run': 3,
+          'syslog:line': 13}
+
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, expected_event_data_counts,
+          extraction_worker=extraction_worker)
+
+      # The content of the second copy is not extracted.
+      storage_writer = fake_writer.FakeStorageWriter()
+
+      expected_event_data_counts = {
+          'fs:stat': 1}
+
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, expected_event_data_counts,
+          extraction_worker=extraction_worker)
+
+    finally:
+      extraction_worker.SetContentHashCache(None)
+      test_cache.Close()
+
+  def testProcessPathSpecFileDuplicateAbandonedTask(self):
+    """Tests the ProcessPathSpec function with an abandoned claiming task."""
+    path_spec = self._GetTestFilePathSpec(['syslog'])
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.skip_duplicate_data_streams = True
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    test_cache = content_hash_cache.ContentHashCache()
+    test_cache.Open()
+
+    extraction_worker.SetContentHashCache(test_cache)
+
+    expected_event_data_counts = {
+        'fs:stat': 1,
+        'syslog:cron:task_run': 3,
+        'syslog:line': 13}
+
+    try:
+      # The task that claims the content hash is abandoned, hence its claim
+      # is never committed.
+      extraction_worker.SetTaskIdentifier('abandoned')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, expected_event_data_counts,
+          extraction_worker=extraction_worker)
+
+      # The content is extracted by the retry task.
+      extraction_worker.SetTaskIdentifier('retry')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, expected_event_data_counts,
+          extraction_worker=extraction_worker)
+
+      test_cache.CommitContentHashes('retry')
+
+      # The content is not extracted after the results of the retry task have
+      # been merged.
+      extraction_worker.SetTaskIdentifier('other')
+
+      storage_writer = fake_writer.FakeStorageWriter()
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, {'fs:stat': 1},
+          extraction_worker=extraction_worker)
+
+    finally:
+      extraction_worker.SetTaskIdentifier(None)
+      extraction_worker.SetContentHashCache(None)
+      test_cache.Close()
+
+  def testProcessPathSpecFileUnchanged(self):
+    """Tests the ProcessPathSpec function on a previously extracted file."""
+    path_spec = self._GetTestFilePathSpec(['syslog'])
+
+    configuration = configurations.ExtractionConfiguration()
+    configuration.hasher_names_string = 'sha256'
+
+    extraction_worker = worker.EventExtractionWorker()
+    extraction_worker.SetExtractionConfiguration(configuration)
+
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    test_index = extracted_file_index.ExtractedFileIndex()
+    test_index.Open()
+
+    try:
+      resolver_context = context.Context()
+      parser_mediator = parsers_mediator.ParserMediator(
+          resolver_context=resolver_context)
+      parser_mediator.SetStorageWriter(storage_writer)
+
+      extraction_worker.ProcessPathSpec(parser_mediator, path_spec)
+
+      self.CheckEventDataCounts(storage_writer, {
+          'fs:stat': 1,
+          'syslog:cron:task_run': 3,
+          'syslog:line': 13})
+
+      test_index.ReadFromStorage(storage_writer)
+
+    finally:
+      storage_writer.Close()
+
+    extraction_worker.SetExtractedFileIndex(test_index)
+
+    try:
+      # The unchanged file is not extracted again.
+      storage_writer = fake_writer.FakeStorageWriter()
+
+      expected_event_data_counts = {
+          'fs:stat': 0}
+
+      self._TestProcessPathSpec(
+          storage_writer, path_spec, expected_event_data_counts,
+          extraction_worker=extraction_worker)
+
+    finally:
+      extraction_worker.SetExtractedFileIndex(None)
+      test_index.Close()
+
   def testProcessPathSpecCompressedFileGZIP(self):
     """Tests the ProcessPathSpec function on a gzip compressed file."""
     path_spec = self._GetTestFilePathSpec(['syslog.gz'])
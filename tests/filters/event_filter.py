@@ -43,6 +43,25 @@ class EventObjectFilterTest(test_lib.FilterTestCase):
       test_filter.CompileFilter(
           'some_stuff is "random" and other_stuff ')
 
+  def testCompileFilterStorageFilterExpression(self):
+    """Tests the storage filter expression set by CompileFilter."""
+    test_filter = event_filter.EventObjectFilter()
+
+    test_filter.CompileFilter('data_type is "fs:stat"')
+    self.assertIsNone(test_filter.storage_filter_expression)
+
+    test_filter.CompileFilter(
+        'timestamp >= DATETIME("2020-12-23T15:00:00") and '
+        'data_type is "fs:stat" and timestamp_desc is "Creation Time"')
+    self.assertEqual(test_filter.storage_filter_expression, (
+        '(timestamp >= 1608735600000000) and '
+        '(timestamp_desc == \'Creation Time\')'))
+
+    test_filter.CompileFilter(
+        'timestamp < DATETIME("2020-12-23T15:00:00") or '
+        'data_type is "fs:stat"')
+    self.assertIsNone(test_filter.storage_filter_expression)
+
   def testMatch(self):
     """Tests the Match function."""
     test_filter = event_filter.EventObjectFilter()
@@ -68,6 +87,21 @@ class EventObjectFilterTest(test_lib.FilterTestCase):
     result = test_filter.Match(None, event_data, None, None)
     self.assertFalse(result)
 
+    test_filter = event_filter.EventObjectFilter()
+    test_filter.CompileFilter(
+        'timestamp > DATETIME("2020-12-23T15:00:00") and '
+        'filename contains PATH("etc/issue")')
+
+    event_data.filename = '/usr/local/etc/issue'
+
+    result = test_filter.Match(event, event_data, None, None)
+    self.assertFalse(result)
+
+    # The timestamp is not compared when the storage filter was applied.
+    result = test_filter.Match(
+        event, event_data, None, None, storage_filter_applied=True)
+    self.assertTrue(result)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -4,8 +4,11 @@
 
 import unittest
 
+from dfdatetime import time_elements as dfdatetime_time_elements
+
 from plaso.containers import events
 from plaso.filters import filters
+from plaso.filters import value_types
 from plaso.lib import definitions
 
 from tests import test_lib as shared_test_lib
@@ -87,6 +90,28 @@ class AndFilterTest(shared_test_lib.BaseTestCase):
        'timestamp': 5134324321,
        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, filters.AndFilter(arguments=[
+            true_filter_object, true_filter_object])])
+
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.AndFilter(arguments=[
+        true_filter_object, filters.AndFilter(arguments=[
+            true_filter_object, false_filter_object])])
+
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
   def testMatches(self):
     """Tests the Matches function."""
     event, event_data, _ = containers_test_lib.CreateEventFromValues(
@@ -117,6 +142,35 @@ class OrFilterTest(shared_test_lib.BaseTestCase):
        'timestamp': 5134324321,
        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    false_filter_object = FalseFilter()
+    true_filter_object = TrueFilter()
+
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, filters.OrFilter(arguments=[
+            false_filter_object, true_filter_object])])
+
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, filters.OrFilter(arguments=[
+            false_filter_object, false_filter_object])])
+
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    # Note that an OR filter without arguments matches all events.
+    filter_object = filters.OrFilter(arguments=[
+        false_filter_object, filters.OrFilter()])
+
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
   def testMatches(self):
     """Tests the Matches function."""
     event, event_data, _ = containers_test_lib.CreateEventFromValues(
@@ -183,6 +237,127 @@ class GenericBinaryOperatorTest(shared_test_lib.BaseTestCase):
     filter_object = filters.GenericBinaryOperator(arguments=['test_value', 1])
     self.assertIsNotNone(filter_object)
 
+  def testCompileGetValueFunction(self):
+    """Tests the _CompileGetValueFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    event_data_stream = events.EventDataStream()
+    event_data_stream.md5_hash = 'e3b0c44298fc1c149afbf4c8996fb924'
+
+    event_tag = events.EventTag()
+    event_tag.AddLabel('browser_search')
+
+    filter_object = filters.GenericBinaryOperator(arguments=['test_value', 1])
+
+    get_value_function = filter_object._CompileGetValueFunction('test_value')
+    test_value = get_value_function(event, event_data, None, event_tag)
+    self.assertEqual(test_value, 1)
+
+    get_value_function = filter_object._CompileGetValueFunction('md5_hash')
+    test_value = get_value_function(
+        event, event_data, event_data_stream, event_tag)
+    self.assertEqual(test_value, 'e3b0c44298fc1c149afbf4c8996fb924')
+
+    get_value_function = filter_object._CompileGetValueFunction('timestamp')
+    test_value = get_value_function(event, event_data, None, event_tag)
+    self.assertIsNotNone(test_value)
+    self.assertEqual(test_value.timestamp, 5134324321)
+
+    get_value_function = filter_object._CompileGetValueFunction('tag')
+    test_value = get_value_function(event, event_data, None, event_tag)
+    self.assertEqual(test_value, ['browser_search'])
+
+  def testCompileMatchFunction(self):
+    """Tests the CompileMatchFunction function."""
+    event, event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    filter_object = filters.EqualsOperator(arguments=['test_value', 1])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object.FlipBool()
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    filter_object = filters.EqualsOperator(arguments=['bogus', 1])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    # Timestamps are compared as integers.
+    date_time = value_types.DateTimeValueType('1970-01-01 01:25:34.324321')
+
+    filter_object = filters.EqualsOperator(arguments=['timestamp', date_time])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    filter_object = filters.LessThanOperator(
+        arguments=['timestamp', date_time])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertFalse(match_function(event, event_data, None, None))
+
+    date_time = value_types.DateTimeValueType('1970-01-01 01:25:34+01:00')
+
+    filter_object = filters.GreaterThanOperator(
+        arguments=['timestamp', date_time])
+    match_function = filter_object.CompileMatchFunction()
+    self.assertTrue(match_function(event, event_data, None, None))
+
+    event.timestamp = None
+    self.assertFalse(match_function(event, event_data, None, None))
+
+  def testGetStorageFilterExpression(self):
+    """Tests the GetStorageFilterExpression function."""
+    date_time = value_types.DateTimeValueType('1970-01-01 01:25:34.324321')
+
+    filter_object = filters.LessThanOperator(
+        arguments=['timestamp', date_time])
+    self.assertEqual(
+        filter_object.GetStorageFilterExpression(), 'timestamp < 5134324321')
+
+    filter_object.FlipBool()
+    self.assertIsNone(filter_object.GetStorageFilterExpression())
+
+    # Timestamps with a fraction of a microsecond are rounded such that the
+    # integer comparison gives the same result.
+    date_time = dfdatetime_time_elements.TimeElementsInNanoseconds()
+    date_time.CopyFromDateTimeString('1970-01-01 01:25:34.324321500')
+
+    filter_object = filters.GreaterEqualOperator(
+        arguments=['timestamp', date_time])
+    self.assertEqual(
+        filter_object.GetStorageFilterExpression(), 'timestamp >= 5134324322')
+
+    filter_object = filters.LessEqualOperator(
+        arguments=['timestamp', date_time])
+    self.assertEqual(
+        filter_object.GetStorageFilterExpression(), 'timestamp <= 5134324321')
+
+    filter_object = filters.EqualsOperator(arguments=['timestamp', date_time])
+    self.assertIsNone(filter_object.GetStorageFilterExpression())
+
+    filter_object = filters.EqualsOperator(
+        arguments=['timestamp_desc', 'Creation Time'])
+    self.assertEqual(
+        filter_object.GetStorageFilterExpression(),
+        'timestamp_desc == \'Creation Time\'')
+
+    filter_object = filters.EqualsOperator(arguments=['test_value', 1])
+    self.assertIsNone(filter_object.GetStorageFilterExpression())
+
+    filter_object = filters.OrFilter(arguments=[
+        filters.EqualsOperator(arguments=['timestamp_desc', 'Creation Time']),
+        filters.EqualsOperator(arguments=['timestamp_desc', 'Access Time'])])
+    self.assertEqual(filter_object.GetStorageFilterExpression(), (
+        '(timestamp_desc == \'Creation Time\') or '
+        '(timestamp_desc == \'Access Time\')'))
+
+    filter_object = filters.AndFilter(arguments=[
+        filters.EqualsOperator(arguments=['timestamp_desc', 'Creation Time']),
+        filters.EqualsOperator(arguments=['test_value', 1])])
+    self.assertIsNone(filter_object.GetStorageFilterExpression())
+
   def testGetValue(self):
     """Tests the _GetValue function."""
     event, event_data, _ = containers_test_lib.CreateEventFromValues(
@@ -317,7 +492,22 @@ class GreaterEqualOperatorTest(shared_test_lib.BaseTestCase):
     self.assertTrue(result)
 
 
-# TODO: add tests for Contains
+class ContainsTest(shared_test_lib.BaseTestCase):
+  """Tests the contains operator."""
+
+  # pylint: disable=protected-access
+
+  def testCompileCompareFunction(self):
+    """Tests the _CompileCompareFunction function."""
+    filter_object = filters.Contains(arguments=['first', 'Second'])
+    compare_function = filter_object._CompileCompareFunction()
+
+    self.assertTrue(compare_function('The SECOND value'))
+    self.assertTrue(compare_function(['Second']))
+    self.assertFalse(compare_function('first'))
+    self.assertFalse(compare_function(10))
+
+
 # TODO: add tests for InSet
 # TODO: add tests for Regexp
 # TODO: add tests for RegexpInsensitive
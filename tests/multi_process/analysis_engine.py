@@ -3,6 +3,7 @@
 """Tests for the task-based multi-process processing analysis engine."""
 
 import os
+import pickle
 import shutil
 import unittest
 
@@ -11,6 +12,7 @@ from plaso.containers import sessions
 from plaso.engine import configurations
 from plaso.lib import definitions
 from plaso.multi_process import analysis_engine
+from plaso.multi_process import plaso_queue
 from plaso.storage import factory as storage_factory
 
 from tests import test_lib as shared_test_lib
@@ -18,11 +20,78 @@ from tests.filters import test_lib as filters_test_lib
 from tests.multi_process import test_lib
 
 
+class TestEventQueue(object):
+  """Event queue for testing that stores the pushed items."""
+
+  def __init__(self):
+    """Initializes an event queue for testing."""
+    super(TestEventQueue, self).__init__()
+    self.items = []
+
+  # pylint: disable=unused-argument
+  def PushItem(self, item, block=True):
+    """Pushes an item onto the queue.
+
+    Args:
+      item (object): item to add.
+      block (Optional[bool]): whether to block if the queue is full.
+    """
+    self.items.append(item)
+
+
 class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
   """Tests for the task-based multi-process processing analysis engine."""
 
   # pylint: disable=protected-access
 
+  def _GetEventsBatches(self, maximum_events_per_batch, event_filter=None):
+    """Retrieves the batches of events pushed onto an event queue.
+
+    Args:
+      maximum_events_per_batch (int): maximum number of events per batch.
+      event_filter (Optional[EventObjectFilter]): event filter.
+
+    Returns:
+      tuple[list[list[tuple[EventObject, EventData, EventDataStream]]],
+          list[int], collections.Counter]: deserialized batches of events,
+          timestamps of the events in storage order and counter containing
+          information about the events processed and filtered.
+    """
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_engine = analysis_engine.AnalysisMultiProcessEngine()
+    test_engine._MAXIMUM_EVENTS_PER_BATCH = maximum_events_per_batch
+
+    event_queue = TestEventQueue()
+    test_engine._event_queues['test'] = event_queue
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      shutil.copyfile(test_file_path, temp_file)
+
+      storage_writer = storage_factory.StorageFactory.CreateStorageWriter(
+          definitions.DEFAULT_STORAGE_FORMAT)
+      storage_writer.Open(path=temp_file)
+
+      try:
+        timestamps = [
+            event.timestamp for event, _, _, _ in (
+                storage_writer.GetSortedJoinedEvents())]
+
+        events_counter = test_engine._AnalyzeEvents(
+            storage_writer, {}, event_filter=event_filter)
+      finally:
+        storage_writer.Close()
+
+    self.assertIsInstance(event_queue.items[-1], plaso_queue.QueueAbort)
+
+    events_batches = [
+        pickle.loads(serialized_events_batch)
+        for serialized_events_batch in event_queue.items[:-1]]
+
+    return events_batches, timestamps, events_counter
+
   def testInternalAnalyzeEvents(self):
     """Tests the _AnalyzeEvents function."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
@@ -71,6 +140,42 @@ class AnalysisEngineMultiProcessEngineTest(test_lib.MultiProcessingTestCase):
     self.assertEqual(events_counter['Events filtered'], 0)
     self.assertEqual(events_counter['Events processed'], 38)
 
+  def testInternalAnalyzeEventsBatches(self):
+    """Tests the _AnalyzeEvents function pushes batches of events."""
+    events_batches, timestamps, events_counter = self._GetEventsBatches(10)
+
+    # The final batch only contains the remaining 8 events.
+    self.assertEqual(
+        [len(events_batch) for events_batch in events_batches],
+        [10, 10, 10, 8])
+
+    self.assertEqual(events_counter['Events filtered'], 0)
+    self.assertEqual(events_counter['Events processed'], 38)
+
+    batched_timestamps = [
+        event.timestamp for events_batch in events_batches
+        for event, _, _ in events_batch]
+    self.assertEqual(batched_timestamps, timestamps)
+
+  def testInternalAnalyzeEventsBatchesWithFilterLimit(self):
+    """Tests the _AnalyzeEvents function with an event filter limit."""
+    test_filter = filters_test_lib.TestEventFilter()
+    test_filter.limit = 15
+
+    events_batches, timestamps, events_counter = self._GetEventsBatches(
+        10, event_filter=test_filter)
+
+    self.assertEqual(
+        [len(events_batch) for events_batch in events_batches], [10, 5])
+
+    self.assertEqual(events_counter['Events filtered'], 0)
+    self.assertEqual(events_counter['Events processed'], 15)
+
+    batched_timestamps = [
+        event.timestamp for events_batch in events_batches
+        for event, _, _ in events_batch]
+    self.assertEqual(batched_timestamps, timestamps[:15])
+
   # TODO: add test for _CheckStatusAnalysisProcess.
   # TODO: add test for _StartAnalysisProcesses.
   # TODO: add test for _StatusUpdateThreadMain.
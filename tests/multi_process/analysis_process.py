@@ -3,10 +3,12 @@
 """Tests for the multi-processing analysis process."""
 
 import os
+import pickle
 import time
 import unittest
 
 from plaso.analysis import interface as analysis_interface
+from plaso.containers import events
 from plaso.engine import configurations
 from plaso.multi_process import analysis_process
 from plaso.multi_process import plaso_queue
@@ -49,6 +51,29 @@ class TestAnalysisPlugin(analysis_interface.AnalysisPlugin):
     return
 
 
+class TestEventRecordingAnalysisPlugin(TestAnalysisPlugin):
+  """Analysis plugin for testing that records the examined events."""
+
+  NAME = 'test_recording_plugin'
+
+  def __init__(self):
+    """Initializes an analysis plugin for testing."""
+    super(TestEventRecordingAnalysisPlugin, self).__init__()
+    self.examined_events = []
+
+  def ExamineEvent(self, mediator, event, event_data, event_data_stream):
+    """Analyzes an event.
+
+    Args:
+      mediator (AnalysisMediator): mediates interactions between analysis
+          plugins and other components, such as storage and dfvfs.
+      event (EventObject): event.
+      event_data (EventData): event data.
+      event_data_stream (EventDataStream): event data stream.
+    """
+    self.examined_events.append((event, event_data, event_data_stream))
+
+
 class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
   """Tests the multi-processing analysis process."""
 
@@ -120,6 +145,38 @@ class AnalysisProcessTest(test_lib.MultiProcessingTestCase):
 
   # TODO: add test for _ProcessEvent.
 
+  def testProcessEventsBatch(self):
+    """Tests the _ProcessEventsBatch function."""
+    analysis_plugin = TestEventRecordingAnalysisPlugin()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = analysis_process.AnalysisProcess(
+          None, analysis_plugin, configuration, [], name='TestAnalysis')
+
+      events_batches = []
+      for batch_index in range(3):
+        events_batch = []
+        for event_index in range(batch_index + 1):
+          event = events.EventObject()
+          event.timestamp = (batch_index * 10) + event_index
+          events_batch.append((event, events.EventData(), None))
+
+        events_batches.append(events_batch)
+
+      for events_batch in events_batches:
+        serialized_events_batch = pickle.dumps(
+            events_batch, protocol=pickle.HIGHEST_PROTOCOL)
+        test_process._ProcessEventsBatch(None, serialized_events_batch)
+
+    self.assertEqual(test_process._number_of_consumed_events, 6)
+
+    timestamps = [
+        event.timestamp for event, _, _ in analysis_plugin.examined_events]
+    self.assertEqual(timestamps, [0, 10, 11, 20, 21, 22])
+
   def testSignalAbort(self):
     """Tests the SignalAbort function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -9,6 +9,7 @@ import unittest
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import event_sources
 from plaso.containers import sessions
 from plaso.lib import definitions
 from plaso.engine import configurations
@@ -18,9 +19,101 @@ from plaso.storage.sqlite import writer as sqlite_writer
 from tests import test_lib as shared_test_lib
 
 
+class EventSourceHeapTest(shared_test_lib.BaseTestCase):
+  """Tests for the event source heap."""
+
+  def testPushPopEventSource(self):
+    """Tests the PushEventSource and PopEventSource functions."""
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    test_values = [
+        ('/small', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, 16),
+        ('/unknown', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, None),
+        ('/large', dfvfs_definitions.FILE_ENTRY_TYPE_FILE, 4096),
+        ('/directory', dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY, None)]
+
+    for location, file_entry_type, file_size in test_values:
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=file_entry_type, file_size=file_size)
+      event_source.path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+      event_source_heap.PushEventSource(event_source)
+
+    locations = []
+    event_source = event_source_heap.PopEventSource()
+    while event_source:
+      locations.append(event_source.path_spec.location)
+      event_source = event_source_heap.PopEventSource()
+
+    self.assertEqual(locations, ['/directory', '/large', '/small', '/unknown'])
+
+
 class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
   """Tests for the task-based multi-process extraction engine."""
 
+  # pylint: disable=protected-access
+
+  def testBatchEventSources(self):
+    """Tests the _BatchEventSources function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine._BATCH_MAXIMUM_NUMBER_OF_PATH_SPECS = 3
+
+    event_source_heap = extraction_engine._EventSourceHeap()
+
+    for filename in ('syslog', 'syslog.gz', 'syslog.bz2', 'syslog.xz'):
+      test_file_path = self._GetTestFilePath([filename])
+      self._SkipIfPathNotExists(test_file_path)
+
+      event_source = event_sources.FileEntryEventSource(
+          file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE,
+          file_size=os.path.getsize(test_file_path))
+      event_source.path_spec = path_spec_factory.Factory.NewPathSpec(
+          dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+      event_source_heap.PushEventSource(event_source)
+
+    event_source = event_source_heap.PopEventSource()
+    task = test_engine._CreateTask('session', event_source)
+    test_engine._BatchEventSources(task, event_source_heap)
+
+    self.assertIsNone(task.path_spec)
+    self.assertEqual(len(task.path_specs), 3)
+    self.assertEqual(task.path_specs[0], event_source.path_spec)
+
+    expected_file_size = sum(
+        os.path.getsize(path_spec.location) for path_spec in task.path_specs)
+    self.assertEqual(task.file_size, expected_file_size)
+
+    # The remaining event source is processed by the next task.
+    event_source = event_source_heap.PopEventSource()
+    self.assertIsNotNone(event_source)
+    self.assertIsNone(event_source_heap.PopEventSource())
+
+    task = test_engine._CreateTask('session', event_source)
+    test_engine._BatchEventSources(task, event_source_heap)
+
+    self.assertEqual(task.path_spec, event_source.path_spec)
+    self.assertIsNone(task.path_specs)
+
+  def testCreateTask(self):
+    """Tests the _CreateTask function."""
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+
+    # The source is not accessed when creating a task, hence a path
+    # specification of a file that does not exist is used.
+    event_source = event_sources.FileEntryEventSource(
+        file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_FILE, file_size=16)
+    event_source.path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location='/bogus')
+
+    task = test_engine._CreateTask('session', event_source)
+    self.assertIsNotNone(task)
+    self.assertEqual(task.file_entry_type, event_source.file_entry_type)
+    self.assertEqual(task.file_size, 16)
+    self.assertEqual(task.path_spec, event_source.path_spec)
+    self.assertEqual(task.session_identifier, 'session')
+
   def testProcessSource(self):
     """Tests the PreprocessSource and ProcessSource functions."""
     test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
@@ -92,6 +185,81 @@ class ExtractionMultiProcessEngineTest(shared_test_lib.BaseTestCase):
         'total': 15})
     self.assertEqual(parsers_counter, expected_parsers_counter)
 
+  def testProcessSourceWithWorkerTimelining(self):
+    """Tests the ProcessSource function with timelining by the workers."""
+    test_artifacts_path = shared_test_lib.GetTestFilePath(['artifacts'])
+    self._SkipIfPathNotExists(test_artifacts_path)
+
+    test_engine = extraction_engine.ExtractionMultiProcessEngine(
+        maximum_number_of_tasks=100)
+    test_engine.BuildArtifactsRegistry(test_artifacts_path, None)
+
+    test_file_path = self._GetTestFilePath(['ímynd.dd'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    os_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file_path)
+    source_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, location='/',
+        parent=os_path_spec)
+
+    session = sessions.Session()
+
+    processing_configuration = configurations.ProcessingConfiguration()
+    processing_configuration.data_location = shared_test_lib.DATA_PATH
+    processing_configuration.extraction.worker_timelining = True
+    processing_configuration.parser_filter_expression = 'filestat'
+    processing_configuration.task_storage_format = (
+        definitions.STORAGE_FORMAT_SQLITE)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      storage_writer = sqlite_writer.SQLiteStorageFileWriter()
+      storage_writer.Open(path=temp_file)
+
+      try:
+        system_configurations = test_engine.PreprocessSource(
+            [source_path_spec], storage_writer)
+
+        processing_status = test_engine.ProcessSourceMulti(
+            storage_writer, session.identifier, processing_configuration,
+            system_configurations, [source_path_spec],
+            storage_file_path=temp_directory)
+
+        number_of_events = storage_writer.GetNumberOfAttributeContainers(
+            'event')
+
+        parsers_counter = collections.Counter({
+            parser_count.name: parser_count.number_of_events
+            for parser_count in storage_writer.GetAttributeContainers(
+                'parser_count')})
+
+        event_data_identifiers = set()
+        for event in storage_writer.GetAttributeContainers('event'):
+          event_data_identifier = event.GetEventDataIdentifier()
+          event_data = storage_writer.GetAttributeContainerByIdentifier(
+              'event_data', event_data_identifier)
+          self.assertIsNotNone(event_data)
+          self.assertEqual(event_data.data_type, 'fs:stat')
+
+          event_data_identifiers.add(event_data_identifier.CopyToString())
+
+        number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+            'event_data')
+
+      finally:
+        storage_writer.Close()
+
+    self.assertFalse(processing_status.aborted)
+
+    self.assertEqual(number_of_events, 15)
+    self.assertEqual(len(event_data_identifiers), number_of_event_data)
+
+    expected_parsers_counter = collections.Counter({
+        'filestat': 15,
+        'total': 15})
+    self.assertEqual(parsers_counter, expected_parsers_counter)
+
 
 if __name__ == '__main__':
   unittest.main()
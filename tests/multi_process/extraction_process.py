@@ -2,14 +2,20 @@
 # -*- coding: utf-8 -*-
 """Tests for the multi-processing worker process."""
 
+import os
 import unittest
 
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+from dfvfs.helpers import file_system_searcher
 from dfvfs.lib import definitions as dfvfs_definitions
 from dfvfs.path import factory as path_spec_factory
 
+from plaso.containers import events
 from plaso.containers import sessions
 from plaso.containers import tasks
 from plaso.engine import configurations
+from plaso.engine import timeliner
 from plaso.engine import worker
 from plaso.lib import definitions
 from plaso.multi_process import extraction_process
@@ -52,7 +58,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          None, configuration, [], None, name='TestWorker')
+          None, configuration, [], None, None, name='TestWorker')
       self.assertIsNotNone(test_process)
 
   def testGetStatus(self):
@@ -62,7 +68,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          None, configuration, [], None, name='TestWorker')
+          None, configuration, [], None, None, name='TestWorker')
       status_attributes = test_process._GetStatus()
 
       self.assertIsNotNone(status_attributes)
@@ -94,13 +100,54 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          input_task_queue, configuration, [], None, name='TestWorker')
+          input_task_queue, configuration, [], None, None, name='TestWorker')
 
       test_process.start()
 
       output_task_queue.PushItem(plaso_queue.QueueAbort(), block=False)
       output_task_queue.Close(abort=True)
 
+  def testProcessEventData(self):
+    """Tests the _ProcessEventData function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration = configurations.ProcessingConfiguration()
+      configuration.task_storage_path = temp_directory
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], None, None, name='TestWorker')
+      test_process._event_data_timeliner = timeliner.EventDataTimeliner(
+          data_location=shared_test_lib.DATA_PATH)
+
+      task_storage_writer = self._CreateStorageWriter()
+
+      event_data_stream = events.EventDataStream()
+      task_storage_writer.AddAttributeContainer(event_data_stream)
+
+      event_data = events.EventData(data_type='fs:stat')
+      event_data.access_time = dfdatetime_posix_time.PosixTime(
+          timestamp=1281643591)
+      event_data.modification_time = dfdatetime_posix_time.PosixTime(
+          timestamp=1281647191)
+      event_data.parser = 'filestat'
+      event_data._parser_chain = 'filestat'
+      event_data.SetEventDataStreamIdentifier(
+          event_data_stream.GetIdentifier())
+      task_storage_writer.AddAttributeContainer(event_data)
+
+      test_process._ProcessEventData(task_storage_writer)
+
+      self.assertEqual(test_process._number_of_produced_events, 2)
+
+      number_of_events = task_storage_writer.GetNumberOfAttributeContainers(
+          'event')
+      self.assertEqual(number_of_events, 2)
+
+      parsers_counter = {
+          parser_count.name: parser_count.number_of_events
+          for parser_count in task_storage_writer.GetAttributeContainers(
+              'parser_count')}
+      self.assertEqual(parsers_counter, {'filestat': 2, 'total': 2})
+
   def testProcessPathSpec(self):
     """Tests the _ProcessPathSpec function."""
     test_file_path = self._GetTestFilePath(['testdir', 'filter_1.txt'])
@@ -114,7 +161,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          None, configuration, [], None, name='TestWorker')
+          None, configuration, [], None, None, name='TestWorker')
 
       task_storage_writer = self._CreateStorageWriter()
       parser_mediator = self._CreateParserMediator(task_storage_writer)
@@ -127,6 +174,19 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       test_process._ProcessPathSpec(None, parser_mediator, path_spec)
       self.assertEqual(parser_mediator._number_of_extraction_warnings, 1)
 
+      # Test with an excluded path specification.
+      find_spec = file_system_searcher.FindSpec(
+          location=test_file_path, location_separator=os.path.sep)
+
+      test_process = extraction_process.ExtractionWorkerProcess(
+          None, configuration, [], [find_spec], None, name='TestWorker')
+
+      task_storage_writer = self._CreateStorageWriter()
+      parser_mediator = self._CreateParserMediator(task_storage_writer)
+
+      test_process._ProcessPathSpec(None, parser_mediator, path_spec)
+      self.assertEqual(parser_mediator._number_of_extraction_warnings, 0)
+
   def testProcessTask(self):
     """Tests the _ProcessTask function."""
     session = sessions.Session()
@@ -136,7 +196,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_format = definitions.STORAGE_FORMAT_SQLITE
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          None, configuration, [], None, name='TestWorker')
+          None, configuration, [], None, None, name='TestWorker')
       test_process._extraction_worker = TestEventExtractionWorker()
 
       task_storage_writer = self._CreateStorageWriter()
@@ -157,7 +217,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          None, configuration, [], None, name='TestWorker')
+          None, configuration, [], None, None, name='TestWorker')
       test_process._extraction_worker = TestEventExtractionWorker()
 
       test_process._StartProfiling(None)
@@ -172,7 +232,7 @@ class WorkerProcessTest(test_lib.MultiProcessingTestCase):
       configuration.task_storage_path = temp_directory
 
       test_process = extraction_process.ExtractionWorkerProcess(
-          None, configuration, [], None, name='TestWorker')
+          None, configuration, [], None, None, name='TestWorker')
       test_process.SignalAbort()
 
 
@@ -226,11 +226,13 @@ class OutputAndFormattingMultiProcessEngineTest(
        'timestamp': 5134024321,
        'timestamp_desc': definitions.TIME_DESCRIPTION_UNKNOWN}]
 
-  def _CreateTestStorageFile(self, path):
+  def _CreateTestStorageFile(self, path, event_values=None):
     """Creates a storage file for testing.
 
     Args:
       path (str): path.
+      event_values (Optional[list[dict[str, object]]]): values of the events
+          to store, where None represents the default test events.
     """
     storage_file = storage_factory.StorageFactory.CreateStorageFile(
         definitions.DEFAULT_STORAGE_FORMAT)
@@ -239,7 +241,8 @@ class OutputAndFormattingMultiProcessEngineTest(
     # TODO: add preprocessing information.
 
     for event, event_data, event_data_stream in (
-        containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        containers_test_lib.CreateEventsFromValues(
+            event_values or self._TEST_EVENTS)):
       storage_file.AddAttributeContainer(event_data_stream)
 
       event_data.SetEventDataStreamIdentifier(event_data_stream.GetIdentifier())
@@ -306,6 +309,34 @@ class OutputAndFormattingMultiProcessEngineTest(
 
   # TODO: add test for _FlushExportBuffer.
 
+  def testGetExportTimeRanges(self):
+    """Tests the _GetExportTimeRanges function."""
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      temp_file = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(temp_file)
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(temp_file))
+
+      try:
+        time_ranges = test_engine._GetExportTimeRanges(storage_reader, 3)
+      finally:
+        storage_reader.Close()
+
+    time_range_values = [
+        (time_range.start_timestamp, time_range.end_timestamp)
+        for time_range in time_ranges]
+
+    # Note that the 9 events with timestamp 5134324322 are not split over
+    # multiple time ranges.
+    expected_time_range_values = [
+        (2134324321, 5134324321),
+        (5134324322, 9134324320),
+        (9134324321, 15134324321)]
+    self.assertEqual(time_range_values, expected_time_range_values)
+
   def testExportEvents(self):
     """Tests the ExportEvents function."""
     test_file_path = self._GetTestFilePath(['psort_test.plaso'])
@@ -343,6 +374,93 @@ class OutputAndFormattingMultiProcessEngineTest(
         'repeated')
     self.assertEqual(lines[14], expected_line)
 
+  def testExportEventsWithWorkers(self):
+    """Tests the ExportEvents function with output worker processes."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = shared_test_lib.DATA_PATH
+    configuration.preferred_language = 'en-US'
+
+    test_file_object = io.StringIO()
+
+    storage_reader = storage_factory.StorageFactory.CreateStorageReaderForFile(
+        test_file_path)
+
+    output_module = dynamic.DynamicOutputModule()
+    output_module._file_object = test_file_object
+
+    test_engine = output_engine.OutputAndFormattingMultiProcessEngine()
+    test_engine.ExportEvents(storage_reader, output_module, configuration)
+
+    expected_output = test_file_object.getvalue()
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration.temporary_directory = temp_directory
+
+      test_file_object = io.StringIO()
+
+      storage_reader = (
+          storage_factory.StorageFactory.CreateStorageReaderForFile(
+              test_file_path))
+
+      output_module = dynamic.DynamicOutputModule()
+      output_module._file_object = test_file_object
+
+      test_engine = output_engine.OutputAndFormattingMultiProcessEngine(
+          number_of_worker_processes=3)
+      test_engine.ExportEvents(
+          storage_reader, output_module, configuration,
+          storage_file_path=test_file_path)
+
+      self.assertEqual(os.listdir(temp_directory), [])
+
+    output = test_file_object.getvalue()
+    self.assertEqual(output, expected_output)
+
+
+  def testExportEventsWithWorkersAndCarriageReturns(self):
+    """Tests the ExportEvents function with carriage returns in values."""
+    event_values = [
+        {'data_type': 'test:event',
+         'text': 'Text with\rcarriage return {0:d}\r\n'.format(index),
+         'timestamp': 5134324321 + (index * 1000000),
+         'timestamp_desc': definitions.TIME_DESCRIPTION_WRITTEN}
+        for index in range(9)]
+
+    configuration = configurations.ProcessingConfiguration()
+    configuration.data_location = shared_test_lib.DATA_PATH
+    configuration.preferred_language = 'en-US'
+
+    outputs = []
+    with shared_test_lib.TempDirectory() as temp_directory:
+      configuration.temporary_directory = temp_directory
+
+      test_file_path = os.path.join(temp_directory, 'storage.plaso')
+      self._CreateTestStorageFile(test_file_path, event_values=event_values)
+
+      for number_of_worker_processes in (0, 3):
+        test_file_object = io.StringIO(newline='')
+
+        storage_reader = (
+            storage_factory.StorageFactory.CreateStorageReaderForFile(
+                test_file_path))
+
+        output_module = dynamic.DynamicOutputModule()
+        output_module.SetFields(['datetime', 'timestamp_desc', 'text'])
+        output_module._file_object = test_file_object
+
+        test_engine = output_engine.OutputAndFormattingMultiProcessEngine(
+            number_of_worker_processes=number_of_worker_processes)
+        test_engine.ExportEvents(
+            storage_reader, output_module, configuration,
+            storage_file_path=test_file_path)
+
+        outputs.append(test_file_object.getvalue())
+
+    self.assertIn('Text with\rcarriage return 8\r\n', outputs[0])
+    self.assertEqual(outputs[1], outputs[0])
 
 if __name__ == '__main__':
   unittest.main()
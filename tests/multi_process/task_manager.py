@@ -319,6 +319,34 @@ class TaskManagerTest(shared_test_lib.BaseTestCase):
 
     self.assertEqual(manager._total_number_of_tasks, 2)
 
+    # Test a task with multiple path specifications.
+    manager = task_manager.TaskManager()
+    task = manager.CreateTask(self._TEST_SESSION_IDENTIFIER)
+    task.path_specs = ['test_path_spec1', 'test_path_spec2']
+
+    manager._AbandonQueuedTasks()
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, 'test_path_spec1')
+    self.assertTrue(task.has_retry)
+
+    self.assertTrue(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNotNone(retry_task)
+    self.assertEqual(retry_task.path_spec, 'test_path_spec2')
+
+    self.assertFalse(manager._HasTasksPendingRetry())
+
+    retry_task = manager.CreateRetryTask()
+    self.assertIsNone(retry_task)
+
+    self.assertEqual(len(manager._tasks_queued), 2)
+    self.assertEqual(len(manager._tasks_abandoned), 1)
+
+    self.assertEqual(manager._total_number_of_tasks, 3)
+
   def testCreateTask(self):
     """Tests the CreateTask function."""
     manager = task_manager.TaskManager()
@@ -457,8 +457,108 @@ class FieldFormattingHelperTest(test_lib.OutputModuleTestCase):
         output_mediator, event, event_data, event_data_stream)
     self.assertEqual(username_string, '-')
 
+  def testGetDateWithTimeOfDay(self):
+    """Tests the _GetDateWithTimeOfDay function."""
+    output_mediator = self._CreateOutputMediator()
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    event, _, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[0])
+
+    date_with_time_of_day = test_helper._GetDateWithTimeOfDay(
+        output_mediator, event)
+    self.assertEqual(date_with_time_of_day, (2012, 6, 27, 18, 17, 1))
+
+    output_mediator.SetTimeZone('Europe/Amsterdam')
+
+    date_with_time_of_day = test_helper._GetDateWithTimeOfDay(
+        output_mediator, event)
+    self.assertEqual(date_with_time_of_day, (2012, 6, 27, 20, 17, 1))
+
+    # Test with an event.timestamp that is truncated to seconds.
+    event.date_time = None
+    event.timestamp = -1500000
+
+    output_mediator.SetTimeZone('UTC')
+
+    date_with_time_of_day = test_helper._GetDateWithTimeOfDay(
+        output_mediator, event)
+    self.assertEqual(date_with_time_of_day, (1969, 12, 31, 23, 59, 59))
+
+    # Test with an event.timestamp outside the range supported by datetime.
+    event.timestamp = 253402300800000000
+
+    date_with_time_of_day = test_helper._GetDateWithTimeOfDay(
+        output_mediator, event)
+    self.assertEqual(date_with_time_of_day, (10000, 1, 1, 0, 0, 0))
+
+    output_mediator.SetTimeZone('Europe/Amsterdam')
+
+    date_with_time_of_day = test_helper._GetDateWithTimeOfDay(
+        output_mediator, event)
+    self.assertEqual(
+        date_with_time_of_day, (None, None, None, None, None, None))
+
+  def testGetFormattedEventData(self):
+    """Tests the _GetFormattedEventData function."""
+    output_mediator = self._CreateOutputMediator()
+
+    formatters_directory_path = self._GetTestFilePath(['formatters'])
+    output_mediator.ReadMessageFormattersFromDirectory(
+        formatters_directory_path)
+
+    test_helper = formatting_helper.FieldFormattingHelper()
+    test_helper._MAXIMUM_CACHED_EVENT_DATA = 1
+
+    event, event_data, event_data_stream = (
+        containers_test_lib.CreateEventFromValues(self._TEST_EVENTS[0]))
+
+    formatted_event_data = test_helper._GetFormattedEventData(
+        output_mediator, event_data)
+    self.assertIsNotNone(formatted_event_data)
+    self.assertEqual(
+        formatted_event_data['event_values']['hostname'], 'ubuntu')
+
+    message_string = test_helper._FormatMessage(
+        output_mediator, event, event_data, event_data_stream)
+    self.assertEqual(formatted_event_data['message'], message_string)
+
+    # The formatted event data is cached per event data.
+    cached_event_data = test_helper._GetFormattedEventData(
+        output_mediator, event_data)
+    self.assertIs(cached_event_data, formatted_event_data)
+
+    _, other_event_data, _ = containers_test_lib.CreateEventFromValues(
+        self._TEST_EVENTS[1])
+
+    test_helper._GetFormattedEventData(output_mediator, other_event_data)
+    self.assertEqual(len(test_helper._event_data_cache), 1)
+
+    cached_event_data = test_helper._GetFormattedEventData(
+        output_mediator, event_data)
+    self.assertIsNot(cached_event_data, formatted_event_data)
+
   # TODO: add coverage for _ReportEventError
 
+  def testGetTimeZoneConverter(self):
+    """Tests the _GetTimeZoneConverter function."""
+    output_mediator = self._CreateOutputMediator()
+    test_helper = formatting_helper.FieldFormattingHelper()
+
+    time_zone_converter = test_helper._GetTimeZoneConverter(output_mediator)
+    self.assertIsNotNone(time_zone_converter)
+    self.assertEqual(time_zone_converter.time_zone, output_mediator.time_zone)
+
+    cached_time_zone_converter = test_helper._GetTimeZoneConverter(
+        output_mediator)
+    self.assertIs(cached_time_zone_converter, time_zone_converter)
+
+    output_mediator.SetTimeZone('Europe/Amsterdam')
+
+    time_zone_converter = test_helper._GetTimeZoneConverter(output_mediator)
+    self.assertIsNot(time_zone_converter, cached_time_zone_converter)
+    self.assertEqual(time_zone_converter.time_zone, output_mediator.time_zone)
+
   def testGetFormattedField(self):
     """Tests the GetFormattedField function."""
     output_mediator = self._CreateOutputMediator()
@@ -13,7 +13,7 @@ class OutputImportTest(test_lib.ImportCheckTestCase):
   _IGNORABLE_FILES = frozenset([
       'formatting_helper.py', 'interface.py', 'logger.py', 'manager.py',
       'mediator.py', 'shared_dsv.py', 'shared_json.py', 'shared_opensearch.py',
-      'text_file.py', 'winevt_rc.py'])
+      'text_file.py', 'time_zone.py', 'winevt_rc.py'])
 
   def testOutputModulesImported(self):
     """Tests that all output modules are imported."""
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Tests for the time zone conversion helper."""
+
+import unittest
+
+import pytz
+
+from plaso.output import time_zone
+
+from tests import test_lib as shared_test_lib
+
+
+class TimeZoneConverterTest(shared_test_lib.BaseTestCase):
+  """Tests for the time zone converter."""
+
+  def testInitialize(self):
+    """Tests the __init__ function."""
+    time_zone_converter = time_zone.TimeZoneConverter(pytz.UTC)
+    self.assertIsNotNone(time_zone_converter)
+
+    time_zone_converter = time_zone.TimeZoneConverter(
+        pytz.timezone('Europe/Amsterdam'))
+    self.assertIsNotNone(time_zone_converter)
+
+  def testCopyToDateTimeString(self):
+    """Tests the CopyToDateTimeString function."""
+    time_zone_converter = time_zone.TimeZoneConverter(pytz.UTC)
+
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1340821021))
+    self.assertEqual(date_time_string, '2012-06-27T18:17:01')
+    self.assertEqual(utc_offset_string, '+00:00')
+
+    time_zone_converter = time_zone.TimeZoneConverter(
+        pytz.timezone('Europe/Amsterdam'))
+
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1340821021))
+    self.assertEqual(date_time_string, '2012-06-27T20:17:01')
+    self.assertEqual(utc_offset_string, '+02:00')
+
+    # Test the start of daylight saving time.
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1616893199))
+    self.assertEqual(date_time_string, '2021-03-28T01:59:59')
+    self.assertEqual(utc_offset_string, '+01:00')
+
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1616893200))
+    self.assertEqual(date_time_string, '2021-03-28T03:00:00')
+    self.assertEqual(utc_offset_string, '+02:00')
+
+    # Test the end of daylight saving time.
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1635641999))
+    self.assertEqual(date_time_string, '2021-10-31T02:59:59')
+    self.assertEqual(utc_offset_string, '+02:00')
+
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1635642000))
+    self.assertEqual(date_time_string, '2021-10-31T02:00:00')
+    self.assertEqual(utc_offset_string, '+01:00')
+
+    # Test a local mean time UTC offset, which pytz rounds to minutes.
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(-2208988800))
+    self.assertEqual(date_time_string, '1900-01-01T00:18:00')
+    self.assertEqual(utc_offset_string, '+00:18')
+
+    time_zone_converter = time_zone.TimeZoneConverter(
+        pytz.timezone('America/St_Johns'))
+
+    date_time_string, utc_offset_string = (
+        time_zone_converter.CopyToDateTimeString(1340821021))
+    self.assertEqual(date_time_string, '2012-06-27T15:47:01')
+    self.assertEqual(utc_offset_string, '-02:30')
+
+    with self.assertRaises(OverflowError):
+      time_zone_converter.CopyToDateTimeString(-62135596801)
+
+    with self.assertRaises(OverflowError):
+      time_zone_converter.CopyToDateTimeString(253402300800)
+
+  def testGetDateWithTimeOfDay(self):
+    """Tests the GetDateWithTimeOfDay function."""
+    time_zone_converter = time_zone.TimeZoneConverter(
+        pytz.timezone('Europe/Amsterdam'))
+
+    date_with_time_of_day = time_zone_converter.GetDateWithTimeOfDay(
+        1340821021)
+    self.assertEqual(date_with_time_of_day, (2012, 6, 27, 20, 17, 1))
+
+    date_with_time_of_day = time_zone_converter.GetDateWithTimeOfDay(
+        1356998399)
+    self.assertEqual(date_with_time_of_day, (2013, 1, 1, 0, 59, 59))
+
+    with self.assertRaises(OverflowError):
+      time_zone_converter.GetDateWithTimeOfDay(253402300799)
+
+  def testGetTimestamp(self):
+    """Tests the GetTimestamp function."""
+    time_zone_converter = time_zone.TimeZoneConverter(pytz.UTC)
+
+    timestamp = time_zone_converter.GetTimestamp(2012, 6, 27, 18, 17, 1)
+    self.assertEqual(timestamp, 1340821021)
+
+    timestamp = time_zone_converter.GetTimestamp(1, 1, 1, 0, 0, 0)
+    self.assertEqual(timestamp, -62135596800)
+
+    with self.assertRaises(TypeError):
+      time_zone_converter.GetTimestamp(None, None, None, None, None, None)
+
+    with self.assertRaises(ValueError):
+      time_zone_converter.GetTimestamp(2012, 2, 30, 18, 17, 1)
+
+
+if __name__ == '__main__':
+  unittest.main()
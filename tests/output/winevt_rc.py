@@ -4,7 +4,9 @@
 
 import unittest
 
+from plaso.containers import artifacts
 from plaso.output import winevt_rc
+from plaso.storage.fake import writer as fake_writer
 
 from tests import test_lib as shared_test_lib
 
@@ -39,6 +41,55 @@ class WinevtResourcesHelperTest(shared_test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  _PROVIDER_IDENTIFIER = '{15a7a4f8-0072-4eab-abad-f98a4d666aed}'
+
+  def _CreateStorageWriter(self):
+    """Creates a storage writer with Windows EventLog resources.
+
+    Returns:
+      FakeStorageWriter: storage writer.
+    """
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    environment_variable = artifacts.EnvironmentVariableArtifact(
+        case_sensitive=False, name='SystemRoot', value='C:\\Windows')
+    storage_writer.AddAttributeContainer(environment_variable)
+
+    provider = artifacts.WindowsEventLogProviderArtifact(
+        event_message_files=['%SystemRoot%\\System32\\dhcpcore.dll'],
+        identifier=self._PROVIDER_IDENTIFIER,
+        log_source='Microsoft-Windows-Dhcp-Client')
+    storage_writer.AddAttributeContainer(provider)
+
+    message_file = artifacts.WindowsEventLogMessageFileArtifact(
+        path='\\Windows\\System32\\dhcpcore.dll',
+        windows_path='%SystemRoot%\\System32\\dhcpcore.dll')
+    storage_writer.AddAttributeContainer(message_file)
+
+    message_string = artifacts.WindowsEventLogMessageStringArtifact(
+        language_identifier=0x00000409, message_identifier=0xb00003ed,
+        string='IP address {0:s} is already in use.')
+    message_string.SetMessageFileIdentifier(message_file.GetIdentifier())
+    storage_writer.AddAttributeContainer(message_string)
+
+    event_definition = artifacts.WindowsWevtTemplateEvent(
+        identifier=1005, message_identifier=0xb00003ed,
+        provider_identifier=self._PROVIDER_IDENTIFIER, version=0)
+    storage_writer.AddAttributeContainer(event_definition)
+
+    return storage_writer
+
+  def testCacheMissingMessageString(self):
+    """Tests the _CacheMissingMessageString function."""
+    test_helper = winevt_rc.WinevtResourcesHelper(None, None, 0x00000409)
+
+    test_helper._CacheMissingMessageString(
+        self._PROVIDER_IDENTIFIER, 'Microsoft-Windows-Dhcp-Client', 5, None)
+
+    self.assertEqual(list(test_helper._missing_message_string_cache), [
+        (self._PROVIDER_IDENTIFIER, 'Microsoft-Windows-Dhcp-Client', 5, None)])
+
   def testGetWinevtRcDatabaseMessageString(self):
     """Tests the _GetWinevtRcDatabaseMessageString function."""
     database_path = self._GetTestFilePath(['winevt-rc.db'])
@@ -57,6 +108,43 @@ class WinevtResourcesHelperTest(shared_test_lib.BaseTestCase):
         'Microsoft-Windows-Dhcp-Client', 0xb00003ed)
     self.assertEqual(message_string, expected_message_string)
 
+  def testReadWindowsEventLogMessageStrings(self):
+    """Tests the _ReadWindowsEventLogMessageStrings function."""
+    storage_writer = self._CreateStorageWriter()
+
+    try:
+      test_helper = winevt_rc.WinevtResourcesHelper(
+          storage_writer, None, 0x00000409)
+      test_helper._ReadEnvironmentVariables(storage_writer)
+      test_helper._ReadWindowsEventLogProviders(storage_writer)
+      test_helper._ReadWindowsEventLogMessageFiles(storage_writer)
+
+      test_helper._ReadWindowsEventLogMessageStrings(storage_writer)
+
+      self.assertEqual(test_helper._message_strings_index, {
+          0xb00003ed: [(
+              'windows_eventlog_message_file.1',
+              'IP address {0:s} is already in use.')]})
+      self.assertEqual(test_helper._wevt_template_events_index, {
+          (self._PROVIDER_IDENTIFIER, 1005, 0): 0xb00003ed,
+          (self._PROVIDER_IDENTIFIER, 1005, None): 0xb00003ed})
+
+      # Test with message strings that exceed the maximum size.
+      test_helper = winevt_rc.WinevtResourcesHelper(
+          storage_writer, None, 0x00000409)
+      test_helper._MAXIMUM_PRELOADED_MESSAGE_STRINGS_SIZE = 16
+      test_helper._ReadEnvironmentVariables(storage_writer)
+      test_helper._ReadWindowsEventLogProviders(storage_writer)
+      test_helper._ReadWindowsEventLogMessageFiles(storage_writer)
+
+      test_helper._ReadWindowsEventLogMessageStrings(storage_writer)
+
+      self.assertIsNone(test_helper._message_strings_index)
+      self.assertIsNone(test_helper._wevt_template_events_index)
+
+    finally:
+      storage_writer.Close()
+
   def testGetMessageString(self):
     """Tests the GetMessageString function."""
     database_path = self._GetTestFilePath(['winevt-rc.db'])
@@ -76,6 +164,39 @@ class WinevtResourcesHelperTest(shared_test_lib.BaseTestCase):
         'Microsoft-Windows-Dhcp-Client', 0xb00003ed, None)
     self.assertEqual(message_string, expected_message_string)
 
+  def testGetMessageStringFromStorage(self):
+    """Tests the GetMessageString function with a storage reader."""
+    storage_writer = self._CreateStorageWriter()
+
+    try:
+      for preload_message_strings in (False, True):
+        test_helper = winevt_rc.WinevtResourcesHelper(
+            storage_writer, None, 0x00000409,
+            preload_message_strings=preload_message_strings)
+
+        message_string = test_helper.GetMessageString(
+            self._PROVIDER_IDENTIFIER, 'Microsoft-Windows-Dhcp-Client', 1005,
+            0)
+        self.assertEqual(message_string, 'IP address {0:s} is already in use.')
+
+        message_string = test_helper.GetMessageString(
+            None, 'Microsoft-Windows-Dhcp-Client', 0xb00003ed, None)
+        self.assertEqual(message_string, 'IP address {0:s} is already in use.')
+
+        self.assertEqual(
+            test_helper._message_strings_index is not None,
+            preload_message_strings)
+
+        message_string = test_helper.GetMessageString(
+            None, 'Microsoft-Windows-Dhcp-Client', 5, None)
+        self.assertIsNone(message_string)
+
+        self.assertEqual(list(test_helper._missing_message_string_cache), [
+            (None, 'Microsoft-Windows-Dhcp-Client', 5, None)])
+
+    finally:
+      storage_writer.Close()
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -20,7 +20,8 @@ class ParserImportTest(test_lib.ImportCheckTestCase):
       'manager.py',
       'mediator.py',
       'plugins.py',
-      'presets.py'])
+      'presets.py',
+      'sqlite_vfs.py'])
 
   def testParsersImported(self):
     """Tests that all parsers are imported."""
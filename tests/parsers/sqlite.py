@@ -51,9 +51,11 @@ class SQLiteDatabaseTest(test_lib.ParserTestCase):
       with open(database_wal_file_path, 'rb') as wal_file_object:
         database.Open(database_file_object, wal_file_object=wal_file_object)
 
-    row_results = []
-    for row in database.Query('SELECT * FROM MyTable'):
-      row_results.append((row['Field1'], row['Field2'], row['Field3']))
+        row_results = []
+        for row in database.Query('SELECT * FROM MyTable'):
+          row_results.append((row['Field1'], row['Field2'], row['Field3']))
+
+        database.Close()
 
     expected_results = [
         ('Committed Text 1', 1, None),
@@ -79,9 +81,11 @@ class SQLiteDatabaseTest(test_lib.ParserTestCase):
     with open(database_file_path, 'rb') as database_file_object:
       database.Open(database_file_object)
 
-    row_results = []
-    for row in database.Query('SELECT * FROM MyTable'):
-      row_results.append((row['Field1'], row['Field2'], row['Field3']))
+      row_results = []
+      for row in database.Query('SELECT * FROM MyTable'):
+        row_results.append((row['Field1'], row['Field2'], row['Field3']))
+
+      database.Close()
 
     expected_results = [
         ('Committed Text 1', 1, None),
@@ -113,18 +117,65 @@ class SQLiteParserTest(test_lib.ParserTestCase):
 
     parser.EnablePlugins([])
     self.assertEqual(len(parser._plugins_per_name), 0)
+    self.assertEqual(parser._plugins_per_table_name, {})
 
     parser.EnablePlugins(parser.ALL_PLUGINS)
     self.assertEqual(len(parser._plugins_per_name), number_of_plugins)
 
+    number_of_indexed_plugins = sum(
+        len(plugin_names)
+        for plugin_names in parser._plugins_per_table_name.values())
+    self.assertEqual(number_of_indexed_plugins, number_of_plugins)
+
     parser.EnablePlugins(['chrome_27_history'])
     self.assertEqual(len(parser._plugins_per_name), 1)
 
+    # With a single plugin enabled the first table name in alphabetical order
+    # is used to index the plugin.
+    self.assertEqual(
+        parser._plugins_per_table_name, {'downloads': ['chrome_27_history']})
+
   def testGetFormatSpecification(self):
     """Tests the GetFormatSpecification function."""
     format_specification = sqlite.SQLiteParser.GetFormatSpecification()
     self.assertIsNotNone(format_specification)
 
+  def testGetPluginsForDatabase(self):
+    """Tests the _GetPluginsForDatabase function."""
+    parser = sqlite.SQLiteParser()
+
+    database_file_path = self._GetTestFilePath(['History'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('History')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+      try:
+        plugins = parser._GetPluginsForDatabase(database)
+      finally:
+        database.Close()
+
+    # Note that the candidate plugins still need to check the required tables
+    # and columns.
+    plugin_names = [plugin.NAME for plugin in plugins]
+    self.assertEqual(plugin_names, [
+        'chrome_17_cookies', 'chrome_66_cookies', 'chrome_8_history'])
+
+    database_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(database_file_path)
+
+    database = sqlite.SQLiteDatabase('wal_database.db')
+    with open(database_file_path, 'rb') as database_file_object:
+      database.Open(database_file_object)
+
+      try:
+        plugins = parser._GetPluginsForDatabase(database)
+      finally:
+        database.Close()
+
+    self.assertEqual(plugins, [])
+
   def testParseFileEntry(self):
     """Tests the ParseFileEntry function."""
     parser = sqlite.SQLiteParser()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the SQLite virtual file system (VFS)."""
+
+import os
+import sqlite3
+import unittest
+
+try:
+  from plaso.parsers import sqlite_vfs
+except ImportError:
+  sqlite_vfs = None
+
+from tests import test_lib as shared_test_lib
+
+
+@unittest.skipIf(sqlite_vfs is None, 'missing apsw support')
+class SQLiteRowTest(shared_test_lib.BaseTestCase):
+  """Tests for the SQLite row."""
+
+  def testGetItem(self):
+    """Tests the __getitem__ function."""
+    row = sqlite_vfs.SQLiteRow(
+        ('Name', 'value', 'name'), {'name': 0, 'Name': 0, 'value': 1},
+        ('first', 1, 'second'))
+
+    self.assertEqual(row[0], 'first')
+    self.assertEqual(row[2], 'second')
+    self.assertEqual(row[1:], (1, 'second'))
+    self.assertEqual(row['Name'], 'first')
+    self.assertEqual(row['name'], 'first')
+    self.assertEqual(row['NAME'], 'first')
+    self.assertEqual(row['value'], 1)
+
+    with self.assertRaises(IndexError):
+      _ = row['bogus']
+
+    with self.assertRaises(IndexError):
+      _ = row[3]
+
+  def testIterAndLen(self):
+    """Tests the __iter__ and __len__ functions."""
+    row = sqlite_vfs.SQLiteRow(
+        ('name', 'value'), {'name': 0, 'value': 1}, ('first', 1))
+
+    self.assertEqual(len(row), 2)
+    self.assertEqual(list(row), ['first', 1])
+
+  def testKeys(self):
+    """Tests the keys function."""
+    row = sqlite_vfs.SQLiteRow(
+        ('Name', 'value'), {'name': 0, 'Name': 0, 'value': 1}, ('first', 1))
+
+    self.assertEqual(row.keys(), ['Name', 'value'])
+
+
+@unittest.skipIf(sqlite_vfs is None, 'missing apsw support')
+class ConnectTest(shared_test_lib.BaseTestCase):
+  """Tests for connecting to a SQLite database in file-like objects."""
+
+  def testConnectWithWAL(self):
+    """Tests the Connect function on a database with a WAL file."""
+    test_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_wal_file_path = self._GetTestFilePath(['wal_database.db-wal'])
+    self._SkipIfPathNotExists(test_wal_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      with open(test_wal_file_path, 'rb') as wal_file_object:
+        connection = sqlite_vfs.Connect(
+            file_object, wal_file_object=wal_file_object)
+
+        try:
+          cursor = connection.cursor()
+          cursor.execute('SELECT Field1, Field2 FROM MyTable WHERE Field2 > 11')
+          rows = cursor.fetchall()
+
+        finally:
+          connection.close()
+
+    row_results = [(row['Field1'], row['field2']) for row in rows]
+    self.assertEqual(row_results, [('New Text 1', 12), ('New Text 2', 13)])
+
+  def testConnectWithoutWAL(self):
+    """Tests the Connect function on a database without a WAL file."""
+    test_file_path = self._GetTestFilePath(['wal_database.db'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      connection = sqlite_vfs.Connect(file_object)
+
+      try:
+        cursor = connection.cursor()
+        cursor.execute('SELECT COUNT(*) AS number_of_rows FROM MyTable')
+        row = cursor.fetchone()
+        self.assertEqual(row['number_of_rows'], 10)
+        self.assertIsNone(cursor.fetchone())
+
+        with self.assertRaises(sqlite3.DatabaseError):
+          cursor.execute('SELECT * FROM bogus')
+
+        cursor.execute('SELECT * FROM MyTable WHERE Field2 < 0')
+        self.assertEqual(cursor.fetchall(), [])
+
+      finally:
+        connection.close()
+
+  def testConnectWithInvalidText(self):
+    """Tests the Connect function on a TEXT value that is not valid UTF-8."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_file_path = os.path.join(temp_directory, 'invalid_text.db')
+
+      database_connection = sqlite3.connect(test_file_path)
+      try:
+        database_connection.execute('CREATE TABLE MyTable (Field1 TEXT)')
+        database_connection.execute(
+            'INSERT INTO MyTable VALUES (CAST(X\'FF\' AS TEXT))')
+        database_connection.commit()
+      finally:
+        database_connection.close()
+
+      with open(test_file_path, 'rb') as file_object:
+        connection = sqlite_vfs.Connect(file_object)
+
+        try:
+          cursor = connection.cursor()
+          cursor.execute('SELECT Field1 FROM MyTable')
+
+          with self.assertRaises(sqlite3.DatabaseError):
+            cursor.fetchall()
+
+        finally:
+          connection.close()
+
+  def testConnectOnInvalidFile(self):
+    """Tests the Connect function on a file that is not a database."""
+    test_file_path = self._GetTestFilePath(['syslog'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      with self.assertRaises(sqlite3.DatabaseError):
+        connection = sqlite_vfs.Connect(file_object)
+        try:
+          connection.cursor().execute('SELECT * FROM sqlite_master')
+        finally:
+          connection.close()
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 """This file contains the tests for the generic text parser."""
 
+import os
 import unittest
 
 from dfvfs.file_io import fake_file_io
@@ -13,6 +14,47 @@ from plaso.parsers import text_parser
 from tests.parsers import test_lib
 
 
+class DataRangeFileObjectTest(test_lib.ParserTestCase):
+  """Tests for the data range file-like object."""
+
+  _TEST_DATA = b'Multiple lines\nof text\nin a single\nfile.'
+
+  def testReadAndSeek(self):
+    """Tests the read and seek functions."""
+    resolver_context = dfvfs_context.Context()
+
+    test_path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    file_object = fake_file_io.FakeFile(
+        resolver_context, test_path_spec, self._TEST_DATA)
+    file_object.Open()
+
+    data_range_file_object = text_parser.DataRangeFileObject(
+        file_object, 15, 8)
+
+    self.assertEqual(data_range_file_object.get_size(), 8)
+
+    data = data_range_file_object.read(3)
+    self.assertEqual(data, b'of ')
+    self.assertEqual(data_range_file_object.get_offset(), 3)
+
+    data = data_range_file_object.read()
+    self.assertEqual(data, b'text\n')
+
+    data = data_range_file_object.read()
+    self.assertEqual(data, b'')
+
+    data_range_file_object.seek(-2, os.SEEK_END)
+    data = data_range_file_object.read(100)
+    self.assertEqual(data, b't\n')
+
+    data_range_file_object.seek(0, os.SEEK_SET)
+    data = data_range_file_object.read()
+    self.assertEqual(data, b'of text\n')
+
+    with self.assertRaises(IOError):
+      data_range_file_object.seek(-1, os.SEEK_SET)
+
+
 class EncodedTextReaderTest(test_lib.ParserTestCase):
   """Tests for encoded text reader."""
 
@@ -45,6 +87,34 @@ class EncodedTextReaderTest(test_lib.ParserTestCase):
     escaped = '\\x{0:2x}'.format(exception.object[exception.start])
     return (escaped, exception.start + 1)
 
+  def testPeekLines(self):
+    """Tests the PeekLines function."""
+    resolver_context = dfvfs_context.Context()
+
+    test_path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    file_object = fake_file_io.FakeFile(
+        resolver_context, test_path_spec, self._TEST_DATA)
+    file_object.Open()
+
+    text_reader = text_parser.EncodedTextReader(file_object)
+    text_reader.ReadLines()
+
+    lines = text_reader.PeekLines()
+    self.assertEqual(lines, self._TEST_LINES)
+
+    lines = text_reader.PeekLines(maximum_size=10)
+    self.assertEqual(lines, self._TEST_LINES[:15])
+
+    text_reader.SkipAhead(10)
+
+    lines = text_reader.PeekLines(maximum_size=10)
+    self.assertEqual(lines, self._TEST_LINES[10:23])
+
+    lines = text_reader.PeekLines(maximum_size=100)
+    self.assertEqual(lines, self._TEST_LINES[10:])
+
+    self.assertEqual(text_reader.lines, self._TEST_LINES[10:])
+
   def testReadLine(self):
     """Tests the ReadLine function."""
     resolver_context = dfvfs_context.Context()
@@ -76,6 +146,16 @@ class EncodedTextReaderTest(test_lib.ParserTestCase):
     text_reader.ReadLines()
     self.assertEqual(text_reader.lines, self._TEST_LINES)
 
+    test_data = b'Multiple lines\r\nof\rtext\r\r\nfile.\r'
+    file_object = fake_file_io.FakeFile(
+        resolver_context, test_path_spec, test_data)
+    file_object.Open()
+
+    text_reader = text_parser.EncodedTextReader(file_object)
+
+    text_reader.ReadLines()
+    self.assertEqual(text_reader.lines, 'Multiple lines\nof\rtext\nfile.')
+
   def testSkipAhead(self):
     """Tests the SkipAhead function."""
     resolver_context = dfvfs_context.Context()
@@ -89,6 +169,12 @@ class EncodedTextReaderTest(test_lib.ParserTestCase):
 
     text_reader.SkipAhead(10)
     self.assertEqual(text_reader.lines, self._TEST_LINES[10:])
+    self.assertEqual(text_reader.lines_size, len(self._TEST_LINES) - 10)
+    self.assertEqual(text_reader.line_number, 0)
+
+    text_reader.SkipAhead(20)
+    self.assertEqual(text_reader.lines, self._TEST_LINES[30:])
+    self.assertEqual(text_reader.line_number, 2)
 
 
 class TextLogParserTest(test_lib.ParserTestCase):
@@ -121,6 +207,30 @@ class TextLogParserTest(test_lib.ParserTestCase):
     parser.EnablePlugins(['apache_access'])
     self.assertEqual(len(parser._plugins_per_name), 1)
 
+  def testGetDataRanges(self):
+    """Tests the _GetDataRanges function."""
+    parser = text_parser.TextLogParser()
+
+    resolver_context = dfvfs_context.Context()
+
+    test_path_spec = fake_path_spec.FakePathSpec(location='/file.txt')
+    file_object = fake_file_io.FakeFile(
+        resolver_context, test_path_spec,
+        b'Multiple lines\nof text\nin a single\nfile.')
+    file_object.Open()
+
+    data_ranges = parser._GetDataRanges(file_object, 10)
+    self.assertEqual(data_ranges, [(0, 15), (15, 20), (35, 5)])
+
+    data_ranges = parser._GetDataRanges(file_object, 15)
+    self.assertEqual(data_ranges, [(0, 15), (15, 20), (35, 5)])
+
+    data_ranges = parser._GetDataRanges(file_object, 16)
+    self.assertEqual(data_ranges, [(0, 23), (23, 17)])
+
+    data_ranges = parser._GetDataRanges(file_object, 100)
+    self.assertEqual(data_ranges, [(0, 40)])
+
   # TODO: add tests for ParseFileObject
 
 
@@ -2,19 +2,163 @@
 # -*- coding: utf-8 -*-
 """Tests for the text plugins interface."""
 
+import re
 import unittest
 
+import pyparsing
+
+from plaso.lib import errors
+from plaso.parsers import text_parser
+from plaso.parsers.text_plugins import interface
+
 from tests.parsers import test_lib
 
 
+class TestTextPlugin(interface.TextPlugin):
+  """Text parser plugin for testing purposes."""
+
+  NAME = 'test'
+
+  _LINE_STRUCTURES = [(
+      'line', pyparsing.Word(pyparsing.nums).setResultsName('value') +
+      pyparsing.Suppress(pyparsing.LineEnd()))]
+
+  _LINE_REGEXES = [('line', re.compile(r'(?P<value>[0-9]+)(?:\n|\Z)'))]
+
+  def _ParseRecord(self, parser_mediator, key, structure):
+    """Parses a pyparsing structure.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      key (str): name of the parsed structure.
+      structure (pyparsing.ParseResults): tokens from a parsed log line.
+    """
+    return
+
+  def CheckRequiredFormat(self, parser_mediator, text_reader):
+    """Check if the log record has the minimal structure required by the plugin.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      text_reader (EncodedTextReader): text reader.
+
+    Returns:
+      bool: True if this is the correct parser, False otherwise.
+    """
+    return True
+
+
+class TestMultiLineTextPlugin(interface.TextPlugin):
+  """Text parser plugin with records of multiple lines for testing purposes.
+
+  Attributes:
+    records (list[tuple[str, int]]): key and number of values of the parsed
+        records.
+  """
+
+  NAME = 'test_multi_line'
+
+  _LINE_STRUCTURES = [(
+      'record', pyparsing.Suppress(pyparsing.Literal('begin')) +
+      pyparsing.Suppress(pyparsing.LineEnd()) +
+      pyparsing.ZeroOrMore(
+          pyparsing.Word(pyparsing.nums) +
+          pyparsing.Suppress(pyparsing.LineEnd())).setResultsName('values') +
+      pyparsing.Suppress(pyparsing.Literal('end')) +
+      pyparsing.Suppress(pyparsing.LineEnd()))]
+
+  def __init__(self):
+    """Initializes a text parser plugin."""
+    super(TestMultiLineTextPlugin, self).__init__()
+    self.records = []
+
+  def _ParseRecord(self, parser_mediator, key, structure):
+    """Parses a pyparsing structure.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      key (str): name of the parsed structure.
+      structure (pyparsing.ParseResults): tokens from a parsed log line.
+    """
+    values = self._GetValueFromStructure(structure, 'values', default_value=[])
+    self.records.append((key, len(values)))
+
+  def CheckRequiredFormat(self, parser_mediator, text_reader):
+    """Check if the log record has the minimal structure required by the plugin.
+
+    Args:
+      parser_mediator (ParserMediator): mediates interactions between parsers
+          and other components, such as storage and dfVFS.
+      text_reader (EncodedTextReader): text reader.
+
+    Returns:
+      bool: True if this is the correct parser, False otherwise.
+    """
+    return True
+
+
 class TextPluginTest(test_lib.ParserTestCase):
   """Tests for the text plugins interface."""
 
   # pylint: disable=protected-access
 
+  def testParseString(self):
+    """Tests the _ParseString function."""
+    plugin = TestTextPlugin()
+
+    key, structure, start, end = plugin._ParseString('1234\n5678\n')
+    self.assertEqual(key, 'line')
+    self.assertEqual(structure, {'value': '1234'})
+    self.assertEqual(start, 0)
+    self.assertEqual(end, 5)
+
+    # Test a line that is only matched by the pyparsing grammar.
+    key, structure, start, end = plugin._ParseString(' 1234\n5678\n')
+    self.assertEqual(key, 'line')
+    self.assertIsInstance(structure, pyparsing.ParseResults)
+    self.assertEqual(structure.get('value', None), '1234')
+    self.assertEqual(start, 1)
+    self.assertEqual(end, 6)
+
+    with self.assertRaises(errors.ParseError):
+      plugin._ParseString('abcd\n5678\n')
+
   # TODO: add tests for _GetMatchingLineStructure
   # TODO: add tests for _GetValueFromStructure
-  # TODO: add tests for _ParseLines
+
+  def testParseLinesWithRecordBeyondWindow(self):
+    """Tests the _ParseLines function with a record beyond the peek window."""
+    plugin = TestMultiLineTextPlugin()
+
+    # The second record starts within and ends beyond the window of the lines
+    # buffer that is passed to pyparsing first.
+    window_size = text_parser.EncodedTextReader.BUFFER_SIZE
+    number_of_values = window_size // len('12345\n')
+
+    data = ''.join([
+        'begin\n', '1\n', 'end\n',
+        'begin\n', '12345\n' * number_of_values, 'end\n',
+        'begin\n', '2\n', 'end\n'])
+
+    file_object = self._CreateFileObject('test.log', data.encode('utf-8'))
+    text_reader = text_parser.EncodedTextReader(file_object)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    plugin._ParseLines(parser_mediator, text_reader)
+
+    self.assertEqual(plugin.records, [
+        ('record', 1), ('record', number_of_values), ('record', 1)])
+
+    number_of_warnings = storage_writer.GetNumberOfAttributeContainers(
+        'extraction_warning')
+    self.assertEqual(number_of_warnings, 0)
+
+  # TODO: add tests for _ParseLineStructure
   # TODO: add tests for _ParseLineStructure
   # TODO: add tests for _SetLineStructures
   # TODO: add tests for Process
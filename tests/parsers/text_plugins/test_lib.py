@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Text parser plugin related functions and classes for testing."""
 
+from dfdatetime import interface as dfdatetime_interface
+
 from plaso.containers import events
 from plaso.parsers import mediator as parsers_mediator
 from plaso.parsers import text_parser
@@ -11,6 +13,32 @@ from tests.parsers import test_lib
 class TextPluginTestCase(test_lib.ParserTestCase):
   """Text parser plugin test case."""
 
+  def _GetComparableEventDataValues(self, storage_writer):
+    """Retrieves comparable attribute values of the event data.
+
+    Args:
+      storage_writer (FakeStorageWriter): storage writer.
+
+    Returns:
+      list[dict[str, object]]: attribute values per event data, where date and
+          time values are represented as ISO 8601 date and time strings.
+    """
+    comparable_event_data_values = []
+    for event_data in storage_writer.GetAttributeContainers('event_data'):
+      event_data_values = {}
+      for name, value in event_data.GetAttributes():
+        if name.startswith('_'):
+          continue
+
+        if isinstance(value, dfdatetime_interface.DateTimeValues):
+          value = value.CopyToDateTimeStringISO8601()
+
+        event_data_values[name] = value
+
+      comparable_event_data_values.append(event_data_values)
+
+    return comparable_event_data_values
+
   def _ParseTextFileWithPlugin(self, path_segments, plugin):
     """Parses a file as a text log file and returns an event generator.
 
@@ -9,9 +9,42 @@ from plaso.parsers.text_plugins import winfirewall
 from tests.parsers.text_plugins import test_lib
 
 
+class PyparsingWinFirewallLogTextPlugin(winfirewall.WinFirewallLogTextPlugin):
+  """Windows firewall log text parser plugin that only uses pyparsing."""
+
+  def _GetStructureFromRegexMatch(self, key, match):
+    """Retrieves a structure from a line regular expression match.
+
+    Args:
+      key (str): name of the matched line regular expression.
+      match (re.Match): line regular expression match.
+
+    Returns:
+      dict[str, object]: None to force the use of the pyparsing grammar.
+    """
+    return None
+
+
 class WinFirewallLogTextPluginTest(test_lib.TextPluginTestCase):
   """Tests for the Windows firewall log text parser plugin."""
 
+  def testLineRegexes(self):
+    """Tests that the line regular expressions match the line structures."""
+    plugin = winfirewall.WinFirewallLogTextPlugin()
+    storage_writer = self._ParseTextFileWithPlugin(
+        ['windows_firewall.log'], plugin)
+
+    plugin = PyparsingWinFirewallLogTextPlugin()
+    pyparsing_storage_writer = self._ParseTextFileWithPlugin(
+        ['windows_firewall.log'], plugin)
+
+    event_data_values = self._GetComparableEventDataValues(storage_writer)
+    pyparsing_event_data_values = self._GetComparableEventDataValues(
+        pyparsing_storage_writer)
+
+    self.assertEqual(len(event_data_values), 15)
+    self.assertEqual(event_data_values, pyparsing_event_data_values)
+
   def testProcess(self):
     """Tests the Process function."""
     plugin = winfirewall.WinFirewallLogTextPlugin()
@@ -7,6 +7,9 @@ import unittest
 from artifacts import reader as artifacts_reader
 from artifacts import registry as artifacts_registry
 
+from dfwinreg import definitions as dfwinreg_definitions
+from dfwinreg import fake as dfwinreg_fake
+
 from plaso.engine import artifact_filters
 from plaso.parsers import winreg_parser
 # Register all plugins.
@@ -44,8 +47,42 @@ class WinRegistryParserTest(test_lib.ParserTestCase):
     # Extract 1 for the default plugin.
     self.assertEqual(len(parser._plugins_per_name), number_of_plugins - 1)
 
+    self.assertEqual(len(parser._filters_without_value_names), 0)
+    self.assertEqual(
+        sorted(parser._filters_per_value_name.keys()),
+        ['0', 'MRUList', 'Start'])
+
     parser.EnablePlugins(['appcompatcache'])
     self.assertEqual(len(parser._plugins_per_name), 1)
+    self.assertEqual(len(parser._filters_per_value_name), 0)
+
+  def testGetPluginWithoutKeyPath(self):
+    """Tests the _GetPluginWithoutKeyPath function."""
+    parser = winreg_parser.WinRegistryParser()
+    parser.EnablePlugins(parser.ALL_PLUGINS)
+
+    storage_writer = self._CreateStorageWriter()
+    parser_mediator = self._CreateParserMediator(storage_writer)
+
+    registry_key = dfwinreg_fake.FakeWinRegistryKey('Services')
+
+    plugin = parser._GetPluginWithoutKeyPath(parser_mediator, registry_key)
+    self.assertIsNone(plugin)
+
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'Start', data_type=dfwinreg_definitions.REG_DWORD)
+    registry_key.AddValue(registry_value)
+
+    plugin = parser._GetPluginWithoutKeyPath(parser_mediator, registry_key)
+    self.assertIsNone(plugin)
+
+    registry_value = dfwinreg_fake.FakeWinRegistryValue(
+        'Type', data_type=dfwinreg_definitions.REG_DWORD)
+    registry_key.AddValue(registry_value)
+
+    plugin = parser._GetPluginWithoutKeyPath(parser_mediator, registry_key)
+    self.assertIsNotNone(plugin)
+    self.assertEqual(plugin.NAME, 'windows_services')
 
   def testParse(self):
     """Test the parse function on a Windows NT Registry file."""
@@ -22,6 +22,11 @@ class BaseWindowsRegistryKeyFilterTest(test_lib.RegistryPluginTestCase):
     path_filter = interface.BaseWindowsRegistryKeyFilter()
     self.assertEqual(path_filter.key_paths, [])
 
+  def testValueNames(self):
+    """Tests the value_names property."""
+    path_filter = interface.BaseWindowsRegistryKeyFilter()
+    self.assertEqual(path_filter.value_names, frozenset())
+
 
 class WindowsRegistryKeyPathFilterTest(test_lib.RegistryPluginTestCase):
   """Tests for the Windows Registry key path filter."""
@@ -187,6 +192,12 @@ class WindowsRegistryKeyWithValuesFilterTest(test_lib.RegistryPluginTestCase):
     result = path_filter.Match(registry_key)
     self.assertTrue(result)
 
+  def testValueNames(self):
+    """Tests the value_names property."""
+    path_filter = interface.WindowsRegistryKeyWithValuesFilter(
+        ('a', 'MRUList'))
+    self.assertEqual(path_filter.value_names, frozenset(['a', 'MRUList']))
+
 
 class WindowsRegistryPluginTest(test_lib.RegistryPluginTestCase):
   """Tests for the Windows Registry plugin interface."""
@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""Tests for the MessagePack attribute container serializer."""
+
+import collections
+import unittest
+
+from acstore.containers import interface as containers_interface
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+try:
+  import msgpack
+except ImportError:
+  msgpack = None
+
+from plaso.containers import event_sources
+from plaso.containers import events
+from plaso.containers import reports
+from plaso.serializer import msgpack_serializer
+
+from tests import test_lib as shared_test_lib
+
+
+@unittest.skipIf(msgpack is None, 'missing msgpack support')
+class MessagePackAttributeContainerSerializerTest(
+    shared_test_lib.BaseTestCase):
+  """Tests for the MessagePack attribute container serializer."""
+
+  # pylint: disable=protected-access
+
+  _SERIALIZER = msgpack_serializer.MessagePackAttributeContainerSerializer
+
+  def testReadAndWriteSerializedAnalysisReport(self):
+    """Test ReadSerialized and WriteSerialized of AnalysisReport."""
+    expected_analysis_report = reports.AnalysisReport(
+        plugin_name='test', text='Report text')
+    expected_analysis_report.analysis_counter = collections.Counter({
+        'first': 5, 'second': 2})
+    expected_analysis_report.time_compiled = 1431978243000000
+
+    serialized_data = self._SERIALIZER.WriteSerialized(
+        expected_analysis_report)
+    self.assertIsNotNone(serialized_data)
+
+    analysis_report = self._SERIALIZER.ReadSerialized(serialized_data)
+    self.assertIsNotNone(analysis_report)
+    self.assertIsInstance(analysis_report, reports.AnalysisReport)
+
+    self.assertIsInstance(
+        analysis_report.analysis_counter, collections.Counter)
+    self.assertEqual(
+        analysis_report.analysis_counter,
+        expected_analysis_report.analysis_counter)
+    self.assertEqual(analysis_report.plugin_name, 'test')
+    self.assertEqual(analysis_report.text, 'Report text')
+    self.assertEqual(analysis_report.time_compiled, 1431978243000000)
+
+  def testReadAndWriteSerializedEventData(self):
+    """Test ReadSerialized and WriteSerialized of EventData."""
+    event_data_stream_identifier = (
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data_stream', sequence_number=1))
+
+    expected_event_data = events.EventData()
+    expected_event_data._ignored = 'Not serialized'
+    expected_event_data._parser_chain = 'test_parser'
+    expected_event_data.data_type = 'test:event2'
+    expected_event_data.SetEventDataStreamIdentifier(
+        event_data_stream_identifier)
+
+    expected_event_data.empty_string = ''
+    expected_event_data.zero_integer = 0
+    expected_event_data.integer = 34
+    expected_event_data.float = -122.082203542683
+    expected_event_data.string = 'Normal string'
+    expected_event_data.unicode_string = 'And I am a unicorn.'
+    expected_event_data.my_list = ['asf', 4234, 2, 54, 'asf']
+    expected_event_data.a_tuple = ('some item', [234, 52, 15])
+    expected_event_data.null_value = None
+    expected_event_data.written_time = dfdatetime_posix_time.PosixTime(
+        timestamp=1621839644)
+
+    serialized_data = self._SERIALIZER.WriteSerialized(expected_event_data)
+    self.assertIsNotNone(serialized_data)
+
+    event_data = self._SERIALIZER.ReadSerialized(serialized_data)
+    self.assertIsNotNone(event_data)
+    self.assertIsInstance(event_data, events.EventData)
+
+    identifier = event_data.GetEventDataStreamIdentifier()
+    self.assertIsNotNone(identifier)
+    self.assertEqual(identifier.CopyToString(), 'event_data_stream.1')
+
+    written_time = event_data.written_time
+    self.assertIsInstance(written_time, dfdatetime_posix_time.PosixTime)
+    self.assertEqual(written_time.timestamp, 1621839644)
+
+    expected_event_data_dict = {
+        '_parser_chain': 'test_parser',
+        'a_tuple': ('some item', [234, 52, 15]),
+        'data_type': 'test:event2',
+        'empty_string': '',
+        'integer': 34,
+        'float': -122.082203542683,
+        'my_list': ['asf', 4234, 2, 54, 'asf'],
+        'string': 'Normal string',
+        'unicode_string': 'And I am a unicorn.',
+        'zero_integer': 0}
+
+    event_data_dict = event_data.CopyToDict()
+    del event_data_dict['_event_data_stream_identifier']
+    del event_data_dict['written_time']
+
+    self.assertEqual(event_data_dict, expected_event_data_dict)
+
+    expected_event_data.unsupported = b'bytes'
+
+    serialized_data = self._SERIALIZER.WriteSerialized(expected_event_data)
+    with self.assertRaises(ValueError):
+      self._SERIALIZER.ReadSerialized(serialized_data)
+
+  def testReadAndWriteSerializedEventSource(self):
+    """Test ReadSerialized and WriteSerialized of EventSource."""
+    test_file = self._GetTestFilePath(['ímynd.dd'])
+
+    volume_path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_OS, location=test_file)
+    path_spec = path_spec_factory.Factory.NewPathSpec(
+        dfvfs_definitions.TYPE_INDICATOR_TSK, inode=15, location='/',
+        parent=volume_path_spec)
+
+    expected_event_source = event_sources.FileEntryEventSource(
+        file_entry_type=dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY,
+        path_spec=path_spec)
+
+    serialized_data = self._SERIALIZER.WriteSerialized(expected_event_source)
+    self.assertIsNotNone(serialized_data)
+
+    event_source = self._SERIALIZER.ReadSerialized(serialized_data)
+    self.assertIsNotNone(event_source)
+    self.assertIsInstance(event_source, event_sources.EventSource)
+
+    self.assertEqual(
+        event_source.file_entry_type,
+        dfvfs_definitions.FILE_ENTRY_TYPE_DIRECTORY)
+    self.assertEqual(event_source.path_spec.comparable, path_spec.comparable)
+
+  def testReadSerialized(self):
+    """Tests the ReadSerialized function."""
+    attribute_container = self._SERIALIZER.ReadSerialized(b'')
+    self.assertIsNone(attribute_container)
+
+    serialized_data = msgpack.packb(['not', 'an', 'attribute', 'container'])
+    with self.assertRaises(TypeError):
+      self._SERIALIZER.ReadSerialized(serialized_data)
+
+    serialized_data = msgpack.packb(msgpack.ExtType(99, b''))
+    with self.assertRaises(ValueError):
+      self._SERIALIZER.ReadSerialized(serialized_data)
+
+  def testWriteSerialized(self):
+    """Tests the WriteSerialized function."""
+    event_data = events.EventData()
+    event_data.unsupported = object()
+
+    with self.assertRaises(TypeError):
+      self._SERIALIZER.WriteSerialized(event_data)
+
+
+if __name__ == '__main__':
+  unittest.main()
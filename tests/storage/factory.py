@@ -4,6 +4,7 @@
 
 import unittest
 
+from plaso.lib import definitions
 from plaso.storage import factory
 from plaso.storage.sqlite import reader as sqlite_reader
 from plaso.storage.sqlite import writer as sqlite_writer
@@ -32,6 +33,31 @@ class StorageFactoryTest(test_lib.StorageTestCase):
         test_file_path)
     self.assertIsInstance(storage_reader, sqlite_writer.SQLiteStorageFileWriter)
 
+  # pylint: disable=protected-access
+
+  def testCreateTaskStorageWriter(self):
+    """Test the CreateTaskStorageWriter function."""
+    storage_writer = factory.StorageFactory.CreateTaskStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE)
+    self.assertIsInstance(storage_writer, sqlite_writer.SQLiteStorageFileWriter)
+    self.assertEqual(
+        storage_writer._compression_format,
+        definitions.COMPRESSION_FORMAT_ZLIB)
+    self.assertEqual(
+        storage_writer._serialization_format,
+        definitions.SERIALIZER_FORMAT_JSON)
+
+    storage_writer = factory.StorageFactory.CreateTaskStorageWriter(
+        definitions.STORAGE_FORMAT_SQLITE,
+        serialization_format=definitions.SERIALIZER_FORMAT_MSGPACK)
+    self.assertIsInstance(storage_writer, sqlite_writer.SQLiteStorageFileWriter)
+    self.assertEqual(
+        storage_writer._compression_format,
+        definitions.COMPRESSION_FORMAT_NONE)
+    self.assertEqual(
+        storage_writer._serialization_format,
+        definitions.SERIALIZER_FORMAT_MSGPACK)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -140,6 +140,43 @@ class FakeStorageWriterTest(test_lib.StorageTestCase):
 
     # TODO: add test with time range.
 
+  def testGetSortedJoinedEvents(self):
+    """Tests the GetSortedJoinedEvents function."""
+    storage_writer = fake_writer.FakeStorageWriter()
+    storage_writer.Open()
+
+    try:
+      test_events = self._AddTestEvents(storage_writer)
+
+      event_tag = events.EventTag()
+      event_tag.AddLabel('Malware')
+      event_tag.SetEventIdentifier(test_events[0].GetIdentifier())
+      storage_writer.AddAttributeContainer(event_tag)
+
+      joined_events = list(storage_writer.GetSortedJoinedEvents())
+      self.assertEqual(len(joined_events), 4)
+
+      number_of_event_tags = 0
+      for event, event_data, event_data_stream, event_tag in joined_events:
+        self.assertEqual(
+            event_data.GetIdentifier().CopyToString(),
+            event.GetEventDataIdentifier().CopyToString())
+        self.assertEqual(
+            event_data_stream.GetIdentifier().CopyToString(),
+            event_data.GetEventDataStreamIdentifier().CopyToString())
+
+        if event_tag:
+          self.assertEqual(
+              event_tag.GetEventIdentifier().CopyToString(),
+              event.GetIdentifier().CopyToString())
+          self.assertEqual(event_tag.labels, ['Malware'])
+          number_of_event_tags += 1
+
+      self.assertEqual(number_of_event_tags, 1)
+
+    finally:
+      storage_writer.Close()
+
   def testOpenClose(self):
     """Tests the Open and Close functions."""
     storage_writer = fake_writer.FakeStorageWriter()
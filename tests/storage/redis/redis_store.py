@@ -378,6 +378,103 @@ class RedisStoreTest(test_lib.StorageTestCase):
       retrieved_events = list(test_store.GetSortedEvents())
       self.assertEqual(len(retrieved_events), 4)
 
+      timestamps = [event.timestamp for event in retrieved_events]
+      self.assertEqual(timestamps, sorted(timestamps))
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
+  def testGetSortedEventTimestamps(self):
+    """Tests the GetSortedEventTimestamps method."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=task.session_identifier,
+        task_identifier=task.identifier)
+
+    # Retrieve the event index in multiple pages.
+    test_store._MAXIMUM_NUMBER_OF_EVENT_INDEX_ITEMS = 64
+
+    try:
+      # Add more events than fit in a listpack encoded sorted set, in an order
+      # that differs from the timestamp order.
+      expected_timestamps = []
+      for index in range(300):
+        event = events.EventObject()
+        event.timestamp = 1340821021000000 + ((index * 7919) % 300) * 1000000
+        test_store.AddAttributeContainer(event)
+
+        expected_timestamps.append(event.timestamp)
+
+      expected_timestamps = sorted(expected_timestamps)
+
+      timestamps = list(test_store.GetSortedEventTimestamps())
+      self.assertEqual(timestamps, expected_timestamps)
+
+      timestamps = [event.timestamp for event in test_store.GetSortedEvents()]
+      self.assertEqual(timestamps, expected_timestamps)
+
+    finally:
+      test_store.Close()
+
+      self._RemoveSessionData(redis_client, session.identifier)
+
+  def testGetSortedJoinedEvents(self):
+    """Tests the GetSortedJoinedEvents method."""
+    redis_client = self._CreateRedisClient()
+
+    session = sessions.Session()
+    task = tasks.Task(session_identifier=session.identifier)
+
+    test_store = redis_store.RedisStore()
+    test_store.Open(
+        redis_client=redis_client, session_identifier=task.session_identifier,
+        task_identifier=task.identifier)
+
+    try:
+      for event, event_data, event_data_stream in (
+          containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+        test_store.AddAttributeContainer(event_data_stream)
+
+        event_data.SetEventDataStreamIdentifier(
+            event_data_stream.GetIdentifier())
+        test_store.AddAttributeContainer(event_data)
+
+        event.SetEventDataIdentifier(event_data.GetIdentifier())
+        test_store.AddAttributeContainer(event)
+
+      event_tag = events.EventTag()
+      event_tag.AddLabel('Malware')
+      event_tag.SetEventIdentifier(event.GetIdentifier())
+      test_store.AddAttributeContainer(event_tag)
+
+      test_events = list(test_store.GetSortedJoinedEvents())
+      self.assertEqual(len(test_events), 4)
+
+      number_of_event_tags = 0
+      for event, event_data, event_data_stream, event_tag in test_events:
+        self.assertEqual(
+            event_data.GetIdentifier().CopyToString(),
+            event.GetEventDataIdentifier().CopyToString())
+        self.assertEqual(
+            event_data_stream.GetIdentifier().CopyToString(),
+            event_data.GetEventDataStreamIdentifier().CopyToString())
+
+        if event_tag:
+          self.assertEqual(
+              event_tag.GetEventIdentifier().CopyToString(),
+              event.GetIdentifier().CopyToString())
+          self.assertEqual(event_tag.labels, ['Malware'])
+          number_of_event_tags += 1
+
+      self.assertEqual(number_of_event_tags, 1)
+
     finally:
       test_store.Close()
 
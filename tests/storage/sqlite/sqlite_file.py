@@ -2,11 +2,22 @@
 # -*- coding: utf-8 -*-
 """Tests for the SQLite-based storage."""
 
+import ast
 import os
+import shutil
 import unittest
 
+from acstore.containers import interface as containers_interface
+
+from dfvfs.lib import definitions as dfvfs_definitions
+from dfvfs.path import factory as path_spec_factory
+
+from plaso.containers import event_sources
 from plaso.containers import events
+from plaso.containers import tasks
 from plaso.lib import definitions
+from plaso.serializer import msgpack_serializer
+from plaso.storage import time_range as storage_time_range
 from plaso.storage.sqlite import sqlite_file
 
 from tests import test_lib as shared_test_lib
@@ -54,6 +65,32 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       test_store._CacheAttributeContainerByIndex(event_data_stream, 0)
       self.assertEqual(len(test_store._attribute_container_cache), 1)
 
+  def testCacheAttributeContainerForWrite(self):
+    """Tests the _CacheAttributeContainerForWrite function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for _ in range(1500):
+          event_data = events.EventData()
+          test_store._WriteNewAttributeContainer(event_data)
+
+        # The first 999 attribute containers with a single column are written
+        # with a single query.
+        write_cache = test_store._write_cache.get(
+            events.EventData.CONTAINER_TYPE, None)
+        self.assertIsNotNone(write_cache)
+        self.assertEqual(len(write_cache), 502)
+
+        containers = list(test_store.GetAttributeContainers(
+            events.EventData.CONTAINER_TYPE))
+        self.assertEqual(len(containers), 1500)
+
+      finally:
+        test_store.Close()
+
   def testCheckStorageMetadata(self):
     """Tests the _CheckStorageMetadata function."""
     with shared_test_lib.TempDirectory():
@@ -65,6 +102,23 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
           'serialization_format': definitions.SERIALIZER_FORMAT_JSON}
       test_store._CheckStorageMetadata(metadata_values)
 
+      self.assertEqual(
+          metadata_values['format_version'], test_store._FORMAT_VERSION)
+
+      if msgpack_serializer.msgpack:
+        metadata_values['format_version'] = '{0:d}'.format(
+            test_store._FORMAT_VERSION)
+        metadata_values['serialization_format'] = (
+            definitions.SERIALIZER_FORMAT_MSGPACK)
+        test_store._CheckStorageMetadata(metadata_values)
+
+        self.assertEqual(
+            metadata_values['serialization_format'],
+            definitions.SERIALIZER_FORMAT_MSGPACK)
+
+        metadata_values['serialization_format'] = (
+            definitions.SERIALIZER_FORMAT_JSON)
+
       metadata_values['format_version'] = 'bogus'
       with self.assertRaises(IOError):
         test_store._CheckStorageMetadata(metadata_values)
@@ -196,6 +250,27 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _RaiseIfNotReadable
   # TODO: add tests for _RaiseIfNotWritable
   # TODO: add tests for _ReadAndCheckStorageMetadata
+
+  def testReadMissingColumnNames(self):
+    """Tests the _ReadMissingColumnNames function."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    test_store = sqlite_file.SQLiteStorageFile()
+    test_store.Open(path=test_file_path)
+
+    try:
+      test_store._ReadMissingColumnNames()
+
+      self.assertEqual(test_store._missing_column_names, {
+          'event_source': set(['file_size'])})
+
+      schema = test_store._GetAttributeContainerSchema('event_source')
+      self.assertNotIn('file_size', schema)
+
+    finally:
+      test_store.Close()
+
   # TODO: add tests for _SerializeAttributeContainer
   # TODO: add tests for _UpdateEventAfterDeserialize
   # TODO: add tests for _UpdateEventBeforeSerialize
@@ -203,7 +278,62 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
   # TODO: add tests for _UpdateEventDataBeforeSerialize
   # TODO: add tests for _UpdateEventTagAfterDeserialize
   # TODO: add tests for _UpdateEventTagBeforeSerialize
-  # TODO: add tests for _UpdateStorageMetadataFormatVersion
+
+  def testUpdateStorageMetadataFormatVersion(self):
+    """Tests the _UpdateStorageMetadataFormatVersion function."""
+    test_file_path = self._GetTestFilePath(['psort_test.plaso'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'psort_test.plaso')
+      shutil.copyfile(test_file_path, test_path)
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        # The event source table of the format version 20230327 store is
+        # upgraded with a file size column.
+        event_source = event_sources.FileEntryEventSource(
+            file_entry_type='file', file_size=1024)
+        event_source.path_spec = path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location='/tmp/test.txt')
+        test_store.AddAttributeContainer(event_source)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(test_store.format_version, test_store._FORMAT_VERSION)
+
+        file_sizes = [
+            event_source.file_size
+            for event_source in test_store.GetAttributeContainers(
+                event_source.CONTAINER_TYPE)]
+        self.assertEqual(file_sizes[-1], 1024)
+        self.assertIsNone(file_sizes[0])
+
+      finally:
+        test_store.Close()
+
+  def testPythonAST2SQL(self):
+    """Tests the _PythonAST2SQL function."""
+    test_store = sqlite_file.SQLiteStorageFile()
+
+    expression_ast = ast.parse(
+        '(timestamp >= 5 and timestamp < 10) or timestamp_desc == "Bogus\'s"',
+        mode='eval')
+    sql_expression = test_store._PythonAST2SQL(expression_ast.body)
+    self.assertEqual(sql_expression, (
+        '((timestamp >= 5) AND (timestamp < 10)) OR '
+        '(timestamp_desc = \'Bogus\'\'s\')'))
+
+    expression_ast = ast.parse('timestamp in [5, 10]', mode='eval')
+    with self.assertRaises(TypeError):
+      test_store._PythonAST2SQL(expression_ast.body)
 
   def testWriteExistingAttributeContainer(self):
     """Tests the _WriteExistingAttributeContainer function."""
@@ -288,6 +418,59 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for CheckSupportedFormat
 
+  def testCreateEventTimestampIndex(self):
+    """Tests the CreateEventTimestampIndex function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        # Creating the index without an event table should not fail.
+        test_store.CreateEventTimestampIndex()
+
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+        test_store.CreateEventTimestampIndex()
+
+        # Creating the index a second time should not fail.
+        test_store.CreateEventTimestampIndex()
+
+        query = (
+            'SELECT name FROM sqlite_master WHERE type = "index" AND '
+            'tbl_name = "event"')
+        test_store._cursor.execute(query)
+        index_names = [row[0] for row in test_store._cursor.fetchall()]
+        self.assertEqual(index_names, ['event_per_timestamp'])
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        test_events = list(test_store.GetSortedEvents())
+        self.assertEqual(len(test_events), 4)
+
+        timestamps = [event.timestamp for event in test_events]
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        with self.assertRaises(IOError):
+          test_store.CreateEventTimestampIndex()
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainers(self):
     """Tests the GetAttributeContainers function."""
     event_data_stream = events.EventDataStream()
@@ -327,6 +510,32 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetAttributeContainersWithMissingColumns(self):
+    """Tests GetAttributeContainers on stores without a file_size column."""
+    for filename in ('pinfo_test.plaso', 'psort_test.plaso'):
+      test_file_path = self._GetTestFilePath([filename])
+      self._SkipIfPathNotExists(test_file_path)
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_file_path)
+
+      try:
+        event_sources_list = list(test_store.GetAttributeContainers(
+            'event_source'))
+        self.assertGreater(len(event_sources_list), 0)
+
+        for event_source in event_sources_list:
+          self.assertIsNotNone(event_source.path_spec)
+          self.assertIsNone(event_source.file_size)
+
+        event_source = test_store.GetAttributeContainerByIndex(
+            'event_source', 0)
+        self.assertIsNotNone(event_source)
+        self.assertIsNone(event_source.file_size)
+
+      finally:
+        test_store.Close()
+
   def testGetAttributeContainerByIdentifier(self):
     """Tests the GetAttributeContainerByIdentifier function."""
     event_data_stream = events.EventDataStream()
@@ -411,6 +620,38 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testGetNumberOfEvents(self):
+    """Tests the GetNumberOfEvents function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        number_of_events = test_store.GetNumberOfEvents()
+        self.assertEqual(number_of_events, 0)
+
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+        number_of_events = test_store.GetNumberOfEvents()
+        self.assertEqual(number_of_events, 4)
+
+        time_range = storage_time_range.TimeRange(0, 1293840000000000)
+        number_of_events = test_store.GetNumberOfEvents(time_range=time_range)
+        self.assertEqual(number_of_events, 1)
+
+      finally:
+        test_store.Close()
+
   def testGetSortedEvents(self):
     """Tests the GetSortedEvents function."""
     with shared_test_lib.TempDirectory() as temp_directory:
@@ -440,10 +681,124 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
         test_events = list(test_store.GetSortedEvents())
         self.assertEqual(len(test_events), 4)
 
+        # Note that a start timestamp of 0 is a valid boundary.
+        time_range = storage_time_range.TimeRange(0, 1293840000000000)
+        test_events = list(test_store.GetSortedEvents(time_range=time_range))
+        self.assertEqual(len(test_events), 1)
+
+        test_events = list(test_store.GetSortedEvents(
+            filter_expression='timestamp >= 1334961526929596'))
+        self.assertEqual(len(test_events), 2)
+
+        time_range = storage_time_range.TimeRange(0, 1334961526929596)
+        test_events = list(test_store.GetSortedEvents(
+            filter_expression=(
+                'timestamp == 1334961526929596 or '
+                'timestamp < 1300000000000000'),
+            time_range=time_range))
+        self.assertEqual(len(test_events), 2)
+
+        test_events = list(test_store.GetSortedEvents(
+            filter_expression='timestamp_desc == "Bogus\'s Time"'))
+        self.assertEqual(len(test_events), 0)
+
       finally:
         test_store.Close()
 
-    # TODO: add test with time range.
+  def testGetSortedEventTimestamps(self):
+    """Tests the GetSortedEventTimestamps function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        timestamps = list(test_store.GetSortedEventTimestamps())
+        self.assertEqual(len(timestamps), 4)
+        self.assertEqual(timestamps, sorted(timestamps))
+
+        expected_timestamps = sorted(
+            event.timestamp for event in test_store.GetSortedEvents())
+        self.assertEqual(timestamps, expected_timestamps)
+
+      finally:
+        test_store.Close()
+
+  def testGetSortedJoinedEvents(self):
+    """Tests the GetSortedJoinedEvents function."""
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        for event, event_data, event_data_stream in (
+            containers_test_lib.CreateEventsFromValues(self._TEST_EVENTS)):
+          test_store.AddAttributeContainer(event_data_stream)
+
+          event_data.SetEventDataStreamIdentifier(
+              event_data_stream.GetIdentifier())
+          test_store.AddAttributeContainer(event_data)
+
+          event.SetEventDataIdentifier(event_data.GetIdentifier())
+          test_store.AddAttributeContainer(event)
+
+        event_tag = events.EventTag()
+        event_tag.AddLabel('Malware')
+        event_tag.SetEventIdentifier(event.GetIdentifier())
+        test_store.AddAttributeContainer(event_tag)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      # Ensure the events are joined with multiple pages.
+      test_store._MAXIMUM_JOINED_EVENTS_PER_PAGE = 3
+
+      try:
+        test_events = list(test_store.GetSortedJoinedEvents())
+        self.assertEqual(len(test_events), 4)
+
+        number_of_event_tags = 0
+        for event, event_data, event_data_stream, event_tag in test_events:
+          self.assertEqual(
+              event_data.GetIdentifier().CopyToString(),
+              event.GetEventDataIdentifier().CopyToString())
+          self.assertEqual(
+              event_data_stream.GetIdentifier().CopyToString(),
+              event_data.GetEventDataStreamIdentifier().CopyToString())
+
+          if event_tag:
+            self.assertEqual(
+                event_tag.GetEventIdentifier().CopyToString(),
+                event.GetIdentifier().CopyToString())
+            self.assertEqual(event_tag.labels, ['Malware'])
+            number_of_event_tags += 1
+
+        self.assertEqual(number_of_event_tags, 1)
+
+      finally:
+        test_store.Close()
 
   def testHasAttributeContainers(self):
     """Tests the HasAttributeContainers function."""
@@ -473,6 +828,57 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
 
   # TODO: add tests for Open and Close
 
+  @unittest.skipIf(
+      msgpack_serializer.msgpack is None, 'missing msgpack support')
+  def testSetSerializationFormat(self):
+    """Tests the SetSerializationFormat function."""
+    event_data_stream_identifier = (
+        containers_interface.AttributeContainerIdentifier(
+            name='event_data_stream', sequence_number=1))
+
+    with shared_test_lib.TempDirectory() as temp_directory:
+      test_path = os.path.join(temp_directory, 'plaso.sqlite')
+      test_store = sqlite_file.SQLiteStorageFile()
+
+      with self.assertRaises(ValueError):
+        test_store.SetSerializationFormat('bogus')
+
+      test_store.SetSerializationFormat(definitions.SERIALIZER_FORMAT_MSGPACK)
+      test_store.Open(path=test_path, read_only=False)
+
+      try:
+        with self.assertRaises(IOError):
+          test_store.SetSerializationFormat(
+              definitions.SERIALIZER_FORMAT_JSON)
+
+        event_data = events.EventData(data_type='test:event')
+        event_data.SetEventDataStreamIdentifier(event_data_stream_identifier)
+        test_store.AddAttributeContainer(event_data)
+
+      finally:
+        test_store.Close()
+
+      test_store = sqlite_file.SQLiteStorageFile()
+      test_store.Open(path=test_path)
+
+      try:
+        self.assertEqual(
+            test_store.serialization_format,
+            definitions.SERIALIZER_FORMAT_MSGPACK)
+
+        containers = list(test_store.GetAttributeContainers(
+            events.EventData.CONTAINER_TYPE))
+        self.assertEqual(len(containers), 1)
+
+        self.assertEqual(containers[0].data_type, 'test:event')
+
+        identifier = containers[0].GetEventDataStreamIdentifier()
+        self.assertIsNotNone(identifier)
+        self.assertEqual(identifier.CopyToString(), 'event_data_stream.1')
+
+      finally:
+        test_store.Close()
+
   def testUpdateAttributeContainer(self):
     """Tests the UpdateAttributeContainer function."""
     event_data_stream = events.EventDataStream()
@@ -502,6 +908,44 @@ class SQLiteStorageFileTest(test_lib.StorageTestCase):
       finally:
         test_store.Close()
 
+  def testUpdateAttributeContainerWithPathSpecs(self):
+    """Tests the UpdateAttributeContainer function with path specifications."""
+    serialization_formats = [definitions.SERIALIZER_FORMAT_JSON]
+    if msgpack_serializer.msgpack:
+      serialization_formats.append(definitions.SERIALIZER_FORMAT_MSGPACK)
+
+    path_specs = [
+        path_spec_factory.Factory.NewPathSpec(
+            dfvfs_definitions.TYPE_INDICATOR_OS, location=location)
+        for location in ('/tmp/test1.txt', '/tmp/test2.txt')]
+
+    for serialization_format in serialization_formats:
+      task = tasks.Task()
+      task.path_spec = path_specs[0]
+
+      with shared_test_lib.TempDirectory() as temp_directory:
+        test_path = os.path.join(temp_directory, 'plaso.sqlite')
+        test_store = sqlite_file.SQLiteStorageFile()
+        test_store.SetSerializationFormat(serialization_format)
+        test_store.Open(path=test_path, read_only=False)
+
+        try:
+          test_store.AddAttributeContainer(task)
+
+          task.aborted = True
+          task.path_specs = path_specs
+          test_store.UpdateAttributeContainer(task)
+
+          containers = list(test_store.GetAttributeContainers(
+              task.CONTAINER_TYPE))
+          self.assertEqual(len(containers), 1)
+          self.assertTrue(containers[0].aborted)
+          self.assertEqual(containers[0].path_spec, path_specs[0])
+          self.assertEqual(containers[0].path_specs, path_specs)
+
+        finally:
+          test_store.Close()
+
   def testVersionCompatibility(self):
     """Tests the version compatibility methods."""
     with shared_test_lib.TempDirectory() as temp_directory:
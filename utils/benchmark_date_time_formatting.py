@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the formatting of event date and time values."""
+
+import argparse
+import calendar
+import random
+import sys
+import time
+
+from dfdatetime import posix_time as dfdatetime_posix_time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from plaso.containers import events
+from plaso.output import dynamic
+from plaso.output import l2t_csv
+from plaso.output import mediator
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the formatting of event date and time values in different '
+      'time zones.'))
+
+  argument_parser.add_argument(
+      '--number_of_events', '--number-of-events', dest='number_of_events',
+      type=int, action='store', default=100000, metavar='NUMBER', help=(
+          'number of events, spread over a year, to format per time zone.'))
+
+  argument_parser.add_argument(
+      '--time_zones', '--time-zones', dest='time_zones', type=str,
+      action='store', default=(
+          'UTC,Europe/Amsterdam,America/New_York,Asia/Kathmandu,'
+          'Australia/Lord_Howe'), metavar='NAMES', help=(
+              'comma separated list of time zones to format in.'))
+
+  argument_parser.add_argument(
+      '--year', dest='year', type=int, action='store', default=2021,
+      metavar='YEAR', help='year of the events.')
+
+  options = argument_parser.parse_args()
+
+  first_timestamp = calendar.timegm((options.year, 1, 1, 0, 0, 0)) * 1000000
+  last_timestamp = calendar.timegm((
+      options.year + 1, 1, 1, 0, 0, 0)) * 1000000
+
+  # Events are formatted in chronological order, as psort does.
+  random.seed(0)
+  timestamps = sorted(
+      random.randrange(first_timestamp, last_timestamp)
+      for _ in range(options.number_of_events))
+
+  field_formatting_helpers = [
+      ('dynamic', dynamic.DynamicFieldFormattingHelper(), True, [
+          'datetime']),
+      ('dynamic', dynamic.DynamicFieldFormattingHelper(), False, [
+          'datetime', 'date', 'time']),
+      ('l2tcsv', l2t_csv.L2TCSVFieldFormattingHelper(), False, [
+          'date', 'time'])]
+
+  print('Formatting {0:d} events in {1:d}'.format(
+      len(timestamps), options.year))
+  print('')
+  print('{0:<22s}\t{1:<8s}\t{2:<18s}\t{3:>8s}\t{4:>10s}'.format(
+      'Time zone', 'Format', 'Field', 'Seconds', 'Events/s'))
+
+  for time_zone_name in options.time_zones.split(','):
+    for (output_format, field_formatting_helper, dynamic_time,
+         field_names) in field_formatting_helpers:
+      output_mediator = mediator.OutputMediator(
+          None, dynamic_time=dynamic_time)
+      output_mediator.SetTimeZone(time_zone_name)
+
+      for field_name in field_names:
+        if dynamic_time:
+          field_name_string = '{0:s} (dynamic)'.format(field_name)
+        else:
+          field_name_string = field_name
+
+        # Date and time values cache the date and time in UTC, hence new event
+        # objects are created for every field.
+        event_objects = []
+        for timestamp in timestamps:
+          event = events.EventObject()
+          event.date_time = dfdatetime_posix_time.PosixTimeInMicroseconds(
+              timestamp=timestamp)
+          event.timestamp = timestamp
+          event_objects.append(event)
+
+        start_time = time.perf_counter()
+        for event in event_objects:
+          field_formatting_helper.GetFormattedField(
+              output_mediator, field_name, event, None, None, None)
+
+        duration = time.perf_counter() - start_time
+
+        print('{0:<22s}\t{1:<8s}\t{2:<18s}\t{3:8.3f}\t{4:10.0f}'.format(
+            time_zone_name, output_format, field_name_string, duration,
+            len(event_objects) / duration))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Script to benchmark the reading and parsing of text log files."""
+
+import argparse
+import io
+import sys
+import time
+
+# Change PYTHONPATH to include plaso.
+sys.path.insert(0, '.')
+
+# pylint: disable=wrong-import-position
+from plaso.parsers import mediator as parsers_mediator
+from plaso.parsers import text_parser
+from plaso.parsers.text_plugins import syslog
+from plaso.storage.fake import writer as fake_writer
+
+
+def Main():
+  """The main program function.
+
+  Returns:
+    bool: True if successful or False if not.
+  """
+  argument_parser = argparse.ArgumentParser(description=(
+      'Benchmark the reading and parsing of a generated syslog text log '
+      'file.'))
+
+  argument_parser.add_argument(
+      '--line_ending', '--line-ending', dest='line_ending', type=str,
+      action='store', choices=['crlf', 'lf'], default='crlf',
+      metavar='ENDING', help='line ending of the lines, either crlf or lf.')
+
+  argument_parser.add_argument(
+      '--number_of_lines', '--number-of-lines', dest='number_of_lines',
+      type=int, action='store', default=400000, metavar='NUMBER', help=(
+          'number of lines in the generated text log file.'))
+
+  options = argument_parser.parse_args()
+
+  line_ending = '\r\n' if options.line_ending == 'crlf' else '\n'
+
+  lines = []
+  for line_index in range(options.number_of_lines):
+    seconds = line_index % 86400
+    lines.append((
+        '2020-05-31T{0:02d}:{1:02d}:{2:02d}.698463+00:00 myhostname.myhost.com '
+        'client[{3:d}]: INFO No new content in line: {4:d}.{5:s}').format(
+            seconds // 3600, (seconds // 60) % 60, seconds % 60,
+            30840 + (line_index % 1000), line_index, line_ending))
+
+  data = ''.join(lines).encode('utf-8')
+
+  print('Reading and parsing {0:d} lines ({1:d} bytes) with {2:s} line '
+        'endings'.format(len(lines), len(data), options.line_ending.upper()))
+  print('')
+  print('{0:<10s}\t{1:>8s}\t{2:>10s}'.format('Stage', 'Seconds', 'Lines/s'))
+
+  file_object = io.BytesIO(data)
+  text_reader = text_parser.EncodedTextReader(file_object)
+
+  start_time = time.perf_counter()
+
+  number_of_lines = 0
+  text_reader.ReadLines()
+  while text_reader.lines_size:
+    text_reader.ReadLine()
+    text_reader.ReadLines()
+    number_of_lines += 1
+
+  duration = time.perf_counter() - start_time
+
+  print('{0:<10s}\t{1:8.3f}\t{2:10.0f}'.format(
+      'read', duration, number_of_lines / duration))
+
+  storage_writer = fake_writer.FakeStorageWriter()
+  storage_writer.Open()
+
+  parser_mediator = parsers_mediator.ParserMediator()
+  parser_mediator.SetStorageWriter(storage_writer)
+
+  plugin = syslog.SyslogTextPlugin()
+
+  file_object = io.BytesIO(data)
+
+  start_time = time.perf_counter()
+
+  text_reader = text_parser.EncodedTextReader(file_object)
+  text_reader.ReadLines()
+
+  if not plugin.CheckRequiredFormat(parser_mediator, text_reader):
+    print('Unable to parse generated lines with the syslog plugin.')
+    return False
+
+  plugin.Process(parser_mediator, file_object=file_object)
+
+  duration = time.perf_counter() - start_time
+
+  number_of_event_data = storage_writer.GetNumberOfAttributeContainers(
+      'event_data')
+
+  storage_writer.Close()
+
+  print('{0:<10s}\t{1:8.3f}\t{2:10.0f}'.format(
+      'parse', duration, number_of_event_data / duration))
+
+  return True
+
+
+if __name__ == '__main__':
+  if not Main():
+    sys.exit(1)
+  else:
+    sys.exit(0)
@@ -21,6 +21,8 @@ class TaskMeasurements(object):
   Attributes:
     completed_time (float): time when the task was completed by the foreman.
     created_time (float): time when the task was created by the foreman.
+    file_size (int): size of the file entry or data range of the task,
+        in bytes, or -1 if not known.
     merging_duration (float): time it took the foreman to merge the task.
     merging_time (float): time when the task was started to be merged by
         the foreman.
@@ -40,6 +42,7 @@ class TaskMeasurements(object):
     super(TaskMeasurements, self).__init__()
     self.completed_time = None
     self.created_time = None
+    self.file_size = None
     self.merging_duration = None
     self.merging_time = None
     self.pending_merge_time = None
@@ -74,7 +77,7 @@ def Main():
     print('No such directory: {0:s}'.format(options.profile_path))
     return False
 
-  names = ['time', 'identifier', 'status']
+  names = ['time', 'identifier', 'status', 'file_size']
 
   measurements = {}
 
@@ -87,11 +90,12 @@ def Main():
     label = os.path.basename(csv_file_name)
     label = label.replace('tasks-', '').replace('.csv.gz', '')
 
-    for time, identifier, status in data:
+    for time, identifier, status, file_size in data:
       if identifier not in measurements:
         measurements[identifier] = TaskMeasurements()
 
       task_measurement = measurements[identifier]
+      task_measurement.file_size = file_size
 
       if status == 'completed':
         task_measurement.completed_time = time
@@ -151,6 +155,34 @@ def Main():
     queued_duration[task_measurement.scheduled_time] = (
         task_measurement.processing_time - task_measurement.scheduled_time)
 
+  # The time between the last task that started to be processed and the last
+  # task that completed processing indicates how long workers were idle at
+  # the end of the extraction. Ideally the last task started is a small one.
+  processed_measurements = [
+      task_measurement for task_measurement in measurements.values()
+      if task_measurement.processing_duration is not None]
+  if processed_measurements:
+    last_started = max(
+        processed_measurements,
+        key=lambda task_measurement: task_measurement.processing_time)
+    last_completed = max(
+        processed_measurements,
+        key=lambda task_measurement: (
+            task_measurement.processing_time +
+            task_measurement.processing_duration))
+
+    tail_duration = (
+        last_completed.processing_time + last_completed.processing_duration -
+        last_started.processing_time)
+
+    print((
+        'Time between the last task started and the last task completed '
+        'processing: {0:.3f} seconds.').format(tail_duration))
+    print((
+        'File size of the last task started: {0:d} and the last task '
+        'completed: {1:d}.').format(
+            last_started.file_size, last_completed.file_size))
+
   if data.size > 0:
     keys = sorted(before_pending_merge_duration.keys())
     values = [before_pending_merge_duration[key] for key in keys]